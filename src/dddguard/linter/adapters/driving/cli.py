@@ -1,4 +1,6 @@
+import sys
 from pathlib import Path
+from typing import cast
 
 import typer
 from rich import box
@@ -9,13 +11,27 @@ from dddguard.shared.adapters.driving import (
     LINTER_THEME,
     tui,  # Unified TUI
 )
-from dddguard.shared.assets.asset_help import get_linter_help_renderable
 
-from ...ports.driving import LinterFacade, LinterResponseSchema, RulesMatrixSchema
+from ...ports.driving import (
+    LinterFacade,
+    LinterPortError,
+    LinterResponseSchema,
+    LintStatsSchema,
+    RulesMatrixSchema,
+)
+from .violation_groups import (
+    GROUP_BY_MODES,
+    GroupBy,
+    group_table,
+    group_violations,
+    violation_table,
+)
 
-# --- LOCAL ADAPTERS (Wizards) ---
-from .lint_wizard import LintSettingsWizard
-from .rules_viewer import RulesViewer
+# Up to this many violations, the `lint` summary lists each one
+_DETAIL_LIMIT = 50
+
+# Groups listed in the non-interactive `lint` summary
+_SUMMARY_ROWS = 25
 
 
 def register_commands(app: typer.Typer, facade: LinterFacade) -> None:
@@ -30,15 +46,115 @@ def register_commands(app: typer.Typer, facade: LinterFacade) -> None:
 
     @app.command(name="lint")
     def lint(
+        *,
         auto: bool = typer.Option(
             False,
             "--auto",
             "-a",
             help="Run automatically without interactive wizard (for CI/CD)",
         ),
+        from_snapshot: Path | None = typer.Option(
+            None,
+            "--from-snapshot",
+            help="Lint a graph saved by 'dddguard snapshot' instead of rescanning.",
+        ),
+        files_mode: bool = typer.Option(
+            False,
+            "--files",
+            help="Lint only the FILES given as arguments (for pre-commit hooks). "
+            "Non-interactive; exit code 1 on violations, 2 on errors.",
+        ),
+        output_format: str = typer.Option(
+            "table",
+            "--format",
+            "-f",
+            help="Report format: 'table' (default), or streamed 'text', 'jsonl', 'sarif' "
+            "(non-interactive; violations are written as they are found).",
+        ),
+        max_violations: int | None = typer.Option(
+            None,
+            "--max-violations",
+            min=0,
+            help="Stop after this many violations (streamed formats).",
+        ),
+        output: Path | None = typer.Option(
+            None,
+            "--output",
+            "-o",
+            help="Write the streamed report to this file instead of stdout.",
+        ),
+        group_by: str | None = typer.Option(
+            None,
+            "--group-by",
+            "-g",
+            help="Summarize the table report by 'rule' (default), 'contexts' "
+            "(source -> target context) or source 'module'.",
+        ),
+        focus: Path | None = typer.Option(
+            None,
+            "--focus",
+            help="Lint only the modules under this directory (e.g. one context). "
+            "The rest of the project is read only as far as they import it.",
+        ),
+        stats: bool = typer.Option(
+            False,
+            "--stats",
+            help="Report rule engine counters (imports checked per rule group, bypass "
+            "hits, violations per rule) and the time spent scanning vs. checking.",
+        ),
+        files: list[Path] | None = typer.Argument(
+            None,
+            help="Files to lint with --files (e.g. passed by pre-commit).",
+            show_default=False,
+        ),
     ) -> None:
         """Lint project architecture."""
-        run_lint_project_flow(facade, auto=auto)
+        if files_mode:
+            if focus is not None or stats:
+                tui.error("--focus and --stats cannot be combined with --files.")
+                raise typer.Exit(2)
+            run_lint_files_flow(facade, files or [], snapshot_path=from_snapshot)
+            return
+        if files:
+            tui.error("Unexpected arguments.", {"Hint": "Pass --files to lint a file list."})
+            raise typer.Exit(2)
+        if focus is not None:
+            # Absolute: the facade may be served by a daemon with another cwd
+            focus = focus.resolve()
+        if group_by is not None and group_by not in GROUP_BY_MODES:
+            tui.error(f"Unknown grouping '{group_by}'.", {"Modes": ", ".join(GROUP_BY_MODES)})
+            raise typer.Exit(2)
+        if output_format != "table":
+            if group_by is not None:
+                tui.error(
+                    "--group-by applies to the table report.",
+                    {"Hint": "Streamed formats list every violation."},
+                )
+                raise typer.Exit(2)
+            run_lint_stream_flow(
+                facade,
+                output_format,
+                max_violations=max_violations,
+                output=output,
+                snapshot_path=from_snapshot,
+                focus_path=focus,
+                collect_stats=stats,
+            )
+            return
+        if max_violations is not None or output is not None:
+            tui.error(
+                "--max-violations and --output need a streamed format.",
+                {"Hint": "Pass --format text, jsonl or sarif."},
+            )
+            raise typer.Exit(2)
+        run_lint_project_flow(
+            facade,
+            auto=auto,
+            snapshot_path=from_snapshot,
+            group_by=cast(GroupBy, group_by or "rule"),  # Validated above
+            focus_path=focus,
+            collect_stats=stats,
+        )
 
 
 # --- PUBLIC FLOWS ---
@@ -53,7 +169,15 @@ def run_lint_directory_flow(facade: LinterFacade) -> None:
     _run_lint_logic(facade, target)
 
 
-def run_lint_project_flow(facade: LinterFacade, auto: bool = False) -> None:
+def run_lint_project_flow(
+    facade: LinterFacade,
+    auto: bool = False,
+    snapshot_path: Path | None = None,
+    group_by: GroupBy = "rule",
+    focus_path: Path | None = None,
+    *,
+    collect_stats: bool = False,
+) -> None:
     tui.set_theme(LINTER_THEME)
     config = facade.config
 
@@ -64,29 +188,126 @@ def run_lint_project_flow(facade: LinterFacade, auto: bool = False) -> None:
 
     if auto:
         # Non-interactive mode: run directly without wizard
-        _run_lint_direct(facade, target)
+        _run_lint_direct(
+            facade, target, snapshot_path, group_by, focus_path, collect_stats=collect_stats
+        )
     else:
-        _run_lint_logic(facade, target)
+        _run_lint_logic(
+            facade, target, snapshot_path, group_by, focus_path, collect_stats=collect_stats
+        )
+
+
+def run_lint_files_flow(
+    facade: LinterFacade, files: list[Path], snapshot_path: Path | None = None
+) -> None:
+    """
+    Hook mode: checks only `files`, prints one line per violation and exits
+    0 (clean), 1 (violations) or 2 (could not lint).
+    """
+    if not files:
+        return
 
+    try:
+        # Absolute paths: the facade may be served by a daemon with another cwd
+        response = facade.lint_files([file.resolve() for file in files], snapshot_path)
+    except LinterPortError as e:
+        tui.console.print(f"dddguard: {e.message}", markup=False, highlight=False)
+        raise typer.Exit(2) from e
 
-def _run_lint_direct(facade: LinterFacade, path: Path) -> None:
+    _print_file_report(response)
+    if not response.success:
+        raise typer.Exit(1)
+
+
+def run_lint_stream_flow(
+    facade: LinterFacade,
+    output_format: str,
+    *,
+    max_violations: int | None = None,
+    output: Path | None = None,
+    snapshot_path: Path | None = None,
+    focus_path: Path | None = None,
+    collect_stats: bool = False,
+) -> None:
+    """
+    Streamed report (CI): violations are written as they are found, in `output_format`.
+    Exits 0 (clean), 1 (violations) or 2 (could not lint).
+    """
+    from .violation_reporters import REPORTERS
+
+    make_reporter = REPORTERS.get(output_format)
+    if make_reporter is None:
+        tui.error(
+            f"Unknown format '{output_format}'.",
+            {"Formats": ", ".join(["table", *REPORTERS])},
+        )
+        raise typer.Exit(2)
+
+    handle = output.open("w", encoding="utf-8") if output else sys.stdout
+    try:
+        reporter = make_reporter(handle)
+        reporter.begin()
+        summary = facade.lint_project_stream(
+            reporter.emit,
+            snapshot_path=snapshot_path,
+            max_violations=max_violations,
+            focus_path=focus_path,
+            collect_stats=collect_stats,
+        )
+        reporter.finish(summary)
+    except LinterPortError as e:
+        tui.console.print(f"dddguard: {e.message}", markup=False, highlight=False)
+        raise typer.Exit(2) from e
+    finally:
+        if output:
+            handle.close()
+
+    if not summary.success:
+        raise typer.Exit(1)
+
+
+def _run_lint_direct(
+    facade: LinterFacade,
+    path: Path,
+    snapshot_path: Path | None = None,
+    group_by: GroupBy = "rule",
+    focus_path: Path | None = None,
+    *,
+    collect_stats: bool = False,
+) -> None:
     """
     Non-interactive linting for CI/CD.
     Runs directly without wizard.
     """
     # Execute Scan via Port
     with tui.spinner("Checking architecture..."):
-        response: LinterResponseSchema = facade.lint_project(path)
+        response: LinterResponseSchema = facade.lint_project(
+            path, snapshot_path, focus_path, collect_stats=collect_stats
+        )
 
     # Render Report (Adapter Responsibility) without pause
-    _print_report(response, auto_mode=True)
+    _print_report(response, auto_mode=True, group_by=group_by)
 
     # Exit with error code if violations found
     if not response.success:
         raise typer.Exit(1)
 
 
-def _run_lint_logic(facade: LinterFacade, path: Path) -> None:
+def _run_lint_logic(
+    facade: LinterFacade,
+    path: Path,
+    snapshot_path: Path | None = None,
+    group_by: GroupBy = "rule",
+    focus_path: Path | None = None,
+    *,
+    collect_stats: bool = False,
+) -> None:
+    # Interactive-only adapters: imported here so `lint --auto` never loads the prompt stack
+    from dddguard.shared.assets.asset_help import get_linter_help_renderable
+
+    from .lint_wizard import LintSettingsWizard
+    from .rules_viewer import RulesViewer
+
     wizard = LintSettingsWizard(facade.config)
 
     # Wizard Loop
@@ -114,56 +335,112 @@ def _run_lint_logic(facade: LinterFacade, path: Path) -> None:
 
     # Execute Scan via Port
     with tui.spinner("Checking architecture..."):
-        response: LinterResponseSchema = facade.lint_project(path)
+        response: LinterResponseSchema = facade.lint_project(
+            path, snapshot_path, focus_path, collect_stats=collect_stats
+        )
 
     # Render Report (Adapter Responsibility)
-    _print_report(response)
+    _print_report(response, group_by=group_by)
 
 
-def _print_report(response_dto: LinterResponseSchema, auto_mode: bool = False) -> None:
+def _cache_summary(response_dto: LinterResponseSchema) -> dict[str, str]:
+    """Summary row for the lint cache (only when it was used)."""
+    if not response_dto.cache_hits and not response_dto.cache_misses:
+        return {}
+    return {"Lint Cache": f"{response_dto.cache_hits} reused / {response_dto.cache_misses} checked"}
+
+
+def _print_stats(stats: LintStatsSchema) -> None:
+    """`lint --stats`: rule engine counters and timings, below the report header."""
+    table = Table(box=box.SIMPLE_HEAD, header_style="bold", title="Lint Statistics")
+    table.add_column("Counter")
+    table.add_column("Value", justify="right")
+
+    table.add_row("Scan time", f"{stats.scan_seconds:.3f}s")
+    table.add_row("Check time", f"{stats.check_seconds:.3f}s")
+    table.add_row("Imports checked", str(stats.edges_evaluated))
+    for group, count in stats.edges_by_group.items():
+        table.add_row(f"  decided by {group}", str(count), style="dim")
+    table.add_row("Bypass hits", str(stats.bypass_hits))
+    for rule_name, count in sorted(stats.violations_by_rule.items(), key=lambda item: -item[1]):
+        table.add_row(f"Violations: {rule_name}", str(count))
+
+    tui.console.print(table)
+
+
+def _print_report(
+    response_dto: LinterResponseSchema, auto_mode: bool = False, group_by: GroupBy = "rule"
+) -> None:
     if response_dto.success:
         # --- SUCCESS STATE ---
         tui.success(
             "Architecture Clean",
             {
                 "Files Scanned": str(response_dto.total_scanned),
+                **_cache_summary(response_dto),
                 "Violations": "[green]0[/]",
                 "Status": "[bold green]PASSED[/]",
             },
         )
+        if response_dto.stats is not None:
+            _print_stats(response_dto.stats)
         if not auto_mode:
             tui.pause()
         return
 
     # --- FAILURE STATE ---
+    groups = group_violations(response_dto.violations, group_by)
     tui.error(
         "Architectural Violations Found",
         {
             "Files Scanned": str(response_dto.total_scanned),
+            **_cache_summary(response_dto),
             "Violations": f"[red]{len(response_dto.violations)}[/]",
+            "Groups": f"{len(groups)} by {group_by}",
             "Status": "[bold red]FAILED[/]",
         },
     )
+    if response_dto.stats is not None:
+        _print_stats(response_dto.stats)
 
-    # Detailed Table
-    table = Table(
-        box=box.SIMPLE_HEAD,
-        expand=True,
-        border_style="dim red",
-        header_style="bold red",
-    )
-    table.add_column("Rule", width=6)
-    table.add_column("Context", width=12, style="dim")
-    table.add_column("Violation Details")
-
-    for v in response_dto.violations:
-        loc = f"[bold white]{v.source}[/] [red]->[/] [dim white]{v.target}[/]"
-        msg = f"{v.message}\nLoc: {loc}"
+    if not auto_mode:
+        # Interactive: the viewer shows the summary and drills down from there
+        from .violations_viewer import ViolationsViewer
 
-        table.add_row(v.rule_name, v.target_context or "internal", msg)
+        tui.pause()
+        ViolationsViewer(response_dto.violations, group_by).render()
+        return
 
-    tui.console.print(table)
+    # Small reports list every violation; large ones only the largest groups,
+    # rendering tens of thousands of rows takes long and floods the terminal
+    if len(response_dto.violations) <= _DETAIL_LIMIT:
+        tui.console.print(violation_table(response_dto.violations))
+    else:
+        tui.console.print(group_table(groups[:_SUMMARY_ROWS], group_by))
+        hidden = len(groups) - _SUMMARY_ROWS
+        if hidden > 0:
+            tui.console.print(f"[dim]... and {hidden} smaller group(s).[/]")
+        tui.console.print(
+            "[dim]Every violation: [bold]dddguard lint --format text[/] "
+            "(or run 'dddguard lint' interactively to browse them).[/]"
+        )
     tui.console.print()
 
-    if not auto_mode:
-        tui.pause()
+
+def _print_file_report(response_dto: LinterResponseSchema) -> None:
+    """Plain, one violation per line: readable in hook output and easy to grep."""
+    for v in response_dto.violations:
+        tui.console.print(
+            f"{v.source} -> {v.target}: [{v.rule_name}] {v.message}",
+            markup=False,
+            highlight=False,
+            soft_wrap=True,
+        )
+
+    count = len(response_dto.violations)
+    if count:
+        tui.console.print(
+            f"dddguard: {count} violation(s) in {response_dto.total_scanned} file(s)",
+            markup=False,
+            highlight=False,
+        )
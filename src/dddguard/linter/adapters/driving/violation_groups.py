@@ -0,0 +1,116 @@
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Final, Literal, get_args
+
+from rich import box
+from rich.table import Table
+
+from ...ports.driving import ViolationSchema
+
+# Aggregation modes of the lint report (`lint --group-by`)
+GroupBy = Literal["rule", "contexts", "module"]
+
+GROUP_BY_MODES: Final[tuple[str, ...]] = get_args(GroupBy)
+
+_KEYS: Final[dict[str, Callable[[ViolationSchema], str]]] = {
+    "rule": lambda v: v.rule_name,
+    "contexts": lambda v: f"{v.source_context or 'internal'} -> {v.target_context or 'internal'}",
+    "module": lambda v: v.source,
+}
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ViolationGroup:
+    """
+    Violations sharing one key (a rule, a context pair or a source module).
+    Keeps references to the violations, in report order, for drilling down.
+    """
+
+    key: str
+    violations: list[ViolationSchema] = field(default_factory=list)
+    by_severity: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def count(self) -> int:
+        return len(self.violations)
+
+    def examples(self, limit: int) -> list[ViolationSchema]:
+        return self.violations[:limit]
+
+
+def group_violations(
+    violations: Iterable[ViolationSchema], group_by: GroupBy
+) -> list[ViolationGroup]:
+    """
+    Groups violations in a single pass (a dict lookup and an append each).
+    Returns the largest groups first; ties keep the order of first appearance.
+    """
+    key_of = _KEYS[group_by]
+    groups: dict[str, ViolationGroup] = {}
+
+    for violation in violations:
+        key = key_of(violation)
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = ViolationGroup(key=key)
+        group.violations.append(violation)
+        group.by_severity[violation.severity] = group.by_severity.get(violation.severity, 0) + 1
+
+    return sorted(groups.values(), key=lambda g: -g.count)
+
+
+# --- Rendering (shared by the `lint` summary and the interactive viewer) ---
+
+_GROUP_TITLES: Final[dict[str, str]] = {
+    "rule": "Rule",
+    "contexts": "Source -> Target Context",
+    "module": "Source Module",
+}
+
+
+def group_table(groups: list[ViolationGroup], group_by: GroupBy, examples: int = 3) -> Table:
+    """One row per group: key, count, severities and the first `examples` imports."""
+    table = Table(
+        box=box.SIMPLE_HEAD,
+        expand=True,
+        border_style="dim red",
+        header_style="bold red",
+    )
+    table.add_column(_GROUP_TITLES[group_by], ratio=2)
+    table.add_column("Count", justify="right", width=7)
+    table.add_column("Severity", width=16, style="dim")
+    table.add_column("Top Examples", ratio=3)
+
+    for group in groups:
+        severities = ", ".join(f"{n} {severity}" for severity, n in group.by_severity.items())
+        shown = "\n".join(
+            f"[bold white]{v.source}[/] [red]->[/] [dim white]{v.target}[/]"
+            for v in group.examples(examples)
+        )
+        more = group.count - examples
+        if more > 0:
+            shown += f"\n[dim]... and {more} more[/]"
+        table.add_row(group.key, str(group.count), severities, shown)
+
+    return table
+
+
+def violation_table(violations: Iterable[ViolationSchema]) -> Table:
+    """One row per violation, with its message and import."""
+    table = Table(
+        box=box.SIMPLE_HEAD,
+        expand=True,
+        border_style="dim red",
+        header_style="bold red",
+    )
+    table.add_column("Rule", width=6)
+    table.add_column("Context", width=12, style="dim")
+    table.add_column("Violation Details")
+
+    for v in violations:
+        loc = f"[bold white]{v.source}[/] [red]->[/] [dim white]{v.target}[/]"
+        msg = f"{v.message}\nLoc: {loc}"
+
+        table.add_row(v.rule_name, v.target_context or "internal", msg)
+
+    return table
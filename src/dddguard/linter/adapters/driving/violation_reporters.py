@@ -0,0 +1,177 @@
+import json
+import re
+from collections.abc import Callable
+from typing import Final, Protocol, TextIO, get_args
+
+from dddguard.shared.domain import RuleName
+
+from ...ports.driving import LintStatsSchema, LintSummarySchema, ViolationSchema
+
+# SARIF levels for linter severities
+_SARIF_LEVELS: Final[dict[str, str]] = {"error": "error", "warning": "warning", "info": "note"}
+
+_SARIF_SCHEMA: Final[str] = "https://json.schemastore.org/sarif-2.1.0.json"
+
+# Base of the artifact URIs: the linted source root
+_SARIF_SRCROOT: Final[str] = "%SRCROOT%"
+
+
+class ViolationReporter(Protocol):
+    """
+    Writes violations as they arrive: `begin`, then `emit` per violation, then
+    `finish` with the summary. Only the current violation is held in memory.
+    """
+
+    def begin(self) -> None: ...
+
+    def emit(self, violation: ViolationSchema) -> None: ...
+
+    def finish(self, summary: LintSummarySchema) -> None: ...
+
+
+class TextReporter:
+    """One `source -> target: [Rule] message` line per violation, then a summary."""
+
+    def __init__(self, handle: TextIO) -> None:
+        self.handle = handle
+
+    def begin(self) -> None:
+        pass
+
+    def emit(self, violation: ViolationSchema) -> None:
+        self.handle.write(
+            f"{violation.source} -> {violation.target}: "
+            f"[{violation.rule_name}] {violation.message}\n"
+        )
+
+    def finish(self, summary: LintSummarySchema) -> None:
+        for rule_name, count in sorted(summary.by_rule.items(), key=lambda item: -item[1]):
+            self.handle.write(f"  {count:>7}  {rule_name}\n")
+        limit = " (stopped at --max-violations)" if summary.truncated else ""
+        self.handle.write(
+            f"dddguard: {summary.violation_count} violation(s) "
+            f"in {summary.total_scanned} file(s){limit}\n"
+        )
+        if summary.stats is not None:
+            stats = summary.stats
+            groups = ", ".join(f"{n} {group}" for group, n in stats.edges_by_group.items())
+            self.handle.write(
+                f"dddguard: {stats.edges_evaluated} import(s) checked ({groups}); "
+                f"scan {stats.scan_seconds:.3f}s, check {stats.check_seconds:.3f}s\n"
+            )
+
+
+class JsonLinesReporter:
+    """One JSON object per line: `{"type": "violation", ...}`, last `{"type": "summary", ...}`."""
+
+    def __init__(self, handle: TextIO) -> None:
+        self.handle = handle
+
+    def begin(self) -> None:
+        pass
+
+    def emit(self, violation: ViolationSchema) -> None:
+        record = {
+            "type": "violation",
+            "rule": violation.rule_name,
+            "severity": violation.severity,
+            "source": violation.source,
+            "target": violation.target,
+            "source_context": violation.source_context,
+            "target_context": violation.target_context,
+            "message": violation.message,
+        }
+        self.handle.write(json.dumps(record) + "\n")
+
+    def finish(self, summary: LintSummarySchema) -> None:
+        self.handle.write(json.dumps({"type": "summary", **_summary_dict(summary)}) + "\n")
+
+
+class SarifReporter:
+    """
+    SARIF 2.1.0 log with a single run, written incrementally: the document is
+    opened in `begin`, results are appended one by one and closed in `finish`.
+    Each result points at the importing file (relative to `%SRCROOT%`, the linted
+    source root) and names its module as a logical location. Rules are identified
+    by a stable slug of their name (`Domain Purity` -> `domain-purity`).
+    """
+
+    def __init__(self, handle: TextIO) -> None:
+        self.handle = handle
+        self._first = True
+
+    def begin(self) -> None:
+        driver = {
+            "name": "dddguard",
+            "rules": [{"id": _rule_id(name), "name": name} for name in get_args(RuleName)],
+        }
+        header = json.dumps({"$schema": _SARIF_SCHEMA, "version": "2.1.0"})
+        # Re-open the header object to append the run
+        self.handle.write(header[:-1] + ', "runs": [{"tool": {"driver": ')
+        self.handle.write(json.dumps(driver))
+        self.handle.write('}, "results": [\n')
+
+    def emit(self, violation: ViolationSchema) -> None:
+        location: dict[str, object] = {
+            "logicalLocations": [{"fullyQualifiedName": violation.source, "kind": "module"}]
+        }
+        if violation.source_file is not None:
+            location["physicalLocation"] = {
+                "artifactLocation": {"uri": violation.source_file, "uriBaseId": _SARIF_SRCROOT}
+            }
+        result = {
+            "ruleId": _rule_id(violation.rule_name),
+            "level": _SARIF_LEVELS.get(violation.severity, "warning"),
+            "message": {"text": violation.message},
+            "locations": [location],
+            "properties": {
+                "target": violation.target,
+                "sourceContext": violation.source_context,
+                "targetContext": violation.target_context,
+            },
+        }
+        self.handle.write(("" if self._first else ",\n") + json.dumps(result))
+        self._first = False
+
+    def finish(self, summary: LintSummarySchema) -> None:
+        invocation = {"executionSuccessful": True, "properties": _summary_dict(summary)}
+        self.handle.write(f'\n], "invocations": [{json.dumps(invocation)}]}}]}}\n')
+
+
+# Streaming formats of `lint --format`
+REPORTERS: Final[dict[str, Callable[[TextIO], ViolationReporter]]] = {
+    "text": TextReporter,
+    "jsonl": JsonLinesReporter,
+    "sarif": SarifReporter,
+}
+
+
+def _rule_id(rule_name: str) -> str:
+    """Stable SARIF rule id: the rule name in kebab case."""
+    return re.sub(r"[^a-z0-9]+", "-", rule_name.lower()).strip("-")
+
+
+def _summary_dict(summary: LintSummarySchema) -> dict[str, object]:
+    result: dict[str, object] = {
+        "files": summary.total_scanned,
+        "violations": summary.violation_count,
+        "by_rule": summary.by_rule,
+        "by_severity": summary.by_severity,
+        "truncated": summary.truncated,
+        "cache_hits": summary.cache_hits,
+        "cache_misses": summary.cache_misses,
+    }
+    if summary.stats is not None:
+        result["stats"] = _stats_dict(summary.stats)
+    return result
+
+
+def _stats_dict(stats: LintStatsSchema) -> dict[str, object]:
+    return {
+        "edges_evaluated": stats.edges_evaluated,
+        "edges_by_group": stats.edges_by_group,
+        "bypass_hits": stats.bypass_hits,
+        "violations_by_rule": stats.violations_by_rule,
+        "scan_seconds": round(stats.scan_seconds, 6),
+        "check_seconds": round(stats.check_seconds, 6),
+    }
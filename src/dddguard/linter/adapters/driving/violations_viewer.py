@@ -0,0 +1,121 @@
+from typing import Final
+
+from InquirerPy.base.control import Choice
+from InquirerPy.separator import Separator
+
+from dddguard.shared.adapters.driving import (
+    LINTER_THEME,
+    tui,  # Unified TUI
+)
+
+from ...ports.driving import ViolationSchema
+from .violation_groups import (
+    GROUP_BY_MODES,
+    GroupBy,
+    ViolationGroup,
+    group_table,
+    group_violations,
+    violation_table,
+)
+
+# Violations per page when drilling into a group
+_PAGE_SIZE: Final[int] = 20
+
+# Groups listed in the summary table (all of them stay selectable)
+_SUMMARY_ROWS: Final[int] = 15
+
+# From this many groups on, the group list is filtered by typing
+_FUZZY_FROM: Final[int] = 30
+
+
+class ViolationsViewer:
+    """
+    Interactive UI Adapter: browses a lint report group by group.
+
+    The summary shows the largest groups with a few examples each; selecting a
+    group pages through its violations. Regrouping reuses the same violations
+    (one more pass over them), nothing is linted again.
+    """
+
+    def __init__(self, violations: tuple[ViolationSchema, ...], group_by: GroupBy) -> None:
+        self.violations = violations
+        self.group_by: GroupBy = group_by
+        self.groups: list[ViolationGroup] = group_violations(violations, group_by)
+
+    def render(self) -> None:
+        tui.set_theme(LINTER_THEME)
+
+        while True:
+            tui.clear()
+            self._render_summary()
+
+            fuzzy = len(self.groups) >= _FUZZY_FROM
+            action = tui.select(
+                message="Drill down into a group",
+                choices=self._group_choices(fuzzy),
+                use_fuzzy=fuzzy,
+                instruction="(Type to filter)" if fuzzy else "(Use arrow keys)",
+            )
+
+            if action is None or action is False:
+                return
+            if isinstance(action, int):
+                self._browse(self.groups[action])
+            elif action in GROUP_BY_MODES:
+                self.group_by = action
+                self.groups = group_violations(self.violations, action)
+
+    def _render_summary(self) -> None:
+        tui.console.print(
+            f"[bold red]{len(self.violations)}[/] violation(s) in "
+            f"[bold white]{len(self.groups)}[/] group(s) by [bold]{self.group_by}[/]"
+        )
+        tui.console.print(group_table(self.groups[:_SUMMARY_ROWS], self.group_by))
+
+        hidden = len(self.groups) - _SUMMARY_ROWS
+        if hidden > 0:
+            tui.console.print(f"[dim]... {hidden} smaller group(s) not shown, select below.[/]")
+
+    def _group_choices(self, fuzzy: bool) -> list[Choice | Separator]:
+        choices: list[Choice | Separator] = [
+            Choice(value=i, name=f"{group.count:>7}  {group.key}")
+            for i, group in enumerate(self.groups)
+        ]
+        # The fuzzy prompt rejects separators
+        if not fuzzy:
+            choices.append(Separator())
+        choices.extend(
+            Choice(value=mode, name=f"Group by {mode}")
+            for mode in GROUP_BY_MODES
+            if mode != self.group_by
+        )
+        choices.append(Choice(value=False, name="Exit"))
+        return choices
+
+    def _browse(self, group: ViolationGroup) -> None:
+        pages = max(1, -(-group.count // _PAGE_SIZE))
+        page = 0
+
+        while True:
+            tui.clear()
+            start = page * _PAGE_SIZE
+            tui.console.print(
+                f"[bold white]{group.key}[/]  [dim]{group.count} violation(s), "
+                f"page {page + 1}/{pages}[/]"
+            )
+            tui.console.print(violation_table(group.violations[start : start + _PAGE_SIZE]))
+
+            choices: list[Choice | Separator] = []
+            if page + 1 < pages:
+                choices.append(Choice(value="next", name="Next page"))
+            if page > 0:
+                choices.append(Choice(value="prev", name="Previous page"))
+            choices.append(Choice(value="back", name="Back to groups"))
+
+            action = tui.select(message=None, choices=choices)
+            if action == "next":
+                page += 1
+            elif action == "prev":
+                page -= 1
+            else:
+                return
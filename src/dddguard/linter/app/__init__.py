@@ -1,10 +1,15 @@
+from .check_files_uc import CheckFilesUseCase
 from .check_project_uc import CheckProjectUseCase
 from .errors import AnalysisExecutionError, LinterAppError
-from .interfaces import IScannerGateway
+from .interfaces import ChangedFilesGraph, IParallelRuleChecker, IScannerGateway, IViolationCache
 
 __all__ = [
     "AnalysisExecutionError",
+    "ChangedFilesGraph",
+    "CheckFilesUseCase",
     "CheckProjectUseCase",
+    "IParallelRuleChecker",
     "IScannerGateway",
+    "IViolationCache",
     "LinterAppError",
 ]
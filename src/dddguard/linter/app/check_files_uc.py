@@ -0,0 +1,63 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..domain import (
+    LinterDomainError,
+    LinterReport,
+    RuleEngineService,
+    ViolationEvent,
+)
+from .errors import AnalysisExecutionError
+from .interfaces import ChangedFilesGraph, IScannerGateway
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class CheckFilesUseCase:
+    """
+    App Service: Lints a list of changed files (e.g. staged for a commit).
+
+    Checks every outgoing edge of the changed modules, plus the incoming edges
+    of those whose classification changed: an unchanged importer can only start
+    violating a rule through a target that got a different passport.
+    Graph-level checks (import cycles) need the whole project and are skipped.
+    """
+
+    scanner_gateway: IScannerGateway
+    rule_engine: RuleEngineService
+
+    def execute(
+        self, file_paths: Iterable[Path], snapshot_path: Path | None = None
+    ) -> LinterReport:
+        try:
+            # 1. Get the changed nodes and their neighbourhood via ACL
+            changes: ChangedFilesGraph = self.scanner_gateway.get_changed_files(
+                file_paths, snapshot_path=snapshot_path
+            )
+            graph = changes.graph
+
+            # 2. Outgoing edges of every changed node
+            violations: list[ViolationEvent] = []
+            for path in changes.changed:
+                violations.extend(self.rule_engine.check_node(graph.nodes[path], graph))
+
+            # 3. Incoming edges of reclassified nodes, from importers not checked above
+            reclassified = frozenset(changes.reclassified)
+            importers: set[str] = set()
+            for path in reclassified:
+                importers.update(graph.importers_of(path))
+            for path in sorted(importers.difference(changes.changed)):
+                violations.extend(
+                    self.rule_engine.check_node(graph.nodes[path], graph, targets=reclassified)
+                )
+
+            return LinterReport(
+                total_files_scanned=len(changes.changed),
+                violations=tuple(violations),
+            )
+
+        except LinterDomainError as e:
+            raise AnalysisExecutionError(step="rule_checking", original_error=e) from e
+
+        except Exception as e:
+            raise AnalysisExecutionError(step="unknown", original_error=e) from e
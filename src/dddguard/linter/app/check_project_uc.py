@@ -1,41 +1,180 @@
-from dataclasses import dataclass
+import time
+from collections import Counter
+from collections.abc import Callable, Generator, Iterable, Iterator
+from dataclasses import dataclass, replace
 from pathlib import Path
 
-from dddguard.shared.domain import CodeGraph
+from dddguard.shared.domain import CodeGraph, CodeNode, LinterConfig
 
 from ..domain import (
+    RULE_GROUPS,
+    CycleRuleService,
     LinterDomainError,
     LinterReport,
+    LintProjection,
+    LintStatsVo,
+    LintSummaryVo,
+    NodeLintResultVo,
     RuleEngineService,
     ViolationEvent,
 )
 from .errors import AnalysisExecutionError
-from .interfaces import IScannerGateway
+from .interfaces import IParallelRuleChecker, IScannerGateway, IViolationCache
+
+
+@dataclass(slots=True)
+class _RunStats:
+    hits: int = 0
+    misses: int = 0
+    # Checked imports by deciding rule group (only with `collect_stats`)
+    group_counts: dict[str, int] | None = None
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
 class CheckProjectUseCase:
     """
     App Service: Orchestrates the linting process.
+
+    With `linter_config.workers > 0` and a large enough graph, node checks run on
+    worker processes over a compact projection of the graph. They report the same
+    violations as the in-process loop, in a deterministic (module, target) order.
+
+    With `linter_config.cache`, each node's violations are stored with a key over
+    everything they depend on (see `RuleEngineService.check_key`); the next run
+    only re-checks nodes whose key changed.
+
+    With a `focus_path`, only modules under it are checked (their imports, and the
+    cycles they start). The scanner then resolves the rest of the project lazily.
+
+    With `collect_stats`, the summary carries a `LintStatsVo`: imports checked per
+    rule group (counted by the check loops themselves), violations per rule and the
+    time spent scanning vs. checking. Stored results are then not reused, so the
+    counts cover every module; the fresh results are still stored.
     """
 
     scanner_gateway: IScannerGateway
     rule_engine: RuleEngineService
+    cycle_rule: CycleRuleService
+    parallel_checker: IParallelRuleChecker
+    violation_cache: IViolationCache
+
+    def execute(
+        self,
+        root_path: Path,
+        snapshot_path: Path | None = None,
+        linter_config: LinterConfig | None = None,
+        focus_path: Path | None = None,
+        collect_stats: bool = False,
+    ) -> LinterReport:
+        violations: list[ViolationEvent] = []
+        summary = self.stream(
+            root_path,
+            violations.append,
+            snapshot_path=snapshot_path,
+            linter_config=linter_config,
+            focus_path=focus_path,
+            collect_stats=collect_stats,
+        )
+
+        report = LinterReport(
+            total_files_scanned=summary.total_files_scanned,
+            violations=tuple(violations),
+            cache_hits=summary.cache_hits,
+            cache_misses=summary.cache_misses,
+            stats=summary.stats,
+        )
 
-    def execute(self, root_path: Path) -> LinterReport:
+        # Persist the result next to the snapshot (database snapshots only)
+        if snapshot_path is not None:
+            try:
+                self.scanner_gateway.record_violations(snapshot_path, report.violations)
+            except Exception as e:
+                raise AnalysisExecutionError(step="recording", original_error=e) from e
+
+        return report
+
+    def stream(
+        self,
+        root_path: Path,
+        emit: Callable[[ViolationEvent], None],
+        *,
+        snapshot_path: Path | None = None,
+        linter_config: LinterConfig | None = None,
+        max_violations: int | None = None,
+        focus_path: Path | None = None,
+        collect_stats: bool = False,
+    ) -> LintSummaryVo:
+        """
+        Lints like `execute`, but hands each violation to `emit` as soon as it is
+        known instead of collecting them, and returns only the counts.
+        Stops after `max_violations` (the summary is then marked truncated).
+        """
         try:
-            # 1. Get Graph via ACL
-            graph: CodeGraph = self.scanner_gateway.get_project_graph(root_path)
-
-            # 2. Validate all nodes against architectural rules
-            all_violations: list[ViolationEvent] = []
-            for node in graph.nodes.values():
-                violations = self.rule_engine.check_node(node, graph)
-                all_violations.extend(violations)
-
-            return LinterReport(
-                total_files_scanned=len(graph.nodes),
-                violations=tuple(all_violations),
+            started = time.perf_counter()
+            # 1. Get Graph via ACL (fresh scan, or a saved snapshot)
+            graph: CodeGraph = self.scanner_gateway.get_project_graph(
+                root_path, snapshot_path=snapshot_path, focus_path=focus_path
+            )
+            # Whole graph: streamed (a database snapshot never loads all nodes at once)
+            nodes: Iterable[CodeNode] = graph.nodes.values()
+            node_count = len(graph.nodes)
+            if focus_path is not None:
+                focused = self._nodes_under(graph, focus_path)
+                nodes, node_count = focused, len(focused)
+
+            scanned = time.perf_counter()
+
+            # 2. Validate all nodes, then graph-level checks, in a deterministic order
+            run_stats = _RunStats(
+                group_counts=dict.fromkeys(RULE_GROUPS, 0) if collect_stats else None
+            )
+            violations = self._iter_violations(
+                graph,
+                nodes,
+                node_count,
+                focus_path or root_path,
+                linter_config,
+                run_stats=run_stats,
+            )
+            by_rule: Counter[str] = Counter()
+            by_severity: Counter[str] = Counter()
+            count = 0
+            truncated = False
+            try:
+                for violation in violations:
+                    if max_violations is not None and count >= max_violations:
+                        truncated = True
+                        break
+                    emit(self._located(violation, graph, root_path))
+                    count += 1
+                    by_rule[violation.rule_name] += 1
+                    by_severity[violation.severity] += 1
+                total_files = node_count
+                checked = time.perf_counter()
+                stats = None
+                if run_stats.group_counts is not None:
+                    stats = LintStatsVo(
+                        edges_by_group=run_stats.group_counts,
+                        violations_by_rule=dict(by_rule),
+                        scan_seconds=scanned - started,
+                        check_seconds=checked - scanned,
+                    )
+            finally:
+                violations.close()
+                # Database-backed views hold a connection
+                close = getattr(graph, "close", None)
+                if close is not None:
+                    close()
+
+            return LintSummaryVo(
+                total_files_scanned=total_files,
+                violation_count=count,
+                by_rule=dict(by_rule),
+                by_severity=dict(by_severity),
+                truncated=truncated,
+                cache_hits=run_stats.hits,
+                cache_misses=run_stats.misses,
+                stats=stats,
             )
 
         except LinterDomainError as e:
@@ -43,3 +182,131 @@ class CheckProjectUseCase:
 
         except Exception as e:
             raise AnalysisExecutionError(step="unknown", original_error=e) from e
+
+    def _iter_violations(
+        self,
+        graph: CodeGraph,
+        nodes: Iterable[CodeNode],
+        node_count: int,
+        cache_root: Path,
+        linter_config: LinterConfig | None,
+        *,
+        run_stats: _RunStats,
+    ) -> Generator[ViolationEvent, None, None]:
+        if linter_config is not None and linter_config.cache:
+            yield from self._iter_incrementally(graph, nodes, cache_root, linter_config, run_stats)
+        else:
+            yield from self._check_nodes(
+                graph, nodes, node_count, linter_config, group_counts=run_stats.group_counts
+            )
+
+        # Graph-level checks (import cycles), reported on the modules they start from
+        cycles = self.cycle_rule.check_graph(graph)
+        if node_count == len(graph.nodes):
+            yield from cycles
+        else:
+            # A partial selection (--focus) is a list: it can be iterated again
+            checked = {node.path for node in nodes}
+            yield from (v for v in cycles if v.source_module in checked)
+
+    @staticmethod
+    def _located(violation: ViolationEvent, graph: CodeGraph, root_path: Path) -> ViolationEvent:
+        """`violation` with the file of its source module, relative to `root_path`."""
+        node = graph.get_node(violation.source_module)
+        if node is None or node.file_path is None:
+            return violation
+        if not node.file_path.is_relative_to(root_path):
+            return violation
+        return replace(violation, source_file=node.file_path.relative_to(root_path).as_posix())
+
+    @staticmethod
+    def _nodes_under(graph: CodeGraph, focus_path: Path) -> list[CodeNode]:
+        """Nodes whose file lies under `focus_path`, in graph order."""
+        return [
+            node
+            for node in graph.nodes.values()
+            if node.file_path is not None and node.file_path.is_relative_to(focus_path)
+        ]
+
+    def _iter_incrementally(
+        self,
+        graph: CodeGraph,
+        nodes: Iterable[CodeNode],
+        cache_root: Path,
+        linter_config: LinterConfig,
+        run_stats: _RunStats,
+    ) -> Iterator[ViolationEvent]:
+        """
+        Re-checks only those of `nodes` whose check key changed since the last run
+        on `cache_root`; the others reuse their stored violations. Yields in graph
+        order; the results are stored only if the run is consumed to the end.
+        While collecting stats every node is re-checked (a reused result has no counts).
+        """
+        stored = self.violation_cache.load(cache_root)
+        reuse = run_stats.group_counts is None
+
+        keys: dict[str, str] = {}
+        stale: list[CodeNode] = []
+        for node in nodes:
+            key = self.rule_engine.check_key(node, graph)
+            if key is None:
+                continue
+            path = node.path
+            keys[path] = key
+            entry = stored.get(path)
+            if not reuse or entry is None or entry.key != key:
+                stale.append(node)
+        run_stats.hits = len(keys) - len(stale)
+        run_stats.misses = len(stale)
+
+        fresh: dict[str, list[ViolationEvent]] = {node.path: [] for node in stale}
+        for violation in self._check_nodes(
+            graph, stale, len(stale), linter_config, group_counts=run_stats.group_counts
+        ):
+            fresh[violation.source_module].append(violation)
+
+        results: dict[str, NodeLintResultVo] = {}
+        for path, key in keys.items():
+            if path in fresh:
+                result = NodeLintResultVo(key=key, violations=tuple(fresh.pop(path)))
+            else:
+                result = stored[path]
+            results[path] = result
+            yield from result.violations
+
+        if stale or results.keys() != stored.keys():
+            self.violation_cache.save(cache_root, results)
+
+    def _check_nodes(
+        self,
+        graph: CodeGraph,
+        nodes: Iterable[CodeNode],
+        node_count: int,
+        linter_config: LinterConfig | None,
+        *,
+        group_counts: dict[str, int] | None = None,
+    ) -> Iterator[ViolationEvent]:
+        """
+        Violations of `nodes` (in order), on worker processes for large batches.
+        `nodes` may be a one-shot stream (the node view of a database snapshot),
+        so its size comes separately and it is iterated at most once.
+        With `group_counts`, counts the checked imports by deciding rule group.
+        """
+        workers = self._parallel_workers(node_count, linter_config)
+        if workers:
+            sources = None if node_count == len(graph.nodes) else {n.path for n in nodes}
+            projection = LintProjection.from_graph(graph, sources=sources)
+            yield from self.parallel_checker.check(projection, workers, group_counts)
+            return
+
+        for node in nodes:
+            yield from self.rule_engine.check_node(node, graph, group_counts=group_counts)
+
+    @staticmethod
+    def _parallel_workers(node_count: int, linter_config: LinterConfig | None) -> int:
+        """Number of worker processes to check `node_count` nodes with (0 = in-process)."""
+        if linter_config is None or linter_config.workers <= 0:
+            return 0
+        if node_count < linter_config.parallel_min_modules:
+            return 0
+        return linter_config.workers
@@ -1,12 +1,93 @@
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol
 
 from dddguard.shared.domain import CodeGraph
 
+from ..domain import LintProjection, NodeLintResultVo, ViolationEvent
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ChangedFilesGraph:
+    """
+    Changed modules (`changed`) inside a graph that also holds the project nodes
+    needed to check their edges; `reclassified` ones come with their importers.
+    """
+
+    graph: CodeGraph
+    changed: tuple[str, ...]
+    reclassified: tuple[str, ...]
+
 
 class IScannerGateway(Protocol):
     """
     Application Port: Abstract interface for retrieving project structure.
     """
 
-    def get_project_graph(self, root_path: Path) -> CodeGraph: ...
+    def get_project_graph(
+        self,
+        root_path: Path,
+        snapshot_path: Path | None = None,
+        focus_path: Path | None = None,
+    ) -> CodeGraph:
+        """
+        :param snapshot_path: Saved graph snapshot to reuse instead of scanning.
+        :param focus_path: Part of `root_path` to scan; the graph then holds its modules
+            plus the modules they import (classified, without imports of their own).
+        """
+        ...
+
+    def get_changed_files(
+        self, file_paths: Iterable[Path], snapshot_path: Path | None = None
+    ) -> ChangedFilesGraph:
+        """
+        Fresh state of `file_paths` only, resolved against a project index
+        (`snapshot_path`, or a warm cached project graph) when one is available.
+        """
+        ...
+
+    def record_violations(
+        self, snapshot_path: Path, violations: tuple[ViolationEvent, ...]
+    ) -> bool:
+        """
+        Stores the lint result next to the snapshot it was computed from.
+        :return: False if the snapshot format cannot hold violations.
+        """
+        ...
+
+
+class IParallelRuleChecker(Protocol):
+    """
+    Application Port: Runs rule checking of a projection on several workers.
+    """
+
+    def check(
+        self,
+        projection: LintProjection,
+        workers: int,
+        group_counts: dict[str, int] | None = None,
+    ) -> Iterator[ViolationEvent]:
+        """
+        Checks all modules of `projection` on up to `workers` workers.
+        Violations come back in module order, as from a single worker, as soon
+        as every shard before theirs is done. Closing the iterator stops the work.
+        With `group_counts`, adds the checked imports of each finished shard to it
+        (see `RuleEngineService.check_node`).
+        """
+        ...
+
+
+class IViolationCache(Protocol):
+    """
+    Application Port: Per-node lint results persisted between runs.
+    Best-effort: implementations must not raise on I/O failures.
+    """
+
+    def load(self, root_path: Path) -> Mapping[str, NodeLintResultVo]:
+        """Results of the last run on `root_path`, by module (empty if none)."""
+        ...
+
+    def save(self, root_path: Path, results: Mapping[str, NodeLintResultVo]) -> None:
+        """Replaces the stored results for `root_path`."""
+        ...
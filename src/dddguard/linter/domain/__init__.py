@@ -1,11 +1,28 @@
+from .cycle_rule_service import CycleRuleService
 from .errors import LinterDomainError, RuleDefinitionError
-from .events import LinterReport, ViolationEvent
+from .events import (
+    RULE_GROUPS,
+    LinterReport,
+    LintStatsVo,
+    LintSummaryVo,
+    NodeLintResultVo,
+    RuleGroup,
+    ViolationEvent,
+)
+from .lint_projection_vo import LintProjection
 from .rule_engine_service import RuleEngineService
 
 __all__ = [
+    "RULE_GROUPS",
+    "CycleRuleService",
+    "LintProjection",
+    "LintStatsVo",
+    "LintSummaryVo",
     "LinterDomainError",
     "LinterReport",
+    "NodeLintResultVo",
     "RuleDefinitionError",
     "RuleEngineService",
+    "RuleGroup",
     "ViolationEvent",
 ]
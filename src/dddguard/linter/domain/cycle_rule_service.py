@@ -0,0 +1,62 @@
+from dataclasses import dataclass
+
+from dddguard.shared.domain import CodeGraph, ImportCycleReportVo, ImportCycleVo
+
+from .events import ViolationEvent
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class CycleRuleService:
+    """
+    Domain Service: Graph-level "Import Cycle" check.
+
+    Unlike the per-import rules of RuleEngineService, a cycle is a property of
+    the whole graph, so one violation is reported per strongly connected component:
+    - Context level (error): bounded contexts depending on each other in a loop.
+    - Module level (warning): modules importing each other in a loop.
+    """
+
+    def check_graph(self, graph: CodeGraph) -> list[ViolationEvent]:
+        report = ImportCycleReportVo.from_graph(graph)
+
+        violations = [self._context_violation(cycle) for cycle in report.context_cycles]
+        violations.extend(self._module_violation(graph, cycle) for cycle in report.module_cycles)
+        return violations
+
+    @staticmethod
+    def _context_violation(cycle: ImportCycleVo) -> ViolationEvent:
+        # Anchor the finding on the module import behind the first hop
+        source_module, target_module = cycle.witnesses[0]
+        return ViolationEvent(
+            rule_name="Import Cycle",
+            severity="error",
+            message=f"Contexts depend on each other in a cycle: {' -> '.join(cycle.cycle)} "
+            f"({cycle.size} contexts: {', '.join(cycle.members)}).",
+            source_module=source_module,
+            source_layer="context",
+            source_context=cycle.cycle[0],
+            target_module=target_module,
+            target_layer="context",
+            target_context=cycle.cycle[1],
+        )
+
+    @staticmethod
+    def _module_violation(graph: CodeGraph, cycle: ImportCycleVo) -> ViolationEvent:
+        return ViolationEvent(
+            rule_name="Import Cycle",
+            severity="warning",
+            message=f"Modules import each other in a cycle: {' -> '.join(cycle.cycle)} "
+            f"({cycle.size} modules in the component).",
+            source_module=cycle.cycle[0],
+            source_layer="module",
+            source_context=CycleRuleService._context_of(graph, cycle.cycle[0]),
+            target_module=cycle.cycle[1],
+            target_layer="module",
+            target_context=CycleRuleService._context_of(graph, cycle.cycle[1]),
+        )
+
+    @staticmethod
+    def _context_of(graph: CodeGraph, module: str) -> str:
+        node = graph.get_node(module)
+        passport = node.passport if node else None
+        return (passport.context_name if passport else None) or "N/A"
@@ -1,11 +1,16 @@
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import Final, Literal, get_args
 
 from dddguard.shared.domain import RuleName
 
 # Severity levels for domain events
 Severity = Literal["error", "warning", "info"]
 
+# Step of the rule engine that decides an import (see `RuleEngineService.check_node`)
+RuleGroup = Literal["bypass", "scope", "internal", "fractal", "cross_context"]
+
+RULE_GROUPS: Final[tuple[str, ...]] = get_args(RuleGroup)
+
 
 @dataclass(frozen=True, kw_only=True, slots=True)
 class ViolationEvent:
@@ -16,9 +21,43 @@ class ViolationEvent:
     message: str
     source_module: str
     source_layer: str
+    source_context: str
     target_module: str
     target_layer: str
     target_context: str
+    # File of `source_module`, POSIX and relative to the lint root (set when reported)
+    source_file: str | None = None
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class NodeLintResultVo:
+    """Violations of one node, stored with the check key they were computed for."""
+
+    key: str
+    violations: tuple[ViolationEvent, ...] = ()
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class LintStatsVo:
+    """
+    Instrumentation of a linting run (collected on request only).
+    Collecting it re-checks every module, so the counters cover the whole report.
+    """
+
+    # Imports checked, by the rule group that decided them (see RULE_GROUPS)
+    edges_by_group: dict[str, int] = field(default_factory=dict)
+    violations_by_rule: dict[str, int] = field(default_factory=dict)
+    # Building the graph (scan or snapshot load) vs. checking it and reporting
+    scan_seconds: float = 0.0
+    check_seconds: float = 0.0
+
+    @property
+    def edges_evaluated(self) -> int:
+        return sum(self.edges_by_group.values())
+
+    @property
+    def bypass_hits(self) -> int:
+        return self.edges_by_group.get("bypass", 0)
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -27,7 +66,26 @@ class LinterReport:
 
     total_files_scanned: int
     violations: tuple[ViolationEvent, ...] = field(default_factory=tuple)
+    # Nodes whose results came from / missed the persisted lint cache
+    cache_hits: int = 0
+    cache_misses: int = 0
+    stats: LintStatsVo | None = None
 
     @property
     def has_errors(self) -> bool:
         return any(v.severity == "error" for v in self.violations)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class LintSummaryVo:
+    """Counts of a streamed linting run (the violations themselves are not kept)."""
+
+    total_files_scanned: int
+    violation_count: int = 0
+    by_rule: dict[str, int] = field(default_factory=dict)
+    by_severity: dict[str, int] = field(default_factory=dict)
+    # Stopped at the violation limit: more violations exist than were reported
+    truncated: bool = False
+    cache_hits: int = 0
+    cache_misses: int = 0
+    stats: LintStatsVo | None = None
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass
+
+from dddguard.shared.domain import PASSPORT_TABLE, CodeGraph, ComponentPassport
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class LintProjection:
+    """
+    Compact, picklable view of a classified graph: just what rule checking needs.
+
+    Modules keep graph order and get dense ids (0..N-1). `passports` holds each
+    distinct passport once; `passport_of[i]` indexes it (-1 = unclassified).
+    Edges are in CSR form: the targets of module `i` are
+    `targets[offsets[i]:offsets[i + 1]]`, sorted by target path.
+
+    Only checkable edges are kept (both ends in the graph and classified), so a
+    worker never needs file contents or the `CodeGraph` itself. With `sources`,
+    only the edges of those modules are kept (the rest are just targets).
+    """
+
+    modules: tuple[str, ...]
+    passports: tuple[ComponentPassport, ...]
+    passport_of: array
+    offsets: array
+    targets: array
+
+    @classmethod
+    def from_graph(
+        cls, graph: CodeGraph, sources: AbstractSet[str] | None = None
+    ) -> LintProjection:
+        # One pass to number modules and passports (lazy views stream nodes once)
+        modules: list[str] = []
+        imports: list[list[str]] = []
+        passport_of = array("i")
+        local_ids: dict[int, int] = {}
+        passports: list[ComponentPassport] = []
+        for path, node in graph.nodes.items():
+            modules.append(path)
+            passport_id = node.passport_id
+            if passport_id is None:
+                passport_of.append(-1)
+                imports.append([])
+                continue
+            local = local_ids.get(passport_id)
+            if local is None:
+                local = local_ids[passport_id] = len(passports)
+                passports.append(PASSPORT_TABLE.get(passport_id))
+            passport_of.append(local)
+            if sources is None or path in sources:
+                imports.append(sorted(node.imports))
+            else:
+                imports.append([])
+
+        ids = {path: i for i, path in enumerate(modules)}
+        offsets = array("q", [0])
+        targets = array("i")
+        for paths in imports:
+            for target in paths:
+                target_id = ids.get(target)
+                if target_id is not None and passport_of[target_id] >= 0:
+                    targets.append(target_id)
+            offsets.append(len(targets))
+
+        return cls(
+            modules=tuple(modules),
+            passports=tuple(passports),
+            passport_of=passport_of,
+            offsets=offsets,
+            targets=targets,
+        )
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    def shards(self, count: int) -> list[range]:
+        """
+        Splits the modules into at most `count` contiguous ranges of similar edge
+        counts. Concatenating per-shard results in order restores module order.
+        """
+        total = len(self.modules)
+        if total == 0:
+            return []
+        count = max(1, min(count, total))
+
+        shards: list[range] = []
+        start = 0
+        for k in range(1, count):
+            # First module whose edge offset reaches the k-th share of all edges
+            goal = self.edge_count * k // count
+            end = max(start + 1, bisect_left(self.offsets, goal, start, total))
+            if end >= total:
+                break
+            shards.append(range(start, end))
+            start = end
+        shards.append(range(start, total))
+        return shards
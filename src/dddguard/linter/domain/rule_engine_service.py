@@ -1,5 +1,9 @@
-from dataclasses import dataclass
-from typing import ClassVar
+import hashlib
+from array import array
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass, field, replace
+from enum import Enum
+from typing import Any, Final
 
 from dddguard.shared.domain import (
     COMPOSITION_LAYERS,
@@ -8,14 +12,103 @@ from dddguard.shared.domain import (
     FRACTAL_DOWNSTREAM_ALLOWED,
     FRACTAL_UPSTREAM_FORBIDDEN,
     INTERNAL_ACCESS_MATRIX,
+    PASSPORT_TABLE,
     CodeGraph,
     CodeNode,
-    InternalAccessMatrix,
+    ComponentPassport,
+    DirectionEnum,
     LayerDirectionKey,
+    LayerEnum,
+    RuleName,
     ScopeEnum,
 )
 
-from .events import ViolationEvent
+from .events import RuleGroup, Severity, ViolationEvent
+from .lint_projection_vo import LintProjection
+
+# ==============================================================================
+# COMPILED POLICY (built once from the shared policy data)
+# ==============================================================================
+
+# Group 1: source (layer, direction) -> forbidden target keys
+_INTERNAL_FORBIDDEN: Final[dict[LayerDirectionKey, frozenset[LayerDirectionKey]]] = {
+    source_key: rule["forbidden"] for source_key, rule in INTERNAL_ACCESS_MATRIX.items()
+}
+
+# Group 1: rule reported for a forbidden import, by source (layer, direction)
+_INTERNAL_RULE_NAMES: Final[dict[LayerDirectionKey, RuleName]] = {
+    (LayerEnum.DOMAIN, DirectionEnum.NONE): "Domain Purity",
+    (LayerEnum.APP, DirectionEnum.NONE): "App Isolation",
+    (LayerEnum.PORTS, DirectionEnum.DRIVING): "Driving Port Boundary",
+    (LayerEnum.PORTS, DirectionEnum.DRIVEN): "Driven Port Boundary",
+    (LayerEnum.ADAPTERS, DirectionEnum.DRIVING): "Driving Adapter Boundary",
+    (LayerEnum.ADAPTERS, DirectionEnum.DRIVEN): "Driven Adapter Boundary",
+}
+
+# Bump when rule logic or messages change: invalidates persisted lint results
+_RULES_REVISION: Final = 1
+
+
+def _canonical(value: Any) -> str:
+    """Order-independent text of policy data (set and enum hashes vary per process)."""
+    if isinstance(value, Enum):
+        return str(value.value)
+    if isinstance(value, dict):
+        items = sorted(f"{_canonical(k)}:{_canonical(v)}" for k, v in value.items())
+        return "{" + ",".join(items) + "}"
+    if isinstance(value, (set, frozenset)):
+        return "{" + ",".join(sorted(_canonical(v) for v in value)) + "}"
+    if isinstance(value, (tuple, list)):
+        return "(" + ",".join(_canonical(v) for v in value) + ")"
+    return repr(value)
+
+
+# Digest of everything rule outcomes depend on besides the passports themselves
+_POLICY_FINGERPRINT: Final[str] = hashlib.blake2b(
+    _canonical(
+        (
+            _RULES_REVISION,
+            INTERNAL_ACCESS_MATRIX,
+            _INTERNAL_RULE_NAMES,
+            FRACTAL_UPSTREAM_FORBIDDEN,
+            FRACTAL_DOWNSTREAM_ALLOWED,
+            CROSS_CONTEXT_OUTBOUND_ALLOWED,
+            CROSS_CONTEXT_INBOUND_ALLOWED,
+            COMPOSITION_LAYERS,
+        )
+    ).encode(),
+    digest_size=8,
+).hexdigest()
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class _Verdict:
+    """
+    A rule violation between two passports, minus the modules it occurs between.
+    Built once per violating passport pair; `at` stamps it onto one import.
+    """
+
+    rule_name: RuleName
+    severity: Severity
+    message: str
+    source_layer: str
+    target_layer: str
+    target_context: str
+    # Set by `_decide` (the rule checks only see the fields they report)
+    source_context: str = "unknown"
+
+    def at(self, source_module: str, target_module: str) -> ViolationEvent:
+        return ViolationEvent(
+            rule_name=self.rule_name,
+            severity=self.severity,
+            message=self.message,
+            source_module=source_module,
+            source_layer=self.source_layer,
+            source_context=self.source_context,
+            target_module=target_module,
+            target_layer=self.target_layer,
+            target_context=self.target_context,
+        )
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -23,43 +116,210 @@ class RuleEngineService:
     """
     Domain Service: Validates architectural dependency links.
     Implements 13 rules across 4 groups (Internal, Fractal, Cross-Context, Scope).
+
+    Every rule depends only on the passports of both ends of an import (the
+    relationship — same context, parent/child, alien — is derived from them too).
+    Verdicts are therefore memoized per (source passport id, target passport id):
+    a project has a few hundred distinct passports, so after warm-up checking an
+    import costs one dict lookup. Passport ids come from the process-wide
+    PASSPORT_TABLE, so the table stays valid for the lifetime of the service.
     """
 
-    _internal_matrix: ClassVar[InternalAccessMatrix] = INTERNAL_ACCESS_MATRIX
+    # source passport id -> target passport id -> verdict (None = allowed)
+    _verdicts: dict[int, dict[int, _Verdict | None]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # source passport id -> target passport id -> deciding rule group (for `group_counts`)
+    _groups: dict[int, dict[int, RuleGroup]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # passport id -> the passport fields rules read, as text (see `check_key`)
+    _tokens: dict[int, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def check_key(self, source_node: CodeNode, graph: CodeGraph) -> str | None:
+        """
+        Digest of every input of `check_node(source_node, graph)`: the policy, the
+        node's passport and its checkable import targets with their passports.
+        Equal keys mean equal violations, so results can be reused across runs.
+        Returns None for unclassified nodes (nothing to check).
+        """
+        source_id = source_node.passport_id
+        if source_id is None:
+            return None
+
+        tokens = self._tokens
+        parts = []
+        for target_path in source_node.imports:
+            target_node = graph.get_node(target_path)
+            if target_node is None:
+                continue
+            target_id = target_node.passport_id
+            if target_id is None:
+                continue
+            token = tokens.get(target_id) or self._token(target_id)
+            parts.append(f"{target_path}={token}")
+        parts.sort()
+
+        source_token = tokens.get(source_id) or self._token(source_id)
+        text = "\n".join((_POLICY_FINGERPRINT, source_token, *parts))
+        return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+    def _token(self, passport_id: int) -> str:
+        passport = PASSPORT_TABLE.get(passport_id)
+        token = self._tokens[passport_id] = "|".join(
+            (
+                passport.scope.value,
+                repr(passport.context_name),
+                repr(passport.macro_zone),
+                passport.layer.value,
+                passport.direction.value,
+            )
+        )
+        return token
 
     def check_node(
         self,
         source_node: CodeNode,
         graph: CodeGraph,
+        targets: AbstractSet[str] | None = None,
+        group_counts: dict[str, int] | None = None,
     ) -> list[ViolationEvent]:
         """
         Validates all imports of a source node against architectural rules.
         Returns a list of violations (empty if all imports are valid).
+
+        :param targets: Only check imports of these paths (None = all imports).
+        :param group_counts: If given, each checked import adds 1 to the entry of
+            the rule group that decided it (keys: RULE_GROUPS).
         """
         violations: list[ViolationEvent] = []
 
-        if not source_node.passport:
+        source_id = source_node.passport_id
+        if source_id is None:
             return []
 
-        for target_path in source_node.imports:
+        row = self._row(source_id)
+        groups = self._group_row(source_id)
+        imports = source_node.imports if targets is None else source_node.imports & targets
+        for target_path in imports:
             target_node = graph.get_node(target_path)
-            if not target_node or not target_node.passport:
+            if target_node is None:
+                continue
+            target_id = target_node.passport_id
+            if target_id is None:
                 continue
 
-            violation = self._validate_link(source_node, target_node, target_path)
-            if violation:
-                violations.append(violation)
+            verdict = (
+                row[target_id] if target_id in row else self._decide(row, source_id, target_id)
+            )
+            if verdict is not None:
+                violations.append(verdict.at(source_node.path, target_path))
+            if group_counts is not None:
+                group_counts[groups[target_id]] += 1
 
         return violations
 
-    def _validate_link(
+    def check_projection(self, projection: LintProjection, shard: range) -> list[ViolationEvent]:
+        """
+        Validates the imports of modules `shard` of a projection.
+        Returns violations in module order, then target path order.
+        """
+        return self.events_for(projection, self.find_violating_edges(projection, shard))
+
+    def find_violating_edges(
         self,
-        source: CodeNode,
-        target: CodeNode,
-        target_path_str: str,
-    ) -> ViolationEvent | None:
+        projection: LintProjection,
+        shard: range,
+        group_counts: dict[str, int] | None = None,
+    ) -> array:
+        """
+        Imports of modules `shard` that break a rule, as flat module id pairs
+        (source, target, source, target, ...). Compact enough to ship back from a
+        worker process; `events_for` turns them into violations.
+        `group_counts` is filled as in `check_node`.
         """
-        Validates a single import link. Returns a ViolationEvent if invalid, None otherwise.
+        edges = array("i")
+
+        ids = self._passport_ids(projection)
+        passport_of = projection.passport_of
+        offsets = projection.offsets
+        targets = projection.targets
+
+        for i in shard:
+            local = passport_of[i]
+            if local < 0:
+                continue
+            source_id = ids[local]
+            row = self._row(source_id)
+            groups = self._group_row(source_id)
+            for j in targets[offsets[i] : offsets[i + 1]]:
+                target_id = ids[passport_of[j]]
+                verdict = (
+                    row[target_id] if target_id in row else self._decide(row, source_id, target_id)
+                )
+                if verdict is not None:
+                    edges.append(i)
+                    edges.append(j)
+                if group_counts is not None:
+                    group_counts[groups[target_id]] += 1
+
+        return edges
+
+    def events_for(self, projection: LintProjection, edges: array) -> list[ViolationEvent]:
+        """Violations of the flat module id pairs found by `find_violating_edges`."""
+        violations: list[ViolationEvent] = []
+
+        ids = self._passport_ids(projection)
+        modules = projection.modules
+        passport_of = projection.passport_of
+
+        for k in range(0, len(edges), 2):
+            i, j = edges[k], edges[k + 1]
+            source_id, target_id = ids[passport_of[i]], ids[passport_of[j]]
+            row = self._row(source_id)
+            verdict = (
+                row[target_id] if target_id in row else self._decide(row, source_id, target_id)
+            )
+            if verdict is not None:
+                violations.append(verdict.at(modules[i], modules[j]))
+
+        return violations
+
+    @staticmethod
+    def _passport_ids(projection: LintProjection) -> list[int]:
+        """Projection-local passport index -> id in this process's PASSPORT_TABLE."""
+        return [PASSPORT_TABLE.intern(passport) for passport in projection.passports]
+
+    def _row(self, source_id: int) -> dict[int, _Verdict | None]:
+        row = self._verdicts.get(source_id)
+        if row is None:
+            row = self._verdicts.setdefault(source_id, {})
+        return row
+
+    def _group_row(self, source_id: int) -> dict[int, RuleGroup]:
+        groups = self._groups.get(source_id)
+        if groups is None:
+            groups = self._groups.setdefault(source_id, {})
+        return groups
+
+    def _decide(
+        self, row: dict[int, _Verdict | None], source_id: int, target_id: int
+    ) -> _Verdict | None:
+        """Judges a passport pair seen for the first time and memoizes the verdict."""
+        src_pass = PASSPORT_TABLE.get(source_id)
+        group, verdict = self._judge(src_pass, PASSPORT_TABLE.get(target_id))
+        if verdict is not None and src_pass.context_name:
+            verdict = replace(verdict, source_context=src_pass.context_name)
+        row[target_id] = verdict
+        self._groups.setdefault(source_id, {})[target_id] = group
+        return verdict
+
+    def _judge(
+        self, src_pass: ComponentPassport, tgt_pass: ComponentPassport
+    ) -> tuple[RuleGroup, _Verdict | None]:
+        """
+        Decides an import between two passports: the rule group that decided it,
+        and its verdict (None if it is allowed).
 
         Rule application order:
         1. Bypass conditions
@@ -68,22 +328,14 @@ class RuleEngineService:
         4. Fractal kinship (parent-child)
         5. Alien contexts (cross-context)
         """
-        src_pass = source.passport
-        tgt_pass = target.passport
-
-        if not src_pass or not tgt_pass:
-            return None
-
         # --- STEP 1: BYPASS CONDITIONS ---
         if self._check_bypass(src_pass.scope, src_pass.layer, tgt_pass.scope):
-            return None
+            return "bypass", None
 
         # --- STEP 2: SCOPE ISOLATION RULES (Group 4) ---
-        scope_violation = self._check_scope_isolation(
-            source.path, src_pass.scope, tgt_pass.scope, target_path_str
-        )
+        scope_violation = self._check_scope_isolation(src_pass.scope, tgt_pass.scope)
         if scope_violation:
-            return scope_violation
+            return "scope", scope_violation
 
         # --- STEP 3: DETERMINE RELATIONSHIP ---
         src_ctx = src_pass.context_name or "unknown"
@@ -92,48 +344,34 @@ class RuleEngineService:
         # Same context?
         if src_pass.scope == ScopeEnum.CONTEXT and tgt_pass.scope == ScopeEnum.CONTEXT:
             if src_ctx == tgt_ctx:
-                return self._check_internal_access(
-                    source.path,
+                return "internal", self._check_internal_access(
                     src_pass.layer,
                     src_pass.direction,
                     tgt_pass.layer,
                     tgt_pass.direction,
-                    target_path_str,
                     src_ctx,
                 )
 
         # Fractal kinship?
         # Upstream: Child -> Parent (source.macro_zone == target.context_name)
         if src_pass.macro_zone == tgt_ctx:
-            return self._check_fractal_upstream(
-                source.path,
-                src_ctx,
-                tgt_pass.layer,
-                tgt_pass.direction,
-                tgt_ctx,
-                target_path_str,
+            return "fractal", self._check_fractal_upstream(
+                src_ctx, tgt_pass.layer, tgt_pass.direction, tgt_ctx
             )
 
         # Downstream: Parent -> Child (target.macro_zone == source.context_name)
         if tgt_pass.macro_zone == src_ctx:
-            return self._check_fractal_downstream(
-                source.path,
-                src_ctx,
-                tgt_pass.layer,
-                tgt_pass.direction,
-                tgt_ctx,
-                target_path_str,
+            return "fractal", self._check_fractal_downstream(
+                src_ctx, tgt_pass.layer, tgt_pass.direction, tgt_ctx
             )
 
         # --- STEP 4: ALIEN CONTEXTS (Group 3: Cross-Context Rules) ---
-        return self._check_cross_context(
-            source.path,
+        return "cross_context", self._check_cross_context(
             src_pass.layer,
             src_pass.direction,
             tgt_pass.layer,
             tgt_pass.direction,
             tgt_ctx,
-            target_path_str,
         )
 
     # ==========================================================================
@@ -161,11 +399,9 @@ class RuleEngineService:
 
     def _check_scope_isolation(
         self,
-        src_path: str,
         src_scope: ScopeEnum,
         tgt_scope: ScopeEnum,
-        tgt_path: str,
-    ) -> ViolationEvent | None:
+    ) -> _Verdict | None:
         """
         Rules 12-13: Shared Independence, Root Isolation
         """
@@ -173,14 +409,12 @@ class RuleEngineService:
         # Shared cannot import from CONTEXT or ROOT
         if src_scope == ScopeEnum.SHARED:
             if tgt_scope in (ScopeEnum.CONTEXT, ScopeEnum.ROOT):
-                return ViolationEvent(
+                return _Verdict(
                     rule_name="Shared Independence",
                     severity="error",
                     message="Shared kernel cannot depend on bounded contexts or root. "
                     "Shared is the base of the pyramid.",
-                    source_module=src_path,
                     source_layer="shared",
-                    target_module=tgt_path,
                     target_layer=tgt_scope.value.lower(),
                     target_context="N/A",
                 )
@@ -199,55 +433,32 @@ class RuleEngineService:
 
     def _check_internal_access(
         self,
-        src_path: str,
         src_layer,
         src_direction,
         tgt_layer,
         tgt_direction,
-        tgt_path: str,
         ctx: str,
-    ) -> ViolationEvent | None:
+    ) -> _Verdict | None:
         """
         Rules 1-7: Domain Purity, App Isolation, Driving Port Boundary,
         Driven Port Boundary, Driving Adapter Boundary, Driven Adapter Boundary, Composition
         """
         src_key: LayerDirectionKey = (src_layer, src_direction)
-        tgt_key: LayerDirectionKey = (tgt_layer, tgt_direction)
+        forbidden = _INTERNAL_FORBIDDEN.get(src_key)
 
-        if src_key not in self._internal_matrix:
+        if forbidden is None:
             # Unknown source layer/direction combo -> skip
             return None
 
-        rule = self._internal_matrix[src_key]
-
         # Check if target is in the forbidden set
-        if tgt_key in rule["forbidden"]:
-            # Determine rule name based on source
-            from typing import cast
-
-            from dddguard.shared.domain import RuleName
-
-            rule_name_map: dict[tuple[str, str], RuleName] = {
-                ("DOMAIN", "NONE"): "Domain Purity",
-                ("APP", "NONE"): "App Isolation",
-                ("PORTS", "DRIVING"): "Driving Port Boundary",
-                ("PORTS", "DRIVEN"): "Driven Port Boundary",
-                ("ADAPTERS", "DRIVING"): "Driving Adapter Boundary",
-                ("ADAPTERS", "DRIVEN"): "Driven Adapter Boundary",
-            }
-            rule_name = rule_name_map.get(
-                (src_layer.value, src_direction.value),
-                cast(RuleName, "Domain Purity"),  # Fallback (shouldn't happen)
-            )
-
-            return ViolationEvent(
-                rule_name=rule_name,
+        if (tgt_layer, tgt_direction) in forbidden:
+            return _Verdict(
+                # Fallback shouldn't happen: every matrix row has a rule name
+                rule_name=_INTERNAL_RULE_NAMES.get(src_key, "Domain Purity"),
                 severity="error",
                 message=f"Layer '{src_layer.value}/{src_direction.value}' cannot import "
                 f"'{tgt_layer.value}/{tgt_direction.value}' within the same context.",
-                source_module=src_path,
                 source_layer=f"{src_layer.value}/{src_direction.value}",
-                target_module=tgt_path,
                 target_layer=f"{tgt_layer.value}/{tgt_direction.value}",
                 target_context=ctx,
             )
@@ -260,13 +471,11 @@ class RuleEngineService:
 
     def _check_fractal_upstream(
         self,
-        src_path: str,
         src_ctx: str,
         tgt_layer,
         tgt_direction,
         tgt_ctx: str,
-        tgt_path: str,
-    ) -> ViolationEvent | None:
+    ) -> _Verdict | None:
         """
         Rule 8: Fractal Upstream Access
         Child -> Parent: can import Domain, App, Ports/Driven
@@ -274,15 +483,13 @@ class RuleEngineService:
         tgt_key: LayerDirectionKey = (tgt_layer, tgt_direction)
 
         if tgt_key in FRACTAL_UPSTREAM_FORBIDDEN:
-            return ViolationEvent(
+            return _Verdict(
                 rule_name="Fractal Upstream Access",
                 severity="error",
                 message=f"Child context '{src_ctx}' can only access parent '{tgt_ctx}' "
                 f"Domain, App, and Driven Ports (local shared kernel). "
                 f"Cannot access '{tgt_layer.value}/{tgt_direction.value}'.",
-                source_module=src_path,
                 source_layer="child",
-                target_module=tgt_path,
                 target_layer=f"{tgt_layer.value}/{tgt_direction.value}",
                 target_context=tgt_ctx,
             )
@@ -291,13 +498,11 @@ class RuleEngineService:
 
     def _check_fractal_downstream(
         self,
-        src_path: str,
         src_ctx: str,
         tgt_layer,
         tgt_direction,
         tgt_ctx: str,
-        tgt_path: str,
-    ) -> ViolationEvent | None:
+    ) -> _Verdict | None:
         """
         Rule 9: Fractal Downstream Access
         Parent -> Child: can only import Ports/Driving (facades)
@@ -305,15 +510,13 @@ class RuleEngineService:
         tgt_key: LayerDirectionKey = (tgt_layer, tgt_direction)
 
         if tgt_key not in FRACTAL_DOWNSTREAM_ALLOWED:
-            return ViolationEvent(
+            return _Verdict(
                 rule_name="Fractal Downstream Access",
                 severity="error",
                 message=f"Parent context '{src_ctx}' can only access child '{tgt_ctx}' "
                 f"via Public Driving Ports (facades). "
                 f"Cannot access '{tgt_layer.value}/{tgt_direction.value}'.",
-                source_module=src_path,
                 source_layer="parent",
-                target_module=tgt_path,
                 target_layer=f"{tgt_layer.value}/{tgt_direction.value}",
                 target_context=tgt_ctx,
             )
@@ -326,14 +529,12 @@ class RuleEngineService:
 
     def _check_cross_context(
         self,
-        src_path: str,
         src_layer,
         src_direction,
         tgt_layer,
         tgt_direction,
         tgt_ctx: str,
-        tgt_path: str,
-    ) -> ViolationEvent | None:
+    ) -> _Verdict | None:
         """
         Rules 10-11: Cross-Context Outbound, Cross-Context Inbound
         """
@@ -343,14 +544,12 @@ class RuleEngineService:
         # Rule 10: Cross-Context Outbound
         # Only Ports/Driven (ACL) can initiate calls to other contexts
         if src_key not in CROSS_CONTEXT_OUTBOUND_ALLOWED:
-            return ViolationEvent(
+            return _Verdict(
                 rule_name="Cross-Context Outbound",
                 severity="error",
                 message=f"Layer '{src_layer.value}/{src_direction.value}' cannot initiate "
                 f"cross-context calls. Only Driven Ports (ACL) may access other contexts.",
-                source_module=src_path,
                 source_layer=f"{src_layer.value}/{src_direction.value}",
-                target_module=tgt_path,
                 target_layer=f"{tgt_layer.value}/{tgt_direction.value}",
                 target_context=tgt_ctx,
             )
@@ -358,14 +557,12 @@ class RuleEngineService:
         # Rule 11: Cross-Context Inbound
         # Can only call Ports/Driving of other contexts
         if tgt_key not in CROSS_CONTEXT_INBOUND_ALLOWED:
-            return ViolationEvent(
+            return _Verdict(
                 rule_name="Cross-Context Inbound",
                 severity="error",
                 message=f"Cannot import internal layer '{tgt_layer.value}/{tgt_direction.value}' "
                 f"of context '{tgt_ctx}'. Only Driving Ports (public API) are accessible.",
-                source_module=src_path,
                 source_layer=f"{src_layer.value}/{src_direction.value}",
-                target_module=tgt_path,
                 target_layer=f"{tgt_layer.value}/{tgt_direction.value}",
                 target_context=tgt_ctx,
             )
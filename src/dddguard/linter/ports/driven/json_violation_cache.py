@@ -0,0 +1,133 @@
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from dddguard.shared.domain import ConfigVo
+
+from ...app import IViolationCache
+from ...domain import NodeLintResultVo, ViolationEvent
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout changes; older files are ignored.
+_FORMAT_VERSION = 2
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class JsonViolationCache(IViolationCache):
+    """
+    Driven Adapter: Per-module lint results as one JSON file per linted root.
+
+    Files live in the project's cache directory (`project.cache_dir`). Without a
+    known project root the cache is inert: `load` returns nothing and `save` is
+    a no-op. Unreadable or outdated files count as empty.
+    """
+
+    config: ConfigVo
+
+    def load(self, root_path: Path) -> Mapping[str, NodeLintResultVo]:
+        file_path = self._file_for(root_path)
+        if file_path is None or not file_path.exists():
+            return {}
+
+        try:
+            data = json.loads(file_path.read_text(encoding="utf-8"))
+            if data.get("version") != _FORMAT_VERSION:
+                return {}
+            return {
+                path: self._result_from_list(path, entry) for path, entry in data["modules"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("Ignoring unreadable lint cache '%s': %s", file_path, e)
+            return {}
+
+    def save(self, root_path: Path, results: Mapping[str, NodeLintResultVo]) -> None:
+        file_path = self._file_for(root_path)
+        if file_path is None:
+            return
+
+        data = {
+            "version": _FORMAT_VERSION,
+            "root": str(root_path),
+            "modules": {path: self._result_to_list(result) for path, result in results.items()},
+        }
+        try:
+            self._ensure_cache_dir(file_path.parent)
+            # Write-then-rename: a concurrent lint never reads a partial file
+            tmp_path = file_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            tmp_path.replace(file_path)
+        except OSError as e:
+            logger.warning("Cannot write lint cache '%s': %s", file_path, e)
+
+    # --- Helpers ---
+
+    def _file_for(self, root_path: Path) -> Path | None:
+        cache_dir = self.config.project.absolute_cache_path
+        if cache_dir is None:
+            return None
+        key = hashlib.sha1(str(root_path.resolve()).encode("utf-8")).hexdigest()[:16]
+        return cache_dir / f"lint-{key}.json"
+
+    @staticmethod
+    def _ensure_cache_dir(cache_dir: Path) -> None:
+        if cache_dir.is_dir():
+            return
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Keep generated caches out of version control
+        (cache_dir / ".gitignore").write_text("*\n", encoding="utf-8")
+
+    @staticmethod
+    def _result_to_list(result: NodeLintResultVo) -> list[Any]:
+        # The source module is the entry's own path
+        return [
+            result.key,
+            [
+                [
+                    v.rule_name,
+                    v.severity,
+                    v.message,
+                    v.source_layer,
+                    v.source_context,
+                    v.target_module,
+                    v.target_layer,
+                    v.target_context,
+                ]
+                for v in result.violations
+            ],
+        ]
+
+    @staticmethod
+    def _result_from_list(path: str, entry: list[Any]) -> NodeLintResultVo:
+        key, violations = entry
+        return NodeLintResultVo(
+            key=key,
+            violations=tuple(
+                ViolationEvent(
+                    rule_name=rule_name,
+                    severity=severity,
+                    message=message,
+                    source_module=path,
+                    source_layer=source_layer,
+                    source_context=source_context,
+                    target_module=target_module,
+                    target_layer=target_layer,
+                    target_context=target_context,
+                )
+                for (
+                    rule_name,
+                    severity,
+                    message,
+                    source_layer,
+                    source_context,
+                    target_module,
+                    target_layer,
+                    target_context,
+                ) in violations
+            ),
+        )
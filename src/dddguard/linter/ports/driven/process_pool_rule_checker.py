@@ -0,0 +1,75 @@
+import multiprocessing
+from array import array
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from ...app import IParallelRuleChecker
+from ...domain import RULE_GROUPS, LintProjection, RuleEngineService, ViolationEvent
+
+# Shards per worker: edge-balanced shards still differ in cost (violations to build),
+# a few per worker lets idle workers pick up the rest.
+_SHARDS_PER_WORKER = 4
+
+# Per-process state, set once by `_init_worker` (the projection is shipped once per worker)
+_projection: LintProjection | None = None
+_rule_engine: RuleEngineService | None = None
+
+
+def _init_worker(projection: LintProjection) -> None:
+    global _projection, _rule_engine
+    _projection = projection
+    _rule_engine = RuleEngineService()
+
+
+def _check_shard(task: tuple[range, bool]) -> tuple[array, dict[str, int] | None]:
+    assert _projection is not None and _rule_engine is not None
+    shard, count_groups = task
+    group_counts = dict.fromkeys(RULE_GROUPS, 0) if count_groups else None
+    return _rule_engine.find_violating_edges(_projection, shard, group_counts), group_counts
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ProcessPoolRuleChecker(IParallelRuleChecker):
+    """
+    Driven Adapter: Checks projection shards on a pool of worker processes.
+
+    Each worker receives the compact projection once and keeps its own verdict
+    memo; shards are plain index ranges. Workers send back violating edges as
+    module id pairs, and only those become ViolationEvents (here, yielded in shard
+    order, so the output does not depend on which worker finished first).
+    Workers are started with 'forkserver' where available: forking a process
+    that runs threads (e.g. the daemon) can deadlock on locks held at fork time.
+    """
+
+    rule_engine: RuleEngineService
+
+    def check(
+        self,
+        projection: LintProjection,
+        workers: int,
+        group_counts: dict[str, int] | None = None,
+    ) -> Iterator[ViolationEvent]:
+        shards = projection.shards(workers * _SHARDS_PER_WORKER)
+        if not shards:
+            return
+
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else None)
+
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(shards)),
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(projection,),
+        ) as pool:
+            try:
+                tasks = [(shard, group_counts is not None) for shard in shards]
+                for edges, shard_counts in pool.map(_check_shard, tasks):
+                    if group_counts is not None and shard_counts is not None:
+                        for group, count in shard_counts.items():
+                            group_counts[group] += count
+                    yield from self.rule_engine.events_for(projection, edges)
+            finally:
+                # Stopped early (e.g. violation limit): drop shards not started yet
+                pool.shutdown(wait=True, cancel_futures=True)
@@ -1,10 +1,12 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 
-from dddguard.scanner.ports.driving import ScannerFacade
+from dddguard.scanner.ports.driving import ScannerFacade, ViolationRecordSchema
 from dddguard.shared.domain import CodeGraph
 
-from ...app import IScannerGateway
+from ...app import ChangedFilesGraph, IScannerGateway
+from ...domain import ViolationEvent
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -18,8 +20,47 @@ class ScannerAcl(IScannerGateway):
 
     scanner: ScannerFacade
 
-    def get_project_graph(self, root_path: Path) -> CodeGraph:
+    def get_project_graph(
+        self,
+        root_path: Path,
+        snapshot_path: Path | None = None,
+        focus_path: Path | None = None,
+    ) -> CodeGraph:
+        if snapshot_path is not None:
+            # Linting reads every node once: a read-only (possibly lazy) view is enough
+            return self.scanner.open_snapshot(snapshot_path)
+
         return self.scanner.scan_project(
             target_path=root_path,
             scan_all=False,
+            snapshot_path=snapshot_path,
+            focus_path=focus_path,
+        )
+
+    def get_changed_files(
+        self, file_paths: Iterable[Path], snapshot_path: Path | None = None
+    ) -> ChangedFilesGraph:
+        result = self.scanner.scan_files(list(file_paths), snapshot_path=snapshot_path)
+        return ChangedFilesGraph(
+            graph=result.graph,
+            changed=tuple(result.changed),
+            reclassified=tuple(result.reclassified),
+        )
+
+    def record_violations(
+        self, snapshot_path: Path, violations: tuple[ViolationEvent, ...]
+    ) -> bool:
+        return self.scanner.record_violations(
+            snapshot_path,
+            [
+                ViolationRecordSchema(
+                    rule_name=v.rule_name,
+                    severity=v.severity,
+                    source_path=v.source_module,
+                    target_path=v.target_module,
+                    target_context=v.target_context,
+                    message=v.message,
+                )
+                for v in violations
+            ],
         )
@@ -2,6 +2,8 @@ from .facade import LinterFacade, LinterPortError
 from .schemas import (
     FractalRulesSchema,
     LinterResponseSchema,
+    LintStatsSchema,
+    LintSummarySchema,
     RulesMatrixSchema,
     Severity,
     ViolationSchema,
@@ -9,6 +11,8 @@ from .schemas import (
 
 __all__ = [
     "FractalRulesSchema",
+    "LintStatsSchema",
+    "LintSummarySchema",
     "LinterFacade",
     "LinterPortError",
     "LinterResponseSchema",
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -13,10 +14,13 @@ from dddguard.shared.domain import (
 )
 from dddguard.shared.helpers.generics import GenericDrivingPortError
 
-from ...app import CheckProjectUseCase, LinterAppError
+from ...app import CheckFilesUseCase, CheckProjectUseCase, LinterAppError
+from ...domain import LinterReport, LintStatsVo, ViolationEvent
 from .schemas import (
     FractalRulesSchema,
     LinterResponseSchema,
+    LintStatsSchema,
+    LintSummarySchema,
     RulesMatrixSchema,
     ViolationSchema,
 )
@@ -39,50 +43,106 @@ class LinterFacade:
     """
 
     use_case: CheckProjectUseCase
+    files_use_case: CheckFilesUseCase
     config: ConfigVo
 
-    def lint_project(self, path: Path | None = None) -> LinterResponseSchema:
+    def lint_project(
+        self,
+        path: Path | None = None,
+        snapshot_path: Path | None = None,
+        focus_path: Path | None = None,
+        *,
+        collect_stats: bool = False,
+    ) -> LinterResponseSchema:
         """
         Executes the linting logic for a given path or the configured project root.
+        With `snapshot_path`, lints the graph saved by `dddguard snapshot` (no rescan).
+        With `focus_path` (a directory inside the root, e.g. one context), lints only the
+        modules under it; the rest of the project is resolved lazily, as far as they import.
+        With `collect_stats`, the response carries rule engine counters and timings.
         """
         # 1. Input Validation
-        target_path = path or self.config.project.absolute_source_path
+        target_path = self._target_path(path)
+        focus_path = self._focus_path(focus_path, target_path)
 
-        if target_path is None:
-            raise LinterPortError(
-                "No target path provided and no source_dir configured. "
-                "Please configure 'project.source_dir' in config.yaml."
+        try:
+            # 2. Application Invocation
+            report = self.use_case.execute(
+                target_path,
+                snapshot_path=snapshot_path,
+                linter_config=self.config.linter,
+                focus_path=focus_path,
+                collect_stats=collect_stats,
             )
+        except LinterAppError as e:
+            raise LinterPortError(e.message, original_error=e) from e
 
-        if not target_path.exists():
-            raise LinterPortError(f"Target path does not exist: {target_path}")
+        # 3. Output Mapping (Domain VO -> Presentation Schema)
+        return self._to_response(report)
+
+    def lint_project_stream(
+        self,
+        emit: Callable[[ViolationSchema], None],
+        path: Path | None = None,
+        snapshot_path: Path | None = None,
+        max_violations: int | None = None,
+        focus_path: Path | None = None,
+        *,
+        collect_stats: bool = False,
+    ) -> LintSummarySchema:
+        """
+        Like `lint_project`, but passes each violation to `emit` as soon as it is
+        found and keeps none of them: memory does not grow with the report.
+        Stops after `max_violations` violations.
+        """
+        target_path = self._target_path(path)
+        focus_path = self._focus_path(focus_path, target_path)
+        if max_violations is not None and max_violations < 0:
+            raise LinterPortError("max_violations must not be negative.")
+
+        def emit_schema(violation: ViolationEvent) -> None:
+            emit(self._to_schema(violation))
 
         try:
-            # 2. Application Invocation
-            report = self.use_case.execute(target_path)
-
-            # 3. Output Mapping (Domain VO -> Presentation Schema)
-            violations = tuple(
-                ViolationSchema(
-                    rule_name=v.rule_name,
-                    message=v.message,
-                    source=v.source_module,
-                    target=v.target_module,
-                    severity=v.severity,
-                    target_context=v.target_context,
-                )
-                for v in report.violations
+            summary = self.use_case.stream(
+                target_path,
+                emit_schema,
+                snapshot_path=snapshot_path,
+                linter_config=self.config.linter,
+                max_violations=max_violations,
+                focus_path=focus_path,
+                collect_stats=collect_stats,
             )
+        except LinterAppError as e:
+            raise LinterPortError(e.message, original_error=e) from e
 
-            return LinterResponseSchema(
-                total_scanned=report.total_files_scanned,
-                violations=violations,
-                success=len(violations) == 0,
-            )
+        return LintSummarySchema(
+            total_scanned=summary.total_files_scanned,
+            violation_count=summary.violation_count,
+            by_rule=summary.by_rule,
+            by_severity=summary.by_severity,
+            truncated=summary.truncated,
+            cache_hits=summary.cache_hits,
+            cache_misses=summary.cache_misses,
+            stats=self._to_stats(summary.stats),
+        )
 
+    def lint_files(
+        self, file_paths: list[Path], snapshot_path: Path | None = None
+    ) -> LinterResponseSchema:
+        """
+        Lints only `file_paths` (e.g. the files staged for a commit): their imports,
+        plus imports into those whose classification changed.
+        The project index is the snapshot at `snapshot_path`, or the cached project graph.
+        Files the scanner would not ingest (ignored, non-Python, outside source_dir) are skipped.
+        """
+        try:
+            report = self.files_use_case.execute(file_paths, snapshot_path=snapshot_path)
         except LinterAppError as e:
             raise LinterPortError(e.message, original_error=e) from e
 
+        return self._to_response(report)
+
     def get_rules_matrix(self) -> RulesMatrixSchema:
         """
         Exposes all 13 Domain Rules to the Adapter (for visualization purposes).
@@ -100,3 +160,67 @@ class LinterFacade:
             outbound_allowed=CROSS_CONTEXT_OUTBOUND_ALLOWED,
             inbound_allowed=CROSS_CONTEXT_INBOUND_ALLOWED,
         )
+
+    def _target_path(self, path: Path | None) -> Path:
+        target_path = path or self.config.project.absolute_source_path
+
+        if target_path is None:
+            raise LinterPortError(
+                "No target path provided and no source_dir configured. "
+                "Please configure 'project.source_dir' in config.yaml."
+            )
+
+        if not target_path.exists():
+            raise LinterPortError(f"Target path does not exist: {target_path}")
+
+        return target_path
+
+    @staticmethod
+    def _focus_path(focus_path: Path | None, target_path: Path) -> Path | None:
+        if focus_path is None:
+            return None
+        if not focus_path.exists():
+            raise LinterPortError(f"Focus path does not exist: {focus_path}")
+        focus_path = focus_path.resolve()
+        # Modules outside the root are never scanned: the focus would silently lint nothing
+        root = target_path.resolve()
+        if not focus_path.is_relative_to(root):
+            raise LinterPortError(f"Focus path {focus_path} is outside the lint root {root}.")
+        return focus_path
+
+    @staticmethod
+    def _to_schema(violation: ViolationEvent) -> ViolationSchema:
+        return ViolationSchema(
+            rule_name=violation.rule_name,
+            message=violation.message,
+            source=violation.source_module,
+            target=violation.target_module,
+            severity=violation.severity,
+            source_context=violation.source_context,
+            target_context=violation.target_context,
+            source_file=violation.source_file,
+        )
+
+    @classmethod
+    def _to_response(cls, report: LinterReport) -> LinterResponseSchema:
+        violations = tuple(cls._to_schema(v) for v in report.violations)
+
+        return LinterResponseSchema(
+            total_scanned=report.total_files_scanned,
+            violations=violations,
+            success=len(violations) == 0,
+            cache_hits=report.cache_hits,
+            cache_misses=report.cache_misses,
+            stats=cls._to_stats(report.stats),
+        )
+
+    @staticmethod
+    def _to_stats(stats: LintStatsVo | None) -> LintStatsSchema | None:
+        if stats is None:
+            return None
+        return LintStatsSchema(
+            edges_by_group=stats.edges_by_group,
+            violations_by_rule=stats.violations_by_rule,
+            scan_seconds=stats.scan_seconds,
+            check_seconds=stats.check_seconds,
+        )
@@ -22,7 +22,31 @@ class ViolationSchema:
     source: str
     target: str
     severity: Severity
+    source_context: str | None = None
     target_context: str | None = None
+    # Relative to the linted source root (POSIX), if known
+    source_file: str | None = None
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class LintStatsSchema:
+    """
+    Driving Schema: Instrumentation of a linting run (`lint --stats`).
+    """
+
+    # Imports checked, by deciding rule group
+    edges_by_group: dict[str, int] = field(default_factory=dict)
+    violations_by_rule: dict[str, int] = field(default_factory=dict)
+    scan_seconds: float = 0.0
+    check_seconds: float = 0.0
+
+    @property
+    def edges_evaluated(self) -> int:
+        return sum(self.edges_by_group.values())
+
+    @property
+    def bypass_hits(self) -> int:
+        return self.edges_by_group.get("bypass", 0)
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -34,6 +58,33 @@ class LinterResponseSchema:
     total_scanned: int
     violations: tuple[ViolationSchema, ...] = field(default_factory=tuple)
     success: bool = True
+    # Modules whose results were reused from / missed the lint cache
+    cache_hits: int = 0
+    cache_misses: int = 0
+    # Only with `collect_stats`
+    stats: LintStatsSchema | None = None
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class LintSummarySchema:
+    """
+    Driving Schema: Counts of a streamed linting run (violations were emitted one by one).
+    """
+
+    total_scanned: int
+    violation_count: int = 0
+    by_rule: dict[str, int] = field(default_factory=dict)
+    by_severity: dict[str, int] = field(default_factory=dict)
+    # Stopped at --max-violations: more violations exist than were emitted
+    truncated: bool = False
+    cache_hits: int = 0
+    cache_misses: int = 0
+    # Only with `collect_stats`
+    stats: LintStatsSchema | None = None
+
+    @property
+    def success(self) -> bool:
+        return self.violation_count == 0
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
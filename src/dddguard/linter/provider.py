@@ -3,9 +3,16 @@ from dataclasses import dataclass
 import typer
 from dishka import Provider, Scope, provide
 
-from .adapters.driving import cli
-from .app import CheckProjectUseCase, IScannerGateway
-from .domain import RuleEngineService
+from .app import (
+    CheckFilesUseCase,
+    CheckProjectUseCase,
+    IParallelRuleChecker,
+    IScannerGateway,
+    IViolationCache,
+)
+from .domain import CycleRuleService, RuleEngineService
+from .ports.driven.json_violation_cache import JsonViolationCache
+from .ports.driven.process_pool_rule_checker import ProcessPoolRuleChecker
 from .ports.driven.scanner_acl import ScannerAcl
 from .ports.driving import LinterFacade
 
@@ -20,20 +27,29 @@ class LinterContainer:
 
     def register_commands(self, app: typer.Typer) -> None:
         """
-        Delegates command registration to the driving adapter logic.
+        Delegates command registration to the driving adapter logic
+        (imported here, so it loads only for commands of this context).
         """
+        from .adapters.driving import cli
+
         cli.register_commands(app, self.facade)
 
 
 class LinterProvider(Provider):
     scope = Scope.APP
     # ACL Wiring: Bind Adapter to Interface.
-    scanner_gateway = provide(ScannerAcl, provides=IScannerGateway)
+    # (Session scope: wraps the config-bound ScannerFacade)
+    scanner_gateway = provide(ScannerAcl, provides=IScannerGateway, scope=Scope.SESSION)
+    parallel_checker = provide(ProcessPoolRuleChecker, provides=IParallelRuleChecker)
+    # (Session scope: the cache location comes from the config)
+    violation_cache = provide(JsonViolationCache, provides=IViolationCache, scope=Scope.SESSION)
     # Domain Service
     rule_engine = provide(RuleEngineService)
+    cycle_rule = provide(CycleRuleService)
     # Application Layer
-    check_use_case = provide(CheckProjectUseCase)
+    check_use_case = provide(CheckProjectUseCase, scope=Scope.SESSION)
+    check_files_use_case = provide(CheckFilesUseCase, scope=Scope.SESSION)
     # Driving Port
-    facade = provide(LinterFacade)
+    facade = provide(LinterFacade, scope=Scope.SESSION)
     # Context Root
-    container = provide(LinterContainer)
+    container = provide(LinterContainer, scope=Scope.SESSION)
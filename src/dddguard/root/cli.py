@@ -3,30 +3,8 @@ import traceback
 from pathlib import Path
 
 import typer
+from dishka import Container
 
-# --- UI IMPORTS ---
-from InquirerPy.base.control import Choice
-from InquirerPy.separator import Separator
-
-from dddguard.linter.adapters.driving import (
-    run_lint_directory_flow,
-    run_lint_project_flow,
-)
-from dddguard.linter.provider import LinterContainer
-from dddguard.scaffolder.provider import ScaffolderContainer
-
-# --- Import FLOWS ---
-from dddguard.scanner.adapters.driving import (
-    get_last_scan_options,
-    run_classify_directory_flow,
-    run_classify_project_flow,
-    run_repeat_last_scan_flow,
-    run_scan_directory_flow,
-    run_scan_project_flow,
-)
-
-# --- Dependency Injection ---
-from dddguard.scanner.provider import ScannerContainer
 from dddguard.shared.adapters.driven.yaml_config_loader import YamlConfigLoader
 
 # Shared Infrastructure
@@ -34,13 +12,9 @@ from dddguard.shared.adapters.driving import (
     ROOT_THEME,
     tui,
 )
-from dddguard.visualizer.adapters.driving import (
-    run_viz_directory_flow,
-    run_viz_project_flow,
-)
-from dddguard.visualizer.provider import VisualizerContainer
 
-from .composition import build_app_container
+# --- Dependency Injection --- (context providers are imported per command)
+from .composition import build_app_container, open_session
 
 app = typer.Typer(
     help="DDDGuard: Architecture Guard & Linter & Scanner for DDD projects.",
@@ -49,6 +23,35 @@ app = typer.Typer(
 )
 
 
+# Top-level command -> context that registers it. `main` registers (and so imports
+# the driving adapter of) only the context owning the invoked command.
+COMMAND_CONTEXTS: dict[str, str] = {
+    "scan": "scanner",
+    "scandir": "scanner",
+    "classify": "scanner",
+    "classifydir": "scanner",
+    "snapshot": "scanner",
+    "query": "scanner",
+    "cycles": "scanner",
+    "init": "scaffolder",
+    "lint": "linter",
+    "lintdir": "linter",
+    "draw": "visualizer",
+    "drawdir": "visualizer",
+    "daemon": "daemon",
+}
+
+# Contexts whose providers a command group needs (None: all of them)
+_WIRED_CONTEXTS: dict[str | None, tuple[str, ...] | None] = {
+    "scanner": ("scanner",),
+    "scaffolder": ("scaffolder",),
+    "linter": ("linter",),
+    "visualizer": ("visualizer",),
+    "daemon": ("linter",),  # Serves scanner + linter (linter wires the scanner too)
+    None: None,
+}
+
+
 class ReloadAppSignal(Exception):
     pass
 
@@ -56,14 +59,16 @@ class ReloadAppSignal(Exception):
 @app.callback()
 def main_callback(ctx: typer.Context) -> None:
     if ctx.invoked_subcommand is None:
-        _interactive_menu_loop()
+        _interactive_menu_loop(ctx.obj["app_container"] if ctx.obj else build_app_container())
 
 
-def _interactive_menu_loop() -> None:
+def _interactive_menu_loop(app_container: Container) -> None:
     while True:
         try:
-            container = build_app_container()
-            _interactive_menu(container)
+            # One session per config generation: a reload rebuilds only config-bound
+            # components; stateless services and caches of the APP container are reused
+            with open_session(app_container) as container:
+                _interactive_menu(container)
             break
         except ReloadAppSignal:
             tui.console.print("[yellow]↻ Reloading Configuration...[/]", style="dim")
@@ -79,6 +84,32 @@ def _interactive_menu_loop() -> None:
 
 
 def _interactive_menu(container) -> None:
+    # --- UI IMPORTS --- (deferred: only the interactive menu needs the prompt stack)
+    from InquirerPy.base.control import Choice
+    from InquirerPy.separator import Separator
+
+    # --- Import FLOWS ---
+    from dddguard.linter.adapters.driving import (
+        run_lint_directory_flow,
+        run_lint_project_flow,
+    )
+    from dddguard.linter.provider import LinterContainer
+    from dddguard.scaffolder.provider import ScaffolderContainer
+    from dddguard.scanner.adapters.driving import (
+        get_last_scan_options,
+        run_classify_directory_flow,
+        run_classify_project_flow,
+        run_repeat_last_scan_flow,
+        run_scan_directory_flow,
+        run_scan_project_flow,
+    )
+    from dddguard.scanner.provider import ScannerContainer
+    from dddguard.visualizer.adapters.driving import (
+        run_viz_directory_flow,
+        run_viz_project_flow,
+    )
+    from dddguard.visualizer.provider import VisualizerContainer
+
     # Retrieve facades
     scanner_ctrl = container.get(ScannerContainer).facade
     scaffolder_ctrl = container.get(ScaffolderContainer).facade
@@ -186,6 +217,7 @@ def _interactive_menu(container) -> None:
         tui.console.print()
 
         # --- ACTION DISPATCH (wrapped in error_boundary) ---
+        reload_requested = False
         with tui.error_boundary():
             if action == "REPEAT_SCAN":
                 run_repeat_last_scan_flow(scanner_ctrl)
@@ -217,24 +249,63 @@ def _interactive_menu(container) -> None:
                 if response.success:
                     tui.success(response.message, {"Config": str(response.config_path)})
                     tui.console.print("\n[dim]Reloading menu...[/]")
+                    reload_requested = True
                 else:
                     tui.error(response.message, response.error_details)
                     tui.pause()
 
+        if reload_requested:
+            # New config: facades are rebuilt in a fresh session
+            raise ReloadAppSignal
 
-def main() -> None:
-    try:
-        container = build_app_container()
+
+def requested_context(argv: list[str]) -> str | None:
+    """
+    Context owning the command in `argv` (arguments after the program name).
+    None means "register everything": no command (menu), root --help, or an unknown name.
+    """
+    command = next((arg for arg in argv if not arg.startswith("-")), None)
+    return COMMAND_CONTEXTS.get(command) if command else None
+
+
+def _register_commands(container: Container, context: str | None) -> None:
+    # Container classes live in the provider modules: import only the wired ones
+    def wanted(name: str) -> bool:
+        return context is None or context == name
+
+    if wanted("scanner") or wanted("linter") or wanted("daemon"):
+        from .daemon import connect_facade, daemon_app
+
+    if wanted("scanner"):
+        from dddguard.scanner.provider import ScannerContainer
+
+        # Served commands go through the project's daemon when one is running
         scanner = container.get(ScannerContainer)
-        scanner.register_commands(app)
-        scaffolder = container.get(ScaffolderContainer)
-        scaffolder.register_commands(app)
+        ScannerContainer(facade=connect_facade(scanner.facade, "scanner")).register_commands(app)
+    if wanted("scaffolder"):
+        from dddguard.scaffolder.provider import ScaffolderContainer
+
+        container.get(ScaffolderContainer).register_commands(app)
+    if wanted("linter"):
+        from dddguard.linter.provider import LinterContainer
+
         linter = container.get(LinterContainer)
-        linter.register_commands(app)
-        visualizer = container.get(VisualizerContainer)
-        visualizer.register_commands(app)
+        LinterContainer(facade=connect_facade(linter.facade, "linter")).register_commands(app)
+    if wanted("visualizer"):
+        from dddguard.visualizer.provider import VisualizerContainer
+
+        container.get(VisualizerContainer).register_commands(app)
+    if wanted("daemon"):
+        app.add_typer(daemon_app, name="daemon")
+
 
-        app(obj={"container": container})
+def main() -> None:
+    try:
+        context = requested_context(sys.argv[1:])
+        app_container = build_app_container(_WIRED_CONTEXTS[context])
+        with open_session(app_container) as container:
+            _register_commands(container, context)
+            app(obj={"app_container": app_container, "container": container})
 
     except Exception:
         tui.console.print("[bold red]Fatal Startup Error[/bold red]")
@@ -1,41 +1,54 @@
-from dataclasses import dataclass
+from collections.abc import Iterable
+from importlib import import_module
 
-from dishka import Container, make_container
+from dishka import Container, Provider, Scope, make_container
 
-from dddguard.linter.provider import LinterContainer, LinterProvider
-from dddguard.scaffolder.provider import ScaffolderContainer, ScaffolderProvider
-from dddguard.scanner.classification.provider import ClassificationProvider
-from dddguard.scanner.detection.provider import DetectionProvider
-from dddguard.scanner.provider import ScannerContainer, ScannerProvider
-from dddguard.shared.provider import SharedProvider
-from dddguard.visualizer.provider import VisualizerContainer, VisualizerProvider
+# Provider classes by key, imported on demand: a command only loads the contexts it wires
+_PROVIDERS: dict[str, str] = {
+    "shared": "dddguard.shared.provider:SharedProvider",
+    "scanner": "dddguard.scanner.provider:ScannerProvider",
+    "detection": "dddguard.scanner.detection.provider:DetectionProvider",
+    "classification": "dddguard.scanner.classification.provider:ClassificationProvider",
+    "scaffolder": "dddguard.scaffolder.provider:ScaffolderProvider",
+    "linter": "dddguard.linter.provider:LinterProvider",
+    "visualizer": "dddguard.visualizer.provider:VisualizerProvider",
+}
 
+# Scanner Macro Context & Sub-Contexts (DetectionFacade, ClassificationFacade)
+_SCANNER = ("shared", "scanner", "detection", "classification")
 
-@dataclass(frozen=True, kw_only=True)
-class ApplicationContainer:
-    """
-    Root Container Facade.
+# Providers each context needs: its own plus those of the contexts it reads through ACLs
+CONTEXT_PROVIDERS: dict[str, tuple[str, ...]] = {
+    "scanner": _SCANNER,
+    "linter": (*_SCANNER, "linter"),
+    "visualizer": (*_SCANNER, "visualizer"),
+    "scaffolder": ("shared", "scaffolder"),
+}
+
+
+def build_app_container(contexts: Iterable[str] | None = None) -> Container:
     """
+    Initializes Dishka DI Container with the providers of `contexts` (all if None).
 
-    scanner: ScannerContainer
-    scaffolder: ScaffolderContainer
-    linter: LinterContainer
-    visualizer: VisualizerContainer
+    The container itself is APP scoped: stateless services, gateways and caches.
+    Everything bound to the loaded configuration (facades, context containers)
+    lives in SESSION scope: see `open_session`.
+    """
+    wanted = CONTEXT_PROVIDERS if contexts is None else contexts
+    keys = dict.fromkeys(key for context in wanted for key in CONTEXT_PROVIDERS[context])
+    return make_container(*(_load_provider(key) for key in keys))
 
 
-def build_app_container() -> Container:
+def open_session(app_container: Container) -> Container:
     """
-    Initializes Dishka DI Container with all context providers.
+    Child container for one configuration generation (close it when done).
+    Reloading the config = closing the session and opening a new one: APP-scoped
+    services (and their warm caches) are reused, only SESSION ones are rebuilt.
     """
-    return make_container(
-        # Shared
-        SharedProvider(),
-        # Scanner Macro Context & Sub-Contexts
-        ScannerProvider(),
-        DetectionProvider(),  # Required to build DetectionFacade
-        ClassificationProvider(),  # Required to build ClassificationFacade
-        # Other Contexts
-        ScaffolderProvider(),
-        LinterProvider(),
-        VisualizerProvider(),
-    )
+    return app_container(scope=Scope.SESSION)
+
+
+def _load_provider(key: str) -> Provider:
+    module_name, class_name = _PROVIDERS[key].split(":")
+    provider: Provider = getattr(import_module(module_name), class_name)()
+    return provider
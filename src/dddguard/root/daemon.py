@@ -0,0 +1,198 @@
+import contextlib
+import os
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import typer
+from dishka import Container
+
+from dddguard.linter.provider import LinterContainer
+from dddguard.scanner.provider import ScannerContainer
+from dddguard.shared.adapters.driven.yaml_config_loader import YamlConfigLoader
+
+# Client and server load on first attribute access (lazy package exports)
+from dddguard.shared.adapters.driving import daemon as daemon_rpc
+from dddguard.shared.adapters.driving import tui
+from dddguard.shared.domain import ConfigVo
+
+from .composition import open_session
+
+# Facade methods served by the daemon, per namespace. Everything else runs locally.
+DAEMON_METHODS: dict[str, frozenset[str]] = {
+    "linter": frozenset({"lint_project", "lint_files"}),
+    "scanner": frozenset({"scan_project", "query", "analyze_cycles"}),
+}
+
+# Set to any value to never talk to a running daemon
+NO_DAEMON_ENV = "DDDGUARD_NO_DAEMON"
+
+_START_TIMEOUT_SECONDS = 30.0
+
+daemon_app = typer.Typer(
+    help="Resident process that keeps the project graph warm between commands.",
+    no_args_is_help=True,
+)
+
+
+def project_root_of(config: ConfigVo) -> Path:
+    return (config.project.project_root or Path.cwd()).resolve()
+
+
+def connect_facade(facade: Any, namespace: str) -> Any:
+    """
+    Proxy of `facade` whose served methods run in the project's daemon, if one is running.
+    Returns `facade` itself otherwise (or when disabled via DDDGUARD_NO_DAEMON).
+    """
+    if os.environ.get(NO_DAEMON_ENV) or not daemon_rpc.daemon_supported():
+        return facade
+
+    socket_path = daemon_rpc.socket_path_for(project_root_of(facade.config))
+    # Only a socket of this user, in its private directory, may answer for the project
+    if not daemon_rpc.is_trusted_socket(socket_path):
+        return facade
+    client = daemon_rpc.DaemonClient(socket_path)
+    if client.ping() is None:
+        return facade
+
+    return daemon_rpc.RemoteFacade(facade, client, namespace, DAEMON_METHODS[namespace])
+
+
+def _session_services(app_container: Container) -> Callable[[], dict[str, object]]:
+    """
+    Service factory for the daemon: each call (start-up, config change) closes the
+    previous session and opens a new one, keeping APP-scoped services and their caches.
+    """
+    sessions: list[Container] = []
+
+    def build() -> dict[str, object]:
+        if sessions:
+            sessions.pop().close()
+        session = open_session(app_container)
+        sessions.append(session)
+        return {
+            "scanner": session.get(ScannerContainer).facade,
+            "linter": session.get(LinterContainer).facade,
+        }
+
+    return build
+
+
+def _config_stamp() -> tuple[str, int] | None:
+    """Changes whenever the discovered config file is created, edited or removed."""
+    config_path = YamlConfigLoader()._discover_config_file()
+    if config_path is None:
+        return None
+    try:
+        return str(config_path), config_path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _current_socket(ctx: typer.Context) -> Path:
+    if not daemon_rpc.daemon_supported():
+        tui.error("Daemon mode needs Unix domain sockets (not available on this platform).")
+        raise typer.Exit(code=1)
+    config = ctx.obj["container"].get(ConfigVo) if ctx.obj else YamlConfigLoader().load()
+    return daemon_rpc.socket_path_for(project_root_of(config))
+
+
+@daemon_app.command(name="start")
+def start_daemon(
+    ctx: typer.Context,
+    detach: bool = typer.Option(
+        False, "--detach", "-d", help="Start in the background and return once it is ready."
+    ),
+) -> None:
+    """
+    Serve scan, lint, query and cycles for this project from a warm graph.
+    """
+    socket_path = _current_socket(ctx)
+    if daemon_rpc.is_socket_alive(socket_path):
+        tui.error("A daemon is already running for this project.", {"Socket": str(socket_path)})
+        raise typer.Exit(code=1)
+
+    try:
+        daemon_rpc.ensure_private_dir(socket_path.parent)
+    except OSError as e:
+        tui.error("Cannot use the daemon socket directory.", {"Reason": str(e)})
+        raise typer.Exit(code=1) from e
+
+    if detach:
+        _spawn_detached(socket_path)
+        return
+
+    server = daemon_rpc.DaemonServer(
+        socket_path=socket_path,
+        build_services=_session_services(ctx.obj["app_container"]),
+        methods=DAEMON_METHODS,
+        reload_stamp=_config_stamp,
+    )
+    tui.success("Daemon listening", {"Socket": str(socket_path), "PID": str(os.getpid())})
+    with contextlib.suppress(KeyboardInterrupt):
+        server.serve_forever()
+
+
+def _spawn_detached(socket_path: Path) -> None:
+    subprocess.Popen(
+        [sys.executable, "-m", "dddguard.root.cli", "daemon", "start"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    client = daemon_rpc.DaemonClient(socket_path)
+    deadline = time.monotonic() + _START_TIMEOUT_SECONDS
+    status = None
+    with tui.spinner("Starting daemon..."):
+        while status is None and time.monotonic() < deadline:
+            time.sleep(0.05)
+            status = client.ping()
+    client.close()
+
+    if status is None:
+        tui.error("Daemon did not come up.", {"Socket": str(socket_path)})
+        raise typer.Exit(code=1)
+    tui.success("Daemon started", {"Socket": str(socket_path), "PID": str(status["pid"])})
+
+
+@daemon_app.command(name="stop")
+def stop_daemon(ctx: typer.Context) -> None:
+    """
+    Stop the daemon of this project.
+    """
+    socket_path = _current_socket(ctx)
+    client = daemon_rpc.DaemonClient(socket_path)
+    if client.ping() is None:
+        tui.console.print("[dim]No daemon running for this project.[/]")
+        return
+    client.call("daemon.shutdown")
+    client.close()
+    tui.success("Daemon stopped", {"Socket": str(socket_path)})
+
+
+@daemon_app.command(name="status")
+def daemon_status(ctx: typer.Context) -> None:
+    """
+    Show whether a daemon serves this project.
+    """
+    socket_path = _current_socket(ctx)
+    client = daemon_rpc.DaemonClient(socket_path)
+    status = client.ping()
+    client.close()
+    if status is None:
+        tui.console.print("[dim]No daemon running for this project.[/]")
+        raise typer.Exit(code=1)
+    tui.success(
+        "Daemon running",
+        {
+            "Socket": str(socket_path),
+            "PID": str(status["pid"]),
+            "Uptime": f"{status['uptime_seconds']}s",
+            "Requests": str(status["requests"]),
+        },
+    )
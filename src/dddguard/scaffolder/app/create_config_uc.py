@@ -1,8 +1,6 @@
 from dataclasses import dataclass
 from pathlib import Path
 
-from dddguard.shared.assets.default_config import DEFAULT_CONFIG_TEMPLATE
-
 from ..domain import ScaffolderFileVo
 from .errors import ScaffolderAppError
 from .interfaces import IFileSystemGateway
@@ -21,6 +19,9 @@ class CreateConfigUseCase:
         Creates the config file at the specified path.
         Injects the current working directory as root_dir in the template.
         """
+        # Template asset loaded on use: `init` is the only command that needs it
+        from dddguard.shared.assets.default_config import DEFAULT_CONFIG_TEMPLATE
+
         try:
             cwd_str = Path.cwd().as_posix()
 
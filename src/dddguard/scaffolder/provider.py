@@ -4,7 +4,6 @@ import typer
 from dishka import Provider, Scope, provide
 
 from .adapters.driven.disk_file_system_gateway import DiskFileSystemGateway
-from .adapters.driving import cli as driving_adapter
 
 # Dependencies for wiring
 from .app import (
@@ -25,8 +24,11 @@ class ScaffolderContainer:
 
     def register_commands(self, app: typer.Typer) -> None:
         """
-        Delegates command registration to the driving adapter logic.
+        Delegates command registration to the driving adapter logic
+        (imported here, so it loads only for commands of this context).
         """
+        from .adapters.driving import cli as driving_adapter
+
         driving_adapter.register_commands(app, self.facade)
 
 
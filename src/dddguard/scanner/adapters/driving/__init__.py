@@ -1,3 +1,5 @@
+from typing import Any
+
 from .console.cli import (
     register_commands,
     run_classify_directory_flow,
@@ -8,7 +10,6 @@ from .console.cli import (
 )
 from .console.scan_options import ScanOptions
 from .console.session_state import get_last_scan_options
-from .console.wizard import ScanSettingsWizard
 
 __all__ = [
     "ScanOptions",
@@ -21,3 +22,12 @@ __all__ = [
     "run_scan_directory_flow",
     "run_scan_project_flow",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # The wizard pulls in InquirerPy/prompt_toolkit: load it on first access only
+    if name == "ScanSettingsWizard":
+        from .console.wizard import ScanSettingsWizard
+
+        return ScanSettingsWizard
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,7 @@
 import json
+import sys
 from dataclasses import dataclass, field
+from enum import Enum
 from pathlib import Path
 from typing import Any
 
@@ -19,15 +21,21 @@ from dddguard.shared.domain import (
     DirectionEnum,
     LayerEnum,
     MatchMethod,
-    NodeStatus,
 )
 
-from ....ports.driving import ScannerFacade
+from ....ports.driving import (
+    CycleReportSchema,
+    ExpansionDirection,
+    ImportCycleSchema,
+    InventorySchema,
+    QueryResultSchema,
+    ScannerFacade,
+)
 
 # Local Adapters
+from .scan_exporter import export_scan
 from .scan_options import ScanOptions
 from .session_state import get_last_scan_options, set_last_scan_options
-from .wizard import ScanSettingsWizard
 
 
 @dataclass
@@ -40,28 +48,145 @@ class RenderNode:
     children: list["RenderNode"] = field(default_factory=list)
 
 
+class QueryOutputFormat(str, Enum):
+    TABLE = "table"
+    NDJSON = "ndjson"
+
+
 def register_commands(app: typer.Typer, facade: ScannerFacade):
     @app.command(name="scandir")
     def scandir(
         depth: int = typer.Option(0, help="Recursively include imported modules up to depth."),
+        direction: ExpansionDirection = typer.Option(
+            ExpansionDirection.DOWNSTREAM,
+            "--direction",
+            help="Expand along imports (downstream), importers (upstream) or both.",
+        ),
     ):
         """Interactive directory scanner."""
-        run_scan_directory_flow(facade, depth)
+        run_scan_directory_flow(facade, depth, expansion_direction=direction)
+
+    def complete_context(incomplete: str) -> list[str]:
+        inventory = _safe_inventory(facade)
+        names = [c.context_name for c in inventory.contexts] if inventory else []
+        return [n for n in names if n.startswith(incomplete)]
+
+    def complete_layer(incomplete: str) -> list[str]:
+        inventory = _safe_inventory(facade)
+        layers = inventory.layers if inventory else [layer.value for layer in LayerEnum]
+        return [layer for layer in layers if layer.startswith(incomplete)]
 
     @app.command(name="scan")
     def scan(
+        *,
         depth: int = typer.Option(0, help="Recursively include imported modules."),
+        direction: ExpansionDirection = typer.Option(
+            ExpansionDirection.DOWNSTREAM,
+            "--direction",
+            help="Expand along imports (downstream), importers (upstream) or both.",
+        ),
         # [CHANGED] Removed --shared and --root CLI flags
         assets: bool = typer.Option(True, help="Include Asset/Resource entities."),
         file_tree_only: bool = typer.Option(False, "--file-tree-only", help="Mask content."),
+        context: list[str] | None = typer.Option(
+            None,
+            "--context",
+            help="Preselect a Bounded Context (repeatable).",
+            autocompletion=complete_context,
+        ),
+        layer: list[str] | None = typer.Option(
+            None,
+            "--layer",
+            help="Preselect a Layer (repeatable).",
+            autocompletion=complete_layer,
+        ),
+        from_snapshot: Path | None = typer.Option(
+            None,
+            "--from-snapshot",
+            help="Reuse a graph saved by 'dddguard snapshot' (skips detection/classification).",
+        ),
+        output: Path = typer.Option(
+            Path("project_tree.json"),
+            "--output",
+            "-o",
+            help="Result file: .json (tree) or .ndjson/.jsonl (one node/edge per line); "
+            "add .gz to compress.",
+        ),
     ):
         """Project scanner (uses config)."""
-        run_scan_project_flow(facade, depth, assets, file_tree_only)
+        run_scan_project_flow(
+            facade,
+            depth,
+            assets,
+            file_tree_only,
+            contexts=context or None,
+            layers=layer or None,
+            expansion_direction=direction,
+            snapshot_path=from_snapshot,
+            output_path=output,
+        )
 
     @app.command(name="classify")
-    def classify():
+    def classify(
+        from_snapshot: Path | None = typer.Option(
+            None,
+            "--from-snapshot",
+            help="Reuse a graph saved by 'dddguard snapshot' (skips detection/classification).",
+        ),
+    ):
         """🔍 Visualize project architecture tree."""
-        run_classify_project_flow(facade)
+        run_classify_project_flow(facade, snapshot_path=from_snapshot)
+
+    @app.command(name="snapshot")
+    def snapshot(
+        output: Path = typer.Argument(
+            Path("dddguard.snapshot"),
+            help="Snapshot file to write (overwritten). A .db/.sqlite suffix writes a "
+            "queryable SQLite database instead of the compact binary format.",
+        ),
+        scan_all: bool = typer.Option(False, "--all", help="Include non-Python files."),
+        content: bool = typer.Option(False, "--content", help="Also store file contents."),
+    ):
+        """💾 Save the classified project graph for reuse (--from-snapshot)."""
+        run_snapshot_flow(facade, output, scan_all=scan_all, include_content=content)
+
+    @app.command(name="query")
+    def query(
+        text: str = typer.Argument(
+            ...,
+            help='Query, e.g. "nodes where context = billing and imports(layer = adapters)".',
+        ),
+        output_format: QueryOutputFormat = typer.Option(
+            QueryOutputFormat.TABLE,
+            "--format",
+            "-f",
+            help="Print a table or one JSON object per row (ndjson).",
+        ),
+        from_snapshot: Path | None = typer.Option(
+            None,
+            "--from-snapshot",
+            help="Query a graph saved by 'dddguard snapshot' instead of rescanning.",
+        ),
+    ):
+        """🔎 Query the dependency graph (nodes, edges, paths)."""
+        run_query_flow(facade, text, output_format=output_format, snapshot_path=from_snapshot)
+
+    @app.command(name="cycles")
+    def cycles(
+        output_format: QueryOutputFormat = typer.Option(
+            QueryOutputFormat.TABLE,
+            "--format",
+            "-f",
+            help="Print tables or one JSON object per cycle (ndjson).",
+        ),
+        from_snapshot: Path | None = typer.Option(
+            None,
+            "--from-snapshot",
+            help="Analyze a graph saved by 'dddguard snapshot' instead of rescanning.",
+        ),
+    ):
+        """🔁 Report import cycles between modules and between contexts."""
+        run_cycles_flow(facade, output_format=output_format, snapshot_path=from_snapshot)
 
     @app.command(name="classifydir")
     def classifydir():
@@ -72,16 +197,24 @@ def register_commands(app: typer.Typer, facade: ScannerFacade):
 # --- INTERNAL FLOWS (Adapter Logic) ---
 
 
-def run_scan_directory_flow(facade: ScannerFacade, import_depth: int = 0):
+def run_scan_directory_flow(
+    facade: ScannerFacade,
+    import_depth: int = 0,
+    *,
+    expansion_direction: ExpansionDirection = ExpansionDirection.DOWNSTREAM,
+):
     tui.set_theme(SCANNER_THEME)
     target_path = tui.path(message="Select directory to scan", default=".")
 
     if not target_path:
         return
 
-    options = ScanOptions(target_path=target_path, import_depth=import_depth)
-    wizard = ScanSettingsWizard(options, facade)
-    if wizard.run():
+    options = ScanOptions(
+        target_path=target_path,
+        import_depth=import_depth,
+        expansion_direction=expansion_direction,
+    )
+    if _run_wizard(options, facade):
         _execute_scan(facade, options)
 
 
@@ -90,6 +223,12 @@ def run_scan_project_flow(
     import_depth: int = 0,
     include_assets: bool = True,
     file_tree_only: bool = False,
+    *,
+    contexts: list[str] | None = None,
+    layers: list[str] | None = None,
+    expansion_direction: ExpansionDirection = ExpansionDirection.DOWNSTREAM,
+    snapshot_path: Path | None = None,
+    output_path: Path = Path("project_tree.json"),
 ):
     tui.set_theme(SCANNER_THEME)
     has_config = facade.config.project.absolute_source_path is not None
@@ -97,7 +236,7 @@ def run_scan_project_flow(
     if not has_config:
         tui.warning("Configuration Missing", "No config.yaml. Using defaults.")
         # Fallback to dir flow if no config found (simplification)
-        run_scan_directory_flow(facade, import_depth)
+        run_scan_directory_flow(facade, import_depth, expansion_direction=expansion_direction)
         return
 
     config = facade.config
@@ -109,13 +248,25 @@ def run_scan_project_flow(
         import_depth=import_depth,
         include_assets=include_assets,
         file_tree_only=file_tree_only,
+        contexts=contexts,
+        layers=layers,
+        expansion_direction=expansion_direction,
+        snapshot_path=snapshot_path,
+        output_json=output_path,
     )
 
-    wizard = ScanSettingsWizard(options, facade)
-    if wizard.run():
+    if _run_wizard(options, facade):
         _execute_scan(facade, options)
 
 
+def _run_wizard(options: ScanOptions, facade: ScannerFacade) -> bool:
+    """Lets the user adjust `options` in place; False if cancelled."""
+    # Interactive-only: imported on use so non-interactive commands never load the prompt stack
+    from .wizard import ScanSettingsWizard
+
+    return ScanSettingsWizard(options, facade).run()
+
+
 def run_repeat_last_scan_flow(facade: ScannerFacade):
     """
     Immediately executes the last scan without the wizard.
@@ -134,7 +285,11 @@ def _execute_scan(facade: ScannerFacade, opts: ScanOptions):
     Bridges the Adapter State to the Port Call.
     """
     mode_msg = "ALL files" if opts.scan_all else "Python files"
-    depth_msg = f", depth={opts.import_depth}" if opts.import_depth > 0 else ""
+    depth_msg = (
+        f", depth={opts.import_depth} {opts.expansion_direction.value}"
+        if opts.import_depth > 0
+        else ""
+    )
 
     with tui.spinner(f"Scanning... ({mode_msg}{depth_msg})"):
         # 1. CALL PORT (Facade)
@@ -146,14 +301,13 @@ def _execute_scan(facade: ScannerFacade, opts: ScanOptions):
             scan_all=opts.scan_all,
             import_depth=opts.import_depth,
             include_assets=opts.include_assets,
+            expansion_direction=opts.expansion_direction,
+            snapshot_path=opts.snapshot_path,
         )
 
         # 2. Handle Side Effects (Saving Report)
-        # Pass the masking flag to the serializer
-        tree_view = _graph_to_json_tree(graph, mask_content=opts.file_tree_only)
-
-        with opts.output_json.open("w", encoding="utf-8") as f:
-            json.dump(tree_view, f, indent=2, ensure_ascii=False, default=str)
+        # Streamed straight to the file; the masking flag skips content entirely
+        export_scan(graph, opts.output_json, mask_content=opts.file_tree_only)
 
     set_last_scan_options(opts)
 
@@ -161,9 +315,9 @@ def _execute_scan(facade: ScannerFacade, opts: ScanOptions):
     tui.pause("[dim]Press Enter to return to menu...[/]")
 
 
-def run_classify_project_flow(facade: ScannerFacade):
+def run_classify_project_flow(facade: ScannerFacade, snapshot_path: Path | None = None):
     with tui.spinner("Analyzing architecture structure..."):
-        graph = facade.classify_tree()
+        graph = facade.classify_tree(snapshot_path=snapshot_path)
         root_path = facade.config.project.absolute_source_path
         render_tree = _graph_to_render_tree(graph, root_path)
 
@@ -185,52 +339,100 @@ def run_classify_directory_flow(facade: ScannerFacade):
     tui.pause("[dim]Press Enter to return to menu...[/]")
 
 
-# --- VIEW LOGIC HELPERS ---
+def run_snapshot_flow(
+    facade: ScannerFacade,
+    output: Path,
+    *,
+    scan_all: bool = False,
+    include_content: bool = False,
+):
+    """
+    Non-interactive: detect + classify once and persist the graph (CI step).
+    """
+    tui.set_theme(SCANNER_THEME)
+    with tui.spinner("Building graph snapshot..."):
+        result = facade.save_snapshot(output, scan_all=scan_all, include_content=include_content)
+
+    tui.success(
+        "Snapshot Saved",
+        {
+            "Output": result.snapshot_path,
+            "Source": result.source_dir,
+            "Nodes": str(result.node_count),
+            "Edges": str(result.edge_count),
+            "Size": f"{result.size_bytes / 1024:.1f} KiB",
+        },
+    )
 
 
-def _graph_to_json_tree(graph: CodeGraph, mask_content: bool) -> dict[str, Any]:
+def run_query_flow(
+    facade: ScannerFacade,
+    query: str,
+    *,
+    output_format: QueryOutputFormat = QueryOutputFormat.TABLE,
+    snapshot_path: Path | None = None,
+):
     """
-    Reconstructs a nested dictionary directory tree from flat graph paths.
-    Applies content masking if requested.
+    Non-interactive: answer one graph query and print the rows.
     """
-    tree: dict[str, Any] = {}
+    tui.set_theme(SCANNER_THEME)
+    with tui.spinner("Querying graph..."):
+        result = facade.query(query, snapshot_path=snapshot_path)
 
-    for path, node in graph.nodes.items():
-        # Only show finalized (visible) nodes
-        if node.status != NodeStatus.FINALIZED:
-            continue
+    if output_format == QueryOutputFormat.NDJSON:
+        for row in result.rows:
+            record = dict(zip(result.columns, row, strict=True))
+            sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return
 
-        parts = path.split(".")
-        # Handle empty path (root __init__)
-        if path == "":
-            parts = []
+    _render_query_result(result)
 
-        # Explicitly include __init__.py in JSON path parts
-        if node.file_path and node.file_path.name == "__init__.py":
-            parts.append("__init__.py")
 
-        current = tree
+def run_cycles_flow(
+    facade: ScannerFacade,
+    *,
+    output_format: QueryOutputFormat = QueryOutputFormat.TABLE,
+    snapshot_path: Path | None = None,
+):
+    """
+    Non-interactive: report every import cycle (context level first).
+    """
+    tui.set_theme(SCANNER_THEME)
+    with tui.spinner("Searching import cycles..."):
+        report = facade.analyze_cycles(snapshot_path=snapshot_path)
+
+    if output_format == QueryOutputFormat.NDJSON:
+        levels = (("context", report.context_cycles), ("module", report.module_cycles))
+        for level, level_cycles in levels:
+            for cycle in level_cycles:
+                record = {
+                    "level": level,
+                    "size": len(cycle.members),
+                    "cycle": cycle.cycle,
+                    "members": cycle.members,
+                }
+                if cycle.witnesses:
+                    record["witnesses"] = [list(w) for w in cycle.witnesses]
+                sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return
 
-        for i, part in enumerate(parts):
-            is_last = i == len(parts) - 1
+    _render_cycle_report(report)
 
-            if part not in current:
-                current[part] = {}
 
-            # Handle mixing dicts and leaf values
-            if current[part] is None or isinstance(current[part], str):
-                if not isinstance(current[part], dict):
-                    current[part] = {}
+# --- COMPLETION HELPERS ---
 
-            if is_last:
-                if mask_content:
-                    current[part] = "<Masked Content>"
-                else:
-                    current[part] = node.content if node.content is not None else ""
-            else:
-                current = current[part]
 
-    return tree
+def _safe_inventory(facade: ScannerFacade) -> InventorySchema | None:
+    """
+    Completion callbacks must never fail or scan: any problem means "no suggestions".
+    """
+    try:
+        return facade.get_inventory()
+    except Exception:
+        return None
+
+
+# --- VIEW LOGIC HELPERS ---
 
 
 def _graph_to_render_tree(graph: CodeGraph, root_path: Path) -> RenderNode:
@@ -300,6 +502,48 @@ def _graph_to_render_tree(graph: CodeGraph, root_path: Path) -> RenderNode:
     return root_node
 
 
+def _render_query_result(result: QueryResultSchema):
+    table = Table(box=box.SIMPLE_HEAD, header_style="bold white", expand=False)
+    for column in result.columns:
+        table.add_column(column, overflow="fold")
+    for row in result.rows:
+        table.add_row(*row)
+
+    shown = len(result.rows)
+    table.caption = f"{shown} rows" if shown == result.total else f"{shown} of {result.total} rows"
+    tui.console.print(table)
+
+
+def _render_cycle_report(report: CycleReportSchema):
+    if not report.context_cycles and not report.module_cycles:
+        tui.success("No import cycles found.")
+        return
+
+    def render(title: str, cycles: list[ImportCycleSchema], show_witnesses: bool):
+        if not cycles:
+            return
+        table = Table(box=box.SIMPLE_HEAD, header_style="bold white", title=title)
+        table.add_column("Size", justify="right")
+        table.add_column("Cycle", overflow="fold")
+        if show_witnesses:
+            table.add_column("Via imports", overflow="fold", style="dim")
+        for cycle in cycles:
+            row = [str(len(cycle.members)), " -> ".join(cycle.cycle)]
+            if show_witnesses:
+                row.append("\n".join(f"{src} -> {dst}" for src, dst in cycle.witnesses))
+            table.add_row(*row)
+        tui.console.print(table)
+
+    render("Context cycles", report.context_cycles, show_witnesses=True)
+    render("Module cycles", report.module_cycles, show_witnesses=False)
+
+    modules = sum(len(cycle.members) for cycle in report.module_cycles)
+    tui.console.print(
+        f"[dim]{len(report.context_cycles)} context cycle(s), "
+        f"{len(report.module_cycles)} module cycle(s) spanning {modules} modules.[/]"
+    )
+
+
 def _render_classified_tree(root_node: RenderNode):
     """
     Renders the architecture as a detailed table.
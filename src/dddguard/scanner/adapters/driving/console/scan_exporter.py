@@ -0,0 +1,142 @@
+import gzip
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Final, TextIO
+
+from dddguard.shared.domain import CodeGraph, CodeNode, NodeStatus
+
+# Output suffixes (before an optional ".gz") that select one JSON object per line
+NDJSON_SUFFIXES: Final[frozenset[str]] = frozenset({".ndjson", ".jsonl"})
+
+MASKED_CONTENT: Final[str] = "<Masked Content>"
+
+
+def export_scan(graph: CodeGraph, output: Path, *, mask_content: bool) -> None:
+    """
+    Writes the scan result to `output`, picking the format from its suffixes:
+    `.ndjson` / `.jsonl` -> one node/edge per line, otherwise a nested JSON tree;
+    a trailing `.gz` compresses either one.
+    """
+    compressed = output.suffix == ".gz"
+    inner_suffix = output.with_suffix("").suffix if compressed else output.suffix
+    writer = write_ndjson if inner_suffix in NDJSON_SUFFIXES else write_json_tree
+
+    if compressed:
+        with gzip.open(output, "wt", encoding="utf-8") as handle:
+            writer(graph, handle, mask_content=mask_content)
+    else:
+        with output.open("w", encoding="utf-8") as handle:
+            writer(graph, handle, mask_content=mask_content)
+
+
+def write_json_tree(graph: CodeGraph, handle: TextIO, *, mask_content: bool) -> None:
+    """
+    Streams the directory tree (`{"pkg": {"mod.py": "<content>"}}`) depth-first.
+
+    Output matches `json.dump(tree, indent=2)`, but only the open directory
+    chain and one file's content are held at a time. Keys are sorted; when a
+    name is both a file and a directory, the directory wins.
+    """
+    entries = _tree_entries(graph)
+    open_dirs: list[str] = []
+    first_child = [True]  # Per open object (root included): nothing written yet
+
+    def write_key(name: str) -> None:
+        separator = "" if first_child[-1] else ","
+        indent = "  " * len(first_child)
+        handle.write(f"{separator}\n{indent}{_dumps(name)}: ")
+        first_child[-1] = False
+
+    def close_object() -> None:
+        empty = first_child.pop()
+        handle.write("}" if empty else f"\n{'  ' * len(first_child)}}}")
+
+    handle.write("{")
+    for i, (parts, node) in enumerate(entries):
+        following = entries[i + 1][0] if i + 1 < len(entries) else None
+        if following is not None and following[: len(parts)] == parts:
+            continue  # Shadowed by a later duplicate or by a directory of the same name
+
+        *dirs, leaf = parts
+        common = 0
+        while common < min(len(open_dirs), len(dirs)) and open_dirs[common] == dirs[common]:
+            common += 1
+        while len(open_dirs) > common:
+            open_dirs.pop()
+            close_object()
+        for name in dirs[common:]:
+            write_key(name)
+            handle.write("{")
+            first_child.append(True)
+            open_dirs.append(name)
+
+        write_key(leaf)
+        handle.write(_dumps(_content_of(node, mask_content)))
+
+    while open_dirs:
+        open_dirs.pop()
+        close_object()
+    close_object()
+
+
+def write_ndjson(graph: CodeGraph, handle: TextIO, *, mask_content: bool) -> None:
+    """
+    One JSON object per line: each exported node, followed by its import edges.
+    Single pass over the graph in its own order; nothing is accumulated.
+    """
+    for node in _exported_nodes(graph):
+        passport = node.passport
+        record = {
+            "type": "node",
+            "path": node.path,
+            "file": str(node.file_path) if node.file_path else None,
+            "context": passport.context_name if passport else None,
+            "layer": passport.layer.value if passport else None,
+            "component": passport.component_type.value if passport else None,
+            "content": _content_of(node, mask_content),
+        }
+        handle.write(_dumps(record) + "\n")
+        for target in sorted(node.imports):
+            handle.write(_dumps({"type": "edge", "source": node.path, "target": target}) + "\n")
+
+
+# --- Helpers ---
+
+
+def _exported_nodes(graph: CodeGraph) -> Iterator[CodeNode]:
+    # Only finalized (visible) nodes are part of the scan result
+    return (node for node in graph.nodes.values() if node.status == NodeStatus.FINALIZED)
+
+
+def _tree_entries(graph: CodeGraph) -> list[tuple[tuple[str, ...], CodeNode]]:
+    """(path parts, node) pairs in depth-first key order. Holds references, not content."""
+    entries: list[tuple[tuple[str, ...], CodeNode]] = []
+    for node in _exported_nodes(graph):
+        parts = node.path.split(".") if node.path else []
+        # Explicitly include __init__.py in JSON path parts
+        if node.file_path and node.file_path.name == "__init__.py":
+            parts.append("__init__.py")
+        if parts:
+            entries.append((tuple(parts), node))
+
+    entries.sort(key=lambda entry: entry[0])
+    return entries
+
+
+def _content_of(node: CodeNode, mask_content: bool) -> str:
+    """Content kept by the scan, else read from disk on demand (e.g. lean snapshots)."""
+    if mask_content:
+        return MASKED_CONTENT
+    if node.content is not None:
+        return node.content
+    if node.file_path is None:
+        return ""
+    try:
+        return node.file_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return ""
+
+
+def _dumps(value: object) -> str:
+    return json.dumps(value, ensure_ascii=False, default=str)
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from pathlib import Path
 
+from ....ports.driving import ExpansionDirection
+
 
 @dataclass
 class ScanOptions:
@@ -27,6 +29,10 @@ class ScanOptions:
     layers: list[str] | None = None
 
     import_depth: int = 0
+    expansion_direction: ExpansionDirection = ExpansionDirection.DOWNSTREAM
+
+    # Input: reuse a saved graph snapshot instead of detecting + classifying
+    snapshot_path: Path | None = None
 
     # Output
     output_json: Path = Path("project_tree.json")
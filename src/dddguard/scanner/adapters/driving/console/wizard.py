@@ -10,7 +10,7 @@ from dddguard.shared.adapters.driving import (
 )
 from dddguard.shared.domain import LayerEnum
 
-from ....ports.driving import ScannerFacade
+from ....ports.driving import ExpansionDirection, ScannerFacade
 from .scan_options import ScanOptions
 
 
@@ -30,11 +30,25 @@ class ScanSettingsWizard:
         self._run_initial_discovery()
 
     def _run_initial_discovery(self) -> None:
+        # 1. Inventory of the last scan (instant, rejected if the tree changed since)
+        try:
+            inventory = self.facade.get_inventory(target_path=self.options.target_path)
+        except Exception:
+            inventory = None
+
+        if inventory is not None:
+            self._all_contexts = [(c.context_name, c.macro_zone) for c in inventory.contexts]
+            self._all_macros = set(inventory.macro_zones)
+            return
+
+        # 2. Fallback: path-only discovery
         try:
             with tui.spinner("Discovering Project Structure...", spinner_type="dots"):
-                # Call Facade -> DiscoverContextsUseCase
+                # Call Facade -> DiscoverContextsUseCase (path-only mode: no parsing)
                 # Returns ContextListSchema
-                schema = self.facade.discover_contexts(target_path=self.options.target_path)
+                schema = self.facade.discover_contexts(
+                    target_path=self.options.target_path, fast=True
+                )
 
                 # Unpack Schema
                 self._all_contexts = [(c.context_name, c.macro_zone) for c in schema.contexts]
@@ -88,6 +102,8 @@ class ScanSettingsWizard:
 
         elif action == "edit_depth":
             self._edit_depth_subscreen()
+        elif action == "cycle_direction":
+            self._cycle_direction()
         elif action == "edit_layers":
             self._edit_layers_subscreen()
         elif action == "edit_macros":
@@ -114,6 +130,7 @@ class ScanSettingsWizard:
         settings_data = {
             "Mode": "All Files" if opts.scan_all else "Python Only",
             "Imp. Depth": f"[{depth_style}]{depth_val}[/]",
+            "Direction": opts.expansion_direction.value.title(),
             "Content": f"[{content_style}]{content_val}[/]",
             # [CHANGED] Removed Shared/Root from dashboard display
             "Assets": toggle_style(opts.include_assets),
@@ -167,6 +184,7 @@ class ScanSettingsWizard:
             item("toggle_all", "Scan All Files", opts.scan_all),
             item("toggle_file_tree_only", "Mask File Content", opts.file_tree_only),
             value_item("edit_depth", "Import Depth", opts.import_depth),
+            value_item("cycle_direction", "Expansion Direction", opts.expansion_direction.value),
             item("toggle_assets", "Include Assets/Res", opts.include_assets),
             Separator(" FILTERS "),
             # [CHANGED] Removed individual toggles for Shared/Root
@@ -192,6 +210,12 @@ class ScanSettingsWizard:
         if result and result.isdigit():
             self.options.import_depth = min(int(result), 10)
 
+    def _cycle_direction(self) -> None:
+        # Downstream (imports) -> Upstream (importers) -> Both -> ...
+        order = list(ExpansionDirection)
+        current = order.index(self.options.expansion_direction)
+        self.options.expansion_direction = order[(current + 1) % len(order)]
+
     def _edit_layers_subscreen(self) -> None:
         current = (
             set(self.options.layers)
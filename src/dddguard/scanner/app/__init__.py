@@ -1,12 +1,41 @@
-from .interfaces import IClassificationGateway, IDetectionGateway
+from .interfaces import (
+    IClassificationGateway,
+    IDetectionGateway,
+    IGraphCache,
+    IGraphSnapshotStore,
+    IInventoryStore,
+    PassthroughGraphCache,
+)
+from .use_cases.analyze_cycles_uc import AnalyzeCyclesUseCase
 from .use_cases.discover_contexts_uc import DiscoverContextsUseCase
 from .use_cases.inspect_tree_uc import InspectTreeUseCase
+from .use_cases.load_snapshot_uc import LoadSnapshotUseCase
+from .use_cases.open_snapshot_view_uc import OpenSnapshotViewUseCase
+from .use_cases.read_inventory_uc import ReadInventoryUseCase
+from .use_cases.record_inventory_uc import RecordInventoryUseCase
+from .use_cases.record_violations_uc import RecordViolationsUseCase
+from .use_cases.run_file_scan_uc import RunFileScanUseCase
+from .use_cases.run_query_uc import RunQueryUseCase
 from .use_cases.run_scan_uc import RunScanUseCase
+from .use_cases.save_snapshot_uc import SaveSnapshotUseCase
 
 __all__ = [
+    "AnalyzeCyclesUseCase",
     "DiscoverContextsUseCase",
     "IClassificationGateway",
     "IDetectionGateway",
+    "IGraphCache",
+    "IGraphSnapshotStore",
+    "IInventoryStore",
     "InspectTreeUseCase",
+    "LoadSnapshotUseCase",
+    "OpenSnapshotViewUseCase",
+    "PassthroughGraphCache",
+    "ReadInventoryUseCase",
+    "RecordInventoryUseCase",
+    "RecordViolationsUseCase",
+    "RunFileScanUseCase",
+    "RunQueryUseCase",
     "RunScanUseCase",
+    "SaveSnapshotUseCase",
 ]
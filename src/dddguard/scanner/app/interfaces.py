@@ -1,8 +1,16 @@
+from collections.abc import Callable, Iterable, Mapping
 from pathlib import Path
 from typing import Protocol
 
 from dddguard.shared.domain import CodeGraph, ScannerConfig
 
+from ..domain import (
+    ContextInventoryVo,
+    DiscoveredContextVo,
+    SnapshotInfoVo,
+    ViolationRecordVo,
+)
+
 
 class IDetectionGateway(Protocol):
     """
@@ -21,6 +29,45 @@ class IDetectionGateway(Protocol):
         """
         ...
 
+    def scan_files(
+        self,
+        scanner_config: ScannerConfig,
+        target_path: Path,
+        file_paths: Iterable[Path],
+        known_modules: Mapping[str, Path] | None = None,
+    ) -> CodeGraph:
+        """
+        Physical scanning of `file_paths` only, imports resolved against `known_modules`
+        (logical path -> file of every project module). Returns a LINKED CodeGraph.
+        Without `known_modules`, imported modules are located by name (nothing else is
+        walked or read) and added as path-only nodes (no imports).
+        """
+        ...
+
+    def scan_focus(
+        self,
+        scanner_config: ScannerConfig,
+        target_path: Path,
+        focus_path: Path,
+    ) -> CodeGraph:
+        """
+        Physical scanning of the files under `focus_path` only. Modules they import
+        from the rest of `target_path` are added as path-only nodes (no imports).
+        Returns a LINKED CodeGraph.
+        """
+        ...
+
+    def list_files(
+        self,
+        scanner_config: ScannerConfig,
+        target_path: Path,
+        scan_all: bool,
+    ) -> list[Path]:
+        """
+        Lists the files a scan would ingest (walk only: no reads, no parsing).
+        """
+        ...
+
 
 class IClassificationGateway(Protocol):
     """
@@ -35,3 +82,130 @@ class IClassificationGateway(Protocol):
         :param source_dir: Contextual root for calculating relative paths during classification.
         """
         ...
+
+    def discover_contexts(
+        self, file_paths: list[Path], source_dir: Path
+    ) -> list[DiscoveredContextVo]:
+        """
+        Path-only discovery of Bounded Contexts (Stage 0 boundary detection).
+        Does not require a CodeGraph.
+        """
+        ...
+
+
+class IInventoryStore(Protocol):
+    """
+    Driven Port: Persistent storage for the context inventory of a source tree.
+    """
+
+    def fingerprint(self, source_dir: Path, scanner_config: ScannerConfig) -> str:
+        """
+        Cheap state token of the source tree (directory mtimes, no file reads).
+        Changes whenever files or directories are added, removed or renamed.
+        """
+        ...
+
+    def load(self, source_dir: Path) -> ContextInventoryVo | None:
+        """
+        Returns the stored inventory for `source_dir`, or None if absent/unreadable.
+        """
+        ...
+
+    def save(self, inventory: ContextInventoryVo) -> None:
+        """
+        Persists the inventory. Must not raise on I/O failures (cache is best-effort).
+        """
+        ...
+
+
+class IGraphSnapshotStore(Protocol):
+    """
+    Driven Port: Persistent, reloadable copy of a CLASSIFIED graph.
+    Lets one process detect + classify and many others reuse the result.
+    """
+
+    def save(
+        self,
+        graph: CodeGraph,
+        snapshot_path: Path,
+        source_dir: Path,
+        *,
+        scan_all: bool,
+        include_content: bool,
+    ) -> SnapshotInfoVo:
+        """
+        Writes the graph. File paths are stored relative to `source_dir`.
+        """
+        ...
+
+    def load(
+        self, snapshot_path: Path, source_dir: Path | None = None
+    ) -> tuple[SnapshotInfoVo, CodeGraph]:
+        """
+        Reads a snapshot back into a CLASSIFIED graph.
+
+        :param source_dir: Root to resolve file paths against
+            (e.g. a different CI checkout). None = the root recorded at save time.
+        """
+        ...
+
+    def open_view(self, snapshot_path: Path, source_dir: Path | None = None) -> CodeGraph:
+        """
+        Read-only graph for whole-project consumers (e.g. lint).
+        Formats that support it stream nodes lazily instead of loading them all.
+        """
+        ...
+
+    def save_violations(self, snapshot_path: Path, violations: Iterable[ViolationRecordVo]) -> bool:
+        """
+        Stores lint results next to the graph, replacing earlier ones.
+        Returns False if the snapshot format cannot hold them.
+        """
+        ...
+
+
+class IGraphCache(Protocol):
+    """
+    Driven Port: Session cache for detected + classified graphs.
+    """
+
+    def get_or_build(
+        self,
+        source_dir: Path,
+        scan_all: bool,
+        scanner_config: ScannerConfig,
+        build: Callable[[], CodeGraph],
+    ) -> CodeGraph:
+        """
+        Returns a CLASSIFIED graph the caller may mutate (filter/finalize).
+        `build` runs detection + classification and is only called on a miss.
+        """
+        ...
+
+    def peek(
+        self, source_dir: Path, scan_all: bool, scanner_config: ScannerConfig
+    ) -> CodeGraph | None:
+        """
+        Like `get_or_build`, but never builds: None unless a valid graph is cached.
+        """
+        ...
+
+
+class PassthroughGraphCache:
+    """
+    Null Object for `IGraphCache`: always builds. Default outside a DI container.
+    """
+
+    def get_or_build(
+        self,
+        source_dir: Path,
+        scan_all: bool,
+        scanner_config: ScannerConfig,
+        build: Callable[[], CodeGraph],
+    ) -> CodeGraph:
+        return build()
+
+    def peek(
+        self, source_dir: Path, scan_all: bool, scanner_config: ScannerConfig
+    ) -> CodeGraph | None:
+        return None
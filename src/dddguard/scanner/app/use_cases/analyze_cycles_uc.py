@@ -0,0 +1,58 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from dddguard.shared.domain import CodeGraph, ImportCycleReportVo, ScannerConfig
+
+from ..interfaces import (
+    IClassificationGateway,
+    IDetectionGateway,
+    IGraphCache,
+    PassthroughGraphCache,
+)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class AnalyzeCyclesUseCase:
+    """
+    Macro UseCase: Import Cycle Report.
+
+    Finds every import cycle of the whole classified project, at module level
+    and between bounded contexts, in linear time (iterative SCC, no recursion).
+
+    **Pipeline:**
+    1.  **Detection + Classification:** Full project (session-cached), or a snapshot.
+    2.  **Analysis:** Strongly connected components per level (read-only).
+    """
+
+    detection_gateway: IDetectionGateway
+    classification_gateway: IClassificationGateway
+    graph_cache: IGraphCache = field(default_factory=PassthroughGraphCache)
+
+    def __call__(
+        self,
+        scanner_config: ScannerConfig,
+        source_dir: Path,
+        scan_all: bool = False,
+        classified_graph: CodeGraph | None = None,
+    ) -> ImportCycleReportVo:
+        """
+        :param classified_graph: Pre-built CLASSIFIED graph (e.g. a snapshot); skips stage 1.
+        """
+        # 1. DETECT & CLASSIFY (cached per session)
+        if classified_graph is None:
+            classified_graph = self.graph_cache.get_or_build(
+                source_dir=source_dir,
+                scan_all=scan_all,
+                scanner_config=scanner_config,
+                build=lambda: self.classification_gateway.classify(
+                    graph=self.detection_gateway.scan(
+                        scanner_config=scanner_config,
+                        target_path=source_dir,
+                        scan_all=scan_all,
+                    ),
+                    source_dir=source_dir,
+                ),
+            )
+
+        # 2. ANALYZE (read-only, safe on the cached graph)
+        return ImportCycleReportVo.from_graph(classified_graph)
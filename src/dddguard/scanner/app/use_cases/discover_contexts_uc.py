@@ -1,10 +1,15 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from dddguard.shared.domain import ScannerConfig
 
 from ...domain import DiscoveredContextVo
-from ..interfaces import IClassificationGateway, IDetectionGateway
+from ..interfaces import (
+    IClassificationGateway,
+    IDetectionGateway,
+    IGraphCache,
+    PassthroughGraphCache,
+)
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -16,16 +21,23 @@ class DiscoverContextsUseCase:
     Used primarily by the UI/CLI Wizard to populate auto-complete lists.
 
     Explicitly includes SHARED and ROOT scopes as discoverable contexts.
+
+    **Modes:**
+    - Full (default): Detect -> Classify, then aggregate passports.
+    - Paths-only: Walk file names and run Stage 0 boundary detection on them.
+      Context names depend purely on paths, so no file is read, parsed or linked.
     """
 
     detection_gateway: IDetectionGateway
     classification_gateway: IClassificationGateway
+    graph_cache: IGraphCache = field(default_factory=PassthroughGraphCache)
 
     def __call__(
         self,
         scanner_config: ScannerConfig,
         source_dir: Path,
         scan_all: bool = False,
+        paths_only: bool = False,
     ) -> list[DiscoveredContextVo]:
         """
         Executes the discovery.
@@ -35,17 +47,25 @@ class DiscoverContextsUseCase:
             Absolute path to the project source root. This is where we scan.
         :param scan_all:
             If True, includes non-Python files in the scan.
+        :param paths_only:
+            If True, skips reading/parsing and derives contexts from paths alone.
         """
-        # 1. DETECT (Physical Scan)
-        detected_graph = self.detection_gateway.scan(
-            scanner_config=scanner_config,
-            target_path=source_dir,
-            scan_all=scan_all,
-        )
+        if paths_only:
+            return self._discover_from_paths(scanner_config, source_dir, scan_all)
 
-        # 2. CLASSIFY
-        classified_graph = self.classification_gateway.classify(
-            graph=detected_graph, source_dir=source_dir
+        # 1-2. DETECT & CLASSIFY (cached per session)
+        classified_graph = self.graph_cache.get_or_build(
+            source_dir=source_dir,
+            scan_all=scan_all,
+            scanner_config=scanner_config,
+            build=lambda: self.classification_gateway.classify(
+                graph=self.detection_gateway.scan(
+                    scanner_config=scanner_config,
+                    target_path=source_dir,
+                    scan_all=scan_all,
+                ),
+                source_dir=source_dir,
+            ),
         )
 
         # 3. AGGREGATE & DEDUPLICATE
@@ -66,6 +86,30 @@ class DiscoverContextsUseCase:
                 )
 
         # 4. SORT
+        return self._sorted(unique_contexts.values())
+
+    def _discover_from_paths(
+        self,
+        scanner_config: ScannerConfig,
+        source_dir: Path,
+        scan_all: bool,
+    ) -> list[DiscoveredContextVo]:
+        # 1. WALK (names only)
+        file_paths = self.detection_gateway.list_files(
+            scanner_config=scanner_config,
+            target_path=source_dir,
+            scan_all=scan_all,
+        )
+
+        # 2. STAGE 0 on paths (already deduplicated by the classifier)
+        discovered = self.classification_gateway.discover_contexts(
+            file_paths=file_paths, source_dir=source_dir
+        )
+
+        return self._sorted(discovered)
+
+    @staticmethod
+    def _sorted(contexts) -> list[DiscoveredContextVo]:
         def sort_key(c: DiscoveredContextVo):
             if c.context_name == "root":
                 return ("0_root", "")
@@ -73,4 +117,4 @@ class DiscoverContextsUseCase:
                 return ("1_shared", "")
             return ("2_biz", c.macro_zone or "", c.context_name)
 
-        return sorted(unique_contexts.values(), key=sort_key)
+        return sorted(contexts, key=sort_key)
@@ -1,9 +1,14 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from dddguard.shared.domain import CodeGraph, ScannerConfig
 
-from ..interfaces import IClassificationGateway, IDetectionGateway
+from ..interfaces import (
+    IClassificationGateway,
+    IDetectionGateway,
+    IGraphCache,
+    PassthroughGraphCache,
+)
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -25,12 +30,14 @@ class InspectTreeUseCase:
 
     detection_gateway: IDetectionGateway
     classification_gateway: IClassificationGateway
+    graph_cache: IGraphCache = field(default_factory=PassthroughGraphCache)
 
     def __call__(
         self,
         scanner_config: ScannerConfig,
         source_dir: Path,
         scan_all: bool = False,
+        classified_graph: CodeGraph | None = None,
     ) -> CodeGraph:
         """
         Executes the inspection.
@@ -38,20 +45,24 @@ class InspectTreeUseCase:
         :param scanner_config: Configuration for the scanning process.
         :param source_dir: The project source root to inspect.
         :param scan_all: If True, includes non-code assets (txt, md, config, etc.).
+        :param classified_graph: Pre-built CLASSIFIED graph (e.g. a snapshot); skips stages 1-2.
         :return: A fully visible (FINALIZED) CodeGraph.
         """
-        # 1. DETECT (Physical Scan)
-        detected_graph = self.detection_gateway.scan(
-            scanner_config=scanner_config,
-            target_path=source_dir,
-            scan_all=scan_all,
-        )
-
-        # 2. CLASSIFY (Architectural Assignment)
-        classified_graph = self.classification_gateway.classify(
-            graph=detected_graph,
-            source_dir=source_dir,
-        )
+        # 1-2. DETECT & CLASSIFY (cached per session)
+        if classified_graph is None:
+            classified_graph = self.graph_cache.get_or_build(
+                source_dir=source_dir,
+                scan_all=scan_all,
+                scanner_config=scanner_config,
+                build=lambda: self.classification_gateway.classify(
+                    graph=self.detection_gateway.scan(
+                        scanner_config=scanner_config,
+                        target_path=source_dir,
+                        scan_all=scan_all,
+                    ),
+                    source_dir=source_dir,
+                ),
+            )
 
         # 3. FINALIZE (Visibility)
         # Mark all nodes as FINALIZED (no filtering applied)
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+from dddguard.shared.domain import CodeGraph
+
+from ...domain import SnapshotInfoVo
+from ..interfaces import IGraphSnapshotStore
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class LoadSnapshotUseCase:
+    """
+    App Service: Reload a classified graph written by `SaveSnapshotUseCase`.
+
+    The returned graph is fresh (not shared), so callers may filter and finalize it.
+    """
+
+    snapshot_store: IGraphSnapshotStore
+
+    def __call__(
+        self, snapshot_path: Path, source_dir: Path | None = None
+    ) -> tuple[SnapshotInfoVo, CodeGraph]:
+        """
+        :param source_dir: Current project root; file paths are rebased onto it.
+            None = keep the root recorded in the snapshot.
+        """
+        return self.snapshot_store.load(snapshot_path, source_dir)
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+from dddguard.shared.domain import CodeGraph
+
+from ..interfaces import IGraphSnapshotStore
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class OpenSnapshotViewUseCase:
+    """
+    App Service: Read-only access to a saved graph for whole-project consumers.
+
+    Unlike `LoadSnapshotUseCase`, the result is not meant to be filtered or
+    finalized: database snapshots are streamed with bounded memory.
+    """
+
+    snapshot_store: IGraphSnapshotStore
+
+    def __call__(self, snapshot_path: Path, source_dir: Path | None = None) -> CodeGraph:
+        return self.snapshot_store.open_view(snapshot_path, source_dir)
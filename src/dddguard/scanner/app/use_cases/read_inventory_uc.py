@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+from dddguard.shared.domain import ScannerConfig
+
+from ...domain import ContextInventoryVo
+from ..interfaces import IInventoryStore
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ReadInventoryUseCase:
+    """
+    App Service: Serves the cached context inventory without scanning.
+
+    **Staleness:** The stored fingerprint is compared with the current one;
+    a mismatch means the tree changed since the last scan and the inventory is rejected.
+    """
+
+    inventory_store: IInventoryStore
+
+    def __call__(
+        self,
+        source_dir: Path,
+        scanner_config: ScannerConfig,
+        allow_stale: bool = False,
+    ) -> ContextInventoryVo | None:
+        """
+        :param allow_stale: Return the inventory even if the tree changed since it was built.
+        :return: The inventory, or None if missing (or stale and not allowed).
+        """
+        inventory = self.inventory_store.load(source_dir)
+        if inventory is None or allow_stale:
+            return inventory
+
+        current = self.inventory_store.fingerprint(source_dir, scanner_config)
+        return inventory if inventory.fingerprint == current else None
@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+from dddguard.shared.domain import CodeGraph, ScannerConfig
+
+from ...domain import ContextInventoryVo, InventoryAggregationService
+from ..interfaces import IInventoryStore
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class RecordInventoryUseCase:
+    """
+    App Service: Refreshes the context inventory after a completed scan.
+
+    The inventory feeds shell completion and the wizard's pickers,
+    which cannot afford a full scan per request.
+    """
+
+    inventory_store: IInventoryStore
+
+    def __call__(
+        self,
+        graph: CodeGraph,
+        source_dir: Path,
+        scanner_config: ScannerConfig,
+    ) -> ContextInventoryVo:
+        """
+        :param graph: The CLASSIFIED graph produced by the scan.
+        :param source_dir: The scanned source root (inventory key).
+        """
+        inventory = InventoryAggregationService.build(
+            graph=graph,
+            source_dir=source_dir,
+            fingerprint=self.inventory_store.fingerprint(source_dir, scanner_config),
+        )
+        self.inventory_store.save(inventory)
+        return inventory
@@ -0,0 +1,22 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from ...domain import ViolationRecordVo
+from ..interfaces import IGraphSnapshotStore
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class RecordViolationsUseCase:
+    """
+    App Service: Attaches lint results to the snapshot they were computed from,
+    so the graph database can answer "which edges break which rule" later.
+    """
+
+    snapshot_store: IGraphSnapshotStore
+
+    def __call__(self, snapshot_path: Path, violations: Iterable[ViolationRecordVo]) -> bool:
+        """
+        :return: False if the snapshot format cannot store violations (binary snapshots).
+        """
+        return self.snapshot_store.save_violations(snapshot_path, violations)
@@ -0,0 +1,141 @@
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from dddguard.shared.domain import CodeGraph, CodeNode, ScannerConfig
+
+from ...domain import FileScanVo
+from ..interfaces import (
+    IClassificationGateway,
+    IDetectionGateway,
+    IGraphCache,
+    PassthroughGraphCache,
+)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class RunFileScanUseCase:
+    """
+    Macro UseCase: Fresh view of a few changed files (e.g. staged for a commit).
+
+    **Pipeline:**
+    1.  **Project Index:** The classified project, from a snapshot or the session
+        cache (only if already warm, e.g. in the daemon: it is never built here).
+    2.  **Detection:** Only the changed files; imports linked against the index.
+    3.  **Classification:** Only the changed files.
+    4.  **Neighbourhood:** Index copies of everything the changed files import and,
+        for reclassified files, of everything importing them.
+
+    Without an index, the modules the changed files import are located by name and
+    classified alongside them; importers cannot be known, so nothing is reported as
+    reclassified. Either way the cost follows the changed files and their
+    neighbours, not the project: a one-shot pre-commit run never scans the tree.
+    """
+
+    detection_gateway: IDetectionGateway
+    classification_gateway: IClassificationGateway
+    graph_cache: IGraphCache = field(default_factory=PassthroughGraphCache)
+
+    def __call__(
+        self,
+        scanner_config: ScannerConfig,
+        source_dir: Path,
+        file_paths: Iterable[Path],
+        classified_graph: CodeGraph | None = None,
+    ) -> FileScanVo:
+        """
+        :param classified_graph: CLASSIFIED graph of the whole project to use as the
+            index (e.g. a snapshot view); skips step 1. Never mutated.
+        """
+        # 1. PROJECT INDEX (a snapshot, or a warm session cache)
+        index = classified_graph
+        if index is None:
+            index = self.graph_cache.peek(
+                source_dir=source_dir, scan_all=False, scanner_config=scanner_config
+            )
+        if index is None:
+            return self._scan_without_index(scanner_config, source_dir, list(file_paths))
+
+        # 2-3. DETECT & CLASSIFY (changed files only)
+        graph = self.detection_gateway.scan_files(
+            scanner_config=scanner_config,
+            target_path=source_dir,
+            file_paths=file_paths,
+            known_modules=_ModuleFiles(index),
+        )
+        self.classification_gateway.classify(graph=graph, source_dir=source_dir)
+
+        changed = tuple(sorted(graph.nodes))
+        reclassified: list[str] = []
+        for path in changed:
+            previous = index.get_node(path)
+            if previous is None or previous.passport_id != graph.nodes[path].passport_id:
+                reclassified.append(path)
+
+        # 4. NEIGHBOURHOOD (what the rules need to judge edges from and into changed nodes)
+        neighbours: set[str] = set()
+        for path in changed:
+            neighbours.update(graph.nodes[path].imports)
+        for path in reclassified:
+            neighbours.update(index.importers_of(path))
+
+        for path in neighbours.difference(changed):
+            node = index.get_node(path)
+            if node is not None:
+                graph.nodes[path] = _copy_node(node)
+
+        return FileScanVo(graph=graph, changed=changed, reclassified=tuple(reclassified))
+
+    def _scan_without_index(
+        self, scanner_config: ScannerConfig, source_dir: Path, file_paths: list[Path]
+    ) -> FileScanVo:
+        # Changed files plus the modules they import (located by name, path-only)
+        graph = self.detection_gateway.scan_files(
+            scanner_config=scanner_config,
+            target_path=source_dir,
+            file_paths=file_paths,
+        )
+        self.classification_gateway.classify(graph=graph, source_dir=source_dir)
+
+        requested = {file_path.resolve() for file_path in file_paths}
+        changed = tuple(
+            sorted(path for path, node in graph.nodes.items() if node.file_path in requested)
+        )
+        return FileScanVo(graph=graph, changed=changed, reclassified=())
+
+
+class _ModuleFiles(Mapping[str, Path]):
+    """Logical path -> file of the index nodes, looked up on demand (lazy views stay lazy)."""
+
+    def __init__(self, index: CodeGraph) -> None:
+        self._index = index
+
+    def __getitem__(self, path: str) -> Path:
+        node = self._index.get_node(path)
+        if node is None or node.file_path is None:
+            raise KeyError(path)
+        return node.file_path
+
+    def __contains__(self, path: object) -> bool:
+        if not isinstance(path, str):
+            return False
+        node = self._index.get_node(path)
+        return node is not None and node.file_path is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index.nodes)
+
+    def __len__(self) -> int:
+        return len(self._index.nodes)
+
+
+def _copy_node(node: CodeNode) -> CodeNode:
+    # Detached copy without content: the index may be a cached or read-only graph
+    return CodeNode(
+        path=node.path,
+        file_path=node.file_path,
+        _status=node.status,
+        imports=node.imports,
+        passport_id=node.passport_id,
+        visible_radius=node.visible_radius,
+    )
@@ -0,0 +1,65 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from dddguard.shared.domain import CodeGraph, ScannerConfig
+
+from ...domain import QueryResultVo
+from ..interfaces import (
+    IClassificationGateway,
+    IDetectionGateway,
+    IGraphCache,
+    PassthroughGraphCache,
+)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class RunQueryUseCase:
+    """
+    Macro UseCase: Ad-hoc Graph Query.
+
+    Answers declarative questions about the whole classified project
+    ("app modules in billing importing adapters", "paths from A to B")
+    without exporting the graph.
+
+    **Pipeline:**
+    1.  **Detection + Classification:** Full project (session-cached), or a snapshot.
+    2.  **Query:** Parse, plan against the graph indexes and execute (read-only).
+    """
+
+    detection_gateway: IDetectionGateway
+    classification_gateway: IClassificationGateway
+    graph_cache: IGraphCache = field(default_factory=PassthroughGraphCache)
+
+    def __call__(
+        self,
+        query: str,
+        scanner_config: ScannerConfig,
+        source_dir: Path,
+        scan_all: bool = False,
+        classified_graph: CodeGraph | None = None,
+    ) -> QueryResultVo:
+        """
+        :param query: Query text (see `GraphQueryService` for the grammar).
+        :param classified_graph: Pre-built CLASSIFIED graph (e.g. a snapshot); skips stage 1.
+        :raises QuerySyntaxError: The query is malformed.
+        """
+        # 1. DETECT & CLASSIFY (cached per session)
+        if classified_graph is None:
+            classified_graph = self.graph_cache.get_or_build(
+                source_dir=source_dir,
+                scan_all=scan_all,
+                scanner_config=scanner_config,
+                build=lambda: self.classification_gateway.classify(
+                    graph=self.detection_gateway.scan(
+                        scanner_config=scanner_config,
+                        target_path=source_dir,
+                        scan_all=scan_all,
+                    ),
+                    source_dir=source_dir,
+                ),
+            )
+
+        # 2. QUERY (does not touch node state, so the cached graph is safe to share)
+        from ...domain import GraphQueryService  # Lazy export: only `query` loads the engine
+
+        return GraphQueryService.execute(classified_graph, query)
@@ -1,13 +1,19 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from dddguard.shared.domain import CodeGraph, ScannerConfig
 
 from ...domain import (
+    ExpansionDirection,
     GraphExpansionService,
     GraphFilteringService,
 )
-from ..interfaces import IClassificationGateway, IDetectionGateway
+from ..interfaces import (
+    IClassificationGateway,
+    IDetectionGateway,
+    IGraphCache,
+    PassthroughGraphCache,
+)
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -17,31 +23,50 @@ class RunScanUseCase:
 
     This is the main entry point for generating a filtered, classified architecture graph.
 
-    **Architectural Strategy: "Global Awareness, Local Focus"**
-    To accurately resolve imports and cross-context dependencies, the scanner **always**
-    ingests the entire project source tree physically (Detection Phase).
-    It then logically narrows down the visibility to the requested `focus_path` (Filtering Phase).
+    **Architectural Strategy: "Resolve What the Focus Needs"**
+    To resolve imports and cross-context dependencies, the scanner ingests the
+    whole source tree physically when no `focus_path` is given. With a
+    `focus_path`, it ingests only the files under it and resolves the rest of the
+    project lazily, as far as the focus imports it (see Lazy Resolution).
+    It then logically narrows down the visibility to the focus (Filtering Phase).
 
     **Pipeline Stages:**
-    1.  **Detection:** Parse AST and resolve imports for the *entire* project (Linkage Integrity).
-    2.  **Classification:** Assign architectural passports to *all* nodes.
+    1.  **Detection:** Parse AST and resolve imports of the whole project, or of the
+        focus and the modules it imports (Linkage Integrity).
+    2.  **Classification:** Assign architectural passports to every detected node.
     3.  **Filtering:** Hide nodes outside the `focus_path` or exclude specific Layers/Contexts.
-    4.  **Expansion:** Recursively reveal hidden dependencies of visible nodes (Import Depth).
+    4.  **Expansion:** Recursively reveal hidden dependencies (or dependents) of visible
+        nodes (Import Depth, Expansion Direction).
     5.  **Pruning:** Finalize the graph state for rendering.
+
+    Without a `focus_path`, stages 1-2 go through `graph_cache`: within a session,
+    repeated scans of an unchanged tree reuse the classified graph and only re-run
+    stages 3-5.
+
+    **Lazy Resolution (`focus_path`):** Stages 1-2 cover only the files under the
+    focus. Modules they import from elsewhere are located by name and classified
+    from their path alone (classification never reads content); they are parsed
+    only when an import runs through their re-exports. Outside nodes carry no
+    imports, so expansion stops at the focus' direct dependencies.
     """
 
     detection_gateway: IDetectionGateway
     classification_gateway: IClassificationGateway
+    graph_cache: IGraphCache = field(default_factory=PassthroughGraphCache)
 
     def __call__(
         self,
         scanner_config: ScannerConfig,
         source_dir: Path,
+        *,
         scan_all: bool = False,
         import_depth: int = 0,
         whitelist_layers: list[str] | None = None,
         whitelist_contexts: list[str] | None = None,
         include_assets: bool = True,
+        expansion_direction: ExpansionDirection = ExpansionDirection.DOWNSTREAM,
+        classified_graph: CodeGraph | None = None,
+        focus_path: Path | None = None,
     ) -> CodeGraph:
         """
         Executes the scan.
@@ -72,41 +97,58 @@ class RunScanUseCase:
         :param include_assets:
             If `False`, filters out non-code components (ArchetypeType.ASSET).
 
+        :param expansion_direction:
+            Edges followed by the expansion: `DOWNSTREAM` (imports, default),
+            `UPSTREAM` (importers, for impact analysis) or `BOTH`.
+
+        :param classified_graph:
+            A CLASSIFIED graph of the whole project obtained elsewhere (e.g. a snapshot).
+            Stages 1-2 are skipped; the graph is filtered and finalized in place.
+
+        :param focus_path:
+            A part of `source_dir` (e.g. one context) to scan lazily instead of the whole
+            project (see Lazy Resolution). Not cached: the graph is partial. With
+            `classified_graph`, only narrows the visibility.
+
         :return: A populated `CodeGraph` where nodes are marked as `FINALIZED` (visible) or not.
         """
 
-        # 1. DETECT (Ingest & Link - Full Project)
-        # Returns a graph with physical nodes and raw import strings resolved to node IDs.
-        detected_graph = self.detection_gateway.scan(
-            scanner_config=scanner_config,
-            target_path=source_dir,
-            scan_all=scan_all,
-        )
-
-        # 2. CLASSIFY (Assign Passports - Full Project)
-        # Mutates the graph: Nodes go from LINKED -> CLASSIFIED state.
-        classified_graph = self.classification_gateway.classify(
-            graph=detected_graph,
-            source_dir=source_dir,
-        )
+        # 1-2. DETECT & CLASSIFY (Full Project, cached per session; or Focus only)
+        if classified_graph is None and focus_path is not None:
+            classified_graph = self.classification_gateway.classify(
+                graph=self.detection_gateway.scan_focus(
+                    scanner_config=scanner_config,
+                    target_path=source_dir,
+                    focus_path=focus_path,
+                ),
+                source_dir=source_dir,
+            )
+        elif classified_graph is None:
+            classified_graph = self.graph_cache.get_or_build(
+                source_dir=source_dir,
+                scan_all=scan_all,
+                scanner_config=scanner_config,
+                build=lambda: self._detect_and_classify(scanner_config, source_dir, scan_all),
+            )
 
         # 3. FILTER (Narrowing Phase)
         # Apply subtractive logic: "What should be hidden?"
         # Returns a set of Node IDs (Paths) that survived the filters.
         initial_visible = GraphFilteringService.determine_initial_focus(
             graph=classified_graph,
-            focus_path=source_dir,
+            focus_path=focus_path or source_dir,
             whitelist_layers=whitelist_layers,
             whitelist_contexts=whitelist_contexts,
             include_assets=include_assets,
         )
 
         # 4. EXPAND (Discovery Phase)
-        # Apply additive logic: "What hidden nodes are needed by visible nodes?"
+        # Apply additive logic: "What hidden nodes are needed by (or need) visible nodes?"
         expanded_visible = GraphExpansionService.expand(
             graph=classified_graph,
             initial_visible=initial_visible,
             depth=import_depth,
+            direction=expansion_direction,
         )
 
         # 5. PRUNE (Finalize State)
@@ -117,3 +159,21 @@ class RunScanUseCase:
         )
 
         return classified_graph
+
+    def _detect_and_classify(
+        self, scanner_config: ScannerConfig, source_dir: Path, scan_all: bool
+    ) -> CodeGraph:
+        # 1. DETECT (Ingest & Link - whole project; a focus goes through `scan_focus`)
+        # Returns a graph with physical nodes and raw import strings resolved to node IDs.
+        detected_graph = self.detection_gateway.scan(
+            scanner_config=scanner_config,
+            target_path=source_dir,
+            scan_all=scan_all,
+        )
+
+        # 2. CLASSIFY (Assign Passports - every detected node)
+        # Mutates the graph: Nodes go from LINKED -> CLASSIFIED state.
+        return self.classification_gateway.classify(
+            graph=detected_graph,
+            source_dir=source_dir,
+        )
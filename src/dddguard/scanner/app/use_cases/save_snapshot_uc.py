@@ -0,0 +1,65 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from dddguard.shared.domain import ScannerConfig
+
+from ...domain import SnapshotInfoVo
+from ..interfaces import (
+    IClassificationGateway,
+    IDetectionGateway,
+    IGraphCache,
+    IGraphSnapshotStore,
+    PassthroughGraphCache,
+)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class SaveSnapshotUseCase:
+    """
+    Macro UseCase: Persist the classified graph of a source tree.
+
+    Runs Detection + Classification once (through the session cache) and writes
+    the result, so CI jobs downstream (lint, diagrams, metrics) can skip both stages.
+    No filtering or expansion is applied: the snapshot holds the whole project.
+    """
+
+    detection_gateway: IDetectionGateway
+    classification_gateway: IClassificationGateway
+    snapshot_store: IGraphSnapshotStore
+    graph_cache: IGraphCache = field(default_factory=PassthroughGraphCache)
+
+    def __call__(
+        self,
+        scanner_config: ScannerConfig,
+        source_dir: Path,
+        snapshot_path: Path,
+        scan_all: bool = False,
+        include_content: bool = False,
+    ) -> SnapshotInfoVo:
+        """
+        :param snapshot_path: Destination file (overwritten).
+        :param include_content: Also store file contents (needed only by content-based reports).
+        """
+        # 1-2. DETECT & CLASSIFY (cached per session)
+        classified_graph = self.graph_cache.get_or_build(
+            source_dir=source_dir,
+            scan_all=scan_all,
+            scanner_config=scanner_config,
+            build=lambda: self.classification_gateway.classify(
+                graph=self.detection_gateway.scan(
+                    scanner_config=scanner_config,
+                    target_path=source_dir,
+                    scan_all=scan_all,
+                ),
+                source_dir=source_dir,
+            ),
+        )
+
+        # 3. PERSIST
+        return self.snapshot_store.save(
+            classified_graph,
+            snapshot_path,
+            source_dir,
+            scan_all=scan_all,
+            include_content=include_content,
+        )
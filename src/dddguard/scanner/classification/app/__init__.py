@@ -1,4 +1,9 @@
 from .classify_graph_workflow import ClassifyGraphWorkflow
+from .discover_context_boundaries_uc import DiscoverContextBoundariesUseCase
 from .identify_component_uc import IdentifyComponentUseCase
 
-__all__ = ["ClassifyGraphWorkflow", "IdentifyComponentUseCase"]
+__all__ = [
+    "ClassifyGraphWorkflow",
+    "DiscoverContextBoundariesUseCase",
+    "IdentifyComponentUseCase",
+]
@@ -0,0 +1,50 @@
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..domain import ContextBoundaryVo, Stage0ContextDiscoveryService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class DiscoverContextBoundariesUseCase:
+    """
+    App Service: Path-only Context Discovery.
+
+    Runs Stage 0 (Context Boundary Detection) on raw file paths.
+    Context names and macro zones depend purely on the path, so no file is read,
+    parsed or linked — unlike a full `IdentifyComponentUseCase` pass.
+    """
+
+    def __call__(self, file_paths: Iterable[Path], source_dir: Path) -> list[ContextBoundaryVo]:
+        """
+        Detects the distinct boundaries found among `file_paths`.
+
+        :param file_paths: Paths located under `source_dir` (as produced by the walker).
+        :param source_dir: Project source root used to compute relative parts.
+        :return: One boundary per distinct (context_name, macro_path), in discovery order.
+        """
+        source_str = str(source_dir)
+        unique: dict[tuple[str | None, str | None], ContextBoundaryVo] = {}
+
+        for file_path in file_paths:
+            try:
+                rel_path = file_path.relative_to(source_dir)
+            except ValueError:
+                logger.debug("Skipping path outside source root: %s", file_path)
+                continue
+
+            parts = list(rel_path.parts)
+            if not parts:
+                continue
+            parts[-1] = file_path.stem
+
+            boundary = Stage0ContextDiscoveryService.detect_context_boundary(
+                source_dir=source_str,
+                relative_path_parts=tuple(parts),
+            )
+            unique.setdefault((boundary.context_name, boundary.macro_path), boundary)
+
+        return list(unique.values())
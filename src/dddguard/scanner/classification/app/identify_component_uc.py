@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from dddguard.shared.domain import (
+    PASSPORT_TABLE,
     ArchetypeType,
     ComponentPassport,
     DirectionEnum,
@@ -29,6 +30,9 @@ class IdentifyComponentUseCase:
 
     Orchestrates the classification pipeline to determine the architectural role
     (Passport) of a specific file within the project structure.
+
+    Passports are obtained from the shared PASSPORT_TABLE, so nodes with the same
+    architectural coordinates share one canonical instance.
     """
 
     def __call__(self, file_path: Path, source_dir: Path) -> ComponentPassport:
@@ -61,7 +65,7 @@ class IdentifyComponentUseCase:
 
             # --- INTERCEPT: AUTOMATIC MARKER CLASSIFICATION ---
             if filename_stem.startswith("__") and filename_stem.endswith("__"):
-                return ComponentPassport(
+                return PASSPORT_TABLE.canonical(
                     scope=coords.scope,
                     context_name=boundary.context_name,
                     macro_zone=boundary.macro_path,
@@ -89,7 +93,7 @@ class IdentifyComponentUseCase:
                 final_layer = matched_layer
 
             # Construct Passport
-            passport = ComponentPassport(
+            passport = PASSPORT_TABLE.canonical(
                 scope=coords.scope,
                 context_name=boundary.context_name,
                 macro_zone=boundary.macro_path,
@@ -122,7 +126,7 @@ class IdentifyComponentUseCase:
     @staticmethod
     def _make_unknown() -> ComponentPassport:
         """Returns a default 'Unknown' passport for failed identifications."""
-        return ComponentPassport(
+        return PASSPORT_TABLE.canonical(
             scope=ScopeEnum.CONTEXT,
             context_name=None,
             macro_zone=None,
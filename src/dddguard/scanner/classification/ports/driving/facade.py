@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -5,7 +6,7 @@ from dddguard.shared.domain import (
     CodeGraph,
 )
 
-from ...app import ClassifyGraphWorkflow
+from ...app import ClassifyGraphWorkflow, DiscoverContextBoundariesUseCase
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -16,6 +17,7 @@ class ClassificationFacade:
     """
 
     graph_workflow: ClassifyGraphWorkflow
+    boundaries_use_case: DiscoverContextBoundariesUseCase
 
     def classify_graph(self, graph: CodeGraph, source_dir: Path | None = None) -> CodeGraph:
         """
@@ -28,3 +30,16 @@ class ClassificationFacade:
                              target path determines the relative root.
         """
         return self.graph_workflow(graph=graph, source_dir=source_dir)  # type: ignore[arg-type]
+
+    def discover_contexts(
+        self, file_paths: Iterable[Path], source_dir: Path
+    ) -> list[tuple[str, str | None]]:
+        """
+        Path-only discovery: returns distinct (context_name, macro_zone) pairs.
+        Paths without a detectable context are omitted.
+        """
+        return [
+            (b.context_name, b.macro_path)
+            for b in self.boundaries_use_case(file_paths=file_paths, source_dir=source_dir)
+            if b.context_name
+        ]
@@ -1,6 +1,10 @@
 from dishka import Provider, Scope, provide
 
-from .app import ClassifyGraphWorkflow, IdentifyComponentUseCase
+from .app import (
+    ClassifyGraphWorkflow,
+    DiscoverContextBoundariesUseCase,
+    IdentifyComponentUseCase,
+)
 from .ports.driving.facade import ClassificationFacade
 
 
@@ -15,6 +19,7 @@ class ClassificationProvider(Provider):
     # Use Cases
     identify_uc = provide(IdentifyComponentUseCase)
     graph_workflow = provide(ClassifyGraphWorkflow)
+    boundaries_uc = provide(DiscoverContextBoundariesUseCase)
 
     # Facade
     facade = provide(ClassificationFacade)
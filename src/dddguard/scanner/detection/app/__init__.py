@@ -1,7 +1,23 @@
-from .interfaces import IProjectReader
+from .interfaces import (
+    FileStamp,
+    IModuleCache,
+    IProjectReader,
+    ModuleCacheEntries,
+    NullModuleCache,
+)
+from .list_project_files_uc import ListProjectFilesUseCase
+from .scan_files_uc import ScanFilesUseCase
+from .scan_focus_uc import ScanFocusUseCase
 from .scan_project_uc import ScanProjectUseCase
 
 __all__ = [
+    "FileStamp",
+    "IModuleCache",
     "IProjectReader",
+    "ListProjectFilesUseCase",
+    "ModuleCacheEntries",
+    "NullModuleCache",
+    "ScanFilesUseCase",
+    "ScanFocusUseCase",
     "ScanProjectUseCase",
 ]
@@ -1,10 +1,16 @@
-from collections.abc import Generator
+from collections.abc import Generator, Mapping
 from pathlib import Path
 from typing import Protocol
 
 from dddguard.shared.domain import ScannerConfig
 
-from ..domain import SourceFileVo
+from ..domain import ScannedModuleVo, SourceFileVo
+
+# (mtime_ns, size) of a file
+FileStamp = tuple[int, int]
+
+# file path -> (stamp when parsed, parsed module)
+ModuleCacheEntries = dict[Path, tuple[FileStamp, ScannedModuleVo]]
 
 
 class IProjectReader(Protocol):
@@ -24,9 +30,68 @@ class IProjectReader(Protocol):
         """
         ...
 
+    def list_project_files(
+        self, scanner_config: ScannerConfig, target_path: Path, scan_all: bool = False
+    ) -> Generator[Path, None, None]:
+        """
+        Yields candidate file paths without reading their content.
+        Applies the same ignore rules as `read_project` (except the size guard).
+        """
+        ...
+
+    def stat_project_files(
+        self, scanner_config: ScannerConfig, target_path: Path, scan_all: bool = False
+    ) -> Generator[tuple[Path, FileStamp | None], None, None]:
+        """
+        Yields the files `read_project` would read with their stamp, without reading them.
+        Applies the size guard; the stamp is None if a file could not be stat-ed.
+        """
+        ...
+
+    def is_project_file(
+        self,
+        scanner_config: ScannerConfig,
+        target_path: Path,
+        file_path: Path,
+        scan_all: bool = False,
+    ) -> bool:
+        """
+        Whether walking `target_path` would yield the existing file `file_path`
+        (same ignore rules as `list_project_files`), without walking.
+        """
+        ...
+
     def read_file(self, file_path: Path) -> SourceFileVo | None:
         """
         Reads a specific file by path.
         Returns None if file cannot be read or doesn't exist.
         """
         ...
+
+
+class IModuleCache(Protocol):
+    """
+    Driven Port: Parsed modules of earlier scans, reused while a file's stamp is unchanged.
+    """
+
+    def entries(
+        self, target_path: Path, scan_all: bool
+    ) -> Mapping[Path, tuple[FileStamp, ScannedModuleVo]]:
+        """Modules recorded by the last scan of this tree (empty if none)."""
+        ...
+
+    def replace(self, target_path: Path, scan_all: bool, entries: ModuleCacheEntries) -> None:
+        """Stores the modules of a finished scan (files absent from `entries` are dropped)."""
+        ...
+
+
+class NullModuleCache:
+    """No-op IModuleCache: every scan parses every file."""
+
+    def entries(
+        self, target_path: Path, scan_all: bool
+    ) -> Mapping[Path, tuple[FileStamp, ScannedModuleVo]]:
+        return {}
+
+    def replace(self, target_path: Path, scan_all: bool, entries: ModuleCacheEntries) -> None:
+        return None
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+from dddguard.shared.domain import ScannerConfig
+
+from .interfaces import IProjectReader
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ListProjectFilesUseCase:
+    """
+    App Service: Lists the files a scan would ingest.
+    Pure traversal — no content is read and no AST is parsed.
+    """
+
+    project_reader: IProjectReader
+
+    def __call__(
+        self,
+        scanner_config: ScannerConfig,
+        target_path: Path,
+        scan_all: bool = False,
+    ) -> list[Path]:
+        return list(
+            self.project_reader.list_project_files(
+                scanner_config=scanner_config,
+                target_path=target_path,
+                scan_all=scan_all,
+            )
+        )
@@ -0,0 +1,188 @@
+import logging
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+from dddguard.shared.domain import CodeGraph, ScannerConfig
+
+from ..domain import ImportLinkingService, ModuleResolutionService, ScannedModuleVo
+from .interfaces import IProjectReader
+from .scan_project_uc import ProjectScanError, parse_source_file
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ScanFilesUseCase:
+    """
+    App Service: Detects a handful of files against an already known project.
+
+    Only the given files are read and parsed. Their imports are resolved against
+    `known_modules` (every module of the project, or a `ModuleLocator` probing the
+    files of each name asked for), so the result links exactly like a full scan would. Files outside the list are parsed only when an import
+    has to be traced through their re-exports (typically an `__init__.py`).
+    """
+
+    project_reader: IProjectReader
+
+    def __call__(
+        self,
+        scanner_config: ScannerConfig,
+        target_path: Path,
+        file_paths: Iterable[Path],
+        known_modules: Mapping[str, Path] | None = None,
+        with_targets: bool = False,
+    ) -> CodeGraph:
+        """
+        :param file_paths: Files to detect. Paths a project walk would skip (outside
+            `target_path`, ignored, non-Python, deleted) are dropped silently.
+        :param known_modules: Logical path -> file of every module in the project.
+            None: modules are located by name when an import asks for them, so the
+            rest of the project is neither walked nor read.
+        :param with_targets: Also add a node (file path only: no content, no imports)
+            for every project module the given files import, so the graph can be
+            classified and checked without an index.
+        :return: A CodeGraph holding the given files, LINKED (plus their targets, DETECTED).
+        """
+        scanned: dict[str, ScannedModuleVo] = {}
+        if known_modules is None:
+            known_modules = ModuleLocator(scanner_config, target_path, self.project_reader)
+
+        try:
+            for file_path in file_paths:
+                if not self.project_reader.is_project_file(scanner_config, target_path, file_path):
+                    continue
+                source_file = self.project_reader.read_file(file_path)
+                if source_file is None:
+                    continue
+                module = parse_source_file(source_file, target_path)
+                if module is not None:
+                    scanned[module.logical_path] = module
+
+            registry = _OnDemandRegistry(
+                scanned, known_modules, self.project_reader, source_dir=target_path
+            )
+            graph = CodeGraph()
+            for logical_path, module in scanned.items():
+                node = graph.add_node(
+                    path=logical_path, file_path=module.file_path, content=module.content
+                )
+                targets = ImportLinkingService.link(module, registry, target_path.name)
+                if targets:
+                    node.link_imports(list(targets))
+
+            if with_targets:
+                for logical_path in scanned:
+                    for target in graph.nodes[logical_path].imports:
+                        if target not in graph.nodes and target in known_modules:
+                            graph.add_node(path=target, file_path=known_modules[target])
+
+        except Exception as e:
+            raise ProjectScanError(
+                root_path=str(target_path), details=str(e), original_error=e
+            ) from e
+
+        logger.debug(
+            "Detected %d file(s); %d more parsed for re-exports",
+            len(scanned),
+            registry.loaded_count,
+        )
+        return graph
+
+
+class _OnDemandRegistry(Mapping[str, ScannedModuleVo]):
+    """
+    Module registry of the whole project, backed by the scanned files plus the
+    known modules. Membership never touches the disk; indexing a known module
+    reads and parses it once.
+    """
+
+    def __init__(
+        self,
+        scanned: dict[str, ScannedModuleVo],
+        known_modules: Mapping[str, Path],
+        project_reader: IProjectReader,
+        source_dir: Path,
+    ) -> None:
+        self._modules = dict(scanned)
+        self._known = known_modules
+        self._reader = project_reader
+        self._source_dir = source_dir
+        self.loaded_count = 0
+
+    def __getitem__(self, path: str) -> ScannedModuleVo:
+        module = self._modules.get(path)
+        if module is None:
+            module = self._load(path, self._known[path])
+            self._modules[path] = module
+        return module
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._modules or path in self._known
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._modules
+        yield from (path for path in self._known if path not in self._modules)
+
+    def __len__(self) -> int:
+        return len(self._modules) + sum(1 for path in self._known if path not in self._modules)
+
+    def _load(self, path: str, file_path: Path) -> ScannedModuleVo:
+        self.loaded_count += 1
+        source_file = self._reader.read_file(file_path)
+        module = None if source_file is None else parse_source_file(source_file, self._source_dir)
+        # Unreadable now: keep the module, without re-exports to follow
+        return module or ScannedModuleVo(logical_path=path, file_path=file_path, content=None)
+
+
+class ModuleLocator(Mapping[str, Path]):
+    """
+    Logical path -> file of the project's modules, found by probing the candidate
+    files of each name asked for (results are memoized). Import linking only
+    tests membership and indexes, so the tree is never walked for it.
+    """
+
+    def __init__(
+        self, scanner_config: ScannerConfig, source_dir: Path, project_reader: IProjectReader
+    ) -> None:
+        self._config = scanner_config
+        self._source_dir = source_dir
+        self._reader = project_reader
+        self._files: dict[str, Path | None] = {}
+
+    @property
+    def located_count(self) -> int:
+        return sum(1 for file_path in self._files.values() if file_path is not None)
+
+    def __getitem__(self, path: str) -> Path:
+        file_path = self._locate(path)
+        if file_path is None:
+            raise KeyError(path)
+        return file_path
+
+    def __contains__(self, path: object) -> bool:
+        return isinstance(path, str) and self._locate(path) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        # Only for completeness of the Mapping interface: this one walks the tree
+        for file_path in self._reader.list_project_files(self._config, self._source_dir):
+            logical_path = ModuleResolutionService.calculate_logical_path(
+                file_path, self._source_dir
+            )
+            if logical_path:
+                yield logical_path
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def _locate(self, path: str) -> Path | None:
+        if path in self._files:
+            return self._files[path]
+
+        found = None
+        for candidate in ModuleResolutionService.candidate_files(path, self._source_dir):
+            if self._reader.is_project_file(self._config, self._source_dir, candidate):
+                found = candidate
+                break
+        self._files[path] = found
+        return found
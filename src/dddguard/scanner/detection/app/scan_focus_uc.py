@@ -0,0 +1,56 @@
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+from dddguard.shared.domain import CodeGraph, ScannerConfig
+
+from .interfaces import IProjectReader
+from .scan_files_uc import ModuleLocator, ScanFilesUseCase
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ScanFocusUseCase:
+    """
+    App Service: Detects one part of a project (e.g. a single context) without
+    walking the rest of it.
+
+    Files under `focus_path` are read and parsed. Their import targets elsewhere in
+    the project are located from the module name alone (`foo.bar` -> `foo/bar.py` or
+    `foo/bar/__init__.py`) and added as path-only nodes; they are read only when an
+    import has to be traced through their re-exports. The cost follows the focus
+    and its direct dependencies, not the size of the project.
+    """
+
+    project_reader: IProjectReader
+    scan_files_use_case: ScanFilesUseCase
+
+    def __call__(
+        self, scanner_config: ScannerConfig, target_path: Path, focus_path: Path
+    ) -> CodeGraph:
+        """
+        :param target_path: The project source root (logical paths are relative to it).
+        :param focus_path: A directory (or file) inside `target_path`.
+        :return: A CodeGraph of the focus files (LINKED) and their targets (DETECTED).
+        """
+        file_paths = list(
+            self.project_reader.list_project_files(
+                scanner_config=scanner_config, target_path=focus_path
+            )
+        )
+        locator = ModuleLocator(scanner_config, target_path, self.project_reader)
+
+        graph = self.scan_files_use_case(
+            scanner_config=scanner_config,
+            target_path=target_path,
+            file_paths=file_paths,
+            known_modules=locator,
+            with_targets=True,
+        )
+        logger.debug(
+            "Focus scan: %d file(s), %d module(s) located outside",
+            len(file_paths),
+            locator.located_count,
+        )
+        return graph
@@ -1,5 +1,6 @@
 import logging
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from dddguard.shared.domain import CodeGraph, ScannerConfig
@@ -7,13 +8,19 @@ from dddguard.shared.helpers.generics import GenericAppError
 
 from ..domain import (
     AstImportParserService,
+    ImportLinkingService,
     ImportParsingError,
     ModuleResolutionService,
-    RecursiveImportResolverService,
     ScannedModuleVo,
     SourceFileVo,
 )
-from .interfaces import IProjectReader
+from .interfaces import (
+    FileStamp,
+    IModuleCache,
+    IProjectReader,
+    ModuleCacheEntries,
+    NullModuleCache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -38,15 +45,51 @@ class ProjectScanError(GenericAppError):
         )
 
 
+def parse_source_file(source_file: SourceFileVo, source_dir: Path) -> ScannedModuleVo | None:
+    """
+    Resolves the logical path of a read file and parses its raw imports (AST).
+    Returns None if the file has no logical path under `source_dir`.
+    """
+    # 1. Resolve Logical Path
+    logical_path = ModuleResolutionService.calculate_logical_path(source_file.path, source_dir)
+    if not logical_path:
+        return None
+
+    # 2. Parse AST (Only for Python files)
+    raw_imports = []
+    if source_file.path.suffix == ".py" and source_file.content is not None:
+        try:
+            raw_imports = AstImportParserService.parse_imports(
+                source_file.content, source_file.path, logical_path
+            )
+        except ImportParsingError as e:
+            logger.warning(
+                "Skipping import parsing for %s: %s",
+                source_file.path,
+                e,
+            )
+
+    return ScannedModuleVo(
+        logical_path=logical_path,
+        file_path=source_file.path,
+        content=source_file.content,
+        raw_imports=raw_imports,
+    )
+
+
 @dataclass(frozen=True, kw_only=True, slots=True)
 class ScanProjectUseCase:
     """
     App Service (Orchestrator):
     Coordinates the process of turning a physical file system into a logical CodeGraph.
     Uses stateless Domain Services for parsing and resolution.
+
+    **Incremental:** With a module cache, a rescan of the same tree only reads and
+    parses files whose (mtime, size) stamp changed; linking always runs on the full set.
     """
 
     project_reader: IProjectReader
+    module_cache: IModuleCache = field(default_factory=NullModuleCache)
 
     def __call__(
         self,
@@ -59,15 +102,36 @@ class ScanProjectUseCase:
         """
         # Local registry to hold intermediate VOs before Graph construction
         registry: ModuleRegistry = {}
+        # Parsed modules to remember for the next scan of this tree
+        entries: ModuleCacheEntries = {}
 
         try:
             # --- PHASE 1: INGEST ---
-            for source_file in self.project_reader.read_project(
-                scanner_config=scanner_config,
-                target_path=target_path,
-                scan_all=scan_all,
-            ):
-                self._ingest_file(source_file, source_dir=target_path, registry=registry)
+            previous = self.module_cache.entries(target_path, scan_all)
+            if previous:
+                self._ingest_changed(
+                    scanner_config,
+                    target_path,
+                    scan_all,
+                    previous=previous,
+                    registry=registry,
+                    entries=entries,
+                )
+            else:
+                # This loop is the parser stage; with `read_workers > 0` the reader
+                # keeps a bounded number of files read ahead on I/O threads.
+                for source_file in self.project_reader.read_project(
+                    scanner_config=scanner_config,
+                    target_path=target_path,
+                    scan_all=scan_all,
+                ):
+                    module = self._ingest_file(
+                        source_file, source_dir=target_path, registry=registry
+                    )
+                    if module is not None and source_file.stamp is not None:
+                        entries[source_file.path] = (source_file.stamp, module)
+
+            self.module_cache.replace(target_path, scan_all, entries)
 
             # --- PHASE 2: LINKING & GRAPH BUILD ---
             return self._build_graph(registry, source_dir=target_path)
@@ -77,41 +141,53 @@ class ScanProjectUseCase:
                 root_path=str(target_path), details=str(e), original_error=e
             ) from e
 
+    def _ingest_changed(
+        self,
+        scanner_config: ScannerConfig,
+        target_path: Path,
+        scan_all: bool,
+        *,
+        previous: Mapping[Path, tuple[FileStamp, ScannedModuleVo]],
+        registry: ModuleRegistry,
+        entries: ModuleCacheEntries,
+    ) -> None:
+        """
+        Helper: Incremental ingest. Stats every candidate file and reuses the parsed
+        module when its stamp is unchanged; only new or modified files are read.
+        """
+        for file_path, stamp in self.project_reader.stat_project_files(
+            scanner_config=scanner_config,
+            target_path=target_path,
+            scan_all=scan_all,
+        ):
+            cached = previous.get(file_path)
+            if stamp is not None and cached is not None and cached[0] == stamp:
+                module = cached[1]
+                registry[module.logical_path] = module
+                entries[file_path] = cached
+                continue
+
+            source_file = self.project_reader.read_file(file_path)
+            if source_file is None:  # Deleted since the walk
+                continue
+            ingested = self._ingest_file(source_file, source_dir=target_path, registry=registry)
+            if ingested is not None and stamp is not None:
+                entries[file_path] = (stamp, ingested)
+
     def _ingest_file(
         self,
         source_file: SourceFileVo,
         source_dir: Path,
         registry: ModuleRegistry,
-    ) -> None:
+    ) -> ScannedModuleVo | None:
         """
-        Helper: Resolves logical path and parses raw imports (AST).
+        Helper: Parses the file and registers it under its logical path.
+        Returns the registered module (None if the file has no logical path).
         """
-        # 1. Resolve Logical Path
-        logical_path = ModuleResolutionService.calculate_logical_path(source_file.path, source_dir)
-        if not logical_path:
-            return
-
-        # 2. Parse AST (Only for Python files)
-        raw_imports = []
-        if source_file.path.suffix == ".py" and source_file.content is not None:
-            try:
-                raw_imports = AstImportParserService.parse_imports(
-                    source_file.content, source_file.path, logical_path
-                )
-            except ImportParsingError as e:
-                logger.warning(
-                    "Skipping import parsing for %s: %s",
-                    source_file.path,
-                    e,
-                )
-
-        # 3. Register
-        registry[logical_path] = ScannedModuleVo(
-            logical_path=logical_path,
-            file_path=source_file.path,
-            content=source_file.content,
-            raw_imports=raw_imports,
-        )
+        module = parse_source_file(source_file, source_dir)
+        if module is not None:
+            registry[module.logical_path] = module
+        return module
 
     def _build_graph(self, registry: ModuleRegistry, source_dir: Path) -> CodeGraph:
         """
@@ -130,50 +206,8 @@ class ScanProjectUseCase:
             if not module_vo or not module_vo.raw_imports:
                 continue
 
-            final_targets: set[str] = set()
-
-            for imp in module_vo.raw_imports:
-                base_target = imp.module_path
-
-                # 1. Resolve Specific Names (Deep Recursion)
-                if imp.imported_names:
-                    for name in imp.imported_names:
-                        resolved = RecursiveImportResolverService.resolve(
-                            registry=registry,
-                            start_module_path=base_target,
-                            imported_name=name,
-                            source_dir_name=source_dir_name,
-                        )
-                        final_targets.add(resolved)
-
-                # 2. Base Linking (Fallback for direct imports or empty names)
-                else:
-                    target = self._normalize_if_needed(base_target, registry, source_dir)
-                    if target:
-                        final_targets.add(target)
-
+            final_targets = ImportLinkingService.link(module_vo, registry, source_dir_name)
             if final_targets:
                 node.link_imports(list(final_targets))
 
         return graph
-
-    def _normalize_if_needed(
-        self,
-        target: str,
-        registry: ModuleRegistry,
-        source_dir: Path,
-    ) -> str | None:
-        """
-        Tries to find the target in registry, applying normalization if needed.
-        """
-        if target in registry:
-            return target
-
-        # Strip source_dir prefix logic
-        parts = target.split(".")
-        if parts and parts[0] == source_dir.name:
-            normalized = ".".join(parts[1:])
-            if normalized in registry:
-                return normalized
-
-        return None
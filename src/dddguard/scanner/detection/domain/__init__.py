@@ -1,5 +1,6 @@
 from .ast_import_parser_service import AstImportParserService
 from .errors import ImportParsingError
+from .import_linking_service import ImportLinkingService
 from .module_resolution_service import ModuleResolutionService
 from .recursive_import_resolver_service import RecursiveImportResolverService
 from .value_objects import (
@@ -10,6 +11,7 @@ from .value_objects import (
 
 __all__ = [
     "AstImportParserService",
+    "ImportLinkingService",
     "ImportParsingError",
     "ImportedModuleVo",
     "ModuleResolutionService",
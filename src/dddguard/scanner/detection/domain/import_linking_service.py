@@ -0,0 +1,72 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+from .recursive_import_resolver_service import RecursiveImportResolverService
+from .value_objects import ScannedModuleVo
+
+
+@dataclass(frozen=True, slots=True)
+class ImportLinkingService:
+    """
+    Domain Service: Turns the raw imports of one module into the logical paths it depends on.
+    Imported names are traced through re-exports; bare module imports are matched directly.
+    """
+
+    @staticmethod
+    def link(
+        module: ScannedModuleVo,
+        registry: Mapping[str, ScannedModuleVo],
+        source_dir_name: str,
+    ) -> set[str]:
+        """
+        :param registry: Every module of the project by logical path. Only modules on a
+            re-export chain are indexed (`registry[path]`); all others are only tested for
+            membership, so lazily parsed registries work too.
+        """
+        targets: set[str] = set()
+
+        for imp in module.raw_imports:
+            base_target = imp.module_path
+
+            # 1. Resolve Specific Names (Deep Recursion)
+            if imp.imported_names:
+                for name in imp.imported_names:
+                    targets.add(
+                        RecursiveImportResolverService.resolve(
+                            registry=registry,
+                            start_module_path=base_target,
+                            imported_name=name,
+                            source_dir_name=source_dir_name,
+                        )
+                    )
+
+            # 2. Base Linking (Fallback for direct imports or empty names)
+            else:
+                target = ImportLinkingService._normalize_if_needed(
+                    base_target, registry, source_dir_name
+                )
+                if target:
+                    targets.add(target)
+
+        return targets
+
+    @staticmethod
+    def _normalize_if_needed(
+        target: str,
+        registry: Mapping[str, ScannedModuleVo],
+        source_dir_name: str,
+    ) -> str | None:
+        """
+        Tries to find the target in registry, applying normalization if needed.
+        """
+        if target in registry:
+            return target
+
+        # Strip source_dir prefix logic
+        parts = target.split(".")
+        if parts and parts[0] == source_dir_name:
+            normalized = ".".join(parts[1:])
+            if normalized in registry:
+                return normalized
+
+        return None
@@ -27,3 +27,14 @@ class ModuleResolutionService:
             return ".".join(parts)
         except ValueError:
             return None
+
+    @staticmethod
+    def candidate_files(logical_path: str, source_dir: Path) -> tuple[Path, ...]:
+        """
+        Forward resolution: 'foo.bar' -> ('/.../src/foo/bar.py', '/.../src/foo/bar/__init__.py').
+        The files a module may live in, most specific first; existence is not checked.
+        """
+        if not logical_path:
+            return ()
+        base = source_dir.joinpath(*logical_path.split("."))
+        return (base.with_name(base.name + ".py"), base / "__init__.py")
@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from dataclasses import dataclass
 
 from .value_objects import ScannedModuleVo
@@ -13,7 +14,7 @@ class RecursiveImportResolverService:
 
     @staticmethod
     def resolve(
-        registry: dict[str, ScannedModuleVo],
+        registry: Mapping[str, ScannedModuleVo],
         start_module_path: str,
         imported_name: str,
         source_dir_name: str,
@@ -33,7 +34,7 @@ class RecursiveImportResolverService:
 
     @staticmethod
     def _resolve_recursive(
-        registry: dict[str, ScannedModuleVo],
+        registry: Mapping[str, ScannedModuleVo],
         current_path: str,
         name: str,
         source_dir_name: str,
@@ -48,6 +48,8 @@ class SourceFileVo:
     path: Path
     content: str | None = None
     reading_error: str | None = None
+    # (mtime_ns, size) observed before reading; None if the file was not stat-ed
+    stamp: tuple[int, int] | None = None
 
     @property
     def is_readable(self) -> bool:
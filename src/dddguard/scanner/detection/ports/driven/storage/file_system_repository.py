@@ -1,12 +1,16 @@
 import logging
-from collections.abc import Generator
+import os
+import queue
+import threading
+from collections.abc import Generator, Iterator
 from collections.abc import Set as AbstractSet
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
 
 from dddguard.shared.domain import ScannerConfig
 
-from ....app import IProjectReader
+from ....app import FileStamp, IProjectReader
 from ....domain import SourceFileVo
 
 logger = logging.getLogger(__name__)
@@ -40,6 +44,8 @@ class FileSystemRepository(IProjectReader):
         3. Walks the tree recursively.
         4. Filters out ignored files/extensions/sizes.
         5. Attempts to read content.
+           With `scanner_config.read_workers > 0` reads run ahead on I/O threads
+           (see `_read_pipelined`), overlapping disk latency with the consumer's work.
 
         Error Handling:
         If a file passes the filters but fails to read (e.g. Permission denied,
@@ -62,14 +68,47 @@ class FileSystemRepository(IProjectReader):
             yield self._read_file_safe(target_path)
             return
 
-        # 2. Prepare Filters (Optimization: load once)
-        exclude_dirs = scanner_config.exclude_dirs
+        # 2. Recursive Traversal (name/extension filters applied by the walker)
+        file_paths = self.list_project_files(scanner_config, target_path, scan_all)
+        max_size = scanner_config.max_file_size_bytes
+
+        # 3. Sequential mode: read one file at a time on the caller's thread
+        if scanner_config.read_workers <= 0:
+            for file_path in file_paths:
+                source_file = self._read_candidate(file_path, max_size)
+                if source_file is not None:
+                    yield source_file
+            return
+
+        # 4. Pipelined mode: reader threads run ahead of the consumer (parser)
+        yield from self._read_pipelined(
+            file_paths,
+            max_size=max_size,
+            workers=scanner_config.read_workers,
+            read_ahead=scanner_config.read_workers * max(1, scanner_config.read_ahead_per_worker),
+        )
+
+    def list_project_files(
+        self,
+        scanner_config: ScannerConfig,
+        target_path: Path,
+        scan_all: bool = False,
+    ) -> Generator[Path, None, None]:
+        """
+        Streams candidate file paths without opening or stat-ing the files.
+
+        Applies the same directory exclusions, ignored filenames and extension
+        strategy as `read_project`. The size guard is skipped because it needs
+        a stat() call per file.
+        """
+        if target_path.is_file():
+            yield target_path
+            return
+
         ignore_files = scanner_config.ignore_files
         binary_exts = scanner_config.binary_extensions
-        max_size = scanner_config.max_file_size_bytes
 
-        # 3. Recursive Traversal
-        for file_path in self._walk_pathlib(target_path, exclude_dirs):
+        for file_path in self._walk_pathlib(target_path, scanner_config.exclude_dirs):
             # A. Filter: Ignored Filenames (Exact match)
             if file_path.name in ignore_files:
                 continue
@@ -83,20 +122,58 @@ class FileSystemRepository(IProjectReader):
             if scan_all and file_path.suffix.lower() in binary_exts:
                 continue
 
-            # C. Filter: File Size (Performance guard)
+            yield file_path
+
+    def stat_project_files(
+        self,
+        scanner_config: ScannerConfig,
+        target_path: Path,
+        scan_all: bool = False,
+    ) -> Generator[tuple[Path, FileStamp | None], None, None]:
+        """
+        Streams candidate files with their (mtime_ns, size) stamp, without reading them.
+        Same filters as `read_project`, including the size guard.
+        """
+        max_size = scanner_config.max_file_size_bytes
+        for file_path in self.list_project_files(scanner_config, target_path, scan_all):
             try:
-                # stat() creates a system call, can raise OSError
-                if file_path.stat().st_size > max_size and file_path.suffix != ".py":
-                    continue
+                stat = file_path.stat()
             except OSError:
-                # If we can't even check size/existence, we likely can't read it.
-                # Yield as an error to notify the user.
-                yield SourceFileVo(path=file_path, reading_error="Access Denied (stat failed)")
+                # Reading will report the error
+                yield file_path, None
                 continue
+            if stat.st_size > max_size and file_path.suffix != ".py":
+                continue
+            yield file_path, (stat.st_mtime_ns, stat.st_size)
+
+    def is_project_file(
+        self,
+        scanner_config: ScannerConfig,
+        target_path: Path,
+        file_path: Path,
+        scan_all: bool = False,
+    ) -> bool:
+        """
+        Applies the walker's filters to a single path (e.g. a file list from a VCS hook).
+        """
+        try:
+            relative = file_path.relative_to(target_path)
+        except ValueError:
+            return False
+
+        # Same pruning as `_walk_pathlib`, applied to every path segment
+        exclude_dirs = scanner_config.exclude_dirs
+        if any(part in exclude_dirs or part.startswith(".") for part in relative.parts):
+            return False
 
-            # D. Attempt Read
-            # _read_file_safe handles the try/catch logic internally
-            yield self._read_file_safe(file_path)
+        if file_path.name in scanner_config.ignore_files:
+            return False
+        if not scan_all and file_path.suffix != ".py":
+            return False
+        if scan_all and file_path.suffix.lower() in scanner_config.binary_extensions:
+            return False
+
+        return file_path.is_file()
 
     def read_file(self, file_path: Path) -> SourceFileVo | None:
         """
@@ -133,21 +210,111 @@ class FileSystemRepository(IProjectReader):
         self, path: Path, exclude_dirs: AbstractSet[str]
     ) -> Generator[Path, None, None]:
         """
-        Custom recursive generator using pathlib.iterdir().
+        Custom recursive generator built on os.scandir().
+        Directory entries carry their type, so no stat() call is made per file.
         """
         try:
-            for entry in path.iterdir():
-                # Prune hidden dirs and excluded dirs immediately
-                if entry.name in exclude_dirs or entry.name.startswith("."):
-                    continue
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    # Prune hidden dirs and excluded dirs immediately
+                    if entry.name in exclude_dirs or entry.name.startswith("."):
+                        continue
 
-                if entry.is_dir():
-                    yield from self._walk_pathlib(entry, exclude_dirs)
-                elif entry.is_file():
-                    yield entry
+                    if entry.is_dir():
+                        yield from self._walk_pathlib(path / entry.name, exclude_dirs)
+                    elif entry.is_file():
+                        yield path / entry.name
         except (PermissionError, OSError) as e:
             logger.warning("Skipping unreadable directory '%s': %s", path, e)
 
+    def _read_candidate(self, file_path: Path, max_size: int) -> SourceFileVo | None:
+        """
+        Applies the size guard and reads a walked file.
+        Returns None if the file is skipped by the guard.
+        """
+        try:
+            # stat() creates a system call, can raise OSError
+            stat = file_path.stat()
+            if stat.st_size > max_size and file_path.suffix != ".py":
+                return None
+        except OSError:
+            # If we can't even check size/existence, we likely can't read it.
+            # Report it as an error to notify the user.
+            return SourceFileVo(path=file_path, reading_error="Access Denied (stat failed)")
+
+        # _read_file_safe handles the try/catch logic internally.
+        # Stamped before reading: a concurrent edit leaves an older stamp, never a newer one.
+        return replace(self._read_file_safe(file_path), stamp=(stat.st_mtime_ns, stat.st_size))
+
+    def _read_pipelined(
+        self,
+        file_paths: Iterator[Path],
+        max_size: int,
+        workers: int,
+        read_ahead: int,
+    ) -> Generator[SourceFileVo, None, None]:
+        """
+        Producer/consumer ingest.
+
+        A walker thread submits reads to a thread pool and pushes the futures
+        into a bounded queue; the caller consumes them in walk order, so the
+        output is identical to the sequential mode. The queue bound provides
+        backpressure: the walker blocks once `read_ahead` files are in flight,
+        keeping memory flat while the consumer (AST parsing) catches up.
+        """
+        # None marks the end of the walk
+        in_flight: queue.Queue[Future[SourceFileVo | None] | BaseException | None] = queue.Queue(
+            maxsize=read_ahead
+        )
+        stop = threading.Event()
+
+        def put(item: Future[SourceFileVo | None] | BaseException | None) -> bool:
+            # Blocking put that gives up once the consumer has gone away
+            while not stop.is_set():
+                try:
+                    in_flight.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dddguard-read") as pool:
+
+            def produce() -> None:
+                try:
+                    for file_path in file_paths:
+                        if not put(pool.submit(self._read_candidate, file_path, max_size)):
+                            return
+                except BaseException as e:  # Surface walker failures to the consumer
+                    put(e)
+                finally:
+                    put(None)
+
+            walker = threading.Thread(target=produce, name="dddguard-walk", daemon=True)
+            walker.start()
+
+            try:
+                while True:
+                    item = in_flight.get()
+                    if item is None:
+                        break
+                    if isinstance(item, BaseException):
+                        raise item
+                    source_file = item.result()
+                    if source_file is not None:
+                        yield source_file
+            finally:
+                # Consumer finished or aborted: release the walker and drop pending reads
+                stop.set()
+                while True:
+                    try:
+                        pending = in_flight.get_nowait()
+                    except queue.Empty:
+                        break
+                    if isinstance(pending, Future):
+                        pending.cancel()
+                walker.join()
+
     def _read_file_safe(self, path: Path) -> SourceFileVo:
         """
         Internal helper: Attempts to read file content as UTF-8.
@@ -0,0 +1,43 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+
+from ....app import FileStamp, IModuleCache, ModuleCacheEntries
+from ....domain import ScannedModuleVo
+
+# (resolved target_path, scan_all)
+_TreeKey = tuple[str, bool]
+
+
+class InMemoryModuleCache(IModuleCache):
+    """
+    Driven Adapter: Parsed modules per scanned tree, kept for the process lifetime.
+
+    Lets long-lived sessions (interactive menu, daemon) rescan a tree by
+    re-parsing only the files that changed. Bounded to a few trees (LRU).
+    """
+
+    def __init__(self, max_trees: int = 4) -> None:
+        self._max_trees = max_trees
+        self._trees: OrderedDict[_TreeKey, ModuleCacheEntries] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def entries(
+        self, target_path: Path, scan_all: bool
+    ) -> Mapping[Path, tuple[FileStamp, ScannedModuleVo]]:
+        key = (str(target_path.resolve()), scan_all)
+        with self._lock:
+            entries = self._trees.get(key)
+            if entries is None:
+                return {}
+            self._trees.move_to_end(key)
+            return entries
+
+    def replace(self, target_path: Path, scan_all: bool, entries: ModuleCacheEntries) -> None:
+        key = (str(target_path.resolve()), scan_all)
+        with self._lock:
+            self._trees[key] = entries
+            self._trees.move_to_end(key)
+            while len(self._trees) > self._max_trees:
+                self._trees.popitem(last=False)
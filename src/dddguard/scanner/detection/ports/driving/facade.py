@@ -1,9 +1,15 @@
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from pathlib import Path
 
 from dddguard.shared.domain import CodeGraph, ScannerConfig
 
-from ...app import ScanProjectUseCase
+from ...app import (
+    ListProjectFilesUseCase,
+    ScanFilesUseCase,
+    ScanFocusUseCase,
+    ScanProjectUseCase,
+)
 from ..errors import InvalidScanPathError
 
 
@@ -18,6 +24,9 @@ class DetectionFacade:
     """
 
     scan_use_case: ScanProjectUseCase
+    list_files_use_case: ListProjectFilesUseCase
+    scan_files_use_case: ScanFilesUseCase
+    scan_focus_use_case: ScanFocusUseCase
 
     def scan_physical_project(
         self, scanner_config: ScannerConfig, target_path: Path, scan_all: bool = False
@@ -45,3 +54,74 @@ class DetectionFacade:
             target_path=target_path,
             scan_all=scan_all,
         )
+
+    def scan_physical_files(
+        self,
+        scanner_config: ScannerConfig,
+        target_path: Path,
+        file_paths: Iterable[Path],
+        known_modules: Mapping[str, Path] | None = None,
+    ) -> CodeGraph:
+        """
+        Detects only `file_paths`, linking their imports against the project's
+        `known_modules` (logical path -> file) instead of walking the tree.
+        Without `known_modules`, imported modules are located by name and added as
+        path-only nodes, so the graph can be classified without a project index.
+
+        :return: A CodeGraph of the given files (those a scan would not ingest are dropped).
+        :raises InvalidScanPathError: If the target path does not exist.
+        """
+        if not target_path.exists():
+            raise InvalidScanPathError(str(target_path))
+
+        return self.scan_files_use_case(
+            scanner_config=scanner_config,
+            target_path=target_path.resolve(),
+            file_paths=[file_path.resolve() for file_path in file_paths],
+            known_modules=known_modules,
+            with_targets=known_modules is None,
+        )
+
+    def scan_physical_focus(
+        self, scanner_config: ScannerConfig, target_path: Path, focus_path: Path
+    ) -> CodeGraph:
+        """
+        Detects the files under `focus_path` only. Their imports are resolved against
+        the whole of `target_path`, but modules outside the focus are located by name
+        and become path-only nodes (parsed only to follow re-exports).
+
+        :return: A CodeGraph of the focus files (LINKED) and the modules they import.
+        :raises InvalidScanPathError: If either path does not exist, or the focus
+            is not inside the target path.
+        """
+        if not target_path.exists():
+            raise InvalidScanPathError(str(target_path))
+        target_path = target_path.resolve()
+        focus_path = focus_path.resolve()
+        if not focus_path.exists() or not focus_path.is_relative_to(target_path):
+            raise InvalidScanPathError(str(focus_path))
+
+        return self.scan_focus_use_case(
+            scanner_config=scanner_config,
+            target_path=target_path,
+            focus_path=focus_path,
+        )
+
+    def list_physical_files(
+        self, scanner_config: ScannerConfig, target_path: Path, scan_all: bool = False
+    ) -> list[Path]:
+        """
+        Lists the files a scan would ingest, without reading or parsing them.
+
+        Cheap enough for interactive inventory (e.g. context discovery in wizards).
+
+        :raises InvalidScanPathError: If the target path does not exist.
+        """
+        if not target_path.exists():
+            raise InvalidScanPathError(str(target_path))
+
+        return self.list_files_use_case(
+            scanner_config=scanner_config,
+            target_path=target_path,
+            scan_all=scan_all,
+        )
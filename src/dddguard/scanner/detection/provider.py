@@ -1,10 +1,15 @@
 from dishka import Provider, Scope, provide
 
 from .app import (
+    IModuleCache,
     IProjectReader,
+    ListProjectFilesUseCase,
+    ScanFilesUseCase,
+    ScanFocusUseCase,
     ScanProjectUseCase,
 )
 from .ports.driven.storage.file_system_repository import FileSystemRepository
+from .ports.driven.storage.in_memory_module_cache import InMemoryModuleCache
 from .ports.driving.facade import DetectionFacade
 
 
@@ -20,8 +25,16 @@ class DetectionProvider(Provider):
     # Driven Adapters
     reader = provide(FileSystemRepository, provides=IProjectReader)
 
+    @provide
+    def provide_module_cache(self) -> IModuleCache:
+        # One per container: long-lived sessions re-parse only changed files
+        return InMemoryModuleCache()
+
     # Application Services
     scan_use_case = provide(ScanProjectUseCase)
+    scan_files_use_case = provide(ScanFilesUseCase)
+    scan_focus_use_case = provide(ScanFocusUseCase)
+    list_files_use_case = provide(ListProjectFilesUseCase)
 
     # Driving Port
     facade = provide(DetectionFacade)
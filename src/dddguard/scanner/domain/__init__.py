@@ -1,12 +1,45 @@
+from typing import TYPE_CHECKING, Any
+
+from .errors import QuerySyntaxError
 from .graph_expansion_service import GraphExpansionService
 from .graph_filtering_service import GraphFilteringService
+from .inventory_aggregation_service import InventoryAggregationService
 from .value_objects import (
+    ContextInventoryVo,
     DiscoveredContextVo,
+    ExpansionDirection,
+    FileScanVo,
+    InventoryContextVo,
+    QueryResultVo,
+    SnapshotInfoVo,
+    ViolationRecordVo,
 )
 
+if TYPE_CHECKING:
+    from .graph_query_service import GraphQueryService
+
 __all__ = [
+    "ContextInventoryVo",
     "DiscoveredContextVo",
+    "ExpansionDirection",
+    "FileScanVo",
     # Services
     "GraphExpansionService",
     "GraphFilteringService",
+    "GraphQueryService",
+    "InventoryAggregationService",
+    "InventoryContextVo",
+    "QueryResultVo",
+    "QuerySyntaxError",
+    "SnapshotInfoVo",
+    "ViolationRecordVo",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # The query engine (parser + planner) is loaded on first use, not with every command
+    if name == "GraphQueryService":
+        from .graph_query_service import GraphQueryService
+
+        return GraphQueryService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
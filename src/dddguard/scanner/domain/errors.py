@@ -0,0 +1,11 @@
+from dddguard.shared.helpers.generics import GenericDomainError
+
+
+class QuerySyntaxError(GenericDomainError):
+    """
+    Raised when a graph query cannot be parsed or references unknown values.
+    """
+
+    def __init__(self, message: str, query: str | None = None):
+        msg = f"{message} (in query: {query!r})" if query else message
+        super().__init__(message=msg, context_name="Scanner")
@@ -1,7 +1,13 @@
 from collections import deque
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 
-from dddguard.shared.domain import CodeGraph
+from dddguard.shared.domain import CodeGraph, CsrAdjacency
+
+from .value_objects import ExpansionDirection
+
+# Neighbour lookup: NodeID -> adjacent NodeIDs
+_Neighbours = Callable[[str], Iterable[str]]
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -9,47 +15,92 @@ class GraphExpansionService:
     """
     Domain Service: Graph Expansion (Additive Logic).
 
-    Responsible for revealing hidden dependencies in the CodeGraph.
-    It takes a set of "Visible" nodes and traverses their imports (outgoing edges)
-    up to a specified `depth`.
+    Responsible for revealing hidden nodes in the CodeGraph.
+    It takes a set of "Visible" nodes and traverses their edges up to a specified `depth`:
+    - DOWNSTREAM: imports (outgoing edges) -> dependencies.
+    - UPSTREAM: importers (incoming edges) -> dependents, i.e. impact analysis.
+    - BOTH: union of the two walks (they are not mixed: no "siblings via a common import").
 
     Algorithm:
     Uses Breadth-First Search (BFS) with 'budget tracking' to ensure we capture
-    dependencies reachable within N hops, resolving circular dependencies gracefully.
+    nodes reachable within N hops, resolving circular dependencies gracefully.
+    Given a `CsrAdjacency` snapshot instead, whole frontiers are expanded per level
+    over int arrays (vectorized when NumPy is available).
     """
 
     @staticmethod
     def expand(
-        graph: CodeGraph,
+        graph: CodeGraph | CsrAdjacency,
         initial_visible: set[str],
         depth: int,
+        direction: ExpansionDirection = ExpansionDirection.DOWNSTREAM,
     ) -> set[str]:
         """
         Executes the expansion logic.
 
-        :param graph: The fully linked CodeGraph (containing all nodes).
+        :param graph: The fully linked CodeGraph (containing all nodes),
+                      or a CSR snapshot of it.
         :param initial_visible: The set of Node IDs (paths) currently visible (seeds).
         :param depth: Recursion depth.
                       0 = Strict (no expansion).
-                      1 = Include direct imports.
+                      1 = Include direct imports (or importers).
                       2 = Include imports of imports.
-        :return: A superset of initial_visible containing discovered dependencies.
+        :param direction: Which edges to follow.
+        :return: A superset of initial_visible containing discovered nodes.
         """
         # Optimization: Zero depth means no work needed
         if depth <= 0:
             return initial_visible
 
-        # We start with what is already visible
+        if isinstance(graph, CsrAdjacency):
+            return GraphExpansionService._expand_csr(graph, initial_visible, depth, direction)
+
+        final_visible = set(initial_visible)
+
+        if direction in (ExpansionDirection.DOWNSTREAM, ExpansionDirection.BOTH):
+            final_visible |= GraphExpansionService._budgeted_bfs(
+                initial_visible, depth, GraphExpansionService._imports_of(graph)
+            )
+
+        if direction in (ExpansionDirection.UPSTREAM, ExpansionDirection.BOTH):
+            final_visible |= GraphExpansionService._budgeted_bfs(
+                initial_visible, depth, GraphExpansionService._importers_of(graph)
+            )
+
+        return final_visible
+
+    # --- INTERNAL HELPERS ---
+
+    @staticmethod
+    def _expand_csr(
+        adjacency: CsrAdjacency,
+        initial_visible: set[str],
+        depth: int,
+        direction: ExpansionDirection,
+    ) -> set[str]:
         final_visible = set(initial_visible)
 
+        if direction in (ExpansionDirection.DOWNSTREAM, ExpansionDirection.BOTH):
+            final_visible |= adjacency.reach_paths(initial_visible, depth)
+
+        if direction in (ExpansionDirection.UPSTREAM, ExpansionDirection.BOTH):
+            final_visible |= adjacency.reach_paths(initial_visible, depth, upstream=True)
+
+        return final_visible
+
+    @staticmethod
+    def _budgeted_bfs(seeds: set[str], depth: int, neighbours: _Neighbours) -> set[str]:
+        # We start with what is already visible
+        reached = set(seeds)
+
         # BFS Queue structure: (NodeID, RemainingDepthBudget)
-        queue: deque[tuple[str, int]] = deque((node_id, depth) for node_id in initial_visible)
+        queue: deque[tuple[str, int]] = deque((node_id, depth) for node_id in seeds)
 
         # Visited Map: NodeID -> MaxBudgetSeen
         # Critical for BFS efficiency: We only re-process a node if we reach it
         # with a HIGHER budget than before (meaning we found a shorter path to it,
-        # allowing us to go deeper into its children).
-        visited: dict[str, int] = dict.fromkeys(initial_visible, depth)
+        # allowing us to go deeper into its neighbours).
+        visited: dict[str, int] = dict.fromkeys(seeds, depth)
 
         while queue:
             current_id, budget = queue.popleft()
@@ -58,14 +109,7 @@ class GraphExpansionService:
             if budget <= 0:
                 continue
 
-            # Resolve Node
-            # Assuming graph.nodes is Dict[str, Node]
-            current_node = graph.nodes.get(current_id)
-            if not current_node:
-                continue
-
-            # Traverse Outgoing Edges (Imports)
-            for target_id in current_node.imports:
+            for target_id in neighbours(current_id):
                 new_budget = budget - 1
 
                 # Additive Logic:
@@ -73,7 +117,28 @@ class GraphExpansionService:
                 # 2. Existing Node but found via shorter path (more budget)? Update & requeue.
                 if target_id not in visited or visited[target_id] < new_budget:
                     visited[target_id] = new_budget
-                    final_visible.add(target_id)
+                    reached.add(target_id)
                     queue.append((target_id, new_budget))
 
-        return final_visible
+        return reached
+
+    @staticmethod
+    def _imports_of(graph: CodeGraph) -> _Neighbours:
+        def neighbours(node_id: str) -> Iterable[str]:
+            node = graph.nodes.get(node_id)
+            return node.imports if node else ()
+
+        return neighbours
+
+    @staticmethod
+    def _importers_of(graph: CodeGraph) -> _Neighbours:
+        # Maintained reverse index on real graphs (and SQL-backed on SQLite views)
+        if hasattr(graph, "importers_of"):
+            return graph.importers_of
+
+        # Graph-like objects: build the reverse adjacency once (O(E)), not per hop
+        reverse: dict[str, set[str]] = {}
+        for node_id, node in graph.nodes.items():
+            for target_id in node.imports:
+                reverse.setdefault(target_id, set()).add(node_id)
+        return lambda node_id: reverse.get(node_id, ())
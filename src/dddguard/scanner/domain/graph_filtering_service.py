@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from pathlib import Path
 
-from dddguard.shared.domain import ArchetypeType, CodeGraph, CodeNode
+from dddguard.shared.domain import ArchetypeType, CodeGraph, CodeNode, LayerEnum
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -39,13 +39,20 @@ class GraphFilteringService:
         :param include_assets: Whether to include non-code files.
         :return: A set of Node Paths (IDs) that are visible.
         """
-        surviving_nodes: set[str] = set()
-
         # Pre-process arguments for O(1) lookups
-        focus_path_str = str(focus_path.resolve())
         allowed_layers = set(whitelist_layers) if whitelist_layers else None
         allowed_contexts = set(whitelist_contexts) if whitelist_contexts else None
 
+        # Duck-typed: any graph exposing the index queries (CodeGraph, SQLite views)
+        if hasattr(graph, "nodes_under"):
+            return GraphFilteringService._focus_from_indexes(
+                graph, focus_path, allowed_layers, allowed_contexts, include_assets
+            )
+
+        # Fallback for graph-like objects without indexes: per-node scan
+        surviving_nodes: set[str] = set()
+        focus_path_str = str(focus_path.resolve())
+
         for path, node in graph.nodes.items():
             # 0. Safety: Skip unclassified nodes (cannot apply logic to them)
             if not node.passport:
@@ -85,16 +92,59 @@ class GraphFilteringService:
         """
         final_set = set()
 
-        for path, node in graph.nodes.items():
-            if path in visible_modules:
+        # Only visible nodes change state: cost follows the visibility set, not the graph
+        for path in visible_modules:
+            node = graph.nodes.get(path)
+            if node is not None:
                 node.finalize()
                 final_set.add(path)
-            # Implicit else: Node remains hidden.
+            # Implicit: every other node remains hidden.
 
         return final_set
 
     # --- INTERNAL HELPERS ---
 
+    @staticmethod
+    def _focus_from_indexes(
+        graph: CodeGraph,
+        focus_path: Path,
+        allowed_layers: set[str] | None,
+        allowed_contexts: set[str] | None,
+        include_assets: bool,
+    ) -> set[str]:
+        """
+        Same result as the per-node scan, computed from the graph's secondary indexes.
+
+        With a context whitelist every survivor must belong to a whitelisted context,
+        and every such node is a candidate, so the physical check is skipped entirely:
+        the cost is proportional to the selected contexts.
+        """
+        # 1. Candidates (classified nodes only)
+        if allowed_contexts is not None:
+            surviving: set[str] = set()
+            for context_name in allowed_contexts:
+                surviving |= graph.nodes_in_context(context_name)
+        else:
+            surviving = {
+                path
+                for path in graph.nodes_under(focus_path)
+                if graph.nodes[path].passport_id is not None
+            }
+
+        # 2. Layer Filter
+        if allowed_layers:
+            layer_nodes: set[str] = set()
+            for layer in LayerEnum:
+                if layer.value in allowed_layers:
+                    layer_nodes |= graph.nodes_in_layer(layer)
+            surviving &= layer_nodes
+
+        # 3. Asset Filter
+        if not include_assets and surviving:
+            surviving -= graph.nodes_of_type(ArchetypeType.ASSET)
+
+        return surviving
+
     @staticmethod
     def _is_physical_candidate(
         node: CodeNode,
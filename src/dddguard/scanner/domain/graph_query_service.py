@@ -0,0 +1,624 @@
+import re
+from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass, replace
+from enum import Enum
+from fnmatch import fnmatchcase
+from typing import Final
+
+from dddguard.shared.domain import (
+    AdapterType,
+    AppType,
+    ArchetypeType,
+    CodeGraph,
+    CompositionType,
+    DirectionEnum,
+    DomainType,
+    LayerEnum,
+    PortType,
+    ReachabilityIndex,
+    ScopeEnum,
+)
+
+from .errors import QuerySyntaxError
+from .value_objects import QueryResultVo
+
+# Longest import chain a `paths` query follows unless `max N` says otherwise
+DEFAULT_MAX_PATH_LENGTH: Final[int] = 6
+
+# Query field -> ComponentPassport attribute
+_PASSPORT_FIELDS: Final[dict[str, str]] = {
+    "context": "context_name",
+    "macro": "macro_zone",
+    "layer": "layer",
+    "direction": "direction",
+    "scope": "scope",
+    "type": "component_type",
+}
+
+# Enum-backed fields only accept known values (matched case-insensitively)
+_ENUM_VALUES: Final[dict[str, frozenset[str]]] = {
+    "layer": frozenset(m.value for m in LayerEnum),
+    "direction": frozenset(m.value for m in DirectionEnum),
+    "scope": frozenset(m.value for m in ScopeEnum),
+    "type": frozenset(
+        m.value
+        for enum in (DomainType, AppType, PortType, AdapterType, CompositionType, ArchetypeType)
+        for m in enum
+    ),
+}
+
+_GLOB_CHARS: Final[frozenset[str]] = frozenset("*?[")
+
+_TOKEN_RE: Final[re.Pattern[str]] = re.compile(
+    r"""\s*(?:(?P<op>!=|=|\(|\)|,)|"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<word>[^\s=!(),'"]+))"""
+)
+
+NODE_COLUMNS: Final[tuple[str, ...]] = ("path", "context", "layer", "direction", "type")
+EDGE_COLUMNS: Final[tuple[str, ...]] = ("source", "source_context", "target", "target_context")
+PATH_COLUMNS: Final[tuple[str, ...]] = ("source", "target", "length", "via")
+
+
+# --- Query AST ---
+
+
+@dataclass(frozen=True, slots=True)
+class _Field:
+    name: str
+    values: frozenset[str]
+
+
+@dataclass(frozen=True, slots=True)
+class _Not:
+    operand: "_Expr"
+
+
+@dataclass(frozen=True, slots=True)
+class _And:
+    operands: tuple["_Expr", ...]
+
+
+@dataclass(frozen=True, slots=True)
+class _Or:
+    operands: tuple["_Expr", ...]
+
+
+@dataclass(frozen=True, slots=True)
+class _Imports:
+    """Nodes importing at least one node matching `operand`."""
+
+    operand: "_Expr"
+
+
+@dataclass(frozen=True, slots=True)
+class _ImportedBy:
+    """Nodes imported by at least one node matching `operand`."""
+
+    operand: "_Expr"
+
+
+@dataclass(frozen=True, slots=True)
+class _Reaches:
+    """Nodes transitively importing at least one node matching `operand`."""
+
+    operand: "_Expr"
+
+
+@dataclass(frozen=True, slots=True)
+class _ReachedBy:
+    """Nodes transitively imported by at least one node matching `operand`."""
+
+    operand: "_Expr"
+
+
+# Edge predicate keyword -> AST node
+_EDGE_PREDICATES: Final[dict[str, Callable[["_Expr"], "_Expr"]]] = {
+    "imports": _Imports,
+    "imported_by": _ImportedBy,
+    "reaches": _Reaches,
+    "reached_by": _ReachedBy,
+}
+
+_Expr = _Field | _Not | _And | _Or | _Imports | _ImportedBy | _Reaches | _ReachedBy
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _Query:
+    kind: str  # nodes | edges | paths
+    where: _Expr | None = None
+    source: _Expr | None = None
+    target: _Expr | None = None
+    min_length: int = 1
+    max_length: int = DEFAULT_MAX_PATH_LENGTH
+    limit: int | None = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class GraphQueryService:
+    """
+    Domain Service: Declarative queries over a classified CodeGraph.
+
+    Grammar (keywords are case-insensitive)::
+
+        nodes [where EXPR]
+        edges [from EXPR] [to EXPR]
+        paths from EXPR to EXPR [min N] [max N]
+        ... [limit N]
+
+        EXPR := EXPR or EXPR | EXPR and EXPR | not EXPR | ( EXPR )
+              | FIELD = VALUE | FIELD != VALUE | FIELD in (VALUE, ...)
+              | imports(EXPR) | imported_by(EXPR)
+              | reaches(EXPR) | reached_by(EXPR)
+        FIELD := context | macro | layer | direction | scope | type | path
+
+    `path` values are globs over dotted module paths (`billing.app.*`).
+    `paths` rows are shortest import chains, `length` counted in hops.
+    `reaches` / `reached_by` are the transitive forms of `imports` / `imported_by`.
+
+    Planning:
+    Passport fields are answered from the graph's passport index and
+    intersected smallest-first; the remaining conjuncts (globs, negations,
+    edge predicates) only filter the surviving candidates. Edge predicates
+    walk the forward or reverse adjacency of the smaller side, and path
+    searches run a BFS bounded by `max` from whichever end has fewer nodes.
+    Transitive predicates read the graph's cached `ReachabilityIndex`.
+    """
+
+    @staticmethod
+    def execute(graph: CodeGraph, query: str) -> QueryResultVo:
+        """
+        Parses and runs `query` against every node of `graph` (status is ignored).
+
+        :raises QuerySyntaxError: The query is malformed or uses unknown values.
+        """
+        parsed = _Parser(query).parse()
+        planner = _Planner(graph)
+
+        if parsed.kind == "nodes":
+            columns = NODE_COLUMNS
+            rows = [planner.node_row(path) for path in sorted(planner.select_or_all(parsed.where))]
+        elif parsed.kind == "edges":
+            columns = EDGE_COLUMNS
+            rows = sorted(planner.edges(parsed.source, parsed.target))
+        else:
+            columns = PATH_COLUMNS
+            rows = sorted(
+                planner.paths(parsed.source, parsed.target, parsed.min_length, parsed.max_length)
+            )
+
+        total = len(rows)
+        if parsed.limit is not None:
+            rows = rows[: parsed.limit]
+        return QueryResultVo(columns=columns, rows=tuple(rows), total=total)
+
+
+# --- Parser ---
+
+
+class _Parser:
+    """Recursive-descent parser: `not` binds tighter than `and`, `and` tighter than `or`."""
+
+    def __init__(self, text: str) -> None:
+        self._text = text
+        self._tokens = self._tokenize(text)
+        self._pos = 0
+
+    def parse(self) -> _Query:
+        kind = self._expect_word("'nodes', 'edges' or 'paths'").lower()
+
+        if kind == "nodes":
+            query = _Query(kind=kind, where=self._expr() if self._accept("where") else None)
+        elif kind == "edges":
+            source = self._expr() if self._accept("from") else None
+            target = self._expr() if self._accept("to") else None
+            query = _Query(kind=kind, source=source, target=target)
+        elif kind == "paths":
+            self._expect("from")
+            source = self._expr()
+            self._expect("to")
+            target = self._expr()
+            min_length = self._int() if self._accept("min") else 1
+            max_length = (
+                self._int() if self._accept("max") else max(DEFAULT_MAX_PATH_LENGTH, min_length)
+            )
+            if min_length < 1 or max_length < min_length:
+                raise self._error(f"Invalid path length bounds: min {min_length}, max {max_length}")
+            query = _Query(
+                kind=kind,
+                source=source,
+                target=target,
+                min_length=min_length,
+                max_length=max_length,
+            )
+        else:
+            raise self._error(f"Unknown query kind {kind!r}: expected 'nodes', 'edges' or 'paths'")
+
+        if self._accept("limit"):
+            query = replace(query, limit=self._int())
+
+        if self._pos < len(self._tokens):
+            raise self._error(f"Unexpected {self._tokens[self._pos][1]!r}")
+        return query
+
+    # --- Expressions ---
+
+    def _expr(self) -> _Expr:
+        operands = [self._conjunction()]
+        while self._accept("or"):
+            operands.append(self._conjunction())
+        return operands[0] if len(operands) == 1 else _Or(tuple(operands))
+
+    def _conjunction(self) -> _Expr:
+        operands = [self._unary()]
+        while self._accept("and"):
+            operands.append(self._unary())
+        return operands[0] if len(operands) == 1 else _And(tuple(operands))
+
+    def _unary(self) -> _Expr:
+        if self._accept("not"):
+            return _Not(self._unary())
+        if self._accept_op("("):
+            expr = self._expr()
+            self._expect_op(")")
+            return expr
+
+        name = self._expect_word("a field or an edge predicate such as 'imports(...)'").lower()
+        if name in _EDGE_PREDICATES:
+            self._expect_op("(")
+            operand = self._expr()
+            self._expect_op(")")
+            return _EDGE_PREDICATES[name](operand)
+
+        if name != "path" and name not in _PASSPORT_FIELDS:
+            fields = ", ".join(["path", *_PASSPORT_FIELDS])
+            raise self._error(f"Unknown field {name!r} (expected one of: {fields})")
+
+        if self._accept_op("="):
+            return self._field(name, [self._value()])
+        if self._accept_op("!="):
+            return _Not(self._field(name, [self._value()]))
+        if self._accept("in"):
+            self._expect_op("(")
+            values = [self._value()]
+            while self._accept_op(","):
+                values.append(self._value())
+            self._expect_op(")")
+            return self._field(name, values)
+
+        raise self._error(f"Expected '=', '!=' or 'in' after {name!r}")
+
+    def _field(self, name: str, values: list[str]) -> _Field:
+        allowed = _ENUM_VALUES.get(name)
+        if allowed is not None:
+            values = [value.upper() for value in values]
+            for value in values:
+                if value not in allowed:
+                    raise self._error(
+                        f"Unknown {name} {value!r} (expected one of: {', '.join(sorted(allowed))})"
+                    )
+        return _Field(name, frozenset(values))
+
+    # --- Tokens ---
+
+    @staticmethod
+    def _tokenize(text: str) -> list[tuple[str, str]]:
+        tokens: list[tuple[str, str]] = []
+        pos = 0
+        while pos < len(text):
+            match = _TOKEN_RE.match(text, pos)
+            if match is None or match.end() == pos:
+                if text[pos:].strip():
+                    raise QuerySyntaxError(f"Unexpected character {text[pos:].strip()[0]!r}", text)
+                break
+            pos = match.end()
+            kind = match.lastgroup
+            if kind is None:
+                continue
+            # Quoted strings are always values, never keywords
+            tokens.append(("str" if kind in ("dq", "sq") else kind, match.group(kind)))
+        return tokens
+
+    def _peek(self) -> tuple[str, str] | None:
+        return self._tokens[self._pos] if self._pos < len(self._tokens) else None
+
+    def _accept(self, keyword: str) -> bool:
+        token = self._peek()
+        if token is not None and token[0] == "word" and token[1].lower() == keyword:
+            self._pos += 1
+            return True
+        return False
+
+    def _accept_op(self, op: str) -> bool:
+        if self._peek() == ("op", op):
+            self._pos += 1
+            return True
+        return False
+
+    def _expect(self, keyword: str) -> None:
+        if not self._accept(keyword):
+            raise self._error(f"Expected {keyword!r}")
+
+    def _expect_op(self, op: str) -> None:
+        if not self._accept_op(op):
+            raise self._error(f"Expected {op!r}")
+
+    def _expect_word(self, what: str) -> str:
+        token = self._peek()
+        if token is None or token[0] != "word":
+            raise self._error(f"Expected {what}")
+        self._pos += 1
+        return token[1]
+
+    def _value(self) -> str:
+        token = self._peek()
+        if token is None or token[0] not in ("word", "str"):
+            raise self._error("Expected a value")
+        self._pos += 1
+        return token[1]
+
+    def _int(self) -> int:
+        value = self._expect_word("a number")
+        if not value.isdigit():
+            raise self._error(f"Expected a number, got {value!r}")
+        return int(value)
+
+    def _error(self, message: str) -> QuerySyntaxError:
+        token = self._peek()
+        where = f" at {token[1]!r}" if token else " at end of query"
+        return QuerySyntaxError(message + where, self._text)
+
+
+# --- Planner / Executor ---
+
+
+class _Planner:
+    """
+    Evaluates expressions against one graph. Selected node sets are memoized
+    per sub-expression, so a predicate reused for filtering is computed once.
+    """
+
+    def __init__(self, graph: CodeGraph) -> None:
+        self._graph = graph
+        self._selected: dict[_Expr, AbstractSet[str]] = {}
+        self._reachability: ReachabilityIndex | None = None
+
+    # --- Results ---
+
+    def select_or_all(self, expr: _Expr | None) -> AbstractSet[str]:
+        return self._graph.nodes.keys() if expr is None else self.select(expr)
+
+    def node_row(self, path: str) -> tuple[str, ...]:
+        node = self._graph.nodes[path]
+        passport = node.passport
+        if passport is None:
+            return (path, "", "", "", "")
+        return (
+            path,
+            passport.context_name or "",
+            passport.layer.value,
+            passport.direction.value,
+            passport.component_type.value,
+        )
+
+    def edges(self, source: _Expr | None, target: _Expr | None) -> Iterator[tuple[str, ...]]:
+        nodes = self._graph.nodes
+        sources = None if source is None else self.select(source)
+        targets = None if target is None else self.select(target)
+
+        if targets is None or (sources is not None and len(sources) <= len(targets)):
+            # Walk imports forward from the (smaller) source side
+            for src in nodes.keys() if sources is None else sources:
+                for dst in nodes[src].imports:
+                    if dst in nodes and (targets is None or dst in targets):
+                        yield self._edge_row(src, dst)
+        else:
+            # Walk the importers index backwards from the (smaller) target side
+            for dst in targets:
+                for src in self._graph.importers_of(dst):
+                    if sources is None or src in sources:
+                        yield self._edge_row(src, dst)
+
+    def paths(
+        self, source: _Expr | None, target: _Expr | None, min_length: int, max_length: int
+    ) -> Iterator[tuple[str, ...]]:
+        sources = self.select_or_all(source)
+        targets = self.select_or_all(target)
+        if not sources or not targets:
+            return
+
+        if len(sources) <= len(targets):
+            for src in sources:
+                for dst, chain in self._bounded_bfs(src, targets, max_length, self._imports_of):
+                    if len(chain) - 1 >= min_length:
+                        yield (src, dst, str(len(chain) - 1), " -> ".join(chain))
+        else:
+            # Reverse search: the chain found from a target leads back to a source
+            for dst in targets:
+                for src, chain in self._bounded_bfs(dst, sources, max_length, self._importers_of):
+                    if len(chain) - 1 >= min_length:
+                        chain.reverse()
+                        yield (src, dst, str(len(chain) - 1), " -> ".join(chain))
+
+    # --- Selection ---
+
+    def select(self, expr: _Expr) -> AbstractSet[str]:
+        selected = self._selected.get(expr)
+        if selected is None:
+            selected = self._select(expr)
+            self._selected[expr] = selected
+        return selected
+
+    def _select(self, expr: _Expr) -> AbstractSet[str]:
+        graph = self._graph
+        nodes = graph.nodes
+
+        if isinstance(expr, _Field):
+            if expr.name == "path":
+                return self._select_paths(expr.values)
+            return graph.nodes_matching_passport(_passport_predicate(expr))
+
+        if isinstance(expr, _Imports):
+            importers: set[str] = set()
+            for path in self.select(expr.operand):
+                importers |= graph.importers_of(path)
+            return importers
+
+        if isinstance(expr, _ImportedBy):
+            imported: set[str] = set()
+            for path in self.select(expr.operand):
+                imported.update(target for target in nodes[path].imports if target in nodes)
+            return imported
+
+        if isinstance(expr, _Reaches):
+            return self._reachable().ancestors(self.select(expr.operand)) & nodes.keys()
+
+        if isinstance(expr, _ReachedBy):
+            return self._reachable().descendants(self.select(expr.operand)) & nodes.keys()
+
+        if isinstance(expr, _Or):
+            union: set[str] = set()
+            for operand in expr.operands:
+                union |= self.select(operand)
+            return union
+
+        if isinstance(expr, _Not):
+            return nodes.keys() - self.select(expr.operand)
+
+        return self._select_conjunction(expr.operands)
+
+    def _select_conjunction(self, operands: tuple[_Expr, ...]) -> AbstractSet[str]:
+        indexed = [operand for operand in operands if _is_indexed(operand)]
+        filters = sorted((operand for operand in operands if not _is_indexed(operand)), key=_cost)
+
+        if indexed:
+            sets = sorted((self.select(operand) for operand in indexed), key=len)
+            candidates = set(sets[0])
+            for other in sets[1:]:
+                candidates &= other
+        else:
+            candidates = set(self.select(filters.pop(0)))
+
+        if not filters:
+            return candidates
+        return {path for path in candidates if all(self._matches(f, path) for f in filters)}
+
+    def _select_paths(self, patterns: frozenset[str]) -> set[str]:
+        nodes = self._graph.nodes
+        result = {pattern for pattern in patterns if not _is_glob(pattern) and pattern in nodes}
+        globs = [pattern for pattern in patterns if _is_glob(pattern)]
+        if globs:
+            result.update(path for path in nodes if any(fnmatchcase(path, g) for g in globs))
+        return result
+
+    def _matches(self, expr: _Expr, path: str) -> bool:
+        """Per-candidate check (used for conjuncts that have no cheap index)."""
+        if isinstance(expr, _Field):
+            if expr.name == "path":
+                return any(fnmatchcase(path, pattern) for pattern in expr.values)
+            passport = self._graph.nodes[path].passport
+            return passport is not None and _passport_predicate(expr)(passport)
+        if isinstance(expr, _Imports):
+            return not self.select(expr.operand).isdisjoint(self._graph.nodes[path].imports)
+        if isinstance(expr, _ImportedBy):
+            return not self.select(expr.operand).isdisjoint(self._graph.importers_of(path))
+        if isinstance(expr, (_Reaches, _ReachedBy)):
+            return path in self.select(expr)
+        if isinstance(expr, _Not):
+            return not self._matches(expr.operand, path)
+        if isinstance(expr, _Or):
+            return any(self._matches(operand, path) for operand in expr.operands)
+        return all(self._matches(operand, path) for operand in expr.operands)
+
+    # --- Traversal ---
+
+    def _reachable(self) -> ReachabilityIndex:
+        if self._reachability is None:
+            self._reachability = ReachabilityIndex.for_graph(self._graph)
+        return self._reachability
+
+    def _imports_of(self, path: str) -> Iterable[str]:
+        return self._graph.nodes[path].imports
+
+    def _importers_of(self, path: str) -> Iterable[str]:
+        return self._graph.importers_of(path)
+
+    def _bounded_bfs(
+        self,
+        start: str,
+        goals: AbstractSet[str],
+        max_length: int,
+        neighbours: Callable[[str], Iterable[str]],
+    ) -> Iterator[tuple[str, list[str]]]:
+        """Yields (goal, chain from `start`) for every goal within `max_length` hops."""
+        nodes = self._graph.nodes
+        parents: dict[str, str | None] = {start: None}
+        frontier = [start]
+
+        for _ in range(max_length):
+            next_frontier: list[str] = []
+            for current in frontier:
+                for neighbour in sorted(neighbours(current)):
+                    if neighbour in parents or neighbour not in nodes:
+                        continue
+                    parents[neighbour] = current
+                    next_frontier.append(neighbour)
+                    if neighbour in goals:
+                        yield neighbour, _chain(parents, neighbour)
+            if not next_frontier:
+                return
+            frontier = next_frontier
+
+    def _edge_row(self, source: str, target: str) -> tuple[str, ...]:
+        return (source, self._context_of(source), target, self._context_of(target))
+
+    def _context_of(self, path: str) -> str:
+        passport = self._graph.nodes[path].passport
+        return (passport.context_name or "") if passport else ""
+
+
+# --- Helpers ---
+
+
+def _passport_predicate(field: _Field) -> Callable[..., bool]:
+    attribute = _PASSPORT_FIELDS[field.name]
+    values = field.values
+
+    def predicate(passport) -> bool:
+        value = getattr(passport, attribute)
+        return (value.value if isinstance(value, Enum) else value) in values
+
+    return predicate
+
+
+def _is_glob(pattern: str) -> bool:
+    return not _GLOB_CHARS.isdisjoint(pattern)
+
+
+def _is_indexed(expr: _Expr) -> bool:
+    """True when `select` is answered from an index (cost ~ result size)."""
+    if isinstance(expr, _Field):
+        return expr.name != "path" or not any(_is_glob(v) for v in expr.values)
+    if isinstance(expr, _Or):
+        return all(_is_indexed(operand) for operand in expr.operands)
+    return False
+
+
+def _cost(expr: _Expr) -> int:
+    # Order for non-indexed conjuncts: the first is selected, the rest filter
+    if isinstance(expr, (_Imports, _ImportedBy, _Reaches, _ReachedBy)):
+        return 0
+    if isinstance(expr, (_And, _Or)):
+        return 1
+    if isinstance(expr, _Field):
+        return 2
+    return 3
+
+
+def _chain(parents: dict[str, str | None], end: str) -> list[str]:
+    chain = [end]
+    parent = parents[end]
+    while parent is not None:
+        chain.append(parent)
+        parent = parents[parent]
+    chain.reverse()
+    return chain
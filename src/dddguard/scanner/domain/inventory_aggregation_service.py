@@ -0,0 +1,62 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+from dddguard.shared.domain import CodeGraph, LayerEnum
+
+from .value_objects import ContextInventoryVo, InventoryContextVo
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class InventoryAggregationService:
+    """
+    Domain Service: Context Inventory Aggregation.
+
+    Condenses a CLASSIFIED CodeGraph into a `ContextInventoryVo`:
+    one entry per (context, macro zone) with the layers present and the node count.
+    """
+
+    @staticmethod
+    def build(graph: CodeGraph, source_dir: Path, fingerprint: str) -> ContextInventoryVo:
+        """
+        :param graph: The CLASSIFIED CodeGraph (any visibility state).
+        :param source_dir: The scanned source root.
+        :param fingerprint: State token of the source tree at scan time.
+        """
+        layers: dict[tuple[str, str | None], set[str]] = defaultdict(set)
+        counts: dict[tuple[str, str | None], int] = defaultdict(int)
+
+        for node in graph.nodes.values():
+            passport = node.passport
+            if not passport or not passport.context_name:
+                continue
+
+            key = (passport.context_name, passport.macro_zone)
+            counts[key] += 1
+            if passport.layer not in (LayerEnum.UNDEFINED, LayerEnum.GLOBAL):
+                layers[key].add(passport.layer.value)
+
+        contexts = [
+            InventoryContextVo(
+                context_name=name,
+                macro_zone=macro,
+                layers=tuple(sorted(layers[(name, macro)])),
+                node_count=count,
+            )
+            for (name, macro), count in counts.items()
+        ]
+
+        return ContextInventoryVo(
+            source_dir=str(source_dir),
+            fingerprint=fingerprint,
+            contexts=tuple(sorted(contexts, key=InventoryAggregationService._sort_key)),
+        )
+
+    @staticmethod
+    def _sort_key(c: InventoryContextVo) -> tuple[str, ...]:
+        # Root -> Shared -> Business contexts (by macro zone, then name)
+        if c.context_name == "root":
+            return ("0_root", "")
+        if c.context_name == "shared":
+            return ("1_shared", "")
+        return ("2_biz", c.macro_zone or "", c.context_name)
@@ -1,4 +1,18 @@
 from dataclasses import dataclass
+from enum import Enum, unique
+
+from dddguard.shared.domain import CodeGraph
+
+
+@unique
+class ExpansionDirection(str, Enum):
+    """
+    Which edges the import-depth expansion follows from the visible nodes.
+    """
+
+    DOWNSTREAM = "downstream"  # What the focus imports (dependencies)
+    UPSTREAM = "upstream"  # What imports the focus (dependents / impact)
+    BOTH = "both"
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -9,3 +23,102 @@ class DiscoveredContextVo:
 
     context_name: str
     macro_zone: str | None
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class InventoryContextVo:
+    """
+    Value Object: Summary of one Bounded Context as recorded in the inventory.
+    """
+
+    context_name: str
+    macro_zone: str | None
+    layers: tuple[str, ...]
+    node_count: int
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ContextInventoryVo:
+    """
+    Value Object: Compact summary of the last completed scan of a source tree.
+
+    Small enough to be loaded on every shell completion request.
+    `fingerprint` identifies the state of the source tree the inventory was built from.
+    """
+
+    source_dir: str
+    fingerprint: str
+    contexts: tuple[InventoryContextVo, ...]
+
+    @property
+    def context_names(self) -> list[str]:
+        return [c.context_name for c in self.contexts]
+
+    @property
+    def macro_zones(self) -> list[str]:
+        return sorted({c.macro_zone for c in self.contexts if c.macro_zone})
+
+    @property
+    def layers(self) -> list[str]:
+        return sorted({layer for c in self.contexts for layer in c.layers})
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class SnapshotInfoVo:
+    """
+    Value Object: Header of a persisted classified graph (see `IGraphSnapshotStore`).
+
+    `source_dir` is the root the node file paths are resolved against.
+    """
+
+    snapshot_path: str
+    source_dir: str
+    scan_all: bool
+    has_content: bool
+    node_count: int
+    edge_count: int
+    size_bytes: int
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ViolationRecordVo:
+    """
+    Value Object: A lint finding as persisted next to a graph snapshot.
+    """
+
+    rule_name: str
+    severity: str
+    source_path: str
+    target_path: str
+    target_context: str | None
+    message: str
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class QueryResultVo:
+    """
+    Value Object: Tabular answer of a graph query (see `GraphQueryService`).
+
+    `total` counts all matching rows; `rows` may be cut short by `limit`.
+    """
+
+    columns: tuple[str, ...]
+    rows: tuple[tuple[str, ...], ...]
+    total: int
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class FileScanVo:
+    """
+    Value Object: Fresh state of a few changed files, placed in their project.
+
+    `graph` holds the changed nodes (re-detected and re-classified) plus copies of
+    the project nodes needed to judge their edges: every import target, and the
+    importers of `reclassified` nodes. `reclassified` lists the changed paths whose
+    passport differs from the project index (including paths new to it); it is
+    empty when there was no index to compare with.
+    """
+
+    graph: CodeGraph
+    changed: tuple[str, ...]
+    reclassified: tuple[str, ...]
@@ -1,3 +1,4 @@
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -6,6 +7,7 @@ from dddguard.shared.domain import CodeGraph, ScannerConfig
 from ...app import IClassificationGateway, IDetectionGateway
 from ...classification.ports.driving.facade import ClassificationFacade
 from ...detection.ports.driving.facade import DetectionFacade
+from ...domain import DiscoveredContextVo
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -24,6 +26,38 @@ class DetectionInternalGateway(IDetectionGateway):
             scan_all=scan_all,
         )
 
+    def scan_files(
+        self,
+        scanner_config: ScannerConfig,
+        target_path: Path,
+        file_paths: Iterable[Path],
+        known_modules: Mapping[str, Path] | None = None,
+    ) -> CodeGraph:
+        return self.facade.scan_physical_files(
+            scanner_config=scanner_config,
+            target_path=target_path,
+            file_paths=file_paths,
+            known_modules=known_modules,
+        )
+
+    def scan_focus(
+        self, scanner_config: ScannerConfig, target_path: Path, focus_path: Path
+    ) -> CodeGraph:
+        return self.facade.scan_physical_focus(
+            scanner_config=scanner_config,
+            target_path=target_path,
+            focus_path=focus_path,
+        )
+
+    def list_files(
+        self, scanner_config: ScannerConfig, target_path: Path, scan_all: bool
+    ) -> list[Path]:
+        return self.facade.list_physical_files(
+            scanner_config=scanner_config,
+            target_path=target_path,
+            scan_all=scan_all,
+        )
+
 
 @dataclass(frozen=True, kw_only=True, slots=True)
 class ClassificationInternalGateway(IClassificationGateway):
@@ -36,3 +70,13 @@ class ClassificationInternalGateway(IClassificationGateway):
     def classify(self, graph: CodeGraph, source_dir: Path | None = None) -> CodeGraph:
         # Maps the generic interface call to the specific Facade method
         return self.facade.classify_graph(graph=graph, source_dir=source_dir)
+
+    def discover_contexts(
+        self, file_paths: list[Path], source_dir: Path
+    ) -> list[DiscoveredContextVo]:
+        return [
+            DiscoveredContextVo(context_name=name, macro_zone=macro)
+            for name, macro in self.facade.discover_contexts(
+                file_paths=file_paths, source_dir=source_dir
+            )
+        ]
@@ -0,0 +1,331 @@
+import os
+import struct
+import zlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+from dddguard.shared.domain import (
+    PASSPORT_TABLE,
+    CodeGraph,
+    CodeNode,
+    ComponentPassport,
+    DirectionEnum,
+    LayerEnum,
+    MatchMethod,
+    NodeStatus,
+    ScopeEnum,
+)
+
+from ....app import IGraphSnapshotStore
+from ....domain import SnapshotInfoVo, ViolationRecordVo
+from ...errors import SnapshotError
+from .graph_codec import component_type_from_key, enum_from_key, enum_key, relative_file_path
+
+# File layout (little endian):
+#   header: magic(8) | version(u16) | flags(u16) | crc32 of body(u32)
+#   body (unsigned LEB128 varints, strings are indexes into the string table):
+#     strings    : count, then (byte length, utf-8 bytes) each; sorted
+#     source_dir : string ref
+#     passports  : count, then 7 refs each (enum fields as "Enum:VALUE"; names ref+1, 0 = None)
+#     nodes      : count, then per node:
+#                  path ref, file ref+1, status, passport+1, radius,
+#                  edge count, first target ref, deltas to the following (sorted) refs
+#     contents   : (FLAG_CONTENT only) per node: byte length+1 (0 = None), utf-8 bytes
+_MAGIC: Final[bytes] = b"DDGSNAP\x00"
+_FORMAT_VERSION: Final[int] = 1
+_HEADER: Final[struct.Struct] = struct.Struct("<8sHHI")
+
+_FLAG_CONTENT: Final[int] = 1
+_FLAG_SCAN_ALL: Final[int] = 2
+
+_STATUS_ORDER: Final[tuple[NodeStatus, ...]] = (
+    NodeStatus.DETECTED,
+    NodeStatus.LINKED,
+    NodeStatus.CLASSIFIED,
+    NodeStatus.FINALIZED,
+)
+_STATUS_CODES: Final[dict[NodeStatus, int]] = {s: i for i, s in enumerate(_STATUS_ORDER)}
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+class _Reader:
+    """Cursor over the body buffer."""
+
+    __slots__ = ("_buffer", "_pos")
+
+    def __init__(self, buffer: bytes) -> None:
+        self._buffer = buffer
+        self._pos = 0
+
+    def varint(self) -> int:
+        buffer = self._buffer
+        pos = self._pos
+        byte = buffer[pos]
+        pos += 1
+        if byte < 0x80:  # Fast path: most refs and all flags fit in one byte
+            self._pos = pos
+            return byte
+
+        result = byte & 0x7F
+        shift = 7
+        while True:
+            byte = buffer[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                self._pos = pos
+                return result
+            shift += 7
+
+    def text(self, length: int) -> str:
+        start = self._pos
+        self._pos = start + length
+        return self._buffer[start : self._pos].decode("utf-8")
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BinarySnapshotStore(IGraphSnapshotStore):
+    """
+    Driven Port Implementation: Versioned binary snapshot of a classified CodeGraph.
+
+    Compact by construction: every path, name and enum value is stored once in a
+    sorted string table; passports are deduplicated; edges are delta-encoded refs.
+    File contents are optional. Loading does no parsing or classification, only
+    varint decoding and object construction.
+    """
+
+    def save(
+        self,
+        graph: CodeGraph,
+        snapshot_path: Path,
+        source_dir: Path,
+        *,
+        scan_all: bool,
+        include_content: bool,
+    ) -> SnapshotInfoVo:
+        body = self._encode(graph, source_dir, include_content)
+        flags = (_FLAG_CONTENT if include_content else 0) | (_FLAG_SCAN_ALL if scan_all else 0)
+        header = _HEADER.pack(_MAGIC, _FORMAT_VERSION, flags, zlib.crc32(body))
+
+        try:
+            snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = snapshot_path.with_name(f"{snapshot_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(header + body)
+            tmp_path.replace(snapshot_path)
+        except OSError as e:
+            raise SnapshotError(f"Cannot write snapshot '{snapshot_path}': {e}", e) from e
+
+        return SnapshotInfoVo(
+            snapshot_path=str(snapshot_path),
+            source_dir=str(source_dir),
+            scan_all=scan_all,
+            has_content=include_content,
+            node_count=len(graph.nodes),
+            edge_count=sum(len(node.imports) for node in graph.nodes.values()),
+            size_bytes=len(header) + len(body),
+        )
+
+    def load(
+        self, snapshot_path: Path, source_dir: Path | None = None
+    ) -> tuple[SnapshotInfoVo, CodeGraph]:
+        try:
+            data = snapshot_path.read_bytes()
+        except OSError as e:
+            raise SnapshotError(f"Cannot read snapshot '{snapshot_path}': {e}", e) from e
+
+        if len(data) < _HEADER.size:
+            raise SnapshotError(f"Not a dddguard snapshot: {snapshot_path}")
+        magic, version, flags, checksum = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise SnapshotError(f"Not a dddguard snapshot: {snapshot_path}")
+        if version != _FORMAT_VERSION:
+            raise SnapshotError(
+                f"Unsupported snapshot version {version} (expected {_FORMAT_VERSION}). "
+                "Re-create it with 'dddguard snapshot'."
+            )
+
+        body = data[_HEADER.size :]
+        if zlib.crc32(body) != checksum:
+            raise SnapshotError(f"Snapshot is corrupted (checksum mismatch): {snapshot_path}")
+
+        try:
+            recorded_root, edge_count, graph = self._decode(
+                body, source_dir, has_content=bool(flags & _FLAG_CONTENT)
+            )
+        except (IndexError, KeyError, ValueError) as e:
+            raise SnapshotError(f"Snapshot is malformed: {snapshot_path}", e) from e
+
+        info = SnapshotInfoVo(
+            snapshot_path=str(snapshot_path),
+            source_dir=str(source_dir or recorded_root),
+            scan_all=bool(flags & _FLAG_SCAN_ALL),
+            has_content=bool(flags & _FLAG_CONTENT),
+            node_count=len(graph.nodes),
+            edge_count=edge_count,
+            size_bytes=len(data),
+        )
+        return info, graph
+
+    def open_view(self, snapshot_path: Path, source_dir: Path | None = None) -> CodeGraph:
+        # The format is read in one pass; the loaded graph is the view
+        return self.load(snapshot_path, source_dir)[1]
+
+    def save_violations(self, snapshot_path: Path, violations: Iterable[ViolationRecordVo]) -> bool:
+        return False
+
+    # --- Encoding ---
+
+    def _encode(self, graph: CodeGraph, source_dir: Path, include_content: bool) -> bytes:
+        nodes = [graph.nodes[path] for path in sorted(graph.nodes)]
+        roots = (source_dir, source_dir.resolve())
+        file_strings = {
+            node.path: relative_file_path(node.file_path, roots)
+            for node in nodes
+            if node.file_path is not None
+        }
+
+        passports: dict[ComponentPassport, int] = {}
+        for node in nodes:
+            passport = node.passport
+            if passport is not None and passport not in passports:
+                passports[passport] = len(passports)
+
+        strings: set[str] = {str(source_dir), *file_strings.values()}
+        for node in nodes:
+            strings.add(node.path)
+            strings.update(node.imports)
+        for passport in passports:
+            strings.update(v for v in self._passport_strings(passport) if v is not None)
+        string_table = sorted(strings)
+        ref = {value: i for i, value in enumerate(string_table)}
+
+        out = bytearray()
+
+        _write_varint(out, len(string_table))
+        for value in string_table:
+            encoded = value.encode("utf-8")
+            _write_varint(out, len(encoded))
+            out += encoded
+
+        _write_varint(out, ref[str(source_dir)])
+
+        _write_varint(out, len(passports))
+        for passport in passports:
+            for field_value in self._passport_strings(passport):
+                _write_varint(out, 0 if field_value is None else ref[field_value] + 1)
+
+        _write_varint(out, len(nodes))
+        for node in nodes:
+            passport = node.passport
+            file_string = file_strings.get(node.path)
+            _write_varint(out, ref[node.path])
+            _write_varint(out, 0 if file_string is None else ref[file_string] + 1)
+            _write_varint(out, _STATUS_CODES[node.status])
+            _write_varint(out, 0 if passport is None else passports[passport] + 1)
+            _write_varint(out, node.visible_radius)
+
+            targets = sorted(ref[target] for target in node.imports)
+            _write_varint(out, len(targets))
+            previous = 0
+            for target in targets:
+                _write_varint(out, target - previous)
+                previous = target
+
+        if include_content:
+            for node in nodes:
+                if node.content is None:
+                    _write_varint(out, 0)
+                    continue
+                encoded = node.content.encode("utf-8")
+                _write_varint(out, len(encoded) + 1)
+                out += encoded
+
+        return bytes(out)
+
+    @staticmethod
+    def _passport_strings(passport: ComponentPassport) -> list[str | None]:
+        return [
+            enum_key(passport.scope),
+            passport.context_name,
+            passport.macro_zone,
+            enum_key(passport.layer),
+            enum_key(passport.direction),
+            enum_key(passport.component_type),
+            enum_key(passport.match_method),
+        ]
+
+    # --- Decoding ---
+
+    @staticmethod
+    def _decode(
+        body: bytes, source_dir: Path | None, has_content: bool
+    ) -> tuple[str, int, CodeGraph]:
+        reader = _Reader(body)
+        varint = reader.varint
+
+        string_table = [reader.text(varint()) for _ in range(varint())]
+        recorded_root = string_table[varint()]
+        root = source_dir or Path(recorded_root)
+
+        passport_ids: list[int] = []
+        for _ in range(varint()):
+            refs = [varint() for _ in range(7)]
+            scope, context, macro, layer, direction, component, method = (
+                string_table[r - 1] if r else None for r in refs
+            )
+            passport_ids.append(
+                PASSPORT_TABLE.intern(
+                    PASSPORT_TABLE.canonical(
+                        scope=enum_from_key(scope, ScopeEnum),
+                        context_name=context,
+                        macro_zone=macro,
+                        layer=enum_from_key(layer, LayerEnum),
+                        direction=enum_from_key(direction, DirectionEnum),
+                        component_type=component_type_from_key(component),
+                        match_method=enum_from_key(method, MatchMethod),
+                    )
+                )
+            )
+
+        records: list[CodeNode] = []
+        edge_count = 0
+        for _ in range(varint()):
+            path = string_table[varint()]
+            file_ref = varint()
+            status = _STATUS_ORDER[varint()]
+            passport_ref = varint()
+            radius = varint()
+
+            imports: set[str] = set()
+            target = 0
+            degree = varint()
+            for _ in range(degree):
+                target += varint()
+                imports.add(string_table[target])
+            edge_count += degree
+
+            records.append(
+                CodeNode(
+                    path=path,
+                    file_path=root / string_table[file_ref - 1] if file_ref else None,
+                    _status=status,
+                    imports=imports,
+                    passport_id=passport_ids[passport_ref - 1] if passport_ref else None,
+                    visible_radius=radius,
+                )
+            )
+
+        if has_content:
+            for node in records:
+                length = varint()
+                node.content = reader.text(length - 1) if length else None
+
+        return recorded_root, edge_count, CodeGraph(nodes={node.path: node for node in records})
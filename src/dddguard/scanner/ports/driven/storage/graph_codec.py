@@ -0,0 +1,86 @@
+"""
+Field encodings shared by the graph snapshot stores (binary and SQLite).
+"""
+
+from enum import Enum
+from pathlib import Path
+from typing import Final, TypeVar
+
+from dddguard.shared.domain import (
+    AdapterType,
+    AppType,
+    ArchetypeType,
+    ComponentType,
+    CompositionType,
+    DirectionEnum,
+    DomainType,
+    LayerEnum,
+    MatchMethod,
+    PortType,
+    ScopeEnum,
+)
+
+# Enums are persisted by class name + value, never by ordinal, so reordering
+# members keeps old files readable. The class name disambiguates component
+# types that share a value (e.g. PortType.REPOSITORY vs AdapterType.REPOSITORY).
+_ENUMS: Final[dict[str, type[Enum]]] = {
+    enum_cls.__name__: enum_cls
+    for enum_cls in (
+        ScopeEnum,
+        LayerEnum,
+        DirectionEnum,
+        MatchMethod,
+        DomainType,
+        AppType,
+        PortType,
+        AdapterType,
+        CompositionType,
+        ArchetypeType,
+    )
+}
+
+
+def enum_key(member: Enum) -> str:
+    return f"{type(member).__name__}:{member.value}"
+
+
+_E = TypeVar("_E", bound=Enum)
+
+
+def resolve_component_type(enum_name: str, value: str) -> ComponentType:
+    member = _ENUMS[enum_name](value)
+    if not isinstance(
+        member, (DomainType, AppType, PortType, AdapterType, CompositionType, ArchetypeType)
+    ):
+        raise KeyError(f"Not a component type enum: {enum_name}")
+    return member
+
+
+def enum_from_key(key: str | None, expected: type[_E]) -> _E:
+    """Decodes an `enum_key` string, which must name a member of `expected`."""
+    if key is None:
+        raise KeyError(f"Missing {expected.__name__} value")
+    enum_name, _, value = key.partition(":")
+    if enum_name != expected.__name__:
+        raise KeyError(f"Expected a {expected.__name__} value, got '{key}'")
+    return expected(value)
+
+
+def component_type_from_key(key: str | None) -> ComponentType:
+    if key is None:
+        raise KeyError("Missing component type value")
+    enum_name, _, value = key.partition(":")
+    return resolve_component_type(enum_name, value)
+
+
+def relative_file_path(file_path: Path, roots: tuple[Path, ...]) -> str:
+    """
+    Posix path relative to the first matching root, so files stay valid across
+    checkouts. Paths outside every root are kept absolute.
+    """
+    for root in roots:
+        try:
+            return file_path.relative_to(root).as_posix()
+        except ValueError:
+            continue
+    return str(file_path)
@@ -0,0 +1,137 @@
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from dddguard.shared.domain import ConfigVo, ScannerConfig
+
+from ....app import IInventoryStore
+from ....domain import ContextInventoryVo, InventoryContextVo
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout changes; older files are ignored.
+_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class JsonInventoryStore(IInventoryStore):
+    """
+    Driven Port Implementation: Context inventory as small JSON files.
+
+    Files live in the project's cache directory (`project.cache_dir`), one per
+    scanned source root. Without a known project root the store is inert:
+    `load` returns None and `save` is a no-op.
+    """
+
+    config: ConfigVo
+
+    def fingerprint(self, source_dir: Path, scanner_config: ScannerConfig) -> str:
+        """
+        Directory-level fingerprint: number of directories and their newest mtime.
+
+        A directory's mtime changes when entries are created, deleted or renamed
+        inside it — exactly the events that can change contexts or layers.
+        Only directories are stat-ed, so this stays in the millisecond range.
+        """
+        exclude_dirs = scanner_config.exclude_dirs
+        count = 0
+        newest = 0
+        stack = [str(source_dir)]
+
+        while stack:
+            current = stack.pop()
+            try:
+                newest = max(newest, Path(current).stat().st_mtime_ns)
+                count += 1
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.name in exclude_dirs or entry.name.startswith("."):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+            except OSError:
+                continue
+
+        return f"{count}:{newest}"
+
+    def load(self, source_dir: Path) -> ContextInventoryVo | None:
+        file_path = self._file_for(source_dir)
+        if file_path is None or not file_path.exists():
+            return None
+
+        try:
+            data = json.loads(file_path.read_text(encoding="utf-8"))
+            if data.get("version") != _FORMAT_VERSION:
+                return None
+            return self._from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("Ignoring unreadable inventory '%s': %s", file_path, e)
+            return None
+
+    def save(self, inventory: ContextInventoryVo) -> None:
+        file_path = self._file_for(Path(inventory.source_dir))
+        if file_path is None:
+            return
+
+        try:
+            self._ensure_cache_dir(file_path.parent)
+            # Write-then-rename so concurrent completion requests never see a partial file
+            tmp_path = file_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(self._to_dict(inventory)), encoding="utf-8")
+            tmp_path.replace(file_path)
+        except OSError as e:
+            logger.warning("Cannot write context inventory '%s': %s", file_path, e)
+
+    # --- Helpers ---
+
+    def _file_for(self, source_dir: Path) -> Path | None:
+        cache_dir = self.config.project.absolute_cache_path
+        if cache_dir is None:
+            return None
+        key = hashlib.sha1(str(source_dir.resolve()).encode("utf-8")).hexdigest()[:16]
+        return cache_dir / f"inventory-{key}.json"
+
+    @staticmethod
+    def _ensure_cache_dir(cache_dir: Path) -> None:
+        if cache_dir.is_dir():
+            return
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Keep generated caches out of version control
+        (cache_dir / ".gitignore").write_text("*\n", encoding="utf-8")
+
+    @staticmethod
+    def _to_dict(inventory: ContextInventoryVo) -> dict[str, Any]:
+        return {
+            "version": _FORMAT_VERSION,
+            "source_dir": inventory.source_dir,
+            "fingerprint": inventory.fingerprint,
+            "contexts": [
+                {
+                    "name": c.context_name,
+                    "macro": c.macro_zone,
+                    "layers": list(c.layers),
+                    "nodes": c.node_count,
+                }
+                for c in inventory.contexts
+            ],
+        }
+
+    @staticmethod
+    def _from_dict(data: dict[str, Any]) -> ContextInventoryVo:
+        return ContextInventoryVo(
+            source_dir=data["source_dir"],
+            fingerprint=data["fingerprint"],
+            contexts=tuple(
+                InventoryContextVo(
+                    context_name=c["name"],
+                    macro_zone=c["macro"],
+                    layers=tuple(c["layers"]),
+                    node_count=int(c["nodes"]),
+                )
+                for c in data["contexts"]
+            ),
+        )
@@ -0,0 +1,64 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+from dddguard.shared.domain import CodeGraph
+
+from ....app import IGraphSnapshotStore
+from ....domain import SnapshotInfoVo, ViolationRecordVo
+from .binary_snapshot_store import BinarySnapshotStore
+from .sqlite_graph_store import SQLITE_MAGIC, SqliteGraphStore
+
+# Output suffixes that select the SQLite format on save
+SQLITE_SUFFIXES: Final[frozenset[str]] = frozenset({".db", ".sqlite", ".sqlite3"})
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SnapshotStoreRouter(IGraphSnapshotStore):
+    """
+    Driven Port Implementation: Picks the snapshot format per file.
+
+    Saving chooses by suffix (`.db` / `.sqlite` / `.sqlite3` -> SQLite, else binary);
+    reading sniffs the file header, so `--from-snapshot` accepts either format.
+    """
+
+    binary_store: BinarySnapshotStore
+    sqlite_store: SqliteGraphStore
+
+    def save(
+        self,
+        graph: CodeGraph,
+        snapshot_path: Path,
+        source_dir: Path,
+        *,
+        scan_all: bool,
+        include_content: bool,
+    ) -> SnapshotInfoVo:
+        store = (
+            self.sqlite_store
+            if snapshot_path.suffix.lower() in SQLITE_SUFFIXES
+            else self.binary_store
+        )
+        return store.save(
+            graph, snapshot_path, source_dir, scan_all=scan_all, include_content=include_content
+        )
+
+    def load(
+        self, snapshot_path: Path, source_dir: Path | None = None
+    ) -> tuple[SnapshotInfoVo, CodeGraph]:
+        return self._reader_for(snapshot_path).load(snapshot_path, source_dir)
+
+    def open_view(self, snapshot_path: Path, source_dir: Path | None = None) -> CodeGraph:
+        return self._reader_for(snapshot_path).open_view(snapshot_path, source_dir)
+
+    def save_violations(self, snapshot_path: Path, violations: Iterable[ViolationRecordVo]) -> bool:
+        return self._reader_for(snapshot_path).save_violations(snapshot_path, violations)
+
+    def _reader_for(self, snapshot_path: Path) -> IGraphSnapshotStore:
+        try:
+            with snapshot_path.open("rb") as f:
+                header = f.read(len(SQLITE_MAGIC))
+        except OSError:
+            header = b""  # Let the binary store report the read error
+        return self.sqlite_store if header == SQLITE_MAGIC else self.binary_store
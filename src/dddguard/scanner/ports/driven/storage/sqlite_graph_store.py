@@ -0,0 +1,505 @@
+import os
+import sqlite3
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Any, Final, cast
+
+from dddguard.shared.domain import (
+    PASSPORT_TABLE,
+    CodeGraph,
+    CodeNode,
+    ComponentPassport,
+    ComponentType,
+    DirectionEnum,
+    LayerEnum,
+    MatchMethod,
+    NodeStatus,
+    ScopeEnum,
+)
+
+from ....app import IGraphSnapshotStore
+from ....domain import SnapshotInfoVo, ViolationRecordVo
+from ...errors import SnapshotError
+from .graph_codec import relative_file_path, resolve_component_type
+
+# First bytes of every SQLite 3 database file
+SQLITE_MAGIC: Final[bytes] = b"SQLite format 3\x00"
+
+# Bump when the schema changes; stored in PRAGMA user_version.
+_SCHEMA_VERSION: Final[int] = 1
+
+# Rows per executemany() / fetchmany(): bounds memory on both write and read paths.
+_BATCH_SIZE: Final[int] = 1000
+
+# Target lookups made by rule checks repeat a lot (shared/domain modules).
+_NODE_CACHE_SIZE: Final[int] = 4096
+
+_SCHEMA: Final[str] = """
+CREATE TABLE meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE passports (
+    id             INTEGER PRIMARY KEY,
+    scope          TEXT NOT NULL,
+    context_name   TEXT,
+    macro_zone     TEXT,
+    layer          TEXT NOT NULL,
+    direction      TEXT NOT NULL,
+    component_enum TEXT NOT NULL,
+    component_type TEXT NOT NULL,
+    match_method   TEXT NOT NULL
+);
+CREATE TABLE nodes (
+    id             INTEGER PRIMARY KEY,
+    path           TEXT NOT NULL UNIQUE,
+    file_path      TEXT,
+    status         TEXT NOT NULL,
+    passport_id    INTEGER REFERENCES passports (id),
+    visible_radius INTEGER NOT NULL,
+    content        TEXT
+);
+CREATE TABLE edges (
+    source_id   INTEGER NOT NULL REFERENCES nodes (id),
+    target_path TEXT NOT NULL,
+    PRIMARY KEY (source_id, target_path)
+) WITHOUT ROWID;
+CREATE TABLE violations (
+    id             INTEGER PRIMARY KEY,
+    rule_name      TEXT NOT NULL,
+    severity       TEXT NOT NULL,
+    source_path    TEXT NOT NULL,
+    target_path    TEXT NOT NULL,
+    target_context TEXT,
+    message        TEXT NOT NULL
+);
+"""
+
+# Created after the bulk load: building an index once is cheaper than maintaining it per row.
+_INDEXES: Final[str] = """
+CREATE INDEX ix_nodes_passport ON nodes (passport_id);
+CREATE INDEX ix_nodes_file_path ON nodes (file_path);
+CREATE INDEX ix_edges_target ON edges (target_path);
+CREATE INDEX ix_passports_context ON passports (context_name);
+CREATE INDEX ix_passports_layer ON passports (layer);
+CREATE INDEX ix_passports_component ON passports (component_type);
+CREATE INDEX ix_violations_rule ON violations (rule_name);
+CREATE INDEX ix_violations_source ON violations (source_path);
+"""
+
+
+def _batched(rows: Iterable[tuple], size: int = _BATCH_SIZE) -> Iterator[list[tuple]]:
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    try:
+        connection = sqlite3.connect(db_path)
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+    except sqlite3.DatabaseError as e:
+        raise SnapshotError(f"Not a dddguard graph database: {db_path}", e) from e
+    if version != _SCHEMA_VERSION:
+        connection.close()
+        raise SnapshotError(
+            f"Unsupported graph database schema {version} (expected {_SCHEMA_VERSION}). "
+            "Re-create it with 'dddguard snapshot'."
+        )
+    return connection
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SqliteGraphStore(IGraphSnapshotStore):
+    """
+    Driven Port Implementation: Classified CodeGraph as a SQLite database.
+
+    Tables: `nodes`, `edges` (by target path, so external imports survive),
+    `passports` (deduplicated) and `violations` (filled by `dddguard lint`),
+    indexed for context/layer/type/importer/directory lookups.
+
+    Rows are written in fixed-size batches and read back lazily through
+    `SqliteCodeGraph`, so whole-project consumers (lint) never hold the full
+    graph. The file doubles as an artefact queryable with any SQLite client.
+    """
+
+    def save(
+        self,
+        graph: CodeGraph,
+        snapshot_path: Path,
+        source_dir: Path,
+        *,
+        scan_all: bool,
+        include_content: bool,
+    ) -> SnapshotInfoVo:
+        tmp_path = snapshot_path.with_name(f"{snapshot_path.name}.{os.getpid()}.tmp")
+        passports: dict[ComponentPassport, int] = {}
+        roots = (source_dir, source_dir.resolve())
+        edge_count = 0
+
+        def node_rows() -> Iterator[tuple]:
+            for node_id, node in enumerate(graph.nodes.values(), start=1):
+                passport = node.passport
+                passport_ref = None
+                if passport is not None:
+                    passport_ref = passports.setdefault(passport, len(passports) + 1)
+                yield (
+                    node_id,
+                    node.path,
+                    relative_file_path(node.file_path, roots) if node.file_path else None,
+                    node.status.value,
+                    passport_ref,
+                    node.visible_radius,
+                    node.content if include_content else None,
+                )
+
+        def edge_rows() -> Iterator[tuple]:
+            nonlocal edge_count
+            for node_id, node in enumerate(graph.nodes.values(), start=1):
+                edge_count += len(node.imports)
+                for target in node.imports:
+                    yield node_id, target
+
+        try:
+            snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.unlink(missing_ok=True)
+            connection = sqlite3.connect(tmp_path)
+            try:
+                connection.executescript(
+                    "PRAGMA journal_mode = OFF; PRAGMA synchronous = OFF;" + _SCHEMA
+                )
+                with connection:
+                    for batch in _batched(node_rows()):
+                        connection.executemany(
+                            "INSERT INTO nodes VALUES (?, ?, ?, ?, ?, ?, ?)", batch
+                        )
+                    for batch in _batched(edge_rows()):
+                        connection.executemany("INSERT INTO edges VALUES (?, ?)", batch)
+                    connection.executemany(
+                        "INSERT INTO passports VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (self._passport_row(p, ref) for p, ref in passports.items()),
+                    )
+                    connection.executemany(
+                        "INSERT INTO meta VALUES (?, ?)",
+                        [
+                            ("source_dir", str(source_dir)),
+                            ("scan_all", str(int(scan_all))),
+                            ("has_content", str(int(include_content))),
+                        ],
+                    )
+                connection.executescript(_INDEXES + f"PRAGMA user_version = {_SCHEMA_VERSION};")
+            finally:
+                connection.close()
+            tmp_path.replace(snapshot_path)
+        except (OSError, sqlite3.Error) as e:
+            tmp_path.unlink(missing_ok=True)
+            raise SnapshotError(f"Cannot write graph database '{snapshot_path}': {e}", e) from e
+
+        return SnapshotInfoVo(
+            snapshot_path=str(snapshot_path),
+            source_dir=str(source_dir),
+            scan_all=scan_all,
+            has_content=include_content,
+            node_count=len(graph.nodes),
+            edge_count=edge_count,
+            size_bytes=snapshot_path.stat().st_size,
+        )
+
+    def load(
+        self, snapshot_path: Path, source_dir: Path | None = None
+    ) -> tuple[SnapshotInfoVo, CodeGraph]:
+        view = self._open(snapshot_path, source_dir)
+        try:
+            info = view.info
+            nodes = {node.path: node for node in view.nodes.values()}
+        finally:
+            view.close()
+        return info, CodeGraph(nodes=nodes)
+
+    def open_view(self, snapshot_path: Path, source_dir: Path | None = None) -> CodeGraph:
+        # Duck-typed: SqliteCodeGraph serves every read path of CodeGraph
+        return cast(CodeGraph, self._open(snapshot_path, source_dir))
+
+    def _open(self, snapshot_path: Path, source_dir: Path | None) -> "SqliteCodeGraph":
+        if not snapshot_path.is_file():
+            raise SnapshotError(f"Cannot read graph database '{snapshot_path}': not a file")
+        return SqliteCodeGraph(_connect(snapshot_path), snapshot_path, source_dir)
+
+    def save_violations(self, snapshot_path: Path, violations: Iterable[ViolationRecordVo]) -> bool:
+        connection = _connect(snapshot_path)
+        try:
+            with connection:
+                # Each lint run replaces the previous results
+                connection.execute("DELETE FROM violations")
+                for batch in _batched(
+                    (
+                        v.rule_name,
+                        v.severity,
+                        v.source_path,
+                        v.target_path,
+                        v.target_context,
+                        v.message,
+                    )
+                    for v in violations
+                ):
+                    connection.executemany(
+                        "INSERT INTO violations "
+                        "(rule_name, severity, source_path, target_path, target_context, message) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        batch,
+                    )
+        except sqlite3.Error as e:
+            raise SnapshotError(f"Cannot record violations in '{snapshot_path}': {e}", e) from e
+        finally:
+            connection.close()
+        return True
+
+    @staticmethod
+    def _passport_row(passport: ComponentPassport, ref: int) -> tuple:
+        return (
+            ref,
+            passport.scope.value,
+            passport.context_name,
+            passport.macro_zone,
+            passport.layer.value,
+            passport.direction.value,
+            type(passport.component_type).__name__,
+            passport.component_type.value,
+            passport.match_method.value,
+        )
+
+
+class SqliteCodeGraph:
+    """
+    Read-only, lazily materialized CodeGraph over a graph database.
+
+    Quacks like `CodeGraph` for read paths (`nodes`, `get_node` and the
+    `nodes_*` / `importers_of` index queries, answered by SQL). Nodes are built
+    on access and not retained, except for a bounded lookup cache; mutating them
+    has no effect on the database.
+    """
+
+    def __init__(
+        self, connection: sqlite3.Connection, db_path: Path, source_dir: Path | None
+    ) -> None:
+        self._connection = connection
+        meta = dict(connection.execute("SELECT key, value FROM meta"))
+        self._root = source_dir or Path(meta["source_dir"])
+        self._passport_ids = self._load_passports()
+        self.nodes = _SqliteNodeView(self)
+        self.get_node = lru_cache(maxsize=_NODE_CACHE_SIZE)(self._fetch_node)
+        self.info = SnapshotInfoVo(
+            snapshot_path=str(db_path),
+            source_dir=str(self._root),
+            scan_all=meta.get("scan_all") == "1",
+            has_content=meta.get("has_content") == "1",
+            node_count=self._scalar("SELECT COUNT(*) FROM nodes"),
+            edge_count=self._scalar("SELECT COUNT(*) FROM edges"),
+            size_bytes=db_path.stat().st_size,
+        )
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "SqliteCodeGraph":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # --- Index Queries (same names as CodeGraph) ---
+
+    def nodes_in_context(self, context_name: str | None) -> set[str]:
+        return self._paths_by_passport("context_name IS ?", context_name)
+
+    def nodes_in_layer(self, layer: LayerEnum) -> set[str]:
+        return self._paths_by_passport("layer = ?", layer.value)
+
+    def nodes_with_direction(self, direction: DirectionEnum) -> set[str]:
+        return self._paths_by_passport("direction = ?", direction.value)
+
+    def nodes_in_scope(self, scope: ScopeEnum) -> set[str]:
+        return self._paths_by_passport("scope = ?", scope.value)
+
+    def nodes_of_type(self, component_type: ComponentType) -> set[str]:
+        # Values repeat across enums (PortType.REPOSITORY / AdapterType.REPOSITORY)
+        rows = self._connection.execute(
+            "SELECT n.path FROM nodes n JOIN passports p ON p.id = n.passport_id "
+            "WHERE p.component_type = ? AND p.component_enum = ?",
+            (component_type.value, type(component_type).__name__),
+        )
+        return {row[0] for row in rows}
+
+    def importers_of(self, path: str) -> set[str]:
+        rows = self._connection.execute(
+            "SELECT n.path FROM edges e JOIN nodes n ON n.id = e.source_id WHERE e.target_path = ?",
+            (path,),
+        )
+        return {row[0] for row in rows}
+
+    def nodes_under(self, directory: Path) -> set[str]:
+        """Nodes whose file path lies under `directory` (string prefix, index range scan)."""
+        try:
+            prefix = directory.resolve().relative_to(self._root.resolve()).as_posix()
+        except ValueError:
+            return set()
+        if prefix == ".":
+            rows = self._connection.execute("SELECT path FROM nodes WHERE file_path IS NOT NULL")
+        else:
+            upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+            rows = self._connection.execute(
+                "SELECT path FROM nodes WHERE file_path >= ? AND file_path < ?",
+                (prefix, upper),
+            )
+        return {row[0] for row in rows}
+
+    def count_by_status(self, status: NodeStatus) -> int:
+        return self._scalar("SELECT COUNT(*) FROM nodes WHERE status = ?", status.value)
+
+    def reachable(self, seeds: Iterable[str], depth: int, *, upstream: bool = False) -> set[str]:
+        """Paths within `depth` hops of `seeds` (seeds included), as one recursive query."""
+        seed_list = list(seeds)
+        if not seed_list or depth <= 0:
+            return set(seed_list)
+
+        if upstream:
+            step = (
+                "SELECT n.path, r.hops + 1 FROM reach r "
+                "JOIN edges e ON e.target_path = r.path "
+                "JOIN nodes n ON n.id = e.source_id WHERE r.hops < ?"
+            )
+        else:
+            step = (
+                "SELECT e.target_path, r.hops + 1 FROM reach r "
+                "JOIN nodes n ON n.path = r.path "
+                "JOIN edges e ON e.source_id = n.id WHERE r.hops < ?"
+            )
+        placeholders = ", ".join("(?, 0)" for _ in seed_list)
+        rows = self._connection.execute(
+            f"WITH RECURSIVE reach(path, hops) AS (VALUES {placeholders} UNION {step}) "
+            "SELECT DISTINCT path FROM reach",
+            (*seed_list, depth),
+        )
+        return {row[0] for row in rows}
+
+    @property
+    def total_files(self) -> int:
+        return self.info.node_count
+
+    @property
+    def classified_count(self) -> int:
+        return self._scalar("SELECT COUNT(*) FROM nodes WHERE passport_id IS NOT NULL")
+
+    # --- Materialization ---
+
+    def _fetch_node(self, path: str) -> CodeNode | None:
+        row = self._connection.execute(
+            "SELECT id, path, file_path, status, passport_id, visible_radius, content "
+            "FROM nodes WHERE path = ?",
+            (path,),
+        ).fetchone()
+        if row is None:
+            return None
+        imports = {
+            target
+            for (target,) in self._connection.execute(
+                "SELECT target_path FROM edges WHERE source_id = ?", (row[0],)
+            )
+        }
+        return self._to_node(row, imports)
+
+    def _iter_nodes(self) -> Iterator[CodeNode]:
+        # Two ordered cursors merged by node id: one pass over each table, O(batch) memory
+        node_cursor = self._connection.execute(
+            "SELECT id, path, file_path, status, passport_id, visible_radius, content "
+            "FROM nodes ORDER BY id"
+        )
+        edge_cursor = self._connection.cursor()
+        edge_cursor.execute("SELECT source_id, target_path FROM edges ORDER BY source_id")
+        pending_edge = edge_cursor.fetchone()
+
+        while rows := node_cursor.fetchmany(_BATCH_SIZE):
+            for row in rows:
+                imports: set[str] = set()
+                while pending_edge is not None and pending_edge[0] == row[0]:
+                    imports.add(pending_edge[1])
+                    pending_edge = edge_cursor.fetchone()
+                yield self._to_node(row, imports)
+
+    def _to_node(self, row: tuple, imports: set[str]) -> CodeNode:
+        _, path, file_path, status, passport_ref, radius, content = row
+        return CodeNode(
+            path=path,
+            file_path=self._root / file_path if file_path is not None else None,
+            content=content,
+            _status=NodeStatus(status),
+            imports=imports,
+            passport_id=self._passport_ids[passport_ref] if passport_ref is not None else None,
+            visible_radius=radius,
+        )
+
+    def _load_passports(self) -> dict[int, int]:
+        passport_ids: dict[int, int] = {}
+        for row in self._connection.execute(
+            "SELECT id, scope, context_name, macro_zone, layer, direction, "
+            "component_enum, component_type, match_method FROM passports"
+        ):
+            ref, scope, context, macro, layer, direction, enum_name, component, method = row
+            passport_ids[ref] = PASSPORT_TABLE.intern(
+                PASSPORT_TABLE.canonical(
+                    scope=ScopeEnum(scope),
+                    context_name=context,
+                    macro_zone=macro,
+                    layer=LayerEnum(layer),
+                    direction=DirectionEnum(direction),
+                    component_type=resolve_component_type(enum_name, component),
+                    match_method=MatchMethod(method),
+                )
+            )
+        return passport_ids
+
+    def _paths_by_passport(self, condition: str, value: Any) -> set[str]:
+        rows = self._connection.execute(
+            "SELECT n.path FROM nodes n JOIN passports p ON p.id = n.passport_id "
+            f"WHERE p.{condition}",
+            (value,),
+        )
+        return {row[0] for row in rows}
+
+    def _scalar(self, sql: str, *params: Any) -> int:
+        value: int = self._connection.execute(sql, params).fetchone()[0]
+        return value
+
+
+class _SqliteNodeView(Mapping[str, CodeNode]):
+    """`graph.nodes` of a SqliteCodeGraph: keyed lookups hit the path index, iteration streams."""
+
+    def __init__(self, graph: SqliteCodeGraph) -> None:
+        self._graph = graph
+
+    def __getitem__(self, path: str) -> CodeNode:
+        node = self._graph.get_node(path)
+        if node is None:
+            raise KeyError(path)
+        return node
+
+    def __contains__(self, path: object) -> bool:
+        return isinstance(path, str) and self._graph.get_node(path) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        cursor = self._graph._connection.execute("SELECT path FROM nodes ORDER BY id")
+        while rows := cursor.fetchmany(_BATCH_SIZE):
+            for (path,) in rows:
+                yield path
+
+    def __len__(self) -> int:
+        return self._graph.info.node_count
+
+    def values(self) -> Iterator[CodeNode]:  # type: ignore[override]
+        return self._graph._iter_nodes()
+
+    def items(self) -> Iterator[tuple[str, CodeNode]]:  # type: ignore[override]
+        return ((node.path, node) for node in self._graph._iter_nodes())
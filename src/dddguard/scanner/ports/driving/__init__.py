@@ -1,7 +1,29 @@
-from .scanner_facade import ContextListSchema, ContextNodeSchema, ScannerFacade
+from ...domain import ExpansionDirection
+from .scanner_facade import (
+    ContextListSchema,
+    ContextNodeSchema,
+    CycleReportSchema,
+    FileScanSchema,
+    ImportCycleSchema,
+    InventoryContextSchema,
+    InventorySchema,
+    QueryResultSchema,
+    ScannerFacade,
+    SnapshotSchema,
+    ViolationRecordSchema,
+)
 
 __all__ = [
     "ContextListSchema",
     "ContextNodeSchema",
+    "CycleReportSchema",
+    "ExpansionDirection",
+    "FileScanSchema",
+    "ImportCycleSchema",
+    "InventoryContextSchema",
+    "InventorySchema",
+    "QueryResultSchema",
     "ScannerFacade",
+    "SnapshotSchema",
+    "ViolationRecordSchema",
 ]
@@ -4,10 +4,32 @@ from pathlib import Path
 from dddguard.shared.domain import (
     CodeGraph,
     ConfigVo,
+    ImportCycleReportVo,
+    ImportCycleVo,
 )
 
-from ...app import DiscoverContextsUseCase, InspectTreeUseCase, RunScanUseCase
-from ...domain import DiscoveredContextVo
+from ...app import (
+    AnalyzeCyclesUseCase,
+    DiscoverContextsUseCase,
+    InspectTreeUseCase,
+    LoadSnapshotUseCase,
+    OpenSnapshotViewUseCase,
+    ReadInventoryUseCase,
+    RecordInventoryUseCase,
+    RecordViolationsUseCase,
+    RunFileScanUseCase,
+    RunQueryUseCase,
+    RunScanUseCase,
+    SaveSnapshotUseCase,
+)
+from ...domain import (
+    DiscoveredContextVo,
+    ExpansionDirection,
+    FileScanVo,
+    QueryResultVo,
+    SnapshotInfoVo,
+    ViolationRecordVo,
+)
 from ..errors import InvalidScanPathError
 
 
@@ -22,6 +44,73 @@ class ContextListSchema:
     contexts: list[ContextNodeSchema]
 
 
+@dataclass(frozen=True, kw_only=True, slots=True)
+class InventoryContextSchema:
+    context_name: str
+    macro_zone: str | None
+    layers: list[str]
+    node_count: int
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class InventorySchema:
+    contexts: list[InventoryContextSchema]
+    macro_zones: list[str]
+    layers: list[str]
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class SnapshotSchema:
+    snapshot_path: str
+    source_dir: str
+    node_count: int
+    edge_count: int
+    size_bytes: int
+    has_content: bool
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class QueryResultSchema:
+    columns: list[str]
+    rows: list[list[str]]
+    total: int
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ImportCycleSchema:
+    members: list[str]
+    cycle: list[str]
+    witnesses: list[tuple[str, str]]
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class CycleReportSchema:
+    module_cycles: list[ImportCycleSchema]
+    context_cycles: list[ImportCycleSchema]
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class FileScanSchema:
+    """
+    Changed nodes (`changed`) in a CodeGraph that also holds the project nodes
+    needed to check their edges. `reclassified` changed nodes come with their importers.
+    """
+
+    graph: CodeGraph
+    changed: list[str]
+    reclassified: list[str]
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ViolationRecordSchema:
+    rule_name: str
+    severity: str
+    source_path: str
+    target_path: str
+    target_context: str | None
+    message: str
+
+
 @dataclass(frozen=True, kw_only=True, slots=True)
 class ScannerFacade:
     """
@@ -38,28 +127,54 @@ class ScannerFacade:
     """
 
     run_scan_use_case: RunScanUseCase
+    run_file_scan_use_case: RunFileScanUseCase
     inspect_tree_use_case: InspectTreeUseCase
     discover_contexts_use_case: DiscoverContextsUseCase
+    record_inventory_use_case: RecordInventoryUseCase
+    read_inventory_use_case: ReadInventoryUseCase
+    save_snapshot_use_case: SaveSnapshotUseCase
+    load_snapshot_use_case: LoadSnapshotUseCase
+    open_snapshot_view_use_case: OpenSnapshotViewUseCase
+    record_violations_use_case: RecordViolationsUseCase
+    run_query_use_case: RunQueryUseCase
+    analyze_cycles_use_case: AnalyzeCyclesUseCase
     config: ConfigVo
 
     def scan_project(
         self,
         target_path: Path | None = None,
+        *,
         whitelist_contexts: list[str] | None = None,
         whitelist_layers: list[str] | None = None,
         scan_all: bool = False,
         import_depth: int = 0,
         include_assets: bool = True,
+        expansion_direction: ExpansionDirection = ExpansionDirection.DOWNSTREAM,
+        snapshot_path: Path | None = None,
+        focus_path: Path | None = None,
     ) -> CodeGraph:
         """
         Runs the full scanning pipeline.
 
         Use `whitelist_contexts` and `whitelist_layers` to control visibility.
+        Use `expansion_direction=UPSTREAM` with `import_depth` to reveal dependents.
+        Use `snapshot_path` to start from a saved snapshot instead of detecting + classifying.
+        Use `focus_path` (inside the source dir) to scan only that part of the project;
+        the modules it imports are resolved lazily.
         """
-        if not target_path:
+        classified_graph = None
+        if snapshot_path is not None:
+            classified_graph, snapshot_root = self._load_snapshot(snapshot_path)
+            target_path = target_path or snapshot_root
+        elif not target_path:
             target_path = self._get_source_dir()
 
-        return self.run_scan_use_case(
+        if focus_path is not None:
+            focus_path = focus_path.resolve()
+            if not focus_path.exists() or not focus_path.is_relative_to(target_path.resolve()):
+                raise InvalidScanPathError(str(focus_path))
+
+        graph = self.run_scan_use_case(
             scanner_config=self.config.scanner,
             source_dir=target_path,
             scan_all=scan_all,
@@ -67,24 +182,115 @@ class ScannerFacade:
             whitelist_layers=whitelist_layers,
             whitelist_contexts=whitelist_contexts,
             include_assets=include_assets,
+            expansion_direction=expansion_direction,
+            classified_graph=classified_graph,
+            focus_path=focus_path,
+        )
+        # A focus scan sees only part of the project
+        if classified_graph is None and focus_path is None:
+            self._record_inventory(graph, target_path)
+        return graph
+
+    def scan_files(
+        self, file_paths: list[Path], snapshot_path: Path | None = None
+    ) -> FileScanSchema:
+        """
+        Re-detects and re-classifies only `file_paths` (e.g. files staged for a commit)
+        against an index of the project: the snapshot at `snapshot_path` (read lazily),
+        or the session-cached project graph if one is warm. Without either, only the
+        modules the files import are located and classified (the tree is not scanned).
+        Files a scan would not ingest (ignored, non-Python, outside the source dir) are dropped.
+        """
+        target_path = self._get_source_dir()
+
+        index = None
+        if snapshot_path is not None:
+            if not snapshot_path.is_file():
+                raise InvalidScanPathError(str(snapshot_path))
+            index = self.open_snapshot_view_use_case(
+                snapshot_path=snapshot_path, source_dir=target_path
+            )
+
+        try:
+            result: FileScanVo = self.run_file_scan_use_case(
+                scanner_config=self.config.scanner,
+                source_dir=target_path,
+                file_paths=file_paths,
+                classified_graph=index,
+            )
+        finally:
+            # Database-backed views hold a connection
+            close = getattr(index, "close", None)
+            if close is not None:
+                close()
+
+        return FileScanSchema(
+            graph=result.graph,
+            changed=list(result.changed),
+            reclassified=list(result.reclassified),
         )
 
-    def classify_tree(self, target_path: Path | None = None) -> CodeGraph:
+    def classify_tree(
+        self, target_path: Path | None = None, snapshot_path: Path | None = None
+    ) -> CodeGraph:
         """
         Scans and classifies the tree, returning the CodeGraph.
         """
-        if not target_path:
+        classified_graph = None
+        if snapshot_path is not None:
+            classified_graph, snapshot_root = self._load_snapshot(snapshot_path)
+            target_path = target_path or snapshot_root
+        elif not target_path:
             target_path = self._get_source_dir()
 
-        return self.inspect_tree_use_case(
+        graph = self.inspect_tree_use_case(
             scanner_config=self.config.scanner,
             source_dir=target_path,
             scan_all=False,
+            classified_graph=classified_graph,
+        )
+        if classified_graph is None:
+            self._record_inventory(graph, target_path)
+        return graph
+
+    def save_snapshot(
+        self,
+        snapshot_path: Path,
+        target_path: Path | None = None,
+        scan_all: bool = False,
+        include_content: bool = False,
+    ) -> SnapshotSchema:
+        """
+        Detects and classifies the whole tree and writes it to `snapshot_path`.
+        Reload it with `scan_project(snapshot_path=...)` (or the CLI's `--from-snapshot`).
+        """
+        if not target_path:
+            target_path = self._get_source_dir()
+
+        info: SnapshotInfoVo = self.save_snapshot_use_case(
+            scanner_config=self.config.scanner,
+            source_dir=target_path,
+            snapshot_path=snapshot_path,
+            scan_all=scan_all,
+            include_content=include_content,
+        )
+        return SnapshotSchema(
+            snapshot_path=info.snapshot_path,
+            source_dir=info.source_dir,
+            node_count=info.node_count,
+            edge_count=info.edge_count,
+            size_bytes=info.size_bytes,
+            has_content=info.has_content,
         )
 
-    def discover_contexts(self, target_path: Path | None = None) -> ContextListSchema:
+    def discover_contexts(
+        self, target_path: Path | None = None, fast: bool = False
+    ) -> ContextListSchema:
         """
         Performs structural discovery to find all Bounded Contexts.
+
+        :param fast: Derive contexts from file paths only (no reads, no AST parsing).
+                     Intended for interactive pickers where latency matters.
         """
         if not target_path:
             target_path = self._get_source_dir()
@@ -93,6 +299,7 @@ class ScannerFacade:
             scanner_config=self.config.scanner,
             source_dir=target_path,
             scan_all=False,
+            paths_only=fast,
         )
 
         return ContextListSchema(
@@ -102,6 +309,151 @@ class ScannerFacade:
             ]
         )
 
+    def get_inventory(self, target_path: Path | None = None) -> InventorySchema | None:
+        """
+        Returns the context inventory recorded by the last completed scan.
+        Never scans: returns None if no inventory exists or the tree changed since.
+        Fast enough to back shell completion.
+        """
+        if not target_path:
+            target_path = self._get_source_dir()
+
+        inventory = self.read_inventory_use_case(
+            source_dir=target_path,
+            scanner_config=self.config.scanner,
+        )
+        if inventory is None:
+            return None
+
+        return InventorySchema(
+            contexts=[
+                InventoryContextSchema(
+                    context_name=c.context_name,
+                    macro_zone=c.macro_zone,
+                    layers=list(c.layers),
+                    node_count=c.node_count,
+                )
+                for c in inventory.contexts
+            ],
+            macro_zones=inventory.macro_zones,
+            layers=inventory.layers,
+        )
+
+    def query(
+        self,
+        query: str,
+        target_path: Path | None = None,
+        snapshot_path: Path | None = None,
+    ) -> QueryResultSchema:
+        """
+        Runs a declarative query over the whole classified project graph.
+        See `GraphQueryService` for the grammar, e.g.
+        `nodes where context = billing and layer = app and imports(layer = adapters)`.
+        """
+        classified_graph = None
+        if snapshot_path is not None:
+            classified_graph, snapshot_root = self._load_snapshot(snapshot_path)
+            target_path = target_path or snapshot_root
+        elif not target_path:
+            target_path = self._get_source_dir()
+
+        result: QueryResultVo = self.run_query_use_case(
+            query=query,
+            scanner_config=self.config.scanner,
+            source_dir=target_path,
+            classified_graph=classified_graph,
+        )
+        return QueryResultSchema(
+            columns=list(result.columns),
+            rows=[list(row) for row in result.rows],
+            total=result.total,
+        )
+
+    def analyze_cycles(
+        self,
+        target_path: Path | None = None,
+        snapshot_path: Path | None = None,
+    ) -> CycleReportSchema:
+        """
+        Reports import cycles of the whole project: between modules and between contexts.
+        Each cycle lists all members of its component plus one shortest closed chain.
+        """
+        classified_graph = None
+        if snapshot_path is not None:
+            classified_graph, snapshot_root = self._load_snapshot(snapshot_path)
+            target_path = target_path or snapshot_root
+        elif not target_path:
+            target_path = self._get_source_dir()
+
+        report: ImportCycleReportVo = self.analyze_cycles_use_case(
+            scanner_config=self.config.scanner,
+            source_dir=target_path,
+            classified_graph=classified_graph,
+        )
+        return CycleReportSchema(
+            module_cycles=[self._to_cycle_schema(c) for c in report.module_cycles],
+            context_cycles=[self._to_cycle_schema(c) for c in report.context_cycles],
+        )
+
+    def open_snapshot(self, snapshot_path: Path) -> CodeGraph:
+        """
+        Read-only whole-project graph from a snapshot (no filtering, no finalization).
+        Database snapshots (.db/.sqlite) are streamed lazily with bounded memory.
+        """
+        if not snapshot_path.is_file():
+            raise InvalidScanPathError(str(snapshot_path))
+
+        return self.open_snapshot_view_use_case(
+            snapshot_path=snapshot_path,
+            source_dir=self.config.project.absolute_source_path,
+        )
+
+    def record_violations(
+        self, snapshot_path: Path, violations: list[ViolationRecordSchema]
+    ) -> bool:
+        """
+        Stores lint results in a database snapshot. Returns False for formats
+        that cannot hold them.
+        """
+        return self.record_violations_use_case(
+            snapshot_path=snapshot_path,
+            violations=[
+                ViolationRecordVo(
+                    rule_name=v.rule_name,
+                    severity=v.severity,
+                    source_path=v.source_path,
+                    target_path=v.target_path,
+                    target_context=v.target_context,
+                    message=v.message,
+                )
+                for v in violations
+            ],
+        )
+
+    def _record_inventory(self, graph: CodeGraph, source_dir: Path) -> None:
+        """
+        Internal Helper: Refreshes the inventory after a completed scan.
+        """
+        self.record_inventory_use_case(
+            graph=graph,
+            source_dir=source_dir,
+            scanner_config=self.config.scanner,
+        )
+
+    def _load_snapshot(self, snapshot_path: Path) -> tuple[CodeGraph, Path]:
+        """
+        Internal Helper: Loads a snapshot, rebased onto the configured source root if any.
+        Returns the graph and the root its file paths now point into.
+        """
+        if not snapshot_path.is_file():
+            raise InvalidScanPathError(str(snapshot_path))
+
+        info, graph = self.load_snapshot_use_case(
+            snapshot_path=snapshot_path,
+            source_dir=self.config.project.absolute_source_path,
+        )
+        return graph, Path(info.source_dir)
+
     def _get_source_dir(self) -> Path:
         """
         Internal Helper: Extracts and validates source_dir from Config.
@@ -124,3 +476,11 @@ class ScannerFacade:
             raise InvalidScanPathError(f"Configured source path is not a directory: {source_dir}")
 
         return source_dir
+
+    @staticmethod
+    def _to_cycle_schema(cycle: ImportCycleVo) -> ImportCycleSchema:
+        return ImportCycleSchema(
+            members=list(cycle.members),
+            cycle=list(cycle.cycle),
+            witnesses=list(cycle.witnesses),
+        )
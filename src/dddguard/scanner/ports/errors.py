@@ -1,4 +1,4 @@
-from dddguard.shared.helpers.generics import GenericDrivingPortError
+from dddguard.shared.helpers.generics import GenericDrivenPortError, GenericDrivingPortError
 
 
 class ScannerPortError(GenericDrivingPortError):
@@ -17,3 +17,14 @@ class InvalidScanPathError(ScannerPortError):
 
     def __init__(self, path: str):
         super().__init__(f"Target path not found or inaccessible: {path}")
+
+
+class SnapshotError(GenericDrivenPortError):
+    """Raised when a graph snapshot cannot be written, read or decoded."""
+
+    def __init__(self, message: str, original_error: Exception | None = None):
+        super().__init__(
+            message=message,
+            context_name="Scanner",
+            original_error=original_error,
+        )
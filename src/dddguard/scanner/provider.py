@@ -1,17 +1,29 @@
 from dataclasses import dataclass
 
 import typer
-from dishka import Provider, Scope, provide
+from dishka import Provider, Scope, alias, provide
 
-from .adapters.driving import register_commands
+from dddguard.shared.adapters.driven.graph_session_cache import GraphSessionCache
 
 # Interfaces
 from .app import (
+    AnalyzeCyclesUseCase,
     DiscoverContextsUseCase,
     IClassificationGateway,
     IDetectionGateway,
+    IGraphCache,
+    IGraphSnapshotStore,
+    IInventoryStore,
     InspectTreeUseCase,
+    LoadSnapshotUseCase,
+    OpenSnapshotViewUseCase,
+    ReadInventoryUseCase,
+    RecordInventoryUseCase,
+    RecordViolationsUseCase,
+    RunFileScanUseCase,
+    RunQueryUseCase,
     RunScanUseCase,
+    SaveSnapshotUseCase,
 )
 
 # Implementations
@@ -19,6 +31,10 @@ from .ports.driven.internal_gateways_acl import (
     ClassificationInternalGateway,
     DetectionInternalGateway,
 )
+from .ports.driven.storage.binary_snapshot_store import BinarySnapshotStore
+from .ports.driven.storage.json_inventory_store import JsonInventoryStore
+from .ports.driven.storage.snapshot_store_router import SnapshotStoreRouter
+from .ports.driven.storage.sqlite_graph_store import SqliteGraphStore
 from .ports.driving import ScannerFacade
 
 
@@ -31,6 +47,9 @@ class ScannerContainer:
     facade: ScannerFacade
 
     def register_commands(self, app: typer.Typer) -> None:
+        # The driving adapter (TUI stack) loads only for commands of this context
+        from .adapters.driving import register_commands
+
         register_commands(app, self.facade)
 
 
@@ -46,12 +65,34 @@ class ScannerProvider(Provider):
     detection_gateway = provide(DetectionInternalGateway, provides=IDetectionGateway)
     classification_gateway = provide(ClassificationInternalGateway, provides=IClassificationGateway)
 
+    # Driven Adapters
+    inventory_store = provide(JsonInventoryStore, provides=IInventoryStore, scope=Scope.SESSION)
+    binary_snapshot_store = provide(BinarySnapshotStore)
+    sqlite_graph_store = provide(SqliteGraphStore)
+    snapshot_store = provide(SnapshotStoreRouter, provides=IGraphSnapshotStore)
+
+    # Session graph cache (owned by SharedProvider, shared with linter/visualizer)
+    graph_cache = alias(source=GraphSessionCache, provides=IGraphCache)
+
     # Macro UseCases
     run_scan_use_case = provide(RunScanUseCase)
+    run_file_scan_use_case = provide(RunFileScanUseCase)
     inspect_tree_use_case = provide(InspectTreeUseCase)
     discover_contexts_use_case = provide(DiscoverContextsUseCase)
+    run_query_use_case = provide(RunQueryUseCase)
+    analyze_cycles_use_case = provide(AnalyzeCyclesUseCase)
+
+    # Inventory (completion / quick menus)
+    record_inventory_use_case = provide(RecordInventoryUseCase, scope=Scope.SESSION)
+    read_inventory_use_case = provide(ReadInventoryUseCase, scope=Scope.SESSION)
+
+    # Snapshots (detect + classify once, reuse across processes)
+    save_snapshot_use_case = provide(SaveSnapshotUseCase)
+    load_snapshot_use_case = provide(LoadSnapshotUseCase)
+    open_snapshot_view_use_case = provide(OpenSnapshotViewUseCase)
+    record_violations_use_case = provide(RecordViolationsUseCase)
 
-    # Main facade
-    facade = provide(ScannerFacade)
+    # Main facade (holds the config: rebuilt per session)
+    facade = provide(ScannerFacade, scope=Scope.SESSION)
 
-    container = provide(ScannerContainer)
+    container = provide(ScannerContainer, scope=Scope.SESSION)
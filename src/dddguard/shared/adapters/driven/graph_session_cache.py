@@ -0,0 +1,128 @@
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from ...domain import CodeGraph, ScannerConfig
+
+logger = logging.getLogger(__name__)
+
+# (resolved source_dir, scan_all, scanner_config)
+_CacheKey = tuple[str, bool, ScannerConfig]
+
+
+@dataclass(frozen=True, slots=True)
+class _CacheEntry:
+    fingerprint: tuple[int, int]
+    graph: CodeGraph  # Pristine CLASSIFIED graph; never handed out directly
+
+
+class GraphSessionCache:
+    """
+    Driven Adapter: Session-wide cache of detected + classified CodeGraphs.
+
+    Shared by every facade living in the same container (scanner, linter,
+    visualizer), so a "scan, lint, draw" session pays for detection and
+    classification once. Callers always receive a fork of the cached graph
+    and can filter/finalize it without affecting other consumers.
+
+    **Invalidation:** Each lookup recomputes a cheap fingerprint of the tree
+    (path, mtime and size of every candidate file, no reads). Any change
+    triggers a rebuild.
+    """
+
+    def __init__(self, max_entries: int = 4) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[_CacheKey, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(
+        self,
+        source_dir: Path,
+        scan_all: bool,
+        scanner_config: ScannerConfig,
+        build: Callable[[], CodeGraph],
+    ) -> CodeGraph:
+        """
+        Returns a private copy of the classified graph for this tree,
+        calling `build` only if nothing valid is cached.
+        """
+        key: _CacheKey = (str(source_dir.resolve()), scan_all, scanner_config)
+        fingerprint = self.fingerprint(source_dir, scan_all, scanner_config)
+
+        graph = self._lookup(key, fingerprint)
+        if graph is not None:
+            return graph
+
+        graph = build()
+
+        with self._lock:
+            # Keep a pristine copy: the caller is about to mutate `graph`
+            self._entries[key] = _CacheEntry(fingerprint=fingerprint, graph=graph.fork())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+        return graph
+
+    def peek(
+        self, source_dir: Path, scan_all: bool, scanner_config: ScannerConfig
+    ) -> CodeGraph | None:
+        """
+        Private copy of the cached graph for this tree, or None if nothing valid is
+        cached. Never builds; with nothing cached for the tree it does not walk it either.
+        """
+        key: _CacheKey = (str(source_dir.resolve()), scan_all, scanner_config)
+        with self._lock:
+            if key not in self._entries:
+                return None
+        return self._lookup(key, self.fingerprint(source_dir, scan_all, scanner_config))
+
+    def _lookup(self, key: _CacheKey, fingerprint: tuple[int, int]) -> CodeGraph | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.fingerprint == fingerprint:
+                self._entries.move_to_end(key)
+                return entry.graph.fork()
+        return None
+
+    def invalidate(self) -> None:
+        """Drops every cached graph."""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def fingerprint(
+        source_dir: Path, scan_all: bool, scanner_config: ScannerConfig
+    ) -> tuple[int, int]:
+        """
+        Order-independent digest of (path, mtime, size) over candidate files.
+        Uses the scanner's directory exclusions; in strict mode only `.py` files count.
+        """
+        exclude_dirs = scanner_config.exclude_dirs
+        count = 0
+        digest = 0
+        stack = [str(source_dir)]
+
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.name in exclude_dirs or entry.name.startswith("."):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            continue
+                        if not scan_all and not entry.name.endswith(".py"):
+                            continue
+                        stat = entry.stat()
+                        digest ^= hash((entry.path, stat.st_mtime_ns, stat.st_size))
+                        count += 1
+            except OSError as e:
+                logger.debug("Fingerprint skipped '%s': %s", current, e)
+
+        return count, digest
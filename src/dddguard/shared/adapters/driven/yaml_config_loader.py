@@ -4,7 +4,7 @@ from typing import Any
 
 import yaml
 
-from ...domain import ConfigVo, ProjectConfig, ScannerConfig
+from ...domain import ConfigVo, LinterConfig, ProjectConfig, ScannerConfig
 
 logger = logging.getLogger(__name__)
 
@@ -68,19 +68,28 @@ class YamlConfigLoader:
         # A. Resolve project root
         project_root = self._resolve_project_root(proj_data, config_file_path)
 
+        optional: dict[str, Any] = {}
+        if "cache_dir" in proj_data:
+            optional["cache_dir"] = proj_data["cache_dir"]
+
         project_conf = ProjectConfig(
             source_dir=proj_data.get("source_dir"),
             tests_dir=proj_data.get("tests_dir"),
             docs_dir=proj_data.get("docs_dir"),
             project_root=project_root,
             config_file_path=config_file_path,
+            **optional,
         )
 
         # 2. Scanner Section
         scan_data: dict[str, Any] = data.get("scanner", {})
         scanner_conf = self._parse_scanner_config(scan_data)
 
-        return ConfigVo(project=project_conf, scanner=scanner_conf)
+        # 3. Linter Section
+        lint_data: dict[str, Any] = data.get("linter", {})
+        linter_conf = self._parse_linter_config(lint_data)
+
+        return ConfigVo(project=project_conf, scanner=scanner_conf, linter=linter_conf)
 
     @staticmethod
     def _resolve_project_root(proj_data: dict[str, Any], config_file_path: Path) -> Path:
@@ -113,4 +122,26 @@ class YamlConfigLoader:
         if "max_file_size_bytes" in scan_data:
             kwargs["max_file_size_bytes"] = scan_data["max_file_size_bytes"]
 
+        if "read_workers" in scan_data:
+            kwargs["read_workers"] = int(scan_data["read_workers"])
+
+        if "read_ahead_per_worker" in scan_data:
+            kwargs["read_ahead_per_worker"] = int(scan_data["read_ahead_per_worker"])
+
         return ScannerConfig(**kwargs)
+
+    @staticmethod
+    def _parse_linter_config(lint_data: dict[str, Any]) -> LinterConfig:
+        """Builds LinterConfig from the 'linter' section of YAML data."""
+        kwargs: dict[str, Any] = {}
+
+        if "workers" in lint_data:
+            kwargs["workers"] = int(lint_data["workers"])
+
+        if "parallel_min_modules" in lint_data:
+            kwargs["parallel_min_modules"] = int(lint_data["parallel_min_modules"])
+
+        if "cache" in lint_data:
+            kwargs["cache"] = bool(lint_data["cache"])
+
+        return LinterConfig(**kwargs)
@@ -1,8 +1,6 @@
 from dataclasses import dataclass
 from typing import Any
 
-from InquirerPy.utils import get_style
-
 from ....assets.themes_data import (
     LINTER_THEME_DATA,
     ROOT_THEME_DATA,
@@ -33,6 +31,8 @@ class GuardTheme:
 
     def get_style(self) -> Any:
         """Returns an InquirerPy style object for prompt rendering."""
+        from InquirerPy.utils import get_style
+
         return get_style(self.inquirer_style, style_override=False)
 
 
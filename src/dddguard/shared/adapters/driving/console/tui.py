@@ -6,9 +6,6 @@ from pathlib import Path
 from typing import Any
 
 import typer
-from InquirerPy import inquirer
-from InquirerPy.base.control import Choice
-from InquirerPy.validator import EmptyInputValidator
 from rich import box
 from rich.align import Align
 from rich.console import Console
@@ -25,6 +22,9 @@ class Tui:
     """
     Unified Text User Interface Adapter.
     Centralizes all Rich and InquirerPy interactions.
+
+    InquirerPy (and prompt_toolkit behind it) is imported by the input methods
+    only: non-interactive commands such as `lint --auto` never load it.
     """
 
     def __init__(self):
@@ -159,6 +159,8 @@ class Tui:
         use_fuzzy: bool = False,
         instruction: str = "(Use arrow keys)",
     ) -> Any:
+        from InquirerPy import inquirer
+
         active_theme = theme or self._theme
         style = active_theme.get_style()
         msg_str = message or ""
@@ -197,6 +199,8 @@ class Tui:
         instruction: str = "(Space to select)",
         use_fuzzy: bool = False,  # <--- Added Parameter
     ) -> list[Any] | None:
+        from InquirerPy import inquirer
+
         active_theme = theme or self._theme
         msg_str = message or ""
         try:
@@ -235,6 +239,9 @@ class Tui:
         allow_empty: bool = False,
         theme: GuardTheme | None = None,
     ) -> str | None:
+        from InquirerPy import inquirer
+        from InquirerPy.validator import EmptyInputValidator
+
         active_theme = theme or self._theme
         try:
             return inquirer.text(
@@ -253,6 +260,9 @@ class Tui:
         Interactive Fuzzy Path Selector.
         Logic ported from widgets.py but encapsulated here.
         """
+        from InquirerPy import inquirer
+        from InquirerPy.base.control import Choice
+
         current_path = Path(default).resolve() if default else Path.cwd()
         if not current_path.exists():
             current_path = Path.cwd()
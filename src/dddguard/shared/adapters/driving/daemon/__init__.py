@@ -0,0 +1,36 @@
+from typing import Any
+
+from .protocol import daemon_supported, ensure_private_dir, is_trusted_socket, socket_path_for
+
+__all__ = [
+    "DaemonClient",
+    "DaemonServer",
+    "DaemonUnavailableError",
+    "RemoteCallError",
+    "RemoteFacade",
+    "daemon_supported",
+    "ensure_private_dir",
+    "is_socket_alive",
+    "is_trusted_socket",
+    "socket_path_for",
+]
+
+# Lazy exports: every CLI call probes for a daemon, but only `daemon start` needs the
+# server (socketserver, threading) and only a running daemon needs the client.
+_LAZY_EXPORTS = {
+    "DaemonClient": ".client",
+    "DaemonUnavailableError": ".client",
+    "RemoteCallError": ".client",
+    "RemoteFacade": ".client",
+    "DaemonServer": ".server",
+    "is_socket_alive": ".server",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    return getattr(import_module(module, __name__), name)
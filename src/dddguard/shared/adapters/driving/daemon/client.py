@@ -0,0 +1,149 @@
+import inspect
+import itertools
+import socket
+import typing
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from dddguard.shared.helpers.generics import BaseDddError, GenericDrivingAdapterError
+
+from .protocol import JSONRPC_VERSION, decode, encode, read_message, send_message
+
+
+class DaemonUnavailableError(GenericDrivingAdapterError):
+    """No daemon answers on the socket (not running, or it went away)."""
+
+    def __init__(self, socket_path: Path, original_error: Exception | None = None):
+        super().__init__(
+            message=f"No daemon listening on {socket_path}",
+            context_name="Daemon",
+            original_error=original_error,
+        )
+
+
+class RemoteCallError(BaseDddError):
+    """
+    An error raised inside the daemon, re-raised on the client with the
+    original context and layer, so it renders exactly like a local failure.
+    """
+
+    def __init__(self, message: str, context_name: str, layer: str):
+        self._layer = layer
+        super().__init__(message=message, context_name=context_name)
+
+    @property
+    def layer_title(self) -> str:
+        return self._layer
+
+
+class DaemonClient:
+    """
+    Driving Adapter: Thin JSON-RPC client of a running `DaemonServer`.
+    Keeps one connection open for the lifetime of the client.
+    """
+
+    def __init__(self, socket_path: Path, connect_timeout: float = 0.5) -> None:
+        self.socket_path = socket_path
+        self._connect_timeout = connect_timeout
+        self._sock: socket.socket | None = None
+        self._stream: typing.BinaryIO | None = None
+        self._ids = itertools.count(1)
+
+    def call(self, method: str, params: dict[str, Any] | None = None) -> Any:
+        """
+        Sends one request and waits for its result.
+
+        :raises DaemonUnavailableError: The daemon cannot be reached.
+        :raises RemoteCallError: The daemon ran the call and it failed.
+        """
+        request_id = next(self._ids)
+        request = {"jsonrpc": JSONRPC_VERSION, "id": request_id, "method": method}
+        if params:
+            request["params"] = params
+
+        try:
+            sock, stream = self._connect()
+            send_message(sock, request)
+            response = read_message(stream)
+        except (OSError, ValueError) as e:
+            self.close()
+            raise DaemonUnavailableError(self.socket_path, original_error=e) from e
+        if response is None:
+            self.close()
+            raise DaemonUnavailableError(self.socket_path)
+
+        error = response.get("error")
+        if error is not None:
+            data = error.get("data") or {}
+            raise RemoteCallError(
+                message=data.get("message", error.get("message", "")),
+                context_name=data.get("context", "Daemon"),
+                layer=data.get("layer", "Daemon"),
+            )
+        return response.get("result")
+
+    def ping(self) -> dict[str, Any] | None:
+        """Daemon status, or None if no daemon answers."""
+        try:
+            status: dict[str, Any] | None = self.call("daemon.ping")
+        except DaemonUnavailableError:
+            return None
+        return status
+
+    def close(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+        self._sock = None
+        self._stream = None
+
+    def _connect(self) -> tuple[socket.socket, typing.BinaryIO]:
+        if self._sock is None or self._stream is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self._connect_timeout)
+            try:
+                sock.connect(str(self.socket_path))
+            except OSError:
+                sock.close()
+                raise
+            sock.settimeout(None)  # Scans may take long; the daemon always answers
+            self._sock = sock
+            self._stream = sock.makefile("rb")
+        return self._sock, self._stream
+
+
+class RemoteFacade:
+    """
+    Stands in for a facade: the listed methods run in the daemon, everything
+    else (attributes such as `config`, other methods) on the local facade.
+    Falls back to the local call if the daemon has gone away.
+    """
+
+    def __init__(
+        self, local: object, client: DaemonClient, namespace: str, methods: frozenset[str]
+    ) -> None:
+        self._local = local
+        self._client = client
+        self._namespace = namespace
+        self._methods = methods
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._local, name)
+        if name not in self._methods:
+            return attribute
+        return self._remote(name, attribute)
+
+    def _remote(self, name: str, local_method: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(local_method)
+        hints = typing.get_type_hints(local_method)
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            bound = signature.bind(*args, **kwargs)
+            params = {key: encode(value, hints.get(key)) for key, value in bound.arguments.items()}
+            try:
+                result = self._client.call(f"{self._namespace}.{name}", params)
+            except DaemonUnavailableError:
+                return local_method(*args, **kwargs)
+            return decode(hints.get("return"), result)
+
+        return call
@@ -0,0 +1,238 @@
+"""
+Wire format of the daemon: newline-delimited JSON-RPC 2.0 over a Unix socket.
+
+Facade arguments and results are dataclass schemas, enums, paths and
+collections; `encode` / `decode` map them to JSON guided by type hints, so
+both ends only need the facade signatures. A `CodeGraph` travels as its nodes.
+"""
+
+import dataclasses
+import hashlib
+import io
+import json
+import os
+import socket
+import stat
+import tempfile
+import types
+import typing
+from enum import Enum
+from pathlib import Path
+from typing import Any, Final, Union
+
+from dddguard.shared.domain import CodeGraph, CodeNode, ComponentPassport, NodeStatus
+
+JSONRPC_VERSION: Final[str] = "2.0"
+
+# JSON-RPC error codes (-32000..-32099 are reserved for implementation errors)
+PARSE_ERROR: Final[int] = -32700
+METHOD_NOT_FOUND: Final[int] = -32601
+INVALID_PARAMS: Final[int] = -32602
+APPLICATION_ERROR: Final[int] = -32000
+
+# Largest single message accepted (a full graph with file contents fits comfortably)
+MAX_MESSAGE_BYTES: Final[int] = 512 * 1024 * 1024
+
+
+def daemon_supported() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+def socket_path_for(project_root: Path) -> Path:
+    """
+    One socket per user and project, in a private per-user directory under the
+    runtime dir (or the temp dir). Check it with `is_trusted_socket` before use.
+    """
+    digest = hashlib.blake2b(str(project_root.resolve()).encode(), digest_size=8).hexdigest()
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(runtime_dir) / f"dddguard-{_uid()}" / f"{digest}.sock"
+
+
+def ensure_private_dir(directory: Path) -> None:
+    """
+    Creates `directory` owner-only (0700).
+
+    :raises PermissionError: It exists but is not a directory private to the current user
+        (e.g. pre-created by another user in a shared temp dir).
+    """
+    directory.mkdir(mode=0o700, exist_ok=True)
+    if not _is_private_dir(directory):
+        raise PermissionError(
+            f"Refusing to use '{directory}': not a directory private to the current user"
+        )
+
+
+def is_trusted_socket(socket_path: Path) -> bool:
+    """
+    True if `socket_path` is a socket of the current user inside a private directory.
+    Anything else may be served by another local user and must not be trusted.
+    """
+    if not _is_private_dir(socket_path.parent):
+        return False
+    try:
+        info = socket_path.lstat()
+    except OSError:
+        return False
+    return stat.S_ISSOCK(info.st_mode) and info.st_uid == _uid()
+
+
+def _is_private_dir(directory: Path) -> bool:
+    try:
+        info = directory.lstat()  # A symlink is never trusted
+    except OSError:
+        return False
+    return stat.S_ISDIR(info.st_mode) and info.st_uid == _uid() and info.st_mode & 0o077 == 0
+
+
+def _uid() -> int:
+    return os.getuid() if hasattr(os, "getuid") else 0
+
+
+# --- Framing ---
+
+
+def send_message(sock: socket.socket, message: dict[str, Any]) -> None:
+    sock.sendall(json.dumps(message, ensure_ascii=False).encode() + b"\n")
+
+
+def read_message(stream: typing.BinaryIO | io.BufferedIOBase) -> dict[str, Any] | None:
+    """Next message from a buffered socket stream; None on a clean EOF."""
+    line = stream.readline(MAX_MESSAGE_BYTES + 1)
+    if not line:
+        return None
+    if len(line) > MAX_MESSAGE_BYTES:
+        raise ValueError("Message too large")
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError("Message is not a JSON object")
+    return message
+
+
+# --- Codec ---
+
+
+def encode(value: Any, hint: Any = None) -> Any:
+    """JSON-ready form of `value`. `hint` (the declared type) disambiguates enum unions."""
+    if value is None or (
+        isinstance(value, (bool, int, float, str)) and not isinstance(value, Enum)
+    ):
+        return value
+    if isinstance(value, Enum):
+        # Several enum types can share a value: tag the type when the declaration is a union
+        if _is_union(hint):
+            return f"{type(value).__name__}:{value.value}"
+        return value.value
+    if isinstance(value, Path):
+        # Relative paths mean the caller's working directory, not the daemon's
+        return str(value.absolute())
+    if isinstance(value, CodeGraph):
+        return {"nodes": [_encode_node(node) for node in value.nodes.values()]}
+    if dataclasses.is_dataclass(value):
+        hints = typing.get_type_hints(type(value))
+        return {
+            f.name: encode(getattr(value, f.name), hints.get(f.name))
+            for f in dataclasses.fields(value)
+        }
+    if isinstance(value, dict):
+        key_hint, value_hint = (typing.get_args(hint) or (None, None))[:2]
+        return {str(encode(k, key_hint)): encode(v, value_hint) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        args = typing.get_args(hint)
+        item_hint = args[0] if args else None
+        items = [encode(item, item_hint) for item in value]
+        return sorted(items, key=str) if isinstance(value, (set, frozenset)) else items
+    raise TypeError(f"Cannot encode {type(value).__name__} for the daemon")
+
+
+def decode(hint: Any, value: Any) -> Any:
+    """Inverse of `encode` for a value declared as `hint`."""
+    if hint is None or hint is Any:
+        return value
+    origin = typing.get_origin(hint)
+    args = typing.get_args(hint)
+
+    if _is_union(hint):
+        if value is None:
+            return None
+        members = [arg for arg in args if arg is not type(None)]
+        if isinstance(value, str) and ":" in value:
+            enum_name, _, raw = value.partition(":")
+            for member in members:
+                if (
+                    isinstance(member, type)
+                    and issubclass(member, Enum)
+                    and member.__name__ == enum_name
+                ):
+                    return member(raw)
+        for member in members:
+            try:
+                return decode(member, value)
+            except (TypeError, ValueError, KeyError):
+                continue
+        raise ValueError(f"Cannot decode {value!r} as {hint}")
+
+    if origin is typing.Literal:
+        return value
+    if hint is CodeGraph:
+        return _decode_graph(value)
+    if isinstance(hint, type) and issubclass(hint, Enum):
+        return hint(value)
+    if hint is Path:
+        return Path(value)
+    if isinstance(hint, type) and dataclasses.is_dataclass(hint):
+        if not isinstance(value, dict):
+            raise TypeError(f"Expected an object for {hint.__name__}")
+        hints = typing.get_type_hints(hint)
+        return hint(
+            **{
+                f.name: decode(hints.get(f.name), value[f.name])
+                for f in dataclasses.fields(hint)
+                if f.init and f.name in value
+            }
+        )
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            return tuple(decode(args[0], item) for item in value)
+        return tuple(decode(arg, item) for arg, item in zip(args, value, strict=True))
+    if origin in (list, set, frozenset):
+        item_hint = args[0] if args else None
+        return origin(decode(item_hint, item) for item in value)
+    if origin is dict:
+        key_hint, value_hint = args or (None, None)
+        return {decode(key_hint, k): decode(value_hint, v) for k, v in value.items()}
+    if hint in (int, float) and isinstance(value, (int, float)):
+        return hint(value)
+    return value
+
+
+def _is_union(hint: Any) -> bool:
+    return typing.get_origin(hint) in (Union, types.UnionType)
+
+
+def _encode_node(node: CodeNode) -> dict[str, Any]:
+    return {
+        "path": node.path,
+        "file_path": str(node.file_path) if node.file_path else None,
+        "content": node.content,
+        "status": node.status.value,
+        "imports": sorted(node.imports),
+        "passport": encode(node.passport),
+        "visible_radius": node.visible_radius,
+    }
+
+
+def _decode_graph(value: dict[str, Any]) -> CodeGraph:
+    nodes: dict[str, CodeNode] = {}
+    for item in value["nodes"]:
+        passport = item["passport"]
+        node = CodeNode(
+            path=item["path"],
+            file_path=Path(item["file_path"]) if item["file_path"] else None,
+            content=item["content"],
+            _status=NodeStatus(item["status"]),
+            imports=item["imports"],
+            passport=None if passport is None else decode(ComponentPassport, passport),
+            visible_radius=item["visible_radius"],
+        )
+        nodes[node.path] = node
+    return CodeGraph(nodes=nodes)
@@ -0,0 +1,213 @@
+import contextlib
+import inspect
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+import typing
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any
+
+from dddguard.shared.helpers.generics import BaseDddError
+
+from .protocol import (
+    APPLICATION_ERROR,
+    INVALID_PARAMS,
+    JSONRPC_VERSION,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    decode,
+    encode,
+    ensure_private_dir,
+    read_message,
+    send_message,
+)
+
+logger = logging.getLogger(__name__)
+
+# namespace -> facade object (e.g. {"linter": LinterFacade})
+Services = Mapping[str, object]
+
+
+class DaemonServer:
+    """
+    Driving Adapter: Resident JSON-RPC server in front of the context facades.
+
+    Keeps one set of facades (and with them the session graph cache) alive
+    across requests, so repeated scan/lint/query calls skip interpreter start,
+    container build and unchanged-file parsing. A method `ns.name` calls
+    `services[ns].name(**params)` when `name` is listed in `methods[ns]`.
+
+    Requests are executed one at a time. Before each request `reload_stamp()`
+    is compared with its previous value; a change (e.g. an edited config file)
+    rebuilds the services.
+    """
+
+    def __init__(
+        self,
+        socket_path: Path,
+        build_services: Callable[[], Services],
+        methods: Mapping[str, frozenset[str]],
+        reload_stamp: Callable[[], object] = lambda: None,
+    ) -> None:
+        self.socket_path = socket_path
+        self._build_services = build_services
+        self._methods = methods
+        self._reload_stamp = reload_stamp
+        self._stamp = reload_stamp()
+        self._services = build_services()
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._requests = 0
+        self._server: socketserver.ThreadingUnixStreamServer | None = None
+
+    def serve_forever(self) -> None:
+        """
+        Binds the socket (owner-only, in a private directory) and serves until
+        `shutdown` or a daemon.shutdown call.
+
+        :raises PermissionError: The socket directory is not private to the current user.
+        """
+        handler = _make_handler(self)
+        ensure_private_dir(self.socket_path.parent)
+        with contextlib.suppress(FileNotFoundError):
+            self.socket_path.unlink()  # Stale file: liveness was checked by the caller
+
+        # The umask makes the socket owner-only from the moment it exists
+        previous_umask = os.umask(0o177)
+        try:
+            server = socketserver.ThreadingUnixStreamServer(str(self.socket_path), handler)
+        finally:
+            os.umask(previous_umask)
+        server.daemon_threads = True
+        self._server = server
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+            with contextlib.suppress(FileNotFoundError):
+                self.socket_path.unlink()
+
+    def shutdown(self) -> None:
+        if self._server is not None:
+            # serve_forever() must be stopped from another thread
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+
+    # --- Dispatch ---
+
+    def handle(self, request: Any) -> dict[str, Any] | None:
+        """Answers one JSON-RPC request (None for notifications)."""
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return _error(None, INVALID_PARAMS, "Invalid request")
+
+        request_id = request.get("id")
+        method = request["method"]
+        params = request.get("params") or {}
+
+        with self._lock:
+            self._requests += 1
+            try:
+                result = self._dispatch(method, params)
+            except _RpcError as e:
+                response = _error(request_id, e.code, e.message)
+            except BaseDddError as e:
+                data = {"context": e.context_name, "layer": e.layer_title, "message": e.message}
+                response = _error(request_id, APPLICATION_ERROR, str(e), data)
+            except Exception as e:
+                logger.exception("Daemon request %s failed", method)
+                response = _error(request_id, APPLICATION_ERROR, str(e) or type(e).__name__)
+            else:
+                response = {"jsonrpc": JSONRPC_VERSION, "id": request_id, "result": result}
+
+        return None if "id" not in request else response
+
+    def _dispatch(self, method: str, params: Any) -> Any:
+        if method == "daemon.ping":
+            return self._status()
+        if method == "daemon.shutdown":
+            self.shutdown()
+            return True
+
+        namespace, _, name = method.partition(".")
+        if name not in self._methods.get(namespace, ()):
+            raise _RpcError(METHOD_NOT_FOUND, f"Unknown method: {method}")
+        if not isinstance(params, dict):
+            raise _RpcError(INVALID_PARAMS, "Params must be an object")
+
+        self._reload_if_changed()
+        target = getattr(self._services[namespace], name)
+        hints = typing.get_type_hints(target)
+        signature = inspect.signature(target)
+        unknown = params.keys() - signature.parameters.keys()
+        if unknown:
+            raise _RpcError(INVALID_PARAMS, f"Unknown params: {', '.join(sorted(unknown))}")
+
+        kwargs = {key: decode(hints.get(key), value) for key, value in params.items()}
+        return encode(target(**kwargs), hints.get("return"))
+
+    def _reload_if_changed(self) -> None:
+        stamp = self._reload_stamp()
+        if stamp != self._stamp:
+            logger.info("Configuration changed, rebuilding services")
+            self._services = self._build_services()
+            self._stamp = stamp
+
+    def _status(self) -> dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "socket": str(self.socket_path),
+            "uptime_seconds": round(time.monotonic() - self._started, 1),
+            "requests": self._requests,
+        }
+
+
+class _RpcError(Exception):
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def _error(request_id: Any, code: int, message: str, data: Any = None) -> dict[str, Any]:
+    error: dict[str, Any] = {"code": code, "message": message}
+    if data is not None:
+        error["data"] = data
+    return {"jsonrpc": JSONRPC_VERSION, "id": request_id, "error": error}
+
+
+def _make_handler(daemon: DaemonServer) -> type[socketserver.StreamRequestHandler]:
+    class _Handler(socketserver.StreamRequestHandler):
+        # One connection may carry several requests (one per line)
+        def handle(self) -> None:
+            while True:
+                try:
+                    request = read_message(self.rfile)
+                except ValueError as e:  # Bad JSON or oversized line
+                    send_message(self.connection, _error(None, PARSE_ERROR, str(e)))
+                    return
+                if request is None:
+                    return
+                response = daemon.handle(request)
+                if response is not None:
+                    try:
+                        send_message(self.connection, response)
+                    except OSError:
+                        return  # Client went away
+
+    return _Handler
+
+
+def is_socket_alive(socket_path: Path, timeout: float = 0.5) -> bool:
+    """True if something accepts connections on `socket_path`."""
+    if not socket_path.exists():
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
@@ -27,4 +27,13 @@ scanner:
     - "manage.py"
     - "setup.py"
     - "__main__.py"
+
+  # I/O threads reading files ahead of the parser (0 = sequential)
+  read_workers: 0
+
+linter:
+  # Processes checking rules in parallel on large graphs (0 = single process)
+  workers: 0
+  # Re-check only modules whose imports or classification changed
+  cache: true
 """.strip()
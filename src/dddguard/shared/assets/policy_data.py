@@ -36,6 +36,7 @@ RuleName = Literal[
     "Cross-Context Inbound",
     "Shared Independence",
     "Root Isolation",
+    "Import Cycle",
 ]
 
 
@@ -34,6 +34,11 @@ GROUP 4 — SCOPE ISOLATION:
 12. Shared Independence  Shared -> Shared, Global only (never contexts)
 13. Root Isolation       Root -> providers + Shared only (never internals)
 
+\b
+GRAPH CHECK:
+------------
+ -  Import Cycle         Contexts (error) or modules (warning) importing in a loop
+
 \b
 BYPASS CONDITIONS (always allowed):
 ------------------------------------
@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING, Any
+
 from .access_policy import (
     COMPOSITION_LAYERS,
     CROSS_CONTEXT_INBOUND_ALLOWED,
@@ -25,8 +27,16 @@ from .architecture_enums import (
     PortType,
     ScopeEnum,
 )
-from .code_graph_ent import CodeGraph, CodeNode, ComponentPassport, NodeStatus
-from .config_vo import ConfigVo, ProjectConfig, ScannerConfig
+from .code_graph_ent import (
+    PASSPORT_TABLE,
+    CodeGraph,
+    CodeNode,
+    ComponentPassport,
+    NodeStatus,
+    PassportTable,
+)
+from .config_vo import ConfigVo, LinterConfig, ProjectConfig, ScannerConfig
+from .import_cycles_vo import ImportCycleReportVo, ImportCycleVo
 from .registry import (
     DDD_DIRECTION_REGISTRY,
     DDD_LAYER_REGISTRY,
@@ -35,6 +45,10 @@ from .registry import (
     DDD_STRUCTURAL_REGISTRY,
 )
 
+if TYPE_CHECKING:
+    from .csr_adjacency_vo import CsrAdjacency
+    from .reachability_index_vo import ReachabilityIndex
+
 __all__ = [
     "COMPOSITION_LAYERS",
     "CROSS_CONTEXT_INBOUND_ALLOWED",
@@ -50,6 +64,7 @@ __all__ = [
     "FRACTAL_UPSTREAM_ALLOWED",
     "FRACTAL_UPSTREAM_FORBIDDEN",
     "INTERNAL_ACCESS_MATRIX",
+    "PASSPORT_TABLE",
     # Access Policy
     "AccessRule",
     "AdapterType",
@@ -63,17 +78,36 @@ __all__ = [
     "CompositionType",
     # Config VOs
     "ConfigVo",
+    "CsrAdjacency",
     "DirectionEnum",
     "DomainType",
+    "ImportCycleReportVo",
+    "ImportCycleVo",
     "InternalAccessMatrix",
     "LayerDirectionKey",
     "LayerEnum",
+    "LinterConfig",
     "MatchMethod",
     "NodeStatus",
+    "PassportTable",
     "PortType",
     "ProjectConfig",
+    "ReachabilityIndex",
     "RuleName",
     "ScannerConfig",
     # Enums
     "ScopeEnum",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Graph snapshots are loaded on first use, not with every command
+    if name == "CsrAdjacency":
+        from .csr_adjacency_vo import CsrAdjacency
+
+        return CsrAdjacency
+    if name == "ReachabilityIndex":
+        from .reachability_index_vo import ReachabilityIndex
+
+        return ReachabilityIndex
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,25 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import threading
+from collections.abc import Callable, Iterable
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from pathlib import Path
+from typing import Any, Final, cast
 
 from ..helpers.generics.errors import GenericDomainError
 from .architecture_enums import (
+    AdapterType,
+    AppType,
+    ArchetypeType,
     ComponentType,
+    CompositionType,
     DirectionEnum,
+    DomainType,
     LayerEnum,
     MatchMethod,
+    PortType,
     ScopeEnum,
 )
 
@@ -49,12 +59,260 @@ class ComponentPassport:
     match_method: MatchMethod
 
 
+# --- 1b. Passport Interning (Flyweight) ---
+
+# Ordinal tables. The position of a member is its ordinal in the packed code.
+_SCOPE_ORDER: Final[tuple[ScopeEnum, ...]] = tuple(ScopeEnum)
+_LAYER_ORDER: Final[tuple[LayerEnum, ...]] = tuple(LayerEnum)
+_DIRECTION_ORDER: Final[tuple[DirectionEnum, ...]] = tuple(DirectionEnum)
+_METHOD_ORDER: Final[tuple[MatchMethod, ...]] = tuple(MatchMethod)
+_COMPONENT_TYPE_ORDER: Final[tuple[ComponentType, ...]] = (
+    *DomainType,
+    *AppType,
+    *PortType,
+    *AdapterType,
+    *CompositionType,
+    *ArchetypeType,
+)
+
+# Bit layout of a packed passport code (low bits first):
+# scope(2) | layer(3) | direction(3) | match_method(2) | component_type(6) | context | macro
+_LAYER_SHIFT: Final[int] = 2
+_DIRECTION_SHIFT: Final[int] = 5
+_METHOD_SHIFT: Final[int] = 8
+_COMPONENT_SHIFT: Final[int] = 10
+_CONTEXT_SHIFT: Final[int] = 16
+_MACRO_SHIFT: Final[int] = 40
+_ENUM_BITS_MASK: Final[int] = (1 << _CONTEXT_SHIFT) - 1
+_STRING_ID_MASK: Final[int] = (1 << (_MACRO_SHIFT - _CONTEXT_SHIFT)) - 1
+
+
+def _ordinals(members: tuple[Enum, ...]) -> dict[Enum, int]:
+    # Str-based enums hash like their values, so plain strings resolve too.
+    return {member: i for i, member in enumerate(members)}
+
+
+_SCOPE_ORDINALS: Final = _ordinals(_SCOPE_ORDER)
+_LAYER_ORDINALS: Final = _ordinals(_LAYER_ORDER)
+_DIRECTION_ORDINALS: Final = _ordinals(_DIRECTION_ORDER)
+_METHOD_ORDINALS: Final = _ordinals(_METHOD_ORDER)
+# Component types share values across enums (e.g. PortType.REPOSITORY vs
+# AdapterType.REPOSITORY), so they are keyed by (enum class, value).
+_COMPONENT_TYPE_ORDINALS: Final[dict[tuple[type, str], int]] = {
+    (type(member), member.value): i for i, member in enumerate(_COMPONENT_TYPE_ORDER)
+}
+_COMPONENT_TYPE_BY_VALUE: Final[dict[str, int]] = {}
+for _i, _member in enumerate(_COMPONENT_TYPE_ORDER):
+    _COMPONENT_TYPE_BY_VALUE.setdefault(_member.value, _i)
+
+
+class PassportTable:
+    """
+    Flyweight registry of ComponentPassports.
+
+    A project only has a few hundred distinct passports, so each unique
+    combination is stored once and addressed by a small integer id.
+    Identity is the *packed code*: all enum fields encoded as ordinals in a
+    single int, plus table-local ids for the context and macro zone names.
+
+    Ids are dense (0..N-1) and stable for the lifetime of the table, which lets
+    consumers cache per-passport decisions in plain dicts or lists.
+    """
+
+    __slots__ = (
+        "_codes",
+        "_id_by_object",
+        "_ids_by_code",
+        "_lock",
+        "_passports",
+        "_string_ids",
+        "_strings",
+    )
+
+    def __init__(self) -> None:
+        self._passports: list[ComponentPassport] = []
+        self._codes: list[int] = []
+        self._ids_by_code: dict[int, int] = {}
+        # Fast path for canonical instances (kept alive by `_passports`).
+        self._id_by_object: dict[int, int] = {}
+        # String table for context / macro names (id 0 is reserved for None).
+        self._strings: list[str | None] = [None]
+        self._string_ids: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._passports)
+
+    def intern(self, passport: ComponentPassport) -> int:
+        """
+        Returns the id of the canonical passport equal to `passport`.
+        A `component_type` given as its plain value (e.g. "ENTITY") is stored as
+        the enum member, so canonical passports always carry enums.
+        """
+        passport_id = self._id_by_object.get(id(passport))
+        if passport_id is not None:
+            return passport_id
+
+        code = self.encode(passport)
+        passport_id = self._ids_by_code.get(code)
+        if passport_id is not None:
+            return passport_id
+
+        with self._lock:
+            passport_id = self._ids_by_code.get(code)
+            if passport_id is None:
+                passport = self._normalized(passport)
+                passport_id = len(self._passports)
+                self._passports.append(passport)
+                self._codes.append(code)
+                self._id_by_object[id(passport)] = passport_id
+                self._ids_by_code[code] = passport_id
+        return passport_id
+
+    def canonical(
+        self,
+        *,
+        scope: ScopeEnum,
+        context_name: str | None,
+        macro_zone: str | None,
+        layer: LayerEnum,
+        direction: DirectionEnum,
+        component_type: ComponentType,
+        match_method: MatchMethod,
+    ) -> ComponentPassport:
+        """
+        Factory: Returns the shared instance for the given fields.
+        Only allocates a new passport the first time a combination is seen.
+        """
+        code = self._pack(
+            scope=scope,
+            context_name=context_name,
+            macro_zone=macro_zone,
+            layer=layer,
+            direction=direction,
+            component_type=component_type,
+            match_method=match_method,
+        )
+        passport_id = self._ids_by_code.get(code)
+        if passport_id is not None:
+            return self._passports[passport_id]
+
+        return self._passports[
+            self.intern(
+                ComponentPassport(
+                    scope=scope,
+                    context_name=context_name,
+                    macro_zone=macro_zone,
+                    layer=layer,
+                    direction=direction,
+                    component_type=component_type,
+                    match_method=match_method,
+                )
+            )
+        ]
+
+    def get(self, passport_id: int) -> ComponentPassport:
+        return self._passports[passport_id]
+
+    def code_of(self, passport_id: int) -> int:
+        return self._codes[passport_id]
+
+    def encode(self, passport: ComponentPassport) -> int:
+        """Packs a passport into its compact integer code."""
+        return self._pack(
+            scope=passport.scope,
+            context_name=passport.context_name,
+            macro_zone=passport.macro_zone,
+            layer=passport.layer,
+            direction=passport.direction,
+            component_type=passport.component_type,
+            match_method=passport.match_method,
+        )
+
+    def decode(self, code: int) -> ComponentPassport:
+        """Inverse of `encode` (string ids refer to this table)."""
+        enum_bits = code & _ENUM_BITS_MASK
+        return self.canonical(
+            scope=_SCOPE_ORDER[enum_bits & 0b11],
+            layer=_LAYER_ORDER[(enum_bits >> _LAYER_SHIFT) & 0b111],
+            direction=_DIRECTION_ORDER[(enum_bits >> _DIRECTION_SHIFT) & 0b111],
+            match_method=_METHOD_ORDER[(enum_bits >> _METHOD_SHIFT) & 0b11],
+            component_type=_COMPONENT_TYPE_ORDER[(enum_bits >> _COMPONENT_SHIFT) & 0b111111],
+            context_name=self._strings[(code >> _CONTEXT_SHIFT) & _STRING_ID_MASK],
+            macro_zone=self._strings[code >> _MACRO_SHIFT],
+        )
+
+    def _pack(
+        self,
+        *,
+        scope: ScopeEnum,
+        context_name: str | None,
+        macro_zone: str | None,
+        layer: LayerEnum,
+        direction: DirectionEnum,
+        component_type: ComponentType,
+        match_method: MatchMethod,
+    ) -> int:
+        try:
+            enum_bits = (
+                _SCOPE_ORDINALS[scope]
+                | _LAYER_ORDINALS[layer] << _LAYER_SHIFT
+                | _DIRECTION_ORDINALS[direction] << _DIRECTION_SHIFT
+                | _METHOD_ORDINALS[match_method] << _METHOD_SHIFT
+                | self._component_ordinal(component_type) << _COMPONENT_SHIFT
+            )
+        except KeyError as e:
+            raise GenericDomainError(
+                f"Cannot encode passport field value: {e}", context_name="Shared"
+            ) from e
+
+        return (
+            enum_bits
+            | self._string_id(context_name) << _CONTEXT_SHIFT
+            | self._string_id(macro_zone) << _MACRO_SHIFT
+        )
+
+    @classmethod
+    def _normalized(cls, passport: ComponentPassport) -> ComponentPassport:
+        member = _COMPONENT_TYPE_ORDER[cls._component_ordinal(passport.component_type)]
+        if passport.component_type is member:
+            return passport
+        return replace(passport, component_type=member)
+
+    @staticmethod
+    def _component_ordinal(component_type: ComponentType) -> int:
+        ordinal = _COMPONENT_TYPE_ORDINALS.get((type(component_type), component_type))
+        if ordinal is None:
+            ordinal = _COMPONENT_TYPE_BY_VALUE[getattr(component_type, "value", component_type)]
+        return ordinal
+
+    def _string_id(self, value: str | None) -> int:
+        if value is None:
+            return 0
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            with self._lock:
+                string_id = self._string_ids.get(value)
+                if string_id is None:
+                    string_id = len(self._strings)
+                    self._strings.append(value)
+                    self._string_ids[value] = string_id
+        return string_id
+
+
+# Process-wide table: nodes of every graph reference passports through it.
+PASSPORT_TABLE: Final[PassportTable] = PassportTable()
+
+
 # --- 2. Entity (The Atom) ---
-@dataclass(slots=True)
+@dataclass(slots=True, init=False)
 class CodeNode:
     """
     Domain Entity: Represents a single Python module (file) in the system.
     It is a mutable State Machine that evolves during the analysis phases.
+
+    The passport is stored as its PASSPORT_TABLE id: pass either `passport` or,
+    when the id is already known (e.g. loading a snapshot), `passport_id`.
     """
 
     # Identity
@@ -70,42 +328,383 @@ class CodeNode:
     _status: NodeStatus = field(default=NodeStatus.DETECTED)
 
     # Relations & Metadata
-    imports: set[str] = field(default_factory=set)
-    passport: ComponentPassport | None = None
+    _imports: frozenset[str] = field(default_factory=frozenset)
+    _passport_id: int | None = None
     visible_radius: int = UNLIMITED_RADIUS
 
+    # Index of the owning graph (set on insertion); told about passport/status changes
+    _index: GraphIndex | None = field(default=None, repr=False, compare=False)
+
+    def __init__(
+        self,
+        path: str,
+        file_path: Path | None = None,
+        content: str | None = None,
+        *,
+        _status: NodeStatus = NodeStatus.DETECTED,
+        imports: Iterable[str] = (),
+        passport: ComponentPassport | None = None,
+        passport_id: int | None = None,
+        visible_radius: int = UNLIMITED_RADIUS,
+    ) -> None:
+        if passport is not None:
+            passport_id = PASSPORT_TABLE.intern(passport)
+        self.path = path
+        self.file_path = file_path
+        self.content = content
+        self._status = _status
+        self._imports = frozenset(imports)
+        self._passport_id = passport_id
+        self.visible_radius = visible_radius
+        self._index = None
+
+    # Pickled without `_index`: the graph rebuilds its index when the node is re-inserted
+    def __getstate__(self) -> tuple[Any, ...]:
+        return (
+            self.path,
+            self.file_path,
+            self.content,
+            self._status,
+            self._imports,
+            self._passport_id,
+            self.visible_radius,
+        )
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+        (
+            self.path,
+            self.file_path,
+            self.content,
+            self._status,
+            self._imports,
+            self._passport_id,
+            self.visible_radius,
+        ) = state
+        self._index = None
+
     @property
     def status(self) -> NodeStatus:
         return self._status
 
+    @property
+    def imports(self) -> frozenset[str]:
+        """
+        Outgoing edges (paths of imported modules). Immutable: assigning a new
+        set is the only way to change them, which keeps the importers index in sync.
+        """
+        return self._imports
+
+    @imports.setter
+    def imports(self, imports: Iterable[str]) -> None:
+        old = self._imports
+        new = self._imports = frozenset(imports)
+        if self._index is not None:
+            self._index.imports_changed(self.path, old, new)
+
+    @property
+    def passport_id(self) -> int | None:
+        """Id of the canonical passport in PASSPORT_TABLE (None = unclassified)."""
+        return self._passport_id
+
+    @property
+    def passport(self) -> ComponentPassport | None:
+        """The canonical passport instance, resolved through PASSPORT_TABLE."""
+        if self._passport_id is None:
+            return None
+        return PASSPORT_TABLE.get(self._passport_id)
+
+    @passport.setter
+    def passport(self, passport: ComponentPassport | None) -> None:
+        self._set_passport_id(None if passport is None else PASSPORT_TABLE.intern(passport))
+
     def link_imports(self, imports: list[str]) -> None:
         """
         Transition: DETECTED -> LINKED.
         """
-        self.imports = set(imports)
-        self._status = NodeStatus.LINKED
+        self.imports = imports  # Keeps the reverse (importers) index in sync
+        self._set_status(NodeStatus.LINKED)
 
     def classify(self, passport: ComponentPassport) -> None:
         """
         Transition: LINKED -> CLASSIFIED.
         """
-        self.passport = passport
-        self._status = NodeStatus.CLASSIFIED
+        self._set_passport_id(PASSPORT_TABLE.intern(passport))
+        self._set_status(NodeStatus.CLASSIFIED)
 
     def finalize(self) -> None:
         """
         Transition: CLASSIFIED -> FINALIZED.
         """
-        if not self.passport:
+        if self._passport_id is None:
             raise GenericDomainError(
                 f"Cannot finalize node {self.path}: missing passport.",
                 context_name="Shared",
             )
 
-        self._status = NodeStatus.FINALIZED
+        self._set_status(NodeStatus.FINALIZED)
+
+    def _set_status(self, status: NodeStatus) -> None:
+        old = self._status
+        self._status = status
+        if self._index is not None and old != status:
+            self._index.status_changed(old, status)
+
+    def _set_passport_id(self, passport_id: int | None) -> None:
+        old = self._passport_id
+        self._passport_id = passport_id
+        if self._index is not None and old != passport_id:
+            self._index.passport_changed(self.path, old, passport_id)
+
+
+# --- 3. Secondary Indexes ---
+
+
+class GraphIndex:
+    """
+    Secondary indexes over the nodes of one CodeGraph.
+
+    Maintained incrementally: the graph reports insertions/removals and every
+    attached node reports passport and status transitions, so queries cost
+    proportional to their result instead of a full node scan.
+
+    - Passport attributes (context, layer, direction, scope) -> node paths.
+    - Reverse adjacency: imported path -> importer paths.
+    - Status counters.
+    - Resolved directory -> node paths, built lazily on the first path query
+      (it needs `Path.resolve()`, which is too expensive to pay on every insert).
+    """
+
+    __slots__ = (
+        "_by_context",
+        "_by_direction",
+        "_by_layer",
+        "_by_passport",
+        "_by_scope",
+        "_dirs",
+        "_file_strs",
+        "_importers",
+        "_nodes",
+        "_resolved_parents",
+        "_status_counts",
+    )
+
+    def __init__(self, nodes: dict[str, CodeNode]) -> None:
+        self._nodes = nodes
+        self._clear()
+
+    def _clear(self) -> None:
+        self._by_passport: dict[int, set[str]] = {}
+        self._by_context: dict[str | None, set[str]] = {}
+        self._by_layer: dict[LayerEnum, set[str]] = {}
+        self._by_direction: dict[DirectionEnum, set[str]] = {}
+        self._by_scope: dict[ScopeEnum, set[str]] = {}
+        self._importers: dict[str, set[str]] = {}
+        self._status_counts: dict[NodeStatus, int] = dict.fromkeys(NodeStatus, 0)
+        # Lazy directory index (None until the first path query)
+        self._dirs: dict[str, set[str]] | None = None
+        self._file_strs: dict[str, str] = {}
+        self._resolved_parents: dict[Path, str] = {}
+
+    # --- Maintenance (called by _NodeMap / CodeNode) ---
+
+    def add(self, node: CodeNode) -> None:
+        node._index = self
+        self._status_counts[node.status] += 1
+        if node.passport_id is not None:
+            self._index_passport(node.path, node.passport_id)
+        self._index_imports(node.path, node.imports)
+        if self._dirs is not None:
+            self._index_file(node)
+
+    def remove(self, node: CodeNode) -> None:
+        node._index = None
+        self._status_counts[node.status] -= 1
+        if node.passport_id is not None:
+            self._unindex_passport(node.path, node.passport_id)
+        self._unindex_imports(node.path, node.imports)
+        if self._dirs is not None:
+            self._unindex_file(node.path)
+
+    def reset(self, detached: Iterable[CodeNode] = ()) -> None:
+        for node in detached:
+            node._index = None
+        self._clear()
+
+    def passport_changed(self, path: str, old: int | None, new: int | None) -> None:
+        if old is not None:
+            self._unindex_passport(path, old)
+        if new is not None:
+            self._index_passport(path, new)
+
+    def imports_changed(self, path: str, old: AbstractSet[str], new: AbstractSet[str]) -> None:
+        self._unindex_imports(path, old)
+        self._index_imports(path, new)
+
+    def status_changed(self, old: NodeStatus, new: NodeStatus) -> None:
+        self._status_counts[old] -= 1
+        self._status_counts[new] += 1
+
+    # --- Queries (results are live sets: do not mutate) ---
+
+    def by_context(self, context_name: str | None) -> AbstractSet[str]:
+        return self._by_context.get(context_name, _EMPTY)
+
+    def by_layer(self, layer: LayerEnum) -> AbstractSet[str]:
+        return self._by_layer.get(layer, _EMPTY)
+
+    def by_direction(self, direction: DirectionEnum) -> AbstractSet[str]:
+        return self._by_direction.get(direction, _EMPTY)
+
+    def by_scope(self, scope: ScopeEnum) -> AbstractSet[str]:
+        return self._by_scope.get(scope, _EMPTY)
+
+    def importers_of(self, path: str) -> AbstractSet[str]:
+        return self._importers.get(path, _EMPTY)
+
+    def by_component_type(self, component_type: ComponentType) -> set[str]:
+        return self.by_passport(lambda passport: passport.component_type == component_type)
+
+    def by_passport(self, predicate: Callable[[ComponentPassport], bool]) -> set[str]:
+        # Few distinct passports exist, so scanning the passport groups is cheap
+        result: set[str] = set()
+        for passport_id, paths in self._by_passport.items():
+            if paths and predicate(PASSPORT_TABLE.get(passport_id)):
+                result |= paths
+        return result
+
+    def under_directory(self, directory: str) -> set[str]:
+        """
+        Paths of nodes whose resolved file path starts with `directory`
+        (same string-prefix semantics as a per-node `startswith` check).
+        """
+        if self._dirs is None:
+            self._dirs = {}
+            for node in self._nodes.values():
+                self._index_file(node)
+
+        result: set[str] = set()
+        for dir_str, paths in self._dirs.items():
+            if dir_str.startswith(directory):
+                result |= paths
+            elif directory.startswith(dir_str):
+                # Prefix ends inside this directory: decide per file
+                result.update(p for p in paths if self._file_strs[p].startswith(directory))
+        return result
+
+    def status_count(self, status: NodeStatus) -> int:
+        return self._status_counts[status]
+
+    # --- Internal ---
+
+    def _index_passport(self, path: str, passport_id: int) -> None:
+        self._by_passport.setdefault(passport_id, set()).add(path)
+        passport = PASSPORT_TABLE.get(passport_id)
+        self._by_context.setdefault(passport.context_name, set()).add(path)
+        self._by_layer.setdefault(passport.layer, set()).add(path)
+        self._by_direction.setdefault(passport.direction, set()).add(path)
+        self._by_scope.setdefault(passport.scope, set()).add(path)
+
+    def _unindex_passport(self, path: str, passport_id: int) -> None:
+        self._by_passport[passport_id].discard(path)
+        passport = PASSPORT_TABLE.get(passport_id)
+        self._by_context[passport.context_name].discard(path)
+        self._by_layer[passport.layer].discard(path)
+        self._by_direction[passport.direction].discard(path)
+        self._by_scope[passport.scope].discard(path)
+
+    def _index_imports(self, path: str, imports: AbstractSet[str]) -> None:
+        for target in imports:
+            self._importers.setdefault(target, set()).add(path)
+
+    def _unindex_imports(self, path: str, imports: AbstractSet[str]) -> None:
+        for target in imports:
+            importers = self._importers.get(target)
+            if importers is not None:
+                importers.discard(path)
+
+    def _index_file(self, node: CodeNode) -> None:
+        if node.file_path is None or self._dirs is None:
+            return
+        parent = node.file_path.parent
+        dir_str = self._resolved_parents.get(parent)
+        if dir_str is None:
+            dir_str = str(parent.resolve())
+            self._resolved_parents[parent] = dir_str
+        self._dirs.setdefault(dir_str, set()).add(node.path)
+        self._file_strs[node.path] = str(Path(dir_str) / node.file_path.name)
+
+    def _unindex_file(self, path: str) -> None:
+        file_str = self._file_strs.pop(path, None)
+        if file_str is not None and self._dirs is not None:
+            self._dirs[str(Path(file_str).parent)].discard(path)
+
+
+_EMPTY: Final[frozenset[str]] = frozenset()
+
+
+class _NodeMap(dict[str, CodeNode]):
+    """
+    `CodeGraph.nodes` storage: a plain dict that keeps the GraphIndex in sync
+    on every insertion and removal (including direct `graph.nodes[k] = node`).
+    Keys are expected to equal `node.path`.
+    """
+
+    __slots__ = ("_index",)
+
+    def __init__(self, items: Iterable[tuple[str, CodeNode]] = ()) -> None:
+        super().__init__()
+        self._index = GraphIndex(self)
+        for path, node in items:
+            self[path] = node
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Default dict-subclass pickling sets items before `_index` exists
+        return (_NodeMap, (list(self.items()),))
+
+    def __setitem__(self, path: str, node: CodeNode) -> None:
+        old = self.get(path)
+        if old is node:
+            return
+        if old is not None:
+            self._index.remove(old)
+        super().__setitem__(path, node)
+        self._index.add(node)
+
+    def __delitem__(self, path: str) -> None:
+        node = self[path]
+        super().__delitem__(path)
+        self._index.remove(node)
+
+    def pop(self, path: str, *default: Any) -> Any:
+        if path in self:
+            node = self[path]
+            del self[path]
+            return node
+        if default:
+            return default[0]
+        raise KeyError(path)
+
+    def popitem(self) -> tuple[str, CodeNode]:
+        path, node = super().popitem()
+        self._index.remove(node)
+        return path, node
 
+    def setdefault(self, path: str, node: CodeNode) -> CodeNode:
+        if path not in self:
+            self[path] = node
+        return self[path]
 
-# --- 3. Aggregate Root (The Universe) ---
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for path, node in dict(*args, **kwargs).items():
+            self[path] = node
+
+    def clear(self) -> None:
+        detached = list(self.values())
+        super().clear()
+        self._index.reset(detached)
+
+
+# --- 4. Aggregate Root (The Universe) ---
 
 
 @dataclass(slots=True)
@@ -113,10 +712,17 @@ class CodeGraph:
     """
     Aggregate Root: Encapsulates the entire graph of code nodes.
     Maintains consistency and provides aggregate-level statistics.
+
+    Secondary indexes (context, layer, direction, scope, importers, directory, status counts)
+    are kept in sync with `nodes` and exposed through the `nodes_*` query methods.
     """
 
     nodes: dict[str, CodeNode] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.nodes, _NodeMap):
+            self.nodes = _NodeMap(self.nodes.items())
+
     def add_node(
         self,
         path: str,
@@ -131,16 +737,73 @@ class CodeGraph:
     def get_node(self, path: str) -> CodeNode | None:
         return self.nodes.get(path)
 
+    def fork(self) -> CodeGraph:
+        """
+        Returns an independent copy whose node states can be mutated freely.
+
+        Node identity fields and `content` strings are shared (immutable);
+        state (status, radius) and import sets are per-copy. Used to hand out
+        cached graphs without re-running detection and classification.
+        """
+        return CodeGraph(
+            nodes={
+                path: CodeNode(
+                    path=node.path,
+                    file_path=node.file_path,
+                    content=node.content,
+                    _status=node.status,
+                    imports=node.imports,
+                    passport_id=node.passport_id,
+                    visible_radius=node.visible_radius,
+                )
+                for path, node in self.nodes.items()
+            }
+        )
+
+    # --- Index Queries (live sets: do not mutate) ---
+
+    @property
+    def _index(self) -> GraphIndex:
+        return cast("_NodeMap", self.nodes)._index
+
+    def nodes_in_context(self, context_name: str | None) -> AbstractSet[str]:
+        return self._index.by_context(context_name)
+
+    def nodes_in_layer(self, layer: LayerEnum) -> AbstractSet[str]:
+        return self._index.by_layer(layer)
+
+    def nodes_with_direction(self, direction: DirectionEnum) -> AbstractSet[str]:
+        return self._index.by_direction(direction)
+
+    def nodes_in_scope(self, scope: ScopeEnum) -> AbstractSet[str]:
+        return self._index.by_scope(scope)
+
+    def importers_of(self, path: str) -> AbstractSet[str]:
+        """Reverse edges: paths of nodes whose imports contain `path`."""
+        return self._index.importers_of(path)
+
+    def nodes_of_type(self, component_type: ComponentType) -> set[str]:
+        return self._index.by_component_type(component_type)
+
+    def nodes_matching_passport(self, predicate: Callable[[ComponentPassport], bool]) -> set[str]:
+        """Classified nodes whose passport satisfies `predicate` (evaluated once per passport)."""
+        return self._index.by_passport(predicate)
+
+    def nodes_under(self, directory: Path) -> set[str]:
+        """Nodes whose resolved file path lies under `directory` (string prefix)."""
+        return self._index.under_directory(str(directory.resolve()))
+
+    def count_by_status(self, status: NodeStatus) -> int:
+        return self._index.status_count(status)
+
     @property
     def total_files(self) -> int:
         return len(self.nodes)
 
     @property
     def classified_count(self) -> int:
-        return sum(
-            1
-            for n in self.nodes.values()
-            if n.status in (NodeStatus.CLASSIFIED, NodeStatus.FINALIZED)
+        return self.count_by_status(NodeStatus.CLASSIFIED) + self.count_by_status(
+            NodeStatus.FINALIZED
         )
 
     @property
@@ -47,6 +47,13 @@ class ScannerConfig:
     # Default: 500 KB
     max_file_size_bytes: int = 500 * 1024
 
+    # Number of I/O threads reading files ahead of the parser.
+    # 0 keeps the strictly sequential read -> parse loop.
+    read_workers: int = 0
+
+    # Max number of files read ahead per worker (bounds memory via backpressure).
+    read_ahead_per_worker: int = 8
+
     # Extensions to strictly ignore in '--all' mode (Media, Binary, Archives).
     binary_extensions: frozenset[str] = field(
         default_factory=lambda: frozenset(
@@ -109,6 +116,9 @@ class ProjectConfig:
     project_root: Path | None = None
     config_file_path: Path | None = None
 
+    # Directory (relative to project_root) for tool-generated caches
+    cache_dir: str = ".dddguard"
+
     @property
     def absolute_source_path(self) -> Path | None:
         """
@@ -123,6 +133,38 @@ class ProjectConfig:
             return src
         return (self.project_root / src).resolve()
 
+    @property
+    def absolute_cache_path(self) -> Path | None:
+        """
+        Location of tool-generated caches (inventory, snapshots).
+        None when the project root is unknown.
+        """
+        if not self.project_root:
+            return None
+
+        cache = Path(self.cache_dir)
+        if cache.is_absolute():
+            return cache
+        return self.project_root / cache
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class LinterConfig:
+    """
+    Configuration specific to rule checking.
+    """
+
+    # Worker processes checking shards of the graph in parallel.
+    # 0 keeps the single-process loop.
+    workers: int = 0
+
+    # Graphs with fewer modules are checked in-process even with `workers > 0`:
+    # starting workers and shipping the projection costs more than it saves.
+    parallel_min_modules: int = 5000
+
+    # Persist per-module results in the cache dir; only changed modules are re-checked.
+    cache: bool = True
+
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class ConfigVo:
@@ -132,3 +174,4 @@ class ConfigVo:
 
     project: ProjectConfig = field(default_factory=ProjectConfig)
     scanner: ScannerConfig = field(default_factory=ScannerConfig)
+    linter: LinterConfig = field(default_factory=LinterConfig)
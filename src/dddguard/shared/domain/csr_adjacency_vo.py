@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import hashlib
+from array import array
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from functools import cache
+
+from .code_graph_ent import CodeGraph
+
+
+# Optional accelerator: frontier expansion is vectorized when NumPy is importable.
+# Probed on the first `reach()`, never at import, so CLI startup does not load NumPy.
+@cache
+def _numpy_available() -> bool:
+    try:
+        import numpy  # noqa: F401
+    except ImportError:  # pragma: no cover - depends on the environment
+        return False
+    return True
+
+
+def _readonly(values: array) -> memoryview:
+    return memoryview(values).toreadonly()
+
+
+def _compress(edge_lists: list[list[int]]) -> tuple[memoryview, memoryview]:
+    """Packs per-node neighbour lists into (offsets, targets) arrays."""
+    offsets = array("q", [0])
+    targets = array("i")
+    for neighbours in edge_lists:
+        neighbours.sort()
+        targets.extend(neighbours)
+        offsets.append(len(targets))
+    return _readonly(offsets), _readonly(targets)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CsrAdjacency:
+    """
+    Immutable, array-backed snapshot of the import graph (Compressed Sparse Row).
+
+    Node ids are dense ints (0..N-1) assigned in sorted path order; the
+    neighbours of node `i` are `targets[offsets[i]:offsets[i + 1]]`.
+    Forward (imports) and reverse (importers) edges are both materialized,
+    so upstream walks cost the same as downstream ones.
+
+    Import targets that are not nodes of the graph (dangling edges) still get
+    an id without outgoing edges, so traversals match the dict-based walk.
+
+    Built once from a linked graph via `from_graph`; later graph mutations
+    are not reflected.
+    """
+
+    paths: tuple[str, ...]
+    ids: Mapping[str, int]
+    offsets: memoryview
+    targets: memoryview
+    reverse_offsets: memoryview
+    reverse_targets: memoryview
+
+    @classmethod
+    def from_graph(cls, graph: CodeGraph) -> CsrAdjacency:
+        """Builds the snapshot from any graph exposing `nodes[path].imports`."""
+        # One pass over the nodes: lazy (database-backed) views stream them
+        return cls.from_adjacency({path: node.imports for path, node in graph.nodes.items()})
+
+    @classmethod
+    def from_adjacency(cls, adjacency: Mapping[str, Iterable[str]]) -> CsrAdjacency:
+        """Builds the snapshot from a plain `source -> targets` mapping (e.g. a quotient graph)."""
+        node_paths = sorted(adjacency)
+        dangling = sorted(
+            {target for targets in adjacency.values() for target in targets}.difference(adjacency)
+        )
+        paths = (*node_paths, *dangling)
+        ids = {path: i for i, path in enumerate(paths)}
+
+        forward: list[list[int]] = [[] for _ in paths]
+        reverse: list[list[int]] = [[] for _ in paths]
+        for path in node_paths:
+            source_id = ids[path]
+            for target in adjacency[path]:
+                target_id = ids[target]
+                forward[source_id].append(target_id)
+                reverse[target_id].append(source_id)
+
+        offsets, targets = _compress(forward)
+        reverse_offsets, reverse_targets = _compress(reverse)
+        return cls(
+            paths=paths,
+            ids=ids,
+            offsets=offsets,
+            targets=targets,
+            reverse_offsets=reverse_offsets,
+            reverse_targets=reverse_targets,
+        )
+
+    # --- Shape ---
+
+    @property
+    def node_count(self) -> int:
+        return len(self.paths)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    def id_of(self, path: str) -> int | None:
+        return self.ids.get(path)
+
+    def path_of(self, node_id: int) -> str:
+        return self.paths[node_id]
+
+    def imports_of(self, node_id: int) -> memoryview:
+        """Outgoing neighbour ids of `node_id`."""
+        return self.targets[self.offsets[node_id] : self.offsets[node_id + 1]]
+
+    def importers_of(self, node_id: int) -> memoryview:
+        """Incoming neighbour ids of `node_id`."""
+        start, end = self.reverse_offsets[node_id], self.reverse_offsets[node_id + 1]
+        return self.reverse_targets[start:end]
+
+    def fingerprint(self) -> str:
+        """Content digest of the snapshot: equal for graphs with the same nodes and edges."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update("\n".join(self.paths).encode())
+        digest.update(self.offsets)
+        digest.update(self.targets)
+        return digest.hexdigest()
+
+    # --- Bulk Traversal ---
+
+    def reach(self, seeds: Iterable[int], depth: int, *, upstream: bool = False) -> list[int]:
+        """
+        Level-synchronous BFS: ids within `depth` hops of `seeds` (seeds included).
+
+        Each level expands the whole frontier at once; with NumPy the gather,
+        dedup and visited-mask steps run as array operations.
+        """
+        seed_ids = sorted(set(seeds))
+        if upstream:
+            offsets, targets = self.reverse_offsets, self.reverse_targets
+        else:
+            offsets, targets = self.offsets, self.targets
+
+        if _numpy_available():
+            return _reach_numpy(self.node_count, offsets, targets, seed_ids, depth)
+        return _reach_pure(self.node_count, offsets, targets, seed_ids, depth)
+
+    def reach_paths(self, seeds: Iterable[str], depth: int, *, upstream: bool = False) -> set[str]:
+        """Path-level `reach`. Seeds unknown to the snapshot are kept but not expanded."""
+        seed_paths = set(seeds)
+        seed_ids = [self.ids[path] for path in seed_paths if path in self.ids]
+        reached = self.reach(seed_ids, depth, upstream=upstream)
+        return seed_paths.union(self.paths[i] for i in reached)
+
+    def strongly_connected_components(self) -> list[list[int]]:
+        """
+        Tarjan's SCC pass, iterative (explicit call stack): O(N + E), no recursion limit.
+
+        Components are returned in reverse topological order of the condensation:
+        every component only imports components listed before it.
+        """
+        return _tarjan(self.node_count, self.offsets, self.targets)
+
+
+def _tarjan(node_count: int, offsets: memoryview, targets: memoryview) -> list[list[int]]:
+    index = array("i", [-1]) * node_count
+    low = array("i", [0]) * node_count
+    on_stack = bytearray(node_count)
+    stack: list[int] = []
+    components: list[list[int]] = []
+    counter = 0
+
+    # Simulated call stack: node and the position of its next unexplored edge
+    call_nodes: list[int] = []
+    call_edges: list[int] = []
+
+    for root in range(node_count):
+        if index[root] != -1:
+            continue
+
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        call_nodes.append(root)
+        call_edges.append(offsets[root])
+
+        while call_nodes:
+            node = call_nodes[-1]
+            edge = call_edges[-1]
+
+            if edge < offsets[node + 1]:
+                call_edges[-1] = edge + 1
+                target = targets[edge]
+                if index[target] == -1:
+                    # "Recurse" into the unvisited neighbour
+                    index[target] = low[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack[target] = 1
+                    call_nodes.append(target)
+                    call_edges.append(offsets[target])
+                elif on_stack[target] and index[target] < low[node]:
+                    low[node] = index[target]
+                continue
+
+            # All edges explored: "return" to the caller
+            call_nodes.pop()
+            call_edges.pop()
+            if call_nodes and low[node] < low[call_nodes[-1]]:
+                low[call_nodes[-1]] = low[node]
+
+            if low[node] == index[node]:
+                component: list[int] = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = 0
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+
+    return components
+
+
+def _reach_pure(
+    node_count: int,
+    offsets: memoryview,
+    targets: memoryview,
+    seeds: list[int],
+    depth: int,
+) -> list[int]:
+    seen = bytearray(node_count)
+    for node_id in seeds:
+        seen[node_id] = 1
+
+    frontier = seeds
+    for _ in range(depth):
+        next_frontier: list[int] = []
+        for node_id in frontier:
+            for target_id in targets[offsets[node_id] : offsets[node_id + 1]]:
+                if not seen[target_id]:
+                    seen[target_id] = 1
+                    next_frontier.append(target_id)
+        if not next_frontier:
+            break
+        frontier = next_frontier
+
+    return [node_id for node_id in range(node_count) if seen[node_id]]
+
+
+def _reach_numpy(
+    node_count: int,
+    offsets: memoryview,
+    targets: memoryview,
+    seeds: list[int],
+    depth: int,
+) -> list[int]:
+    import numpy as np
+
+    offsets_np = np.frombuffer(offsets, dtype=np.int64)
+    targets_np = np.frombuffer(targets, dtype=np.int32)
+
+    seen = np.zeros(node_count, dtype=bool)
+    frontier = np.asarray(seeds, dtype=np.int64)
+    seen[frontier] = True
+
+    for _ in range(depth):
+        starts = offsets_np[frontier]
+        lengths = offsets_np[frontier + 1] - starts
+        total = int(lengths.sum())
+        if total == 0:
+            break
+
+        # Flat gather of every frontier row: start of row + position inside it
+        row_base = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        candidates = np.unique(targets_np[row_base + np.arange(total)])
+        candidates = candidates[~seen[candidates]]
+        if candidates.size == 0:
+            break
+
+        seen[candidates] = True
+        frontier = candidates.astype(np.int64)
+
+    reached: list[int] = np.flatnonzero(seen).tolist()
+    return reached
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from itertools import pairwise
+
+from .code_graph_ent import CodeGraph
+from .csr_adjacency_vo import CsrAdjacency
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ImportCycleVo:
+    """
+    One import cycle: a strongly connected component of the import graph
+    (modules, or contexts on the context-level quotient graph).
+
+    `members` are all nodes that reach each other (sorted): the cycle only
+    disappears once an edge between two of them is removed. `cycle` is a
+    representative shortest closed chain through the first member
+    (`a -> b -> a`).
+    """
+
+    members: tuple[str, ...]
+    cycle: tuple[str, ...]
+    # Context level only: the module import (source, target) behind each hop of `cycle`
+    witnesses: tuple[tuple[str, str], ...] = ()
+
+    @property
+    def size(self) -> int:
+        return len(self.members)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ImportCycleReportVo:
+    """
+    Import cycles of a graph at module and at context level, largest first.
+
+    Built by `from_graph` in O(N + E): one iterative SCC pass per level plus a
+    BFS confined to each component for its representative cycle.
+    """
+
+    module_cycles: tuple[ImportCycleVo, ...]
+    context_cycles: tuple[ImportCycleVo, ...]
+
+    @property
+    def has_cycles(self) -> bool:
+        return bool(self.module_cycles or self.context_cycles)
+
+    @classmethod
+    def from_graph(cls, graph: CodeGraph) -> ImportCycleReportVo:
+        """Accepts any graph exposing `nodes` with `imports` and `passport` (lazy views too)."""
+        module_adjacency: dict[str, Iterable[str]] = {}
+        context_of: dict[str, str] = {}
+        for path, node in graph.nodes.items():
+            module_adjacency[path] = node.imports
+            passport = node.passport
+            if passport is not None and passport.context_name:
+                context_of[path] = passport.context_name
+
+        # Quotient graph: one node per context, an edge wherever an import crosses contexts.
+        # Each context edge keeps its smallest module import as a witness (deterministic).
+        context_adjacency: dict[str, set[str]] = {name: set() for name in context_of.values()}
+        witnesses: dict[tuple[str, str], tuple[str, str]] = {}
+        for source, targets in module_adjacency.items():
+            source_context = context_of.get(source)
+            if source_context is None:
+                continue
+            for target in targets:
+                target_context = context_of.get(target)
+                if target_context is None or target_context == source_context:
+                    continue
+                context_adjacency[source_context].add(target_context)
+                hop = (source_context, target_context)
+                witness = witnesses.get(hop)
+                if witness is None or (source, target) < witness:
+                    witnesses[hop] = (source, target)
+
+        context_cycles = tuple(
+            replace(
+                cycle,
+                witnesses=tuple(witnesses[hop] for hop in pairwise(cycle.cycle)),
+            )
+            for cycle in _cycles(CsrAdjacency.from_adjacency(context_adjacency))
+        )
+        return cls(
+            module_cycles=_cycles(CsrAdjacency.from_adjacency(module_adjacency)),
+            context_cycles=context_cycles,
+        )
+
+
+# --- Helpers ---
+
+
+def _cycles(adjacency: CsrAdjacency) -> tuple[ImportCycleVo, ...]:
+    cycles: list[ImportCycleVo] = []
+    for component in adjacency.strongly_connected_components():
+        # A single node is only "cyclic" through a self-import, which is not a dependency cycle
+        if len(component) < 2:
+            continue
+        # Ids follow sorted path order (dangling targets never form cycles)
+        component.sort()
+        chain = _shortest_cycle(adjacency, component[0], frozenset(component))
+        cycles.append(
+            ImportCycleVo(
+                members=tuple(adjacency.path_of(node_id) for node_id in component),
+                cycle=tuple(adjacency.path_of(node_id) for node_id in chain),
+            )
+        )
+
+    cycles.sort(key=lambda cycle: (-cycle.size, cycle.members))
+    return tuple(cycles)
+
+
+def _shortest_cycle(adjacency: CsrAdjacency, start: int, members: frozenset[int]) -> list[int]:
+    """BFS from `start` confined to its component, closed by the first edge back to it."""
+    parents: dict[int, int] = {start: start}
+    queue: deque[int] = deque([start])
+    while queue:
+        node = queue.popleft()
+        for target in adjacency.imports_of(node):
+            if target == start:
+                chain = [node]
+                while chain[-1] != start:
+                    chain.append(parents[chain[-1]])
+                chain.reverse()
+                chain.append(start)
+                return chain
+            if target in members and target not in parents:
+                parents[target] = node
+                queue.append(target)
+
+    return [start]  # Unreachable for components of two or more nodes
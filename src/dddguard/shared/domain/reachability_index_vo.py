@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import ClassVar
+
+from .code_graph_ent import CodeGraph
+from .csr_adjacency_vo import CsrAdjacency
+
+
+class ReachabilityIndex:
+    """
+    Precomputed transitive closure of the import graph ("does A reach B?").
+
+    Strongly connected components are condensed into a DAG; every component
+    then gets a bitset (a Python int) of the components it reaches, built in
+    reverse topological order so each set is the union of its successors' sets.
+    A node reaches itself only through a cycle (or a self-import).
+
+    - `reaches(a, b)`: O(1) bit test.
+    - `descendants` / `ancestors`: O(words) union plus one pass over the set bits.
+
+    Downstream sets are built eagerly, upstream sets (impact analysis) on first use.
+    `for_graph` caches indexes by graph content fingerprint, so repeated queries
+    over an unchanged graph skip the build.
+    """
+
+    __slots__ = ("_adjacency", "_component_of", "_components", "_cyclic", "_down", "_lock", "_up")
+
+    _CACHE_SIZE: ClassVar[int] = 4
+    _cache: ClassVar[OrderedDict[str, ReachabilityIndex]] = OrderedDict()
+    _cache_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, adjacency: CsrAdjacency) -> None:
+        self._adjacency = adjacency
+        # Reverse topological order: every component only imports components listed before it
+        self._components = adjacency.strongly_connected_components()
+        self._component_of = [0] * adjacency.node_count
+        for component_id, members in enumerate(self._components):
+            for node_id in members:
+                self._component_of[node_id] = component_id
+
+        self._cyclic = [
+            len(members) > 1 or members[0] in adjacency.imports_of(members[0])
+            for members in self._components
+        ]
+        self._down = self._build(upstream=False)
+        self._up: list[int] | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_graph(cls, graph: CodeGraph | CsrAdjacency) -> ReachabilityIndex:
+        """Cached index of `graph` (rebuilt only when its nodes or edges change)."""
+        adjacency = graph if isinstance(graph, CsrAdjacency) else CsrAdjacency.from_graph(graph)
+        fingerprint = adjacency.fingerprint()
+
+        with cls._cache_lock:
+            index = cls._cache.get(fingerprint)
+            if index is not None:
+                cls._cache.move_to_end(fingerprint)
+                return index
+
+        index = cls(adjacency)
+
+        with cls._cache_lock:
+            cls._cache[fingerprint] = index
+            while len(cls._cache) > cls._CACHE_SIZE:
+                cls._cache.popitem(last=False)
+        return index
+
+    # --- Queries ---
+
+    @property
+    def component_count(self) -> int:
+        return len(self._components)
+
+    def reaches(self, source: str, target: str) -> bool:
+        """True if `source` transitively imports `target` (one or more hops)."""
+        ids = self._adjacency.ids
+        if source not in ids or target not in ids:
+            return False
+        source_component = self._component_of[ids[source]]
+        target_component = self._component_of[ids[target]]
+        if source_component == target_component:
+            return self._cyclic[source_component]
+        return bool(self._down[source_component] >> target_component & 1)
+
+    def descendants(self, paths: Iterable[str]) -> set[str]:
+        """Everything transitively imported by any of `paths`."""
+        bits = 0
+        for component_id in self._component_ids(paths):
+            bits |= self._strict(self._down, component_id, upstream=False)
+        return self._expand(bits, upstream=False)
+
+    def ancestors(self, paths: Iterable[str]) -> set[str]:
+        """Everything transitively importing any of `paths` (the impact of changing them)."""
+        up = self._upstream()
+        bits = 0
+        for component_id in self._component_ids(paths):
+            bits |= self._strict(up, component_id, upstream=True)
+        return self._expand(bits, upstream=True)
+
+    # --- Construction ---
+
+    def _build(self, *, upstream: bool) -> list[int]:
+        """
+        One bitset per component. Downstream, component `c` is bit `c`;
+        upstream, bits are mirrored (`count - 1 - c`) so sets stay as narrow as the order allows.
+        """
+        adjacency = self._adjacency
+        component_of = self._component_of
+        count = len(self._components)
+        neighbours_of = adjacency.importers_of if upstream else adjacency.imports_of
+        # Successors of a component are finished before it in this order
+        order = range(count - 1, -1, -1) if upstream else range(count)
+
+        reach = [0] * count
+        for component_id in order:
+            successors = {
+                component_of[neighbour]
+                for node_id in self._components[component_id]
+                for neighbour in neighbours_of(node_id)
+            }
+            successors.discard(component_id)
+
+            # Sets are stored inclusive (own bit always set), see `_strict`.
+            # Nearest successors first: one already covered by another's set adds nothing.
+            bits = 1 << self._bit(component_id, upstream)
+            for successor in sorted(successors, reverse=not upstream):
+                if not bits >> self._bit(successor, upstream) & 1:
+                    bits |= reach[successor]
+            reach[component_id] = bits
+        return reach
+
+    def _upstream(self) -> list[int]:
+        if self._up is None:
+            with self._lock:
+                if self._up is None:
+                    self._up = self._build(upstream=True)
+        return self._up
+
+    def _strict(self, reach: list[int], component_id: int, *, upstream: bool) -> int:
+        """Stored set without the component itself, unless it lies on a cycle."""
+        if self._cyclic[component_id]:
+            return reach[component_id]
+        return reach[component_id] ^ 1 << self._bit(component_id, upstream)
+
+    def _bit(self, component_id: int, upstream: bool) -> int:
+        return len(self._components) - 1 - component_id if upstream else component_id
+
+    def _component_ids(self, paths: Iterable[str]) -> set[int]:
+        ids = self._adjacency.ids
+        return {self._component_of[ids[path]] for path in paths if path in ids}
+
+    def _expand(self, bits: int, *, upstream: bool) -> set[str]:
+        """Member paths of every component set in `bits` (one scan of the binary digits)."""
+        paths = self._adjacency.paths
+        digits = bin(bits)[:1:-1]  # Least significant first
+        result: set[str] = set()
+        position = digits.find("1")
+        while position != -1:
+            component_id = self._bit(position, upstream)
+            result.update(paths[node_id] for node_id in self._components[component_id])
+            position = digits.find("1", position + 1)
+        return result
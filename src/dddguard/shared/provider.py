@@ -1,14 +1,27 @@
 from dishka import Provider, Scope, provide
 
+from .adapters.driven.graph_session_cache import GraphSessionCache
 from .adapters.driven.yaml_config_loader import YamlConfigLoader
 from .domain import ConfigVo
 
 
 class SharedProvider(Provider):
+    """
+    APP scope: stateless or self-invalidating services, built once per process.
+    SESSION scope: the loaded configuration. A config reload opens a new session,
+    so only config-dependent components are rebuilt.
+    """
+
     scope = Scope.APP
 
     loader = provide(YamlConfigLoader)
 
-    @provide
+    @provide(scope=Scope.SESSION)
     def provide_config(self, loader: YamlConfigLoader) -> ConfigVo:
         return loader.load()
+
+    @provide
+    def provide_graph_cache(self) -> GraphSessionCache:
+        # One cache per process: keyed by the source tree and scanner config, so it
+        # stays valid across config reloads and is shared by every facade
+        return GraphSessionCache()
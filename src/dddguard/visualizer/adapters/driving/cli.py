@@ -8,7 +8,6 @@ from dddguard.shared.adapters.driving import (
 )
 
 from ...ports.driving.visualizer_facade import VisualizerFacade
-from .visualizer_wizard import VisualizerSettingsWizard
 
 
 def register_commands(app: typer.Typer, facade: VisualizerFacade, config):
@@ -18,9 +17,15 @@ def register_commands(app: typer.Typer, facade: VisualizerFacade, config):
         run_viz_directory_flow(facade, config)
 
     @app.command(name="draw")
-    def draw():
+    def draw(
+        from_snapshot: Path | None = typer.Option(
+            None,
+            "--from-snapshot",
+            help="Draw a graph saved by 'dddguard snapshot' instead of rescanning.",
+        ),
+    ):
         """🎨 Visualize project architecture."""
-        run_viz_project_flow(facade, config)
+        run_viz_project_flow(facade, config, snapshot_path=from_snapshot)
 
 
 # --- PUBLIC FLOWS ---
@@ -35,20 +40,23 @@ def run_viz_directory_flow(facade: VisualizerFacade, config):
     _run_viz_logic(facade, target, config)
 
 
-def run_viz_project_flow(facade: VisualizerFacade, config):
+def run_viz_project_flow(facade: VisualizerFacade, config, snapshot_path: Path | None = None):
     tui.set_theme(VISUALIZER_THEME)
     if config.project.config_file_path is None:
         tui.warning("Configuration Missing", "Using default source root.")
     target = config.project.absolute_source_path
 
-    _run_viz_logic(facade, target, config)
+    _run_viz_logic(facade, target, config, snapshot_path)
 
 
-def _run_viz_logic(facade: VisualizerFacade, path: Path, config):
+def _run_viz_logic(facade: VisualizerFacade, path: Path, config, snapshot_path: Path | None = None):
     """
     Executes the visualization workflow and renders a styled report.
     Loops to allow re-configuration after generation.
     """
+    # Interactive-only: imported on use so the prompt stack loads with the wizard
+    from .visualizer_wizard import VisualizerSettingsWizard
+
     # 1. Init Wizard (Stateful - keeps settings between runs)
     wizard = VisualizerSettingsWizard(config)
 
@@ -62,7 +70,7 @@ def _run_viz_logic(facade: VisualizerFacade, path: Path, config):
         # 3. Execution with Spinner
         with tui.spinner("Generating Diagram...", spinner_type="earth"):
             # Pass the DTO to the facade (Port)
-            facade.draw_architecture(path, dto)
+            facade.draw_architecture(path, dto, snapshot_path=snapshot_path)
 
         # 4. Render Beautiful Success Panel
         # We pass the clickable link as a value
@@ -21,4 +21,6 @@ class IScannerGateway(Protocol):
     Uses Shared Kernel's CodeGraph directly.
     """
 
-    def get_dependency_graph(self, root_path: Path) -> CodeGraph: ...
+    def get_dependency_graph(
+        self, root_path: Path, snapshot_path: Path | None = None
+    ) -> CodeGraph: ...
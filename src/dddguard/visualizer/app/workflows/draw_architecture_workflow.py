@@ -19,10 +19,17 @@ class DrawArchitectureWorkflow:
     calculate_layout: CalculateLayoutUseCase
     render_diagram: RenderDiagramUseCase
 
-    def execute(self, root_path: Path, option: VisualizationConfig) -> None:
-        # 1. Scan Project
+    def execute(
+        self,
+        root_path: Path,
+        option: VisualizationConfig,
+        snapshot_path: Path | None = None,
+    ) -> None:
+        # 1. Scan Project (or reuse a saved snapshot)
         try:
-            graph = self.scanner_gateway.get_dependency_graph(root_path)
+            graph = self.scanner_gateway.get_dependency_graph(
+                root_path, snapshot_path=snapshot_path
+            )
         except Exception as e:
             raise VisualizerAppError(
                 message=f"Workflow failed at Scanning stage: {e}", original_error=e
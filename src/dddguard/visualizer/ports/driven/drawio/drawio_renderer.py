@@ -3,10 +3,7 @@ import uuid
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
 from pathlib import Path
-from xml.dom import minidom
 
-from dddguard.shared.assets.asset_legend import get_architecture_legend
-from dddguard.shared.assets.naming_cloud import get_naming_cloud_html
 from dddguard.shared.helpers.generics import GenericDrivenAdapterError
 
 from ....app import IDiagramRenderer
@@ -154,7 +151,9 @@ class DrawioRenderer(IDiagramRenderer):
             # 5. Render Edges (Refactored to use Service)
             self._render_edges(ctx, options)
 
-            # 6. Save File
+            # 6. Save File (minidom is only needed here: imported on use)
+            from xml.dom import minidom
+
             xml_str = minidom.parseString(ET.tostring(mxfile)).toprettyxml(indent="  ")
             with output_path.open("w", encoding="utf-8") as f:
                 f.write(xml_str)
@@ -289,6 +288,10 @@ class DrawioRenderer(IDiagramRenderer):
         )
 
     def _render_sidebar(self, root, towers: list[ContextTower]) -> None:
+        # HTML asset modules are large string tables: loaded on first render, not at start-up
+        from dddguard.shared.assets.asset_legend import get_architecture_legend
+        from dddguard.shared.assets.naming_cloud import get_naming_cloud_html
+
         context_names = [t.name for t in towers]
         legend_html = get_architecture_legend(context_names)
         self._add_text_block(root, "legend", legend_html, 0, 0, README_WIDTH, 24.0)
@@ -19,10 +19,11 @@ class ScannerAcl(IScannerGateway):
 
     _scanner_facade: ScannerFacade
 
-    def get_dependency_graph(self, root_path: Path) -> CodeGraph:
+    def get_dependency_graph(self, root_path: Path, snapshot_path: Path | None = None) -> CodeGraph:
         return self._scanner_facade.scan_project(
             target_path=root_path,
             scan_all=False,
             import_depth=0,
             include_assets=True,
+            snapshot_path=snapshot_path,
         )
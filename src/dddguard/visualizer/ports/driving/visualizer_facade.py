@@ -33,7 +33,12 @@ class VisualizerFacade:
     workflow: DrawArchitectureWorkflow
     config: ConfigVo
 
-    def draw_architecture(self, path: Path | None, dto: DrawOptionsDto) -> None:
+    def draw_architecture(
+        self,
+        path: Path | None,
+        dto: DrawOptionsDto,
+        snapshot_path: Path | None = None,
+    ) -> None:
         target_path = path if path else self.config.project.absolute_source_path
 
         if not target_path:
@@ -48,4 +53,4 @@ class VisualizerFacade:
             output_file=dto.output_file,
         )
 
-        self.workflow.execute(target_path, domain_options)
+        self.workflow.execute(target_path, domain_options, snapshot_path=snapshot_path)
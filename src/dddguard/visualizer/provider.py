@@ -5,7 +5,6 @@ from dishka import Provider, Scope, provide
 
 from dddguard.shared.domain import ConfigVo
 
-from .adapters.driving import cli as driving_adapter
 from .app import (
     CalculateLayoutUseCase,
     DrawArchitectureWorkflow,
@@ -31,8 +30,11 @@ class VisualizerContainer:
 
     def register_commands(self, app: typer.Typer) -> None:
         """
-        Delegates command registration to the driving adapter logic.
+        Delegates command registration to the driving adapter logic
+        (imported here, so it loads only for commands of this context).
         """
+        from .adapters.driving import cli as driving_adapter
+
         driving_adapter.register_commands(app, self.facade, self.config)
 
 
@@ -58,16 +60,17 @@ class VisualizerProvider(Provider):
 
     # --- 1. Adapters Layer (Driven) ---
     renderer = provide(DrawioRenderer, provides=IDiagramRenderer)
-    scanner_gateway = provide(ScannerAcl, provides=IScannerGateway)
+    # (Session scope: wraps the config-bound ScannerFacade)
+    scanner_gateway = provide(ScannerAcl, provides=IScannerGateway, scope=Scope.SESSION)
 
     # --- 2. App Layer (Use Cases & Workflow) ---
     # CalculateLayoutUseCase now automatically gets StyleConfig and OptimizationConfig injected
     calculate_layout_uc = provide(CalculateLayoutUseCase)
     render_diagram_uc = provide(RenderDiagramUseCase)
-    draw_arch_workflow = provide(DrawArchitectureWorkflow)
+    draw_arch_workflow = provide(DrawArchitectureWorkflow, scope=Scope.SESSION)
 
     # --- 3. Ports Layer (Driving) ---
-    facade = provide(VisualizerFacade)
+    facade = provide(VisualizerFacade, scope=Scope.SESSION)
 
     # --- 4. Context Root --
-    container = provide(VisualizerContainer)
+    container = provide(VisualizerContainer, scope=Scope.SESSION)
@@ -0,0 +1,55 @@
+"""
+Flow tests for LinterFacade input validation.
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from dddguard.linter.domain import LinterReport
+from dddguard.linter.ports.driving.facade import LinterFacade, LinterPortError
+from dddguard.shared.domain import ConfigVo, ProjectConfig
+
+
+@pytest.fixture
+def source_dir(tmp_path) -> Path:
+    d = tmp_path / "src"
+    (d / "billing").mkdir(parents=True)
+    return d
+
+
+@pytest.fixture
+def use_case() -> MagicMock:
+    uc = MagicMock()
+    uc.execute.return_value = LinterReport(total_files_scanned=0)
+    return uc
+
+
+@pytest.fixture
+def facade(source_dir, use_case) -> LinterFacade:
+    return LinterFacade(
+        use_case=use_case,
+        files_use_case=MagicMock(),
+        config=ConfigVo(project=ProjectConfig(source_dir="src", project_root=source_dir.parent)),
+    )
+
+
+class TestFocusPath:
+    def test_focus_inside_the_root_is_resolved(self, facade, use_case, source_dir):
+        facade.lint_project(source_dir, focus_path=source_dir / "billing" / "..")
+
+        assert use_case.execute.call_args.kwargs["focus_path"] == source_dir.resolve()
+
+    def test_focus_outside_the_root_is_rejected(self, facade, use_case, source_dir):
+        with pytest.raises(LinterPortError, match="outside the lint root") as exc_info:
+            facade.lint_project(source_dir / "billing", focus_path=source_dir)
+
+        assert str((source_dir / "billing").resolve()) in str(exc_info.value)
+        use_case.execute.assert_not_called()
+
+    def test_streamed_lint_checks_the_focus_too(self, facade, use_case, source_dir, tmp_path):
+        with pytest.raises(LinterPortError, match="outside the lint root"):
+            facade.lint_project_stream(lambda _: None, source_dir, focus_path=tmp_path)
+
+        use_case.stream.assert_not_called()
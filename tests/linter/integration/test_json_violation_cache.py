@@ -0,0 +1,52 @@
+"""
+Integration tests for JsonViolationCache — lint results persisted in the cache dir.
+"""
+
+from pathlib import Path
+
+from dddguard.linter.domain import NodeLintResultVo, ViolationEvent
+from dddguard.linter.ports.driven.json_violation_cache import JsonViolationCache
+from dddguard.shared.domain import ConfigVo, ProjectConfig
+
+VIOLATION = ViolationEvent(
+    rule_name="Domain Purity",
+    severity="error",
+    message="Layer 'DOMAIN/NONE' cannot import 'APP/NONE' within the same context.",
+    source_module="ctx.domain.order",
+    source_layer="DOMAIN/NONE",
+    source_context="ctx",
+    target_module="ctx.app.uc",
+    target_layer="APP/NONE",
+    target_context="ctx",
+)
+
+
+def test_round_trip(tmp_path: Path):
+    cache = JsonViolationCache(config=ConfigVo(project=ProjectConfig(project_root=tmp_path)))
+    results = {
+        "ctx.domain.order": NodeLintResultVo(key="a1", violations=(VIOLATION,)),
+        "ctx.app.uc": NodeLintResultVo(key="b2"),
+    }
+
+    cache.save(tmp_path / "src", results)
+
+    assert cache.load(tmp_path / "src") == results
+    assert cache.load(tmp_path / "other") == {}
+    assert (tmp_path / ".dddguard" / ".gitignore").exists()
+
+
+def test_inert_without_project_root(tmp_path: Path):
+    cache = JsonViolationCache(config=ConfigVo())
+
+    cache.save(tmp_path, {"m": NodeLintResultVo(key="k")})
+
+    assert cache.load(tmp_path) == {}
+
+
+def test_unreadable_file_counts_as_empty(tmp_path: Path):
+    cache = JsonViolationCache(config=ConfigVo(project=ProjectConfig(project_root=tmp_path)))
+    cache.save(tmp_path, {"m": NodeLintResultVo(key="k")})
+    for file in (tmp_path / ".dddguard").glob("lint-*.json"):
+        file.write_text("{not json", encoding="utf-8")
+
+    assert cache.load(tmp_path) == {}
@@ -0,0 +1,48 @@
+"""
+Integration tests for ProcessPoolRuleChecker — rule checking on worker processes.
+"""
+
+from dddguard.linter.domain import RULE_GROUPS, LintProjection
+from dddguard.linter.ports.driven.process_pool_rule_checker import ProcessPoolRuleChecker
+from dddguard.shared.domain import LayerEnum
+from tests.linter.conftest import make_graph, make_node, make_passport
+
+DOMAIN = make_passport(layer=LayerEnum.DOMAIN)
+APP = make_passport(layer=LayerEnum.APP)
+
+
+def test_workers_report_what_a_single_process_reports(rule_engine):
+    # Every domain module imports two app modules (one violation per edge)
+    nodes = []
+    for i in range(40):
+        nodes.append(
+            make_node(
+                f"ctx.domain.m{i:02}",
+                passport=DOMAIN,
+                imports=frozenset({f"ctx.app.u{i:02}", f"ctx.app.u{(i + 1) % 40:02}"}),
+            )
+        )
+        nodes.append(make_node(f"ctx.app.u{i:02}", passport=APP))
+    projection = LintProjection.from_graph(make_graph(*nodes))
+
+    violations = list(ProcessPoolRuleChecker(rule_engine=rule_engine).check(projection, workers=2))
+
+    assert violations == rule_engine.check_projection(projection, range(len(projection.modules)))
+    assert len(violations) == 80
+
+
+def test_workers_count_checked_imports_by_rule_group(rule_engine):
+    nodes = [
+        make_node(f"ctx.domain.m{i:02}", passport=DOMAIN, imports=frozenset({f"ctx.app.u{i:02}"}))
+        for i in range(10)
+    ]
+    nodes += [make_node(f"ctx.app.u{i:02}", passport=APP) for i in range(10)]
+    projection = LintProjection.from_graph(make_graph(*nodes))
+    counts = dict.fromkeys(RULE_GROUPS, 0)
+
+    checker = ProcessPoolRuleChecker(rule_engine=rule_engine)
+    violations = list(checker.check(projection, workers=2, group_counts=counts))
+
+    assert len(violations) == 10
+    assert counts["internal"] == 10
+    assert sum(counts.values()) == 10
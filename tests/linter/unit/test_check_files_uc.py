@@ -0,0 +1,63 @@
+"""
+Unit tests for CheckFilesUseCase — linting only the changed files of a commit.
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from dddguard.linter.app import ChangedFilesGraph, CheckFilesUseCase
+from dddguard.shared.domain import LayerEnum
+from tests.linter.conftest import make_graph, make_node, make_passport
+
+DOMAIN = make_passport(context_name="billing", layer=LayerEnum.DOMAIN)
+APP = make_passport(context_name="billing", layer=LayerEnum.APP)
+
+
+def check(rule_engine, changes: ChangedFilesGraph):
+    gateway = MagicMock()
+    gateway.get_changed_files.return_value = changes
+    use_case = CheckFilesUseCase(scanner_gateway=gateway, rule_engine=rule_engine)
+    return use_case.execute([Path("changed.py")])
+
+
+class TestCheckFilesUseCase:
+    def test_checks_outgoing_edges_of_changed_files(self, rule_engine):
+        graph = make_graph(
+            make_node(
+                "billing.domain.order", passport=DOMAIN, imports=frozenset({"billing.app.uc"})
+            ),
+            make_node("billing.app.uc", passport=APP),
+        )
+
+        report = check(
+            rule_engine,
+            ChangedFilesGraph(graph=graph, changed=("billing.domain.order",), reclassified=()),
+        )
+
+        assert report.total_files_scanned == 1
+        assert [(v.rule_name, v.source_module) for v in report.violations] == [
+            ("Domain Purity", "billing.domain.order")
+        ]
+
+    def test_checks_only_edges_into_reclassified_files_from_importers(self, rule_engine):
+        # The importer also violates a rule towards an unchanged target: not reported
+        graph = make_graph(
+            make_node(
+                "billing.domain.entity",
+                passport=DOMAIN,
+                imports=frozenset({"billing.app.moved", "billing.app.old"}),
+            ),
+            make_node("billing.app.moved", passport=APP),
+            make_node("billing.app.old", passport=APP),
+        )
+
+        report = check(
+            rule_engine,
+            ChangedFilesGraph(
+                graph=graph, changed=("billing.app.moved",), reclassified=("billing.app.moved",)
+            ),
+        )
+
+        assert [(v.source_module, v.target_module) for v in report.violations] == [
+            ("billing.domain.entity", "billing.app.moved")
+        ]
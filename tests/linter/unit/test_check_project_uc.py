@@ -0,0 +1,232 @@
+"""
+Unit tests for CheckProjectUseCase — incremental linting with the lint cache.
+"""
+
+from collections.abc import Mapping
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from dddguard.linter.app import CheckProjectUseCase
+from dddguard.linter.domain import CycleRuleService, NodeLintResultVo
+from dddguard.shared.domain import LayerEnum, LinterConfig
+from tests.linter.conftest import make_graph, make_node, make_passport
+
+DOMAIN = make_passport(layer=LayerEnum.DOMAIN)
+APP = make_passport(layer=LayerEnum.APP)
+ROOT = Path("/project/src")
+
+
+class InMemoryViolationCache:
+    def __init__(self) -> None:
+        self.stored: dict[Path, dict[str, NodeLintResultVo]] = {}
+        self.saves = 0
+
+    def load(self, root_path: Path) -> Mapping[str, NodeLintResultVo]:
+        return self.stored.get(root_path, {})
+
+    def save(self, root_path: Path, results: Mapping[str, NodeLintResultVo]) -> None:
+        self.stored[root_path] = dict(results)
+        self.saves += 1
+
+
+def layered_graph(uc_passport=APP):
+    return make_graph(
+        make_node("ctx.domain.order", passport=DOMAIN, imports=frozenset({"ctx.app.uc"})),
+        make_node("ctx.domain.item", passport=DOMAIN),
+        make_node("ctx.app.uc", passport=uc_passport, imports=frozenset({"ctx.domain.item"})),
+    )
+
+
+@pytest.fixture
+def cache() -> InMemoryViolationCache:
+    return InMemoryViolationCache()
+
+
+@pytest.fixture
+def gateway() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def use_case(gateway, cache, rule_engine) -> CheckProjectUseCase:
+    return CheckProjectUseCase(
+        scanner_gateway=gateway,
+        rule_engine=rule_engine,
+        cycle_rule=CycleRuleService(),
+        parallel_checker=MagicMock(),
+        violation_cache=cache,
+    )
+
+
+def lint(use_case, gateway, graph, config=LinterConfig()):
+    gateway.get_project_graph.return_value = graph
+    return use_case.execute(ROOT, linter_config=config)
+
+
+class TestIncrementalLint:
+    def test_unchanged_graph_reuses_every_result(self, use_case, gateway, cache):
+        cold = lint(use_case, gateway, layered_graph())
+        warm = lint(use_case, gateway, layered_graph())
+
+        assert (cold.cache_hits, cold.cache_misses) == (0, 3)
+        assert (warm.cache_hits, warm.cache_misses) == (3, 0)
+        assert warm.violations == cold.violations
+        assert [(v.source_module, v.target_module) for v in warm.violations] == [
+            ("ctx.domain.order", "ctx.app.uc")
+        ]
+        # Nothing changed: the stored results are not rewritten
+        assert cache.saves == 1
+
+    def test_reclassified_target_rechecks_its_importers(self, use_case, gateway):
+        lint(use_case, gateway, layered_graph())
+
+        # ctx.app.uc becomes a domain module: importing it is no longer a violation
+        report = lint(use_case, gateway, layered_graph(uc_passport=DOMAIN))
+
+        assert (report.cache_hits, report.cache_misses) == (1, 2)
+        assert report.violations == ()
+
+    def test_cache_disabled(self, use_case, gateway, cache):
+        report = lint(use_case, gateway, layered_graph(), LinterConfig(cache=False))
+
+        assert (report.cache_hits, report.cache_misses) == (0, 0)
+        assert len(report.violations) == 1
+        assert cache.saves == 0
+
+
+class TestCheckKey:
+    def test_is_none_for_unclassified_nodes(self, rule_engine):
+        node = make_node("ctx.domain.order")
+        node.passport = None
+
+        assert rule_engine.check_key(node, make_graph(node)) is None
+
+    def test_ignores_import_order_and_unknown_targets(self, rule_engine):
+        graph = layered_graph()
+        node = graph.nodes["ctx.domain.order"]
+        key = rule_engine.check_key(node, graph)
+
+        node.imports = {"requests", "ctx.app.uc"}
+
+        assert rule_engine.check_key(node, graph) == key
+
+    def test_changes_with_the_import_set(self, rule_engine):
+        graph = layered_graph()
+        node = graph.nodes["ctx.domain.order"]
+        key = rule_engine.check_key(node, graph)
+
+        node.imports = {"ctx.app.uc", "ctx.domain.item"}
+
+        assert rule_engine.check_key(node, graph) != key
+
+
+class TestStream:
+    def test_emits_in_graph_order_and_counts(self, use_case, gateway):
+        gateway.get_project_graph.return_value = layered_graph()
+        emitted = []
+
+        summary = use_case.stream(ROOT, emitted.append, linter_config=LinterConfig(cache=False))
+
+        assert [(v.source_module, v.target_module) for v in emitted] == [
+            ("ctx.domain.order", "ctx.app.uc")
+        ]
+        assert summary.violation_count == 1
+        assert summary.by_rule == {"Domain Purity": 1}
+        assert summary.by_severity == {"error": 1}
+        assert summary.truncated is False
+
+    def test_locates_violations_by_file_relative_to_the_root(self, use_case, gateway):
+        graph = layered_graph()
+        graph.nodes["ctx.domain.order"].file_path = ROOT / "ctx" / "domain" / "order.py"
+        gateway.get_project_graph.return_value = graph
+
+        located = use_case.execute(ROOT, linter_config=LinterConfig(cache=False)).violations
+        # Outside the root (here: relative test paths), no file is reported
+        gateway.get_project_graph.return_value = layered_graph()
+        unlocated = use_case.execute(ROOT, linter_config=LinterConfig(cache=False)).violations
+
+        assert [v.source_file for v in located] == ["ctx/domain/order.py"]
+        assert [v.source_file for v in unlocated] == [None]
+
+    def test_stops_at_max_violations_without_storing_results(self, use_case, gateway, cache):
+        gateway.get_project_graph.return_value = layered_graph()
+        emitted = []
+
+        summary = use_case.stream(
+            ROOT, emitted.append, linter_config=LinterConfig(), max_violations=0
+        )
+
+        assert emitted == []
+        assert summary.truncated is True
+        # An interrupted run is incomplete: nothing is written to the lint cache
+        assert cache.saves == 0
+
+
+class TestFocus:
+    @staticmethod
+    def focus_graph():
+        nodes = [
+            make_node("ctx.domain.order", passport=DOMAIN, imports=frozenset({"ctx.app.uc"})),
+            make_node("ctx.app.uc", passport=APP),
+            # Outside the focus, with a violation of its own
+            make_node("other.domain.x", passport=DOMAIN, imports=frozenset({"ctx.app.uc"})),
+        ]
+        for node in nodes:
+            node.file_path = ROOT.joinpath(*node.path.split(".")).with_suffix(".py")
+        return make_graph(*nodes)
+
+    def test_checks_only_modules_under_the_focus(self, use_case, gateway, cache):
+        gateway.get_project_graph.return_value = self.focus_graph()
+        focus = ROOT / "ctx"
+
+        report = use_case.execute(ROOT, linter_config=LinterConfig(), focus_path=focus)
+
+        assert gateway.get_project_graph.call_args.kwargs["focus_path"] == focus
+        assert [v.source_module for v in report.violations] == ["ctx.domain.order"]
+        assert report.total_files_scanned == 2
+        # Results are stored per focus: a full lint keeps its own cache entry
+        assert set(cache.stored) == {focus}
+        assert set(cache.stored[focus]) == {"ctx.domain.order", "ctx.app.uc"}
+
+
+class TestStats:
+    def test_not_collected_by_default(self, use_case, gateway):
+        assert lint(use_case, gateway, layered_graph()).stats is None
+
+    def test_counts_checked_imports_and_times_both_steps(self, use_case, gateway):
+        gateway.get_project_graph.return_value = layered_graph()
+
+        report = use_case.execute(ROOT, linter_config=LinterConfig(cache=False), collect_stats=True)
+
+        stats = report.stats
+        assert stats.edges_by_group["internal"] == 2
+        assert stats.edges_evaluated == 2
+        assert stats.bypass_hits == 0
+        assert stats.violations_by_rule == {"Domain Purity": 1}
+        assert stats.scan_seconds >= 0
+        assert stats.check_seconds >= 0
+
+    def test_warm_cache_reports_the_same_totals(self, use_case, gateway, cache):
+        def lint_with_stats():
+            gateway.get_project_graph.return_value = layered_graph()
+            return use_case.execute(ROOT, linter_config=LinterConfig(), collect_stats=True)
+
+        cold = lint_with_stats()
+        warm = lint_with_stats()
+
+        assert warm.stats.edges_by_group == cold.stats.edges_by_group
+        assert warm.stats.edges_evaluated == 2
+        assert warm.stats.violations_by_rule == cold.stats.violations_by_rule
+        # Every module is re-checked, and the fresh results are still stored
+        assert warm.cache_hits == 0
+        assert set(cache.stored[ROOT]) == {"ctx.domain.order", "ctx.domain.item", "ctx.app.uc"}
+
+    def test_results_stored_with_stats_are_reused_later(self, use_case, gateway):
+        gateway.get_project_graph.return_value = layered_graph()
+        use_case.execute(ROOT, linter_config=LinterConfig(), collect_stats=True)
+
+        report = lint(use_case, gateway, layered_graph())
+
+        assert report.cache_hits == 3
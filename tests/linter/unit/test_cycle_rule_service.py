@@ -0,0 +1,55 @@
+"""
+Unit tests for CycleRuleService — graph-level "Import Cycle" check.
+"""
+
+from dddguard.linter.domain import CycleRuleService
+from tests.linter.conftest import make_graph, make_node, make_passport
+
+
+def _node(path: str, *imports: str):
+    return make_node(
+        path,
+        passport=make_passport(context_name=path.split(".", 1)[0]),
+        imports=frozenset(imports),
+    )
+
+
+class TestCycleRuleService:
+    def test_module_cycle_is_a_warning(self):
+        graph = make_graph(
+            _node("billing.domain.order", "billing.domain.line"),
+            _node("billing.domain.line", "billing.domain.order"),
+        )
+
+        (violation,) = CycleRuleService().check_graph(graph)
+
+        assert violation.rule_name == "Import Cycle"
+        assert violation.severity == "warning"
+        assert violation.source_module == "billing.domain.line"
+        assert violation.target_module == "billing.domain.order"
+        assert (
+            "billing.domain.line -> billing.domain.order -> billing.domain.line"
+            in violation.message
+        )
+
+    def test_context_cycle_is_an_error_anchored_on_an_import(self):
+        graph = make_graph(
+            _node("billing.app.uc", "shipping.ports.api"),
+            _node("shipping.ports.api", "shipping.app.uc"),
+            _node("shipping.app.uc", "billing.domain.order"),
+            _node("billing.domain.order"),
+        )
+
+        (violation,) = CycleRuleService().check_graph(graph)
+
+        assert violation.severity == "error"
+        assert violation.source_module == "billing.app.uc"
+        assert violation.target_module == "shipping.ports.api"
+        assert violation.source_context == "billing"
+        assert violation.target_context == "shipping"
+        assert "billing -> shipping -> billing" in violation.message
+
+    def test_acyclic_graph_is_clean(self):
+        graph = make_graph(_node("a.app.uc", "a.domain.x"), _node("a.domain.x"))
+
+        assert CycleRuleService().check_graph(graph) == []
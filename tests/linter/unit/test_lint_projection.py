@@ -0,0 +1,66 @@
+"""
+Unit tests for LintProjection — the compact graph view checked by lint workers.
+"""
+
+import pickle
+
+from dddguard.linter.domain import LintProjection
+from dddguard.shared.domain import LayerEnum
+from tests.linter.conftest import make_graph, make_node, make_passport
+
+DOMAIN = make_passport(layer=LayerEnum.DOMAIN)
+APP = make_passport(layer=LayerEnum.APP)
+
+
+def layered_graph():
+    return make_graph(
+        make_node("ctx.domain.a", passport=DOMAIN, imports=frozenset({"ctx.app.b", "ctx.app.c"})),
+        make_node("ctx.app.b", passport=APP, imports=frozenset({"ctx.domain.a", "requests"})),
+        make_node("ctx.app.c", passport=APP),
+        make_node("ctx.domain.d", passport=DOMAIN, imports=frozenset({"ctx.app.c"})),
+    )
+
+
+class TestLintProjection:
+    def test_keeps_only_checkable_edges_in_target_order(self):
+        projection = LintProjection.from_graph(layered_graph())
+
+        assert projection.modules == ("ctx.domain.a", "ctx.app.b", "ctx.app.c", "ctx.domain.d")
+        assert projection.passports == (DOMAIN, APP)
+        assert list(projection.passport_of) == [0, 1, 1, 0]
+        # 'requests' is not a node of the graph
+        assert list(projection.offsets) == [0, 2, 3, 3, 4]
+        assert list(projection.targets) == [1, 2, 0, 2]
+
+    def test_survives_pickling(self):
+        projection = LintProjection.from_graph(layered_graph())
+
+        assert pickle.loads(pickle.dumps(projection)) == projection
+
+    def test_shards_are_contiguous_and_cover_all_modules(self):
+        projection = LintProjection.from_graph(layered_graph())
+
+        for count in (1, 2, 3, 10):
+            shards = projection.shards(count)
+            assert len(shards) <= count
+            assert [i for shard in shards for i in shard] == [0, 1, 2, 3]
+
+    def test_check_projection_matches_check_node(self, rule_engine):
+        graph = layered_graph()
+        projection = LintProjection.from_graph(graph)
+
+        parallel = [
+            v
+            for shard in projection.shards(3)
+            for v in rule_engine.check_projection(projection, shard)
+        ]
+        sequential = [
+            v for node in graph.nodes.values() for v in rule_engine.check_node(node, graph)
+        ]
+
+        assert sorted(parallel, key=repr) == sorted(sequential, key=repr)
+        assert [(v.source_module, v.target_module) for v in parallel] == [
+            ("ctx.domain.a", "ctx.app.b"),
+            ("ctx.domain.a", "ctx.app.c"),
+            ("ctx.domain.d", "ctx.app.c"),
+        ]
@@ -2,6 +2,7 @@
 Unit tests for RuleEngineService — validates all 13 architectural rules.
 """
 
+from dddguard.linter.domain import RULE_GROUPS, LintProjection
 from dddguard.shared.domain import (
     DirectionEnum,
     LayerEnum,
@@ -878,3 +879,108 @@ class TestBypassConditions:
 
         violations = rule_engine.check_node(source, graph)
         assert len(violations) == 0  # Composition bypasses
+
+
+class TestVerdictMemo:
+    """Verdicts are decided once per passport pair and reused for every import."""
+
+    def test_same_passport_pair_reports_each_import(self, rule_engine):
+        domain = make_passport(layer=LayerEnum.DOMAIN, direction=DirectionEnum.NONE)
+        app = make_passport(layer=LayerEnum.APP, direction=DirectionEnum.NONE)
+        first = make_node(
+            "src/ordering/domain/order.py",
+            passport=domain,
+            imports=frozenset({"src/ordering/app/a_uc.py", "src/ordering/app/b_uc.py"}),
+        )
+        second = make_node(
+            "src/ordering/domain/item.py",
+            passport=domain,
+            imports=frozenset({"src/ordering/app/a_uc.py"}),
+        )
+        graph = make_graph(
+            first,
+            second,
+            make_node("src/ordering/app/a_uc.py", passport=app),
+            make_node("src/ordering/app/b_uc.py", passport=app),
+        )
+
+        violations = rule_engine.check_node(first, graph) + rule_engine.check_node(second, graph)
+
+        assert sorted((v.source_module, v.target_module) for v in violations) == [
+            ("src/ordering/domain/item.py", "src/ordering/app/a_uc.py"),
+            ("src/ordering/domain/order.py", "src/ordering/app/a_uc.py"),
+            ("src/ordering/domain/order.py", "src/ordering/app/b_uc.py"),
+        ]
+        assert {
+            (v.rule_name, v.message, v.source_context, v.target_context) for v in violations
+        } == {
+            (
+                "Domain Purity",
+                "Layer 'DOMAIN/NONE' cannot import 'APP/NONE' within the same context.",
+                "test_ctx",
+                "test_ctx",
+            )
+        }
+
+
+class TestGroupCounts:
+    """Checked imports are counted by the rule group that decides them."""
+
+    @staticmethod
+    def mixed_graph():
+        domain = make_passport(layer=LayerEnum.DOMAIN, direction=DirectionEnum.NONE)
+        shared = make_passport(scope=ScopeEnum.SHARED, context_name=None)
+        foreign_app = make_passport(context_name="billing", layer=LayerEnum.APP)
+        source = make_node(
+            "src/ordering/domain/order.py",
+            passport=domain,
+            imports=frozenset(
+                {
+                    "src/ordering/domain/item.py",
+                    "src/shared/domain/money_vo.py",
+                    "src/billing/app/a_uc.py",
+                    "src/billing/app/b_uc.py",
+                    "requests",  # Not in the graph: not checked
+                }
+            ),
+        )
+        return make_graph(
+            source,
+            make_node("src/ordering/domain/item.py", passport=domain),
+            make_node("src/shared/domain/money_vo.py", passport=shared),
+            make_node("src/billing/app/a_uc.py", passport=foreign_app),
+            make_node("src/billing/app/b_uc.py", passport=foreign_app),
+        )
+
+    def test_counts_each_import_by_deciding_group(self, rule_engine):
+        graph = self.mixed_graph()
+        counts = dict.fromkeys(RULE_GROUPS, 0)
+
+        # Twice: the second pass is served by the verdict memo and still counted
+        for _ in range(2):
+            rule_engine.check_node(
+                graph.nodes["src/ordering/domain/order.py"], graph, group_counts=counts
+            )
+
+        assert counts == {
+            "bypass": 2,
+            "scope": 0,
+            "internal": 2,
+            "fractal": 0,
+            "cross_context": 4,
+        }
+
+    def test_projection_counts_match_node_counts(self, rule_engine):
+        graph = self.mixed_graph()
+        projection = LintProjection.from_graph(graph)
+        by_node = dict.fromkeys(RULE_GROUPS, 0)
+        by_projection = dict.fromkeys(RULE_GROUPS, 0)
+
+        for node in graph.nodes.values():
+            rule_engine.check_node(node, graph, group_counts=by_node)
+        rule_engine.find_violating_edges(
+            projection, range(len(projection.modules)), group_counts=by_projection
+        )
+
+        assert by_projection == by_node
+        assert sum(by_node.values()) == 4
@@ -0,0 +1,81 @@
+"""
+Unit tests for violation grouping — the aggregated `lint` report.
+"""
+
+from rich.console import Console
+
+from dddguard.linter.adapters.driving.violation_groups import group_table, group_violations
+from dddguard.linter.ports.driving import ViolationSchema
+
+
+def violation(rule: str, source: str, source_context: str, target_context: str, severity="error"):
+    return ViolationSchema(
+        rule_name=rule,
+        message=f"{rule} message",
+        source=source,
+        target=f"{target_context}.ports.driving.api",
+        severity=severity,
+        source_context=source_context,
+        target_context=target_context,
+    )
+
+
+VIOLATIONS = (
+    violation("Cross-Context Inbound", "billing.app.uc", "billing", "orders"),
+    violation("Domain Purity", "orders.domain.a", "orders", "orders"),
+    violation("Cross-Context Inbound", "billing.app.uc", "billing", "orders"),
+    violation("Cross-Context Inbound", "billing.domain.b", "billing", "shipping"),
+    violation("Import Cycle", "orders.domain.a", "orders", "orders", severity="warning"),
+)
+
+
+class TestGroupViolations:
+    def test_by_rule_largest_first(self):
+        groups = group_violations(VIOLATIONS, "rule")
+
+        assert [(g.key, g.count) for g in groups] == [
+            ("Cross-Context Inbound", 3),
+            ("Domain Purity", 1),
+            ("Import Cycle", 1),
+        ]
+        assert groups[2].by_severity == {"warning": 1}
+
+    def test_by_context_pair(self):
+        groups = group_violations(VIOLATIONS, "contexts")
+
+        assert [(g.key, g.count) for g in groups] == [
+            ("billing -> orders", 2),
+            ("orders -> orders", 2),
+            ("billing -> shipping", 1),
+        ]
+
+    def test_by_source_module_keeps_report_order(self):
+        groups = group_violations(VIOLATIONS, "module")
+
+        assert groups[0].key == "billing.app.uc"
+        assert groups[0].violations == [VIOLATIONS[0], VIOLATIONS[2]]
+        assert groups[1].examples(1) == [VIOLATIONS[1]]
+
+    def test_accepts_a_single_pass_iterator(self):
+        groups = group_violations(iter(VIOLATIONS), "rule")
+
+        assert sum(g.count for g in groups) == len(VIOLATIONS)
+
+    def test_missing_contexts_are_internal(self):
+        schema = ViolationSchema(
+            rule_name="Domain Purity", message="m", source="a", target="b", severity="error"
+        )
+
+        assert group_violations([schema], "contexts")[0].key == "internal -> internal"
+
+
+def test_group_table_shows_top_examples_only():
+    groups = group_violations(VIOLATIONS, "rule")
+    console = Console(width=200, record=True)
+
+    console.print(group_table(groups, "rule", examples=1))
+    text = console.export_text()
+
+    assert "Cross-Context Inbound" in text
+    assert "... and 2 more" in text
+    assert "billing.domain.b" not in text
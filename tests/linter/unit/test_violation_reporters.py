@@ -0,0 +1,117 @@
+"""
+Unit tests for the streamed lint reporters (text, JSON Lines, SARIF).
+"""
+
+import dataclasses
+import io
+import json
+
+import pytest
+
+from dddguard.linter.adapters.driving.violation_reporters import REPORTERS
+from dddguard.linter.ports.driving import LintStatsSchema, LintSummarySchema, ViolationSchema
+
+VIOLATIONS = [
+    ViolationSchema(
+        rule_name="Domain Purity",
+        message=f"Layer 'DOMAIN/NONE' cannot import 'APP/NONE' ({i}).",
+        source=f"ctx.domain.m{i}",
+        target="ctx.app.uc",
+        severity="error",
+        source_context="ctx",
+        target_context="ctx",
+        source_file=f"ctx/domain/m{i}.py",
+    )
+    for i in range(3)
+]
+SUMMARY = LintSummarySchema(
+    total_scanned=10,
+    violation_count=3,
+    by_rule={"Domain Purity": 3},
+    by_severity={"error": 3},
+    truncated=True,
+)
+
+
+def render(output_format: str, violations=VIOLATIONS, summary=SUMMARY) -> str:
+    handle = io.StringIO()
+    reporter = REPORTERS[output_format](handle)
+    reporter.begin()
+    for violation in violations:
+        reporter.emit(violation)
+    reporter.finish(summary)
+    return handle.getvalue()
+
+
+def test_text_lines_and_summary():
+    lines = render("text").splitlines()
+
+    assert lines[0] == (
+        "ctx.domain.m0 -> ctx.app.uc: [Domain Purity] "
+        "Layer 'DOMAIN/NONE' cannot import 'APP/NONE' (0)."
+    )
+    assert lines[-1] == "dddguard: 3 violation(s) in 10 file(s) (stopped at --max-violations)"
+
+
+def test_json_lines_end_with_summary():
+    records = [json.loads(line) for line in render("jsonl").splitlines()]
+
+    assert [r["type"] for r in records] == ["violation"] * 3 + ["summary"]
+    assert records[0]["source"] == "ctx.domain.m0"
+    assert records[-1]["by_rule"] == {"Domain Purity": 3}
+    assert records[-1]["truncated"] is True
+    assert "stats" not in records[-1]
+
+
+def test_stats_close_the_summary():
+    stats = LintStatsSchema(
+        edges_by_group={"bypass": 4, "internal": 6},
+        violations_by_rule={"Domain Purity": 3},
+        scan_seconds=0.5,
+        check_seconds=0.25,
+    )
+    summary = dataclasses.replace(SUMMARY, stats=stats)
+
+    record = json.loads(render("jsonl", summary=summary).splitlines()[-1])
+    text = render("text", summary=summary).splitlines()[-1]
+
+    assert record["stats"] == {
+        "edges_evaluated": 10,
+        "edges_by_group": {"bypass": 4, "internal": 6},
+        "bypass_hits": 4,
+        "violations_by_rule": {"Domain Purity": 3},
+        "scan_seconds": 0.5,
+        "check_seconds": 0.25,
+    }
+    assert text == (
+        "dddguard: 10 import(s) checked (4 bypass, 6 internal); scan 0.500s, check 0.250s"
+    )
+
+
+@pytest.mark.parametrize("violations", [VIOLATIONS, []])
+def test_sarif_is_one_valid_document(violations):
+    log = json.loads(render("sarif", violations))
+
+    assert log["version"] == "2.1.0"
+    (run,) = log["runs"]
+    assert {"id": "domain-purity", "name": "Domain Purity"} in run["tool"]["driver"]["rules"]
+    assert [
+        r["locations"][0]["logicalLocations"][0]["fullyQualifiedName"] for r in run["results"]
+    ] == [v.source for v in violations]
+    assert run["invocations"][0]["properties"]["violations"] == 3
+
+
+def test_sarif_results_point_at_source_files():
+    unlocated = dataclasses.replace(VIOLATIONS[0], source_file=None)
+    (run,) = json.loads(render("sarif", [VIOLATIONS[1], unlocated]))["runs"]
+
+    located, bare = run["results"]
+    assert located["ruleId"] == "domain-purity"
+    assert located["locations"][0]["physicalLocation"] == {
+        "artifactLocation": {"uri": "ctx/domain/m1.py", "uriBaseId": "%SRCROOT%"}
+    }
+    assert "physicalLocation" not in bare["locations"][0]
+    # Every rule id used by a result is declared by the driver
+    assert {r["ruleId"] for r in run["results"]} <= {
+        rule["id"] for rule in run["tool"]["driver"]["rules"]
+    }
@@ -0,0 +1,62 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import dddguard
+
+SRC_DIR = Path(next(iter(dddguard.__path__))).resolve().parent
+
+
+# --- FIXTURES ---
+@pytest.fixture(params=[True, False], ids=["cache", "no-cache"])
+def project(request, tmp_path):
+    source = tmp_path / "src" / "proj"
+    for package in ("", "billing", "billing/app", "orders", "orders/domain"):
+        (source / package).mkdir(parents=True, exist_ok=True)
+        (source / package / "__init__.py").write_text("")
+    (source / "orders" / "domain" / "order_vo.py").write_text("x = 1\n")
+    # App -> another context's domain: one violation
+    (source / "billing" / "app" / "pay_uc.py").write_text(
+        "from proj.orders.domain.order_vo import x\n"
+    )
+    config_dir = tmp_path / "docs" / "dddguard"
+    config_dir.mkdir(parents=True)
+    (config_dir / "config.yaml").write_text(
+        f'project:\n  root_dir: "{tmp_path.as_posix()}/"\n  source_dir: "src/proj"\n'
+        f"linter:\n  cache: {str(request.param).lower()}\n"
+    )
+    return tmp_path
+
+
+def _run(project: Path, *args: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR), "DDDGUARD_NO_DAEMON": "1"}
+    return subprocess.run(
+        [sys.executable, "-m", "dddguard.root.cli", *args],
+        cwd=project,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=False,
+    )
+
+
+# --- TESTS ---
+
+
+def test_lint_from_sqlite_snapshot(project):
+    saved = _run(project, "snapshot", "graph.sqlite")
+    assert saved.returncode == 0, saved.stdout + saved.stderr
+
+    linted = _run(project, "lint", "--from-snapshot", "graph.sqlite", "--format", "jsonl")
+
+    # Exit code 1: violations found (2 would mean the lint itself failed)
+    assert linted.returncode == 1, linted.stdout + linted.stderr
+    records = [json.loads(line) for line in linted.stdout.splitlines()]
+    assert [(r["source"], r["target"]) for r in records if r["type"] == "violation"] == [
+        ("billing.app.pay_uc", "orders.domain.order_vo")
+    ]
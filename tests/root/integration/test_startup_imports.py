@@ -0,0 +1,87 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import dddguard
+
+SRC_DIR = Path(next(iter(dddguard.__path__))).resolve().parent
+
+# Wall-clock ceiling for all imports of a `lint --auto` run. Deliberately loose (shared CI
+# runners are noisy): the module denylist below is the precise regression guard.
+IMPORT_BUDGET_MS = 1500
+
+# Modules a non-interactive lint must never load
+FORBIDDEN_MODULES = (
+    "InquirerPy",
+    "numpy",
+    "prompt_toolkit",
+    "xml.dom.minidom",
+    "socketserver",
+    "dddguard.linter.adapters.driving.lint_wizard",
+    "dddguard.scanner.adapters.driving.console.wizard",
+    "dddguard.scanner.domain.graph_query_service",
+    "dddguard.shared.assets.asset_help",
+    "dddguard.shared.assets.asset_legend",
+    "dddguard.shared.assets.default_config",
+    "dddguard.shared.assets.naming_cloud",
+    "dddguard.visualizer.provider",
+    "dddguard.scaffolder.provider",
+)
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def project(tmp_path):
+    source = tmp_path / "src" / "proj"
+    (source / "billing" / "domain").mkdir(parents=True)
+    (source / "billing" / "app").mkdir()
+    (source / "billing" / "domain" / "order.py").write_text("x = 1\n")
+    (source / "billing" / "app" / "pay_uc.py").write_text(
+        "from proj.billing.domain.order import x\n"
+    )
+    config_dir = tmp_path / "docs" / "dddguard"
+    config_dir.mkdir(parents=True)
+    (config_dir / "config.yaml").write_text(
+        f'project:\n  root_dir: "{tmp_path.as_posix()}/"\n  source_dir: "src/proj"\n'
+    )
+    return tmp_path
+
+
+def _import_times(project: Path, *args: str) -> dict[str, int]:
+    """Runs the CLI under `-X importtime`; returns cumulative microseconds per top-level import."""
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR), "DDDGUARD_NO_DAEMON": "1"}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "dddguard.root.cli", *args],
+        cwd=project,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=False,
+    )
+    assert completed.returncode == 0, completed.stdout + completed.stderr
+
+    times: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.rstrip()] = int(cumulative)
+    return times
+
+
+# --- TESTS ---
+
+
+def test_lint_auto_loads_only_what_it_needs(project):
+    times = _import_times(project, "lint", "--auto")
+    loaded = {name.strip() for name in times}
+
+    assert "dddguard.linter.adapters.driving.cli" in loaded
+    assert sorted(loaded.intersection(FORBIDDEN_MODULES)) == []
+
+    top_level_ms = sum(us for name, us in times.items() if not name.startswith(" ")) / 1000
+    assert top_level_ms < IMPORT_BUDGET_MS
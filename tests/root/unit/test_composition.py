@@ -0,0 +1,55 @@
+import pytest
+from dishka.exceptions import NoFactoryError
+
+from dddguard.linter.provider import LinterContainer
+from dddguard.root.cli import COMMAND_CONTEXTS, requested_context
+from dddguard.root.composition import CONTEXT_PROVIDERS, build_app_container, open_session
+from dddguard.scaffolder.provider import ScaffolderContainer
+from dddguard.scanner.provider import ScannerContainer
+from dddguard.shared.adapters.driven.graph_session_cache import GraphSessionCache
+from dddguard.shared.domain import ConfigVo
+
+
+@pytest.mark.parametrize("context", sorted(CONTEXT_PROVIDERS))
+def test_each_context_wires_on_its_own(context):
+    # make_container validates the graph: a missing provider or a scope leak fails here
+    container = build_app_container([context])
+    container.close()
+
+
+def test_scaffolder_container_skips_scanner():
+    app_container = build_app_container(["scaffolder"])
+
+    with open_session(app_container) as session:
+        assert session.get(ScaffolderContainer).facade is not None
+        with pytest.raises(NoFactoryError):
+            session.get(ScannerContainer)
+
+
+def test_new_session_rebuilds_config_bound_services_only():
+    app_container = build_app_container(["linter"])
+
+    with open_session(app_container) as session:
+        first_facade = session.get(LinterContainer).facade
+        first_config = session.get(ConfigVo)
+        cache = session.get(GraphSessionCache)
+
+    with open_session(app_container) as session:
+        assert session.get(LinterContainer).facade is not first_facade
+        assert session.get(ConfigVo) is not first_config
+        assert session.get(GraphSessionCache) is cache  # APP scope: warm across reloads
+
+
+@pytest.mark.parametrize(
+    ("argv", "expected"),
+    [
+        (["lint", "--auto"], "linter"),
+        (["--help"], None),
+        ([], None),
+        (["nonsense"], None),
+        (["daemon", "start", "-d"], "daemon"),
+    ],
+)
+def test_requested_context(argv, expected):
+    assert requested_context(argv) == expected
+    assert expected is None or expected in COMMAND_CONTEXTS.values()
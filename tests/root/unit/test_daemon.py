@@ -0,0 +1,30 @@
+import socket
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from dddguard.root import daemon
+from dddguard.shared.adapters.driving import daemon as daemon_rpc
+
+pytestmark = pytest.mark.skipif(not daemon_rpc.daemon_supported(), reason="needs AF_UNIX sockets")
+
+
+def test_untrusted_socket_falls_back_to_the_local_facade(monkeypatch):
+    facade = SimpleNamespace(config=SimpleNamespace(project=SimpleNamespace(project_root=None)))
+    monkeypatch.delenv(daemon.NO_DAEMON_ENV, raising=False)
+
+    # AF_UNIX paths are limited to ~100 bytes: keep it short
+    with tempfile.TemporaryDirectory(prefix="dg") as directory:
+        Path(directory).chmod(0o777)  # A shared directory another user could write to
+        socket_path = Path(directory) / "d.sock"
+        monkeypatch.setattr(daemon_rpc, "socket_path_for", lambda _root: socket_path)
+        monkeypatch.setattr(
+            daemon_rpc, "DaemonClient", lambda *_: pytest.fail("Untrusted socket was contacted")
+        )
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as impostor:
+            impostor.bind(str(socket_path))
+            impostor.listen()
+
+            assert daemon.connect_facade(facade, "linter") is facade
@@ -24,7 +24,7 @@ def mock_workflow():
 
 @pytest.fixture
 def facade(mock_workflow) -> ClassificationFacade:
-    return ClassificationFacade(graph_workflow=mock_workflow)
+    return ClassificationFacade(graph_workflow=mock_workflow, boundaries_use_case=MagicMock())
 
 
 # ---------------------------------------------------------------------------
@@ -64,7 +64,7 @@ class TestClassifyGraphWorkflowHappyPath:
         assert mock_identifier.call_count == 3
         for node in graph.nodes.values():
             assert node.status == NodeStatus.CLASSIFIED
-            assert node.passport is passport
+            assert node.passport == passport
 
 
 class TestClassifyGraphWorkflowFallbackPath:
@@ -87,7 +87,7 @@ class TestClassifyGraphWorkflowFallbackPath:
         call_args = mock_identifier.call_args
         expected_path = source_dir / "billing/domain/model.py"
         assert call_args.kwargs["file_path"] == expected_path
-        assert node.passport is passport
+        assert node.passport == passport
 
 
 class TestClassifyGraphWorkflowEmptyGraph:
@@ -121,6 +121,6 @@ class TestClassifyGraphWorkflowMetrics:
 
         # Verify the passports were assigned in order
         nodes = list(graph.nodes.values())
-        assert nodes[0].passport is real_passport
-        assert nodes[1].passport is real_passport
-        assert nodes[2].passport is unknown_passport
+        assert nodes[0].passport == real_passport
+        assert nodes[1].passport == real_passport
+        assert nodes[2].passport == unknown_passport
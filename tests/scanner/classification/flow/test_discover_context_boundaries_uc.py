@@ -0,0 +1,45 @@
+from pathlib import Path
+
+import pytest
+
+from dddguard.scanner.classification.app.discover_context_boundaries_uc import (
+    DiscoverContextBoundariesUseCase,
+)
+
+
+class TestDiscoverContextBoundariesUseCaseFlow:
+    @pytest.fixture
+    def source_dir(self, tmp_path) -> Path:
+        return tmp_path / "src"
+
+    @pytest.fixture
+    def use_case(self):
+        return DiscoverContextBoundariesUseCase()
+
+    def test_deduplicates_contexts_from_paths(self, use_case, source_dir):
+        """
+        Many files of the same context collapse into a single boundary.
+        """
+        paths = [
+            source_dir / "billing" / "domain" / "invoice.py",
+            source_dir / "billing" / "app" / "pay_uc.py",
+            source_dir / "shipping" / "domain" / "parcel.py",
+        ]
+
+        result = use_case(file_paths=paths, source_dir=source_dir)
+
+        names = sorted(b.context_name for b in result)
+        assert names == ["billing", "shipping"]
+
+    def test_skips_paths_outside_source_root(self, use_case, source_dir, tmp_path):
+        paths = [
+            tmp_path / "elsewhere" / "billing" / "domain" / "x.py",
+            source_dir / "billing" / "domain" / "x.py",
+        ]
+
+        result = use_case(file_paths=paths, source_dir=source_dir)
+
+        assert [b.context_name for b in result] == ["billing"]
+
+    def test_empty_input_returns_empty_list(self, use_case, source_dir):
+        assert use_case(file_paths=[], source_dir=source_dir) == []
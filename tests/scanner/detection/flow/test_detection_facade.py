@@ -24,7 +24,12 @@ def mock_scan_uc():
 
 @pytest.fixture
 def facade(mock_scan_uc) -> DetectionFacade:
-    return DetectionFacade(scan_use_case=mock_scan_uc)
+    return DetectionFacade(
+        scan_use_case=mock_scan_uc,
+        list_files_use_case=MagicMock(),
+        scan_files_use_case=MagicMock(),
+        scan_focus_use_case=MagicMock(),
+    )
 
 
 @pytest.fixture
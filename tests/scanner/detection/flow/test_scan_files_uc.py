@@ -0,0 +1,103 @@
+from pathlib import Path
+from unittest.mock import MagicMock, create_autospec
+
+import pytest
+
+from dddguard.scanner.detection.app.interfaces import IProjectReader
+from dddguard.scanner.detection.app.scan_files_uc import ScanFilesUseCase
+from dddguard.scanner.detection.domain import SourceFileVo
+from dddguard.shared.domain import ScannerConfig
+
+ROOT = Path("/root")
+
+# Virtual project: pkg re-exports Service from pkg.service
+FILES = {
+    ROOT / "app/uc.py": "from pkg import Service\nimport utils\nimport requests\n",
+    ROOT / "pkg/__init__.py": "from .service import Service\n",
+    ROOT / "pkg/service.py": "class Service: ...\n",
+    ROOT / "utils.py": "",
+}
+KNOWN_MODULES = {
+    "app.uc": ROOT / "app/uc.py",
+    "pkg": ROOT / "pkg/__init__.py",
+    "pkg.service": ROOT / "pkg/service.py",
+    "utils": ROOT / "utils.py",
+}
+
+
+class TestScanFilesUseCaseFlow:
+    """
+    FLOW Test: Only the listed files are parsed; their imports link against the
+    known modules like a full scan, reading other files only to follow re-exports.
+    """
+
+    @pytest.fixture
+    def mock_reader(self) -> MagicMock:
+        reader = create_autospec(IProjectReader, instance=True)
+        reader.is_project_file.side_effect = lambda _config, _root, path: path.suffix == ".py"
+        reader.read_file.side_effect = lambda path: SourceFileVo(path=path, content=FILES[path])
+        return reader
+
+    @pytest.fixture
+    def use_case(self, mock_reader) -> ScanFilesUseCase:
+        return ScanFilesUseCase(project_reader=mock_reader)
+
+    def test_links_through_re_exports_on_demand(self, use_case, mock_reader):
+        graph = use_case(
+            scanner_config=ScannerConfig(),
+            target_path=ROOT,
+            file_paths=[ROOT / "app/uc.py"],
+            known_modules=KNOWN_MODULES,
+        )
+
+        assert list(graph.nodes) == ["app.uc"]
+        assert graph.nodes["app.uc"].imports == {"pkg.service", "utils"}
+        # Only the re-export chain was parsed besides the changed file (not utils)
+        assert [c.args[0] for c in mock_reader.read_file.call_args_list] == [
+            ROOT / "app/uc.py",
+            ROOT / "pkg/__init__.py",
+            ROOT / "pkg/service.py",
+        ]
+
+    def test_new_module_links_to_other_changed_files(self, use_case):
+        files = [ROOT / "pkg/service.py", ROOT / "pkg/__init__.py"]
+
+        graph = use_case(
+            scanner_config=ScannerConfig(),
+            target_path=ROOT,
+            file_paths=files,
+            known_modules={"utils": ROOT / "utils.py"},
+        )
+
+        assert graph.nodes["pkg"].imports == {"pkg.service"}
+
+    def test_skips_files_a_scan_would_not_ingest(self, use_case, mock_reader):
+        graph = use_case(
+            scanner_config=ScannerConfig(),
+            target_path=ROOT,
+            file_paths=[ROOT / "README.md"],
+            known_modules=KNOWN_MODULES,
+        )
+
+        assert graph.nodes == {}
+        mock_reader.read_file.assert_not_called()
+
+    def test_without_known_modules_reads_only_what_the_files_need(self, use_case, mock_reader):
+        # Unrelated modules exist, but only the imported names are probed
+        mock_reader.is_project_file.side_effect = lambda _config, _root, path: path in FILES
+
+        graph = use_case(
+            scanner_config=ScannerConfig(),
+            target_path=ROOT,
+            file_paths=[ROOT / "app/uc.py"],
+            with_targets=True,
+        )
+
+        assert graph.nodes["app.uc"].imports == {"pkg.service", "utils"}
+        assert graph.nodes["utils"].file_path == ROOT / "utils.py"
+        assert [c.args[0] for c in mock_reader.read_file.call_args_list] == [
+            ROOT / "app/uc.py",
+            ROOT / "pkg/__init__.py",
+            ROOT / "pkg/service.py",
+        ]
+        mock_reader.list_project_files.assert_not_called()
@@ -0,0 +1,83 @@
+from pathlib import Path
+from unittest.mock import MagicMock, create_autospec
+
+import pytest
+
+from dddguard.scanner.detection.app.interfaces import IProjectReader
+from dddguard.scanner.detection.app.scan_files_uc import ScanFilesUseCase
+from dddguard.scanner.detection.app.scan_focus_uc import ScanFocusUseCase
+from dddguard.scanner.detection.domain import SourceFileVo
+from dddguard.shared.domain import NodeStatus, ScannerConfig
+
+ROOT = Path("/root")
+
+# Virtual project: billing imports shared (a re-export) and orders; orders is large
+FILES = {
+    ROOT / "billing/app/uc.py": "from shared import Money\nimport orders.api\nimport requests\n",
+    ROOT / "billing/domain/invoice.py": "from billing.app import uc\n",
+    ROOT / "shared/__init__.py": "from .money import Money\n",
+    ROOT / "shared/money.py": "class Money: ...\n",
+    ROOT / "orders/api.py": "import orders.internal\n",
+    ROOT / "orders/internal.py": "",
+}
+
+
+class TestScanFocusUseCaseFlow:
+    """
+    FLOW Test: Only files under the focus are parsed; modules they import are
+    located by name and added as path-only nodes, parsed only for re-exports.
+    """
+
+    @pytest.fixture
+    def mock_reader(self) -> MagicMock:
+        reader = create_autospec(IProjectReader, instance=True)
+        reader.list_project_files.side_effect = lambda scanner_config, target_path: iter(
+            [path for path in FILES if path.is_relative_to(target_path)]
+        )
+        reader.is_project_file.side_effect = lambda _config, _root, path: path in FILES
+        reader.read_file.side_effect = lambda path: SourceFileVo(path=path, content=FILES[path])
+        return reader
+
+    @pytest.fixture
+    def use_case(self, mock_reader) -> ScanFocusUseCase:
+        return ScanFocusUseCase(
+            project_reader=mock_reader,
+            scan_files_use_case=ScanFilesUseCase(project_reader=mock_reader),
+        )
+
+    def test_parses_the_focus_and_locates_its_targets(self, use_case, mock_reader):
+        graph = use_case(
+            scanner_config=ScannerConfig(), target_path=ROOT, focus_path=ROOT / "billing"
+        )
+
+        assert graph.nodes["billing.app.uc"].imports == {"shared.money", "orders.api"}
+        assert graph.nodes["billing.domain.invoice"].imports == {"billing.app.uc"}
+        # Targets outside the focus: path only, nothing linked
+        outside = graph.nodes["orders.api"]
+        assert outside.file_path == ROOT / "orders/api.py"
+        assert outside.content is None
+        assert outside.imports == set()
+        assert outside.status == NodeStatus.DETECTED
+        # Neither the targets' own imports nor the rest of the project are pulled in
+        assert "orders.internal" not in graph.nodes
+        assert set(graph.nodes) == {
+            "billing.app.uc",
+            "billing.domain.invoice",
+            "shared.money",
+            "orders.api",
+        }
+
+    def test_reads_outside_files_only_for_re_exports(self, use_case, mock_reader):
+        use_case(scanner_config=ScannerConfig(), target_path=ROOT, focus_path=ROOT / "billing")
+
+        read = {c.args[0] for c in mock_reader.read_file.call_args_list}
+        assert read == {
+            ROOT / "billing/app/uc.py",
+            ROOT / "billing/domain/invoice.py",
+            ROOT / "shared/__init__.py",
+            ROOT / "shared/money.py",
+        }
+        # Located by name: the project tree itself was only listed under the focus
+        assert [c.kwargs["target_path"] for c in mock_reader.list_project_files.call_args_list] == [
+            ROOT / "billing"
+        ]
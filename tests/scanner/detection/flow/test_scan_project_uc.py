@@ -7,6 +7,9 @@ import pytest
 from dddguard.scanner.detection.app.interfaces import IProjectReader
 from dddguard.scanner.detection.app.scan_project_uc import ScanProjectUseCase
 from dddguard.scanner.detection.domain import SourceFileVo
+from dddguard.scanner.detection.ports.driven.storage.in_memory_module_cache import (
+    InMemoryModuleCache,
+)
 from dddguard.shared.domain import CodeGraph, NodeStatus, ScannerConfig
 
 
@@ -118,3 +121,33 @@ class TestScanProjectUseCaseFlow:
 
         # 'app.core' normalized to 'core'
         assert "core" in main_node.imports
+
+    def test_rescan_reads_only_changed_files(self, mock_reader: MagicMock):
+        """
+        Scenario: Two scans of the same tree with a module cache; only b.py changed.
+        Goal: a.py is reused from the cache, b.py is re-read and relinked.
+        """
+        scan_root = Path("/app")
+        use_case = ScanProjectUseCase(
+            project_reader=mock_reader, module_cache=InMemoryModuleCache()
+        )
+        a_path, b_path = scan_root / "a.py", scan_root / "b.py"
+
+        mock_reader.read_project.return_value = iter(
+            [
+                SourceFileVo(path=a_path, content="import b", stamp=(1, 8)),
+                SourceFileVo(path=b_path, content="", stamp=(1, 0)),
+            ]
+        )
+        use_case(scanner_config=ScannerConfig(), target_path=scan_root)
+
+        mock_reader.stat_project_files.return_value = iter([(a_path, (1, 8)), (b_path, (2, 8))])
+        mock_reader.read_file.return_value = SourceFileVo(
+            path=b_path, content="import a", stamp=(2, 8)
+        )
+        graph = use_case(scanner_config=ScannerConfig(), target_path=scan_root)
+
+        mock_reader.read_project.assert_called_once()
+        mock_reader.read_file.assert_called_once_with(b_path)
+        assert graph.get_node("a").imports == {"b"}
+        assert graph.get_node("b").imports == {"a"}
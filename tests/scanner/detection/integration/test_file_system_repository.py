@@ -1,3 +1,6 @@
+import threading
+from dataclasses import replace
+
 import pytest
 
 from dddguard.scanner.detection.ports.driven.storage.file_system_repository import (
@@ -190,3 +193,79 @@ def test_get_subdirectories(repo, scanner_config, tmp_path):
     assert "tests" in names
     assert ".git" not in names
     assert "venv" not in names
+
+
+def test_list_project_files_applies_filters_without_reading(repo, scanner_config, tmp_path):
+    """
+    Scenario: Path-only listing (used by fast context discovery).
+    Expectation: Same name/extension filters as read_project, but the size guard
+    is not applied because nothing is opened.
+    """
+    # Arrange
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "small.py").write_text("x = 1")
+    (tmp_path / "pkg" / "huge.py").write_text("x" * 500)  # Over the 100-byte limit
+    (tmp_path / "README.md").write_text("# Docs")
+    (tmp_path / "conftest.py").write_text("ignored")
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "hook.py").write_text("ignored")
+
+    # Act
+    paths = list(
+        repo.list_project_files(scanner_config=scanner_config, target_path=tmp_path, scan_all=False)
+    )
+
+    # Assert
+    assert {p.name for p in paths} == {"small.py", "huge.py"}
+
+
+def _make_tree(root, count):
+    for i in range(count):
+        pkg = root / f"pkg_{i % 3}"
+        pkg.mkdir(exist_ok=True)
+        (pkg / f"mod_{i}.py").write_text(f"x = {i}")
+    (root / "pkg_0" / "big.txt").write_text("x" * 500)  # Size-guarded in scan_all mode
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_pipelined_read_matches_sequential_order(repo, scanner_config, tmp_path, workers):
+    """
+    Scenario: read_workers > 0 (producer/consumer ingest).
+    Expectation: Same files, same contents, same order as the sequential mode.
+    """
+    # Arrange
+    _make_tree(tmp_path, 30)
+    pipelined_config = replace(scanner_config, read_workers=workers, read_ahead_per_worker=1)
+
+    # Act
+    sequential = list(
+        repo.read_project(scanner_config=scanner_config, target_path=tmp_path, scan_all=True)
+    )
+    pipelined = list(
+        repo.read_project(scanner_config=pipelined_config, target_path=tmp_path, scan_all=True)
+    )
+
+    # Assert
+    assert [(f.path, f.content) for f in pipelined] == [(f.path, f.content) for f in sequential]
+    assert "big.txt" not in {f.path.name for f in pipelined}
+
+
+def test_pipelined_read_stops_cleanly_when_consumer_aborts(repo, scanner_config, tmp_path):
+    """
+    Scenario: The consumer stops early (e.g. parser failure).
+    Expectation: Closing the generator releases the walker and reader threads.
+    """
+    # Arrange
+    _make_tree(tmp_path, 50)
+    pipelined_config = replace(scanner_config, read_workers=2, read_ahead_per_worker=1)
+    stream = repo.read_project(
+        scanner_config=pipelined_config, target_path=tmp_path, scan_all=False
+    )
+
+    # Act
+    first = next(stream)
+    stream.close()
+
+    # Assert
+    assert first.content is not None
+    assert not any(t.name.startswith("dddguard-") for t in threading.enumerate())
@@ -14,6 +14,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from dddguard.scanner.app.use_cases.discover_contexts_uc import DiscoverContextsUseCase
+from dddguard.scanner.domain import DiscoveredContextVo
 from dddguard.shared.domain import (
     CodeGraph,
     ScannerConfig,
@@ -206,3 +207,31 @@ class TestDiscoverContextsEmptyGraph:
         result = use_case(scanner_config=scanner_config, source_dir=source_dir)
 
         assert result == []
+
+
+class TestDiscoverContextsPathsOnly:
+    def test_paths_only_skips_scan_and_classify(
+        self,
+        use_case,
+        detection_gateway,
+        classification_gateway,
+        source_dir,
+        scanner_config,
+    ):
+        """Fast mode walks file names and never parses or classifies a graph."""
+        files = [source_dir / "billing" / "domain" / "x.py"]
+        detection_gateway.list_files.return_value = files
+        classification_gateway.discover_contexts.return_value = [
+            DiscoveredContextVo(context_name="billing", macro_zone=None),
+            DiscoveredContextVo(context_name="shared", macro_zone=None),
+            DiscoveredContextVo(context_name="root", macro_zone=None),
+        ]
+
+        result = use_case(scanner_config=scanner_config, source_dir=source_dir, paths_only=True)
+
+        detection_gateway.scan.assert_not_called()
+        classification_gateway.classify.assert_not_called()
+        classification_gateway.discover_contexts.assert_called_once_with(
+            file_paths=files, source_dir=source_dir
+        )
+        assert [c.context_name for c in result] == ["root", "shared", "billing"]
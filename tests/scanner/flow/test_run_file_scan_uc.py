@@ -0,0 +1,104 @@
+"""
+Flow tests for RunFileScanUseCase: changed files placed in the project index.
+Gateways are mocked; the index is a classified graph (as loaded from a snapshot).
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from dddguard.scanner.app.use_cases.run_file_scan_uc import RunFileScanUseCase
+from dddguard.shared.domain import CodeGraph, LayerEnum, ScannerConfig
+from tests.scanner.conftest import make_classified_graph, make_passport
+
+APP = make_passport(context_name="billing", layer=LayerEnum.APP)
+DOMAIN = make_passport(context_name="billing", layer=LayerEnum.DOMAIN)
+
+
+@pytest.fixture
+def index() -> CodeGraph:
+    return make_classified_graph(
+        [
+            {"path": "billing.app.uc", "passport": APP, "imports": {"billing.domain.order"}},
+            {"path": "billing.domain.order", "passport": DOMAIN},
+            {"path": "billing.app.other", "passport": APP, "imports": {"billing.domain.item"}},
+            {"path": "billing.domain.item", "passport": DOMAIN, "file_path": Path("item.py")},
+        ]
+    )
+
+
+def make_use_case(changed: CodeGraph, passports: dict) -> RunFileScanUseCase:
+    detection_gateway = MagicMock()
+    detection_gateway.scan_files.return_value = changed
+    classification_gateway = MagicMock()
+    classification_gateway.classify.side_effect = lambda graph, source_dir: [
+        node.classify(passports[path]) for path, node in graph.nodes.items()
+    ]
+    return RunFileScanUseCase(
+        detection_gateway=detection_gateway,
+        classification_gateway=classification_gateway,
+    )
+
+
+def changed_graph(path: str, imports: set[str]) -> CodeGraph:
+    graph = CodeGraph()
+    graph.add_node(path=path).link_imports(list(imports))
+    return graph
+
+
+def test_changed_node_comes_with_its_import_targets(index):
+    use_case = make_use_case(
+        changed_graph("billing.app.uc", {"billing.domain.order"}), {"billing.app.uc": APP}
+    )
+
+    result = use_case(
+        scanner_config=ScannerConfig(),
+        source_dir=Path("/src"),
+        file_paths=[Path("/src/billing/app/uc.py")],
+        classified_graph=index,
+    )
+
+    assert result.changed == ("billing.app.uc",)
+    assert result.reclassified == ()
+    assert set(result.graph.nodes) == {"billing.app.uc", "billing.domain.order"}
+    assert result.graph.nodes["billing.domain.order"].passport == DOMAIN
+    # The index is read, never mutated
+    assert index.nodes["billing.domain.order"] is not result.graph.nodes["billing.domain.order"]
+
+
+def test_reclassified_node_comes_with_its_importers(index):
+    # Same module path, different passport (e.g. a changed classification rule)
+    use_case = make_use_case(
+        changed_graph("billing.domain.item", set()), {"billing.domain.item": APP}
+    )
+
+    result = use_case(
+        scanner_config=ScannerConfig(),
+        source_dir=Path("/src"),
+        file_paths=[Path("/src/billing/domain/item.py")],
+        classified_graph=index,
+    )
+
+    assert result.reclassified == ("billing.domain.item",)
+    assert result.graph.importers_of("billing.domain.item") == {"billing.app.other"}
+
+
+def test_without_an_index_the_project_is_not_scanned():
+    # Detection returns the changed file plus its located import target
+    located = changed_graph("billing.app.uc", {"billing.domain.order"})
+    located.nodes["billing.app.uc"].file_path = Path("/src/billing/app/uc.py")
+    located.add_node(path="billing.domain.order", file_path=Path("/src/billing/domain/order.py"))
+    use_case = make_use_case(located, {"billing.app.uc": APP, "billing.domain.order": DOMAIN})
+
+    result = use_case(
+        scanner_config=ScannerConfig(),
+        source_dir=Path("/src"),
+        file_paths=[Path("/src/billing/app/uc.py")],
+    )
+
+    use_case.detection_gateway.scan.assert_not_called()
+    assert use_case.detection_gateway.scan_files.call_args.kwargs.get("known_modules") is None
+    assert result.changed == ("billing.app.uc",)
+    assert result.reclassified == ()
+    assert result.graph.nodes["billing.domain.order"].passport == DOMAIN
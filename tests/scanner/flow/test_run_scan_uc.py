@@ -17,6 +17,8 @@ from unittest.mock import MagicMock
 import pytest
 
 from dddguard.scanner.app.use_cases.run_scan_uc import RunScanUseCase
+from dddguard.scanner.domain import ExpansionDirection
+from dddguard.shared.adapters.driven.graph_session_cache import GraphSessionCache
 from dddguard.shared.domain import (
     CodeGraph,
     NodeStatus,
@@ -232,6 +234,51 @@ class TestRunScanUCExpansion:
         assert "billing.domain.item" in finalized
         assert "shared.helpers.utils" in finalized
 
+    def test_upstream_expansion_reveals_dependents(
+        self,
+        use_case,
+        detection_gateway,
+        classification_gateway,
+        source_dir,
+        scanner_config,
+    ):
+        """
+        Impact analysis: focusing on 'shared' with UPSTREAM reveals who imports it.
+        """
+        classified = make_classified_graph(
+            [
+                {
+                    "path": "billing.domain.item",
+                    "file_path": source_dir / "billing/domain/item.py",
+                    "passport": make_passport(context_name="billing"),
+                    "imports": {"shared.helpers.utils"},
+                },
+                {
+                    "path": "ordering.domain.cart",
+                    "file_path": source_dir / "ordering/domain/cart.py",
+                    "passport": make_passport(context_name="ordering"),
+                },
+                {
+                    "path": "shared.helpers.utils",
+                    "file_path": source_dir / "shared/helpers/utils.py",
+                    "passport": make_passport(context_name="shared"),
+                },
+            ]
+        )
+        detection_gateway.scan.return_value = CodeGraph()
+        classification_gateway.classify.return_value = classified
+
+        result = use_case(
+            scanner_config=scanner_config,
+            source_dir=source_dir,
+            import_depth=1,
+            whitelist_contexts=["shared"],
+            expansion_direction=ExpansionDirection.UPSTREAM,
+        )
+
+        finalized = {p for p, n in result.nodes.items() if n.status == NodeStatus.FINALIZED}
+        assert finalized == {"shared.helpers.utils", "billing.domain.item"}
+
 
 class TestRunScanUCEmptyGraph:
     def test_empty_graph_still_completes(
@@ -252,3 +299,91 @@ class TestRunScanUCEmptyGraph:
         )
 
         assert result.total_files == 0
+
+
+class TestRunScanUCPrebuiltGraph:
+    def test_classified_graph_skips_detection_and_classification(
+        self,
+        use_case,
+        detection_gateway,
+        classification_gateway,
+        source_dir,
+        scanner_config,
+    ):
+        """A snapshot-loaded graph goes straight to filter/expand/prune."""
+        graph = _build_classified_graph(source_dir)
+
+        result = use_case(
+            scanner_config=scanner_config,
+            source_dir=source_dir,
+            classified_graph=graph,
+        )
+
+        assert result is graph
+        detection_gateway.scan.assert_not_called()
+        classification_gateway.classify.assert_not_called()
+        assert result.count_by_status(NodeStatus.FINALIZED) > 0
+
+
+class TestRunScanUCFocus:
+    def test_focus_scans_lazily_and_shows_only_the_focus(
+        self,
+        use_case,
+        detection_gateway,
+        classification_gateway,
+        source_dir,
+        scanner_config,
+    ):
+        """A focus scan detects the focus only and hides the modules it imports."""
+        focus = source_dir / "billing"
+        focused = _build_classified_graph(source_dir)
+        detection_gateway.scan_focus.return_value = CodeGraph()
+        classification_gateway.classify.return_value = focused
+
+        result = use_case(scanner_config=scanner_config, source_dir=source_dir, focus_path=focus)
+
+        detection_gateway.scan_focus.assert_called_once_with(
+            scanner_config=scanner_config, target_path=source_dir, focus_path=focus
+        )
+        detection_gateway.scan.assert_not_called()
+        assert result is focused
+        assert result.nodes["billing.domain.order"].status == NodeStatus.FINALIZED
+        assert result.nodes["shared.helpers.utils"].status == NodeStatus.CLASSIFIED
+
+
+class TestRunScanUCSessionCache:
+    def test_second_scan_reuses_classified_graph(
+        self,
+        detection_gateway,
+        classification_gateway,
+        source_dir,
+        scanner_config,
+    ):
+        """
+        With a session cache, an unchanged tree is detected/classified once;
+        each caller still gets its own filtered view.
+        """
+        use_case = RunScanUseCase(
+            detection_gateway=detection_gateway,
+            classification_gateway=classification_gateway,
+            graph_cache=GraphSessionCache(),
+        )
+        detection_gateway.scan.return_value = CodeGraph()
+        classification_gateway.classify.side_effect = lambda **_: _build_classified_graph(
+            source_dir
+        )
+
+        first = use_case(scanner_config=scanner_config, source_dir=source_dir)
+        second = use_case(
+            scanner_config=scanner_config,
+            source_dir=source_dir,
+            whitelist_contexts=["shared"],
+        )
+
+        assert detection_gateway.scan.call_count == 1
+        assert classification_gateway.classify.call_count == 1
+        assert second is not first
+
+        # The second (narrower) view did not leak into the first
+        assert first.nodes["billing.domain.order"].status == NodeStatus.FINALIZED
+        assert second.nodes["billing.domain.order"].status != NodeStatus.FINALIZED
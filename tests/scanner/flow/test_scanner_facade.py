@@ -13,15 +13,31 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from dddguard.scanner.ports.errors import InvalidScanPathError
-from dddguard.scanner.domain.value_objects import DiscoveredContextVo
+from dddguard.scanner.domain.value_objects import (
+    ContextInventoryVo,
+    DiscoveredContextVo,
+    ExpansionDirection,
+    InventoryContextVo,
+    QueryResultVo,
+    SnapshotInfoVo,
+    ViolationRecordVo,
+)
 from dddguard.scanner.ports.driving.scanner_facade import (
     ContextListSchema,
+    CycleReportSchema,
+    ImportCycleSchema,
+    InventorySchema,
+    QueryResultSchema,
     ScannerFacade,
+    SnapshotSchema,
+    ViolationRecordSchema,
 )
+from dddguard.scanner.ports.errors import InvalidScanPathError
 from dddguard.shared.domain import (
     CodeGraph,
     ConfigVo,
+    ImportCycleReportVo,
+    ImportCycleVo,
     ProjectConfig,
     ScannerConfig,
 )
@@ -66,11 +82,73 @@ def discover_contexts_uc():
 
 
 @pytest.fixture
-def facade(run_scan_uc, inspect_tree_uc, discover_contexts_uc, config) -> ScannerFacade:
+def record_inventory_uc():
+    return MagicMock()
+
+
+@pytest.fixture
+def read_inventory_uc():
+    return MagicMock()
+
+
+@pytest.fixture
+def save_snapshot_uc():
+    return MagicMock()
+
+
+@pytest.fixture
+def load_snapshot_uc():
+    return MagicMock()
+
+
+@pytest.fixture
+def open_snapshot_view_uc():
+    return MagicMock()
+
+
+@pytest.fixture
+def record_violations_uc():
+    return MagicMock()
+
+
+@pytest.fixture
+def run_query_uc():
+    return MagicMock()
+
+
+@pytest.fixture
+def analyze_cycles_uc():
+    return MagicMock()
+
+
+@pytest.fixture
+def facade(
+    run_scan_uc,
+    inspect_tree_uc,
+    discover_contexts_uc,
+    record_inventory_uc,
+    read_inventory_uc,
+    save_snapshot_uc,
+    load_snapshot_uc,
+    open_snapshot_view_uc,
+    record_violations_uc,
+    run_query_uc,
+    analyze_cycles_uc,
+    config,
+) -> ScannerFacade:
     return ScannerFacade(
         run_scan_use_case=run_scan_uc,
+        run_file_scan_use_case=MagicMock(),
         inspect_tree_use_case=inspect_tree_uc,
         discover_contexts_use_case=discover_contexts_uc,
+        record_inventory_use_case=record_inventory_uc,
+        read_inventory_use_case=read_inventory_uc,
+        save_snapshot_use_case=save_snapshot_uc,
+        load_snapshot_use_case=load_snapshot_uc,
+        open_snapshot_view_use_case=open_snapshot_view_uc,
+        record_violations_use_case=record_violations_uc,
+        run_query_use_case=run_query_uc,
+        analyze_cycles_use_case=analyze_cycles_uc,
         config=config,
     )
 
@@ -97,6 +175,9 @@ class TestScannerFacadeScanProject:
             whitelist_layers=None,
             whitelist_contexts=None,
             include_assets=True,
+            expansion_direction=ExpansionDirection.DOWNSTREAM,
+            classified_graph=None,
+            focus_path=None,
         )
 
     def test_with_target_path_none_uses_config(self, facade, run_scan_uc, source_dir, config):
@@ -109,6 +190,22 @@ class TestScannerFacadeScanProject:
         # Should resolve to the same directory
         assert call_kwargs["source_dir"].resolve() == source_dir.resolve()
 
+    def test_focus_path_is_passed_and_skips_inventory(
+        self, facade, run_scan_uc, record_inventory_uc, source_dir
+    ):
+        focus = source_dir / "billing"
+        focus.mkdir()
+        run_scan_uc.return_value = CodeGraph()
+
+        facade.scan_project(target_path=source_dir, focus_path=focus)
+
+        assert run_scan_uc.call_args.kwargs["focus_path"] == focus.resolve()
+        record_inventory_uc.assert_not_called()
+
+    def test_focus_outside_source_dir_raises(self, facade, tmp_path, source_dir):
+        with pytest.raises(InvalidScanPathError):
+            facade.scan_project(target_path=source_dir, focus_path=tmp_path)
+
 
 # ---------------------------------------------------------------------------
 # classify_tree()
@@ -127,6 +224,7 @@ class TestScannerFacadeClassifyTree:
             scanner_config=config.scanner,
             source_dir=source_dir,
             scan_all=False,
+            classified_graph=None,
         )
 
 
@@ -153,8 +251,218 @@ class TestScannerFacadeDiscoverContexts:
             scanner_config=config.scanner,
             source_dir=source_dir,
             scan_all=False,
+            paths_only=False,
+        )
+
+    def test_fast_mode_requests_paths_only_discovery(
+        self, facade, discover_contexts_uc, source_dir, config
+    ):
+        discover_contexts_uc.return_value = []
+
+        facade.discover_contexts(target_path=source_dir, fast=True)
+
+        discover_contexts_uc.assert_called_once_with(
+            scanner_config=config.scanner,
+            source_dir=source_dir,
+            scan_all=False,
+            paths_only=True,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Inventory (recorded after scans, served without scanning)
+# ---------------------------------------------------------------------------
+
+
+class TestScannerFacadeInventory:
+    def test_scan_project_records_inventory(
+        self, facade, run_scan_uc, record_inventory_uc, source_dir, config
+    ):
+        graph = CodeGraph()
+        run_scan_uc.return_value = graph
+
+        facade.scan_project(target_path=source_dir)
+
+        record_inventory_uc.assert_called_once_with(
+            graph=graph, source_dir=source_dir, scanner_config=config.scanner
+        )
+
+    def test_classify_tree_records_inventory(
+        self, facade, inspect_tree_uc, record_inventory_uc, source_dir
+    ):
+        graph = CodeGraph()
+        inspect_tree_uc.return_value = graph
+
+        facade.classify_tree(target_path=source_dir)
+
+        assert record_inventory_uc.call_args.kwargs["graph"] is graph
+
+    def test_get_inventory_maps_to_schema(self, facade, read_inventory_uc, source_dir):
+        read_inventory_uc.return_value = ContextInventoryVo(
+            source_dir=str(source_dir),
+            fingerprint="1:1",
+            contexts=(
+                InventoryContextVo(
+                    context_name="billing",
+                    macro_zone="finance",
+                    layers=("app", "domain"),
+                    node_count=3,
+                ),
+            ),
+        )
+
+        result = facade.get_inventory(target_path=source_dir)
+
+        assert isinstance(result, InventorySchema)
+        assert [c.context_name for c in result.contexts] == ["billing"]
+        assert result.macro_zones == ["finance"]
+        assert result.layers == ["app", "domain"]
+
+    def test_get_inventory_returns_none_when_missing_or_stale(
+        self, facade, read_inventory_uc, source_dir
+    ):
+        read_inventory_uc.return_value = None
+
+        assert facade.get_inventory(target_path=source_dir) is None
+
+
+# ---------------------------------------------------------------------------
+# Snapshots (save once, reuse without detection/classification)
+# ---------------------------------------------------------------------------
+
+
+class TestScannerFacadeSnapshot:
+    def test_save_snapshot_maps_to_schema(self, facade, save_snapshot_uc, source_dir, config):
+        save_snapshot_uc.return_value = SnapshotInfoVo(
+            snapshot_path="graph.snapshot",
+            source_dir=str(source_dir),
+            scan_all=False,
+            has_content=False,
+            node_count=3,
+            edge_count=2,
+            size_bytes=128,
+        )
+
+        result = facade.save_snapshot(Path("graph.snapshot"))
+
+        assert isinstance(result, SnapshotSchema)
+        assert (result.node_count, result.edge_count, result.size_bytes) == (3, 2, 128)
+        assert save_snapshot_uc.call_args.kwargs["source_dir"].resolve() == source_dir.resolve()
+
+    def test_scan_project_from_snapshot(
+        self,
+        facade,
+        run_scan_uc,
+        load_snapshot_uc,
+        record_inventory_uc,
+        source_dir,
+        tmp_path,
+    ):
+        snapshot = tmp_path / "graph.snapshot"
+        snapshot.write_bytes(b"")
+        loaded = make_classified_graph([{"path": "billing.domain.order"}])
+        load_snapshot_uc.return_value = (MagicMock(source_dir=str(source_dir)), loaded)
+
+        facade.scan_project(snapshot_path=snapshot)
+
+        assert load_snapshot_uc.call_args.kwargs["source_dir"] == source_dir.resolve()
+        call_kwargs = run_scan_uc.call_args.kwargs
+        assert call_kwargs["classified_graph"] is loaded
+        assert call_kwargs["source_dir"] == source_dir
+        # The live tree may differ from the snapshot: keep the inventory untouched
+        record_inventory_uc.assert_not_called()
+
+    def test_missing_snapshot_raises(self, facade, tmp_path):
+        with pytest.raises(InvalidScanPathError):
+            facade.scan_project(snapshot_path=tmp_path / "absent.snapshot")
+
+    def test_open_snapshot_returns_view_rebased_on_source_dir(
+        self, facade, open_snapshot_view_uc, run_scan_uc, source_dir, tmp_path
+    ):
+        snapshot = tmp_path / "graph.sqlite"
+        snapshot.write_bytes(b"")
+
+        result = facade.open_snapshot(snapshot)
+
+        assert result is open_snapshot_view_uc.return_value
+        assert open_snapshot_view_uc.call_args.kwargs["source_dir"] == source_dir.resolve()
+        run_scan_uc.assert_not_called()
+
+    def test_record_violations_maps_schemas_to_domain(self, facade, record_violations_uc, tmp_path):
+        record_violations_uc.return_value = True
+        schema = ViolationRecordSchema(
+            rule_name="Domain Purity",
+            severity="error",
+            source_path="billing.domain.order",
+            target_path="billing.app.service",
+            target_context="billing",
+            message="Domain cannot import App",
         )
 
+        assert facade.record_violations(tmp_path / "graph.sqlite", [schema]) is True
+
+        (record,) = record_violations_uc.call_args.kwargs["violations"]
+        assert isinstance(record, ViolationRecordVo)
+        assert (record.rule_name, record.source_path) == ("Domain Purity", "billing.domain.order")
+
+
+# ---------------------------------------------------------------------------
+# query()
+# ---------------------------------------------------------------------------
+
+
+class TestScannerFacadeQuery:
+    def test_maps_result_to_schema(self, facade, run_query_uc, source_dir):
+        run_query_uc.return_value = QueryResultVo(
+            columns=("path", "context"), rows=(("billing.app.uc", "billing"),), total=4
+        )
+
+        result = facade.query("nodes where context = billing limit 1")
+
+        assert result == QueryResultSchema(
+            columns=["path", "context"], rows=[["billing.app.uc", "billing"]], total=4
+        )
+        call_kwargs = run_query_uc.call_args.kwargs
+        assert call_kwargs["query"] == "nodes where context = billing limit 1"
+        assert call_kwargs["source_dir"].resolve() == source_dir.resolve()
+        assert call_kwargs["classified_graph"] is None
+
+    def test_from_snapshot(self, facade, run_query_uc, load_snapshot_uc, source_dir, tmp_path):
+        snapshot = tmp_path / "graph.snapshot"
+        snapshot.write_bytes(b"")
+        loaded = make_classified_graph([{"path": "billing.domain.order"}])
+        load_snapshot_uc.return_value = (MagicMock(source_dir=str(source_dir)), loaded)
+        run_query_uc.return_value = QueryResultVo(columns=("path",), rows=(), total=0)
+
+        facade.query("nodes", snapshot_path=snapshot)
+
+        assert run_query_uc.call_args.kwargs["classified_graph"] is loaded
+
+
+# ---------------------------------------------------------------------------
+# analyze_cycles()
+# ---------------------------------------------------------------------------
+
+
+class TestScannerFacadeAnalyzeCycles:
+    def test_maps_report_to_schema(self, facade, analyze_cycles_uc, source_dir):
+        analyze_cycles_uc.return_value = ImportCycleReportVo(
+            module_cycles=(ImportCycleVo(members=("a", "b"), cycle=("a", "b", "a")),),
+            context_cycles=(),
+        )
+
+        result = facade.analyze_cycles()
+
+        assert result == CycleReportSchema(
+            module_cycles=[
+                ImportCycleSchema(members=["a", "b"], cycle=["a", "b", "a"], witnesses=[])
+            ],
+            context_cycles=[],
+        )
+        call_kwargs = analyze_cycles_uc.call_args.kwargs
+        assert call_kwargs["source_dir"].resolve() == source_dir.resolve()
+        assert call_kwargs["classified_graph"] is None
+
 
 # ---------------------------------------------------------------------------
 # _get_source_dir() via public methods
@@ -169,8 +477,17 @@ class TestScannerFacadeGetSourceDir:
         )
         facade = ScannerFacade(
             run_scan_use_case=run_scan_uc,
+            run_file_scan_use_case=MagicMock(),
             inspect_tree_use_case=MagicMock(),
             discover_contexts_use_case=MagicMock(),
+            record_inventory_use_case=MagicMock(),
+            read_inventory_use_case=MagicMock(),
+            save_snapshot_use_case=MagicMock(),
+            load_snapshot_use_case=MagicMock(),
+            open_snapshot_view_use_case=MagicMock(),
+            record_violations_use_case=MagicMock(),
+            run_query_use_case=MagicMock(),
+            analyze_cycles_use_case=MagicMock(),
             config=config,
         )
 
@@ -187,8 +504,17 @@ class TestScannerFacadeGetSourceDir:
         )
         facade = ScannerFacade(
             run_scan_use_case=run_scan_uc,
+            run_file_scan_use_case=MagicMock(),
             inspect_tree_use_case=MagicMock(),
             discover_contexts_use_case=MagicMock(),
+            record_inventory_use_case=MagicMock(),
+            read_inventory_use_case=MagicMock(),
+            save_snapshot_use_case=MagicMock(),
+            load_snapshot_use_case=MagicMock(),
+            open_snapshot_view_use_case=MagicMock(),
+            record_violations_use_case=MagicMock(),
+            run_query_use_case=MagicMock(),
+            analyze_cycles_use_case=MagicMock(),
             config=config,
         )
 
@@ -208,8 +534,17 @@ class TestScannerFacadeGetSourceDir:
         )
         facade = ScannerFacade(
             run_scan_use_case=run_scan_uc,
+            run_file_scan_use_case=MagicMock(),
             inspect_tree_use_case=MagicMock(),
             discover_contexts_use_case=MagicMock(),
+            record_inventory_use_case=MagicMock(),
+            read_inventory_use_case=MagicMock(),
+            save_snapshot_use_case=MagicMock(),
+            load_snapshot_use_case=MagicMock(),
+            open_snapshot_view_use_case=MagicMock(),
+            record_violations_use_case=MagicMock(),
+            run_query_use_case=MagicMock(),
+            analyze_cycles_use_case=MagicMock(),
             config=config,
         )
 
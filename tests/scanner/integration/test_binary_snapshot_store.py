@@ -0,0 +1,182 @@
+import pytest
+
+from dddguard.scanner.app import LoadSnapshotUseCase, SaveSnapshotUseCase
+from dddguard.scanner.ports.driven.storage.binary_snapshot_store import BinarySnapshotStore
+from dddguard.scanner.ports.errors import SnapshotError
+from dddguard.shared.domain import (
+    AdapterType,
+    CodeGraph,
+    DirectionEnum,
+    LayerEnum,
+    NodeStatus,
+    PortType,
+    ScannerConfig,
+)
+from tests.scanner.conftest import make_classified_graph, make_passport
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def source_dir(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    return src
+
+
+@pytest.fixture
+def store() -> BinarySnapshotStore:
+    return BinarySnapshotStore()
+
+
+@pytest.fixture
+def graph(source_dir) -> CodeGraph:
+    # REPOSITORY exists in both PortType and AdapterType: the enum class must survive
+    graph = make_classified_graph(
+        [
+            {
+                "path": "billing.ports.repo",
+                "file_path": source_dir / "billing" / "ports" / "repo.py",
+                "imports": {"billing.domain.invoice", "external.lib"},
+                "passport": make_passport(
+                    layer=LayerEnum.PORTS,
+                    direction=DirectionEnum.DRIVEN,
+                    component_type=PortType.REPOSITORY,
+                    macro_zone="finance",
+                ),
+            },
+            {
+                "path": "billing.adapters.repo",
+                "file_path": source_dir / "billing" / "adapters" / "repo.py",
+                "passport": make_passport(
+                    layer=LayerEnum.ADAPTERS, component_type=AdapterType.REPOSITORY
+                ),
+            },
+            {
+                "path": "billing.domain.invoice",
+                "file_path": source_dir / "billing" / "domain" / "invoice.py",
+            },
+        ]
+    )
+    graph.add_node("loose", file_path=None, content="print(1)")
+    graph.nodes["billing.domain.invoice"].content = "class Invoice: ..."
+    return graph
+
+
+# --- TESTS ---
+class TestRoundTrip:
+    def test_restores_nodes_edges_and_passports(self, store, graph, source_dir, tmp_path):
+        snapshot = tmp_path / "graph.snapshot"
+
+        saved = store.save(graph, snapshot, source_dir, scan_all=False, include_content=False)
+        info, loaded = store.load(snapshot)
+
+        assert (saved.node_count, saved.edge_count) == (4, 2)
+        assert (info.node_count, info.edge_count, info.size_bytes) == (
+            4,
+            2,
+            snapshot.stat().st_size,
+        )
+        assert info.source_dir == str(source_dir)
+        for path, node in graph.nodes.items():
+            restored = loaded.nodes[path]
+            assert restored.imports == node.imports
+            assert restored.passport == node.passport
+            assert restored.passport_id == node.passport_id
+            assert restored.status == node.status
+            assert restored.file_path == node.file_path
+        assert loaded.nodes["billing.ports.repo"].passport.component_type is PortType.REPOSITORY
+        assert loaded.nodes["billing.adapters.repo"].passport.component_type is (
+            AdapterType.REPOSITORY
+        )
+
+    def test_loaded_graph_has_live_indexes(self, store, graph, source_dir, tmp_path):
+        snapshot = tmp_path / "graph.snapshot"
+        store.save(graph, snapshot, source_dir, scan_all=False, include_content=False)
+
+        _, loaded = store.load(snapshot)
+
+        assert loaded.importers_of("billing.domain.invoice") == {"billing.ports.repo"}
+        assert loaded.nodes_in_layer(LayerEnum.PORTS) == {"billing.ports.repo"}
+        assert loaded.count_by_status(NodeStatus.CLASSIFIED) == 3
+
+    def test_content_is_optional(self, store, graph, source_dir, tmp_path):
+        lean, full = tmp_path / "lean.snapshot", tmp_path / "full.snapshot"
+        store.save(graph, lean, source_dir, scan_all=False, include_content=False)
+        store.save(graph, full, source_dir, scan_all=True, include_content=True)
+
+        _, lean_graph = store.load(lean)
+        info, full_graph = store.load(full)
+
+        assert lean_graph.nodes["billing.domain.invoice"].content is None
+        assert full_graph.nodes["billing.domain.invoice"].content == "class Invoice: ..."
+        assert full_graph.nodes["billing.ports.repo"].content is None
+        assert info.scan_all and info.has_content
+
+    def test_file_paths_are_rebased_onto_a_new_root(self, store, graph, source_dir, tmp_path):
+        snapshot = tmp_path / "graph.snapshot"
+        store.save(graph, snapshot, source_dir, scan_all=False, include_content=False)
+        checkout = tmp_path / "other" / "src"
+
+        info, loaded = store.load(snapshot, checkout)
+
+        assert info.source_dir == str(checkout)
+        assert loaded.nodes["billing.domain.invoice"].file_path == (
+            checkout / "billing" / "domain" / "invoice.py"
+        )
+
+
+class TestRejectsBadFiles:
+    def test_missing_file(self, store, tmp_path):
+        with pytest.raises(SnapshotError, match="Cannot read"):
+            store.load(tmp_path / "absent.snapshot")
+
+    def test_foreign_file(self, store, tmp_path):
+        path = tmp_path / "x.snapshot"
+        path.write_bytes(b"definitely not a snapshot")
+
+        with pytest.raises(SnapshotError, match="Not a dddguard snapshot"):
+            store.load(path)
+
+    def test_corrupted_body(self, store, graph, source_dir, tmp_path):
+        path = tmp_path / "graph.snapshot"
+        store.save(graph, path, source_dir, scan_all=False, include_content=False)
+        data = bytearray(path.read_bytes())
+        data[-1] ^= 0xFF
+        path.write_bytes(bytes(data))
+
+        with pytest.raises(SnapshotError, match="checksum"):
+            store.load(path)
+
+    def test_unknown_version(self, store, graph, source_dir, tmp_path):
+        path = tmp_path / "graph.snapshot"
+        store.save(graph, path, source_dir, scan_all=False, include_content=False)
+        data = bytearray(path.read_bytes())
+        data[8] = 99
+        path.write_bytes(bytes(data))
+
+        with pytest.raises(SnapshotError, match="Unsupported snapshot version 99"):
+            store.load(path)
+
+
+class TestSnapshotUseCases:
+    def test_save_then_load(self, store, graph, source_dir, tmp_path):
+        class _Detection:
+            def scan(self, scanner_config, target_path, scan_all):
+                return graph
+
+        class _Classification:
+            def classify(self, graph, source_dir=None):
+                return graph
+
+        snapshot = tmp_path / "ci" / "graph.snapshot"
+        save = SaveSnapshotUseCase(
+            detection_gateway=_Detection(),
+            classification_gateway=_Classification(),
+            snapshot_store=store,
+        )
+
+        info = save(scanner_config=ScannerConfig(), source_dir=source_dir, snapshot_path=snapshot)
+        _, loaded = LoadSnapshotUseCase(snapshot_store=store)(snapshot_path=snapshot)
+
+        assert info.node_count == 4
+        assert set(loaded.nodes) == set(graph.nodes)
@@ -0,0 +1,98 @@
+import json
+import os
+
+import pytest
+
+from dddguard.scanner.app import ReadInventoryUseCase, RecordInventoryUseCase
+from dddguard.scanner.ports.driven.storage.json_inventory_store import JsonInventoryStore
+from dddguard.shared.domain import ConfigVo, ProjectConfig, ScannerConfig
+from tests.scanner.conftest import make_classified_graph
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def source_dir(tmp_path):
+    src = tmp_path / "src"
+    (src / "billing" / "domain").mkdir(parents=True)
+    (src / "billing" / "domain" / "invoice.py").write_text("x = 1")
+    return src
+
+
+@pytest.fixture
+def scanner_config() -> ScannerConfig:
+    return ScannerConfig()
+
+
+@pytest.fixture
+def store(tmp_path) -> JsonInventoryStore:
+    return JsonInventoryStore(
+        config=ConfigVo(project=ProjectConfig(source_dir="src", project_root=tmp_path))
+    )
+
+
+@pytest.fixture
+def graph():
+    return make_classified_graph([{"path": "billing.domain.invoice"}])
+
+
+# --- TESTS ---
+
+
+def test_round_trip_through_use_cases(store, source_dir, scanner_config, graph, tmp_path):
+    """
+    Scenario: A scan completes, then a completion request reads the inventory.
+    Expectation: Same contexts come back; cache dir is git-ignored.
+    """
+    RecordInventoryUseCase(inventory_store=store)(
+        graph=graph, source_dir=source_dir, scanner_config=scanner_config
+    )
+
+    inventory = ReadInventoryUseCase(inventory_store=store)(
+        source_dir=source_dir, scanner_config=scanner_config
+    )
+
+    assert inventory is not None
+    assert inventory.context_names == ["billing"]
+    assert (tmp_path / ".dddguard" / ".gitignore").read_text() == "*\n"
+
+
+def test_inventory_is_stale_after_tree_changes(store, source_dir, scanner_config, graph):
+    """
+    Scenario: A new context directory appears after the last scan.
+    Expectation: The inventory is rejected (unless stale data is explicitly allowed).
+    """
+    RecordInventoryUseCase(inventory_store=store)(
+        graph=graph, source_dir=source_dir, scanner_config=scanner_config
+    )
+    (source_dir / "shipping").mkdir()
+    # Make sure the mtime moves even on coarse-grained filesystems
+    future = source_dir.stat().st_mtime + 10
+    os.utime(source_dir, (future, future))
+
+    read = ReadInventoryUseCase(inventory_store=store)
+
+    assert read(source_dir=source_dir, scanner_config=scanner_config) is None
+    assert read(source_dir=source_dir, scanner_config=scanner_config, allow_stale=True)
+
+
+def test_corrupt_or_foreign_files_are_ignored(store, source_dir, tmp_path, graph):
+    RecordInventoryUseCase(inventory_store=store)(
+        graph=graph, source_dir=source_dir, scanner_config=ScannerConfig()
+    )
+    (file_path,) = (tmp_path / ".dddguard").glob("inventory-*.json")
+
+    file_path.write_text("{not json")
+    assert store.load(source_dir) is None
+
+    file_path.write_text(json.dumps({"version": 999}))
+    assert store.load(source_dir) is None
+
+
+def test_store_is_inert_without_project_root(source_dir, graph):
+    store = JsonInventoryStore(config=ConfigVo())
+
+    RecordInventoryUseCase(inventory_store=store)(
+        graph=graph, source_dir=source_dir, scanner_config=ScannerConfig()
+    )
+
+    assert store.load(source_dir) is None
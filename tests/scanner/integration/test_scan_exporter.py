@@ -0,0 +1,112 @@
+import gzip
+import json
+
+import pytest
+
+from dddguard.scanner.adapters.driving.console.scan_exporter import (
+    MASKED_CONTENT,
+    export_scan,
+)
+from dddguard.shared.domain import CodeGraph
+from tests.scanner.conftest import make_classified_graph
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def source_dir(tmp_path):
+    src = tmp_path / "src"
+    (src / "billing" / "domain").mkdir(parents=True)
+    (src / "billing" / "domain" / "invoice.py").write_text("class Invoice: ...", "utf-8")
+    return src
+
+
+@pytest.fixture
+def graph(source_dir) -> CodeGraph:
+    graph = make_classified_graph(
+        [
+            {
+                "path": "billing",
+                "file_path": source_dir / "billing" / "__init__.py",
+            },
+            {
+                "path": "billing.domain.order",
+                "file_path": source_dir / "billing" / "domain" / "order.py",
+                "imports": {"billing.domain.invoice", "external.lib"},
+            },
+            {
+                # Content not kept in memory (e.g. lean snapshot): read from disk
+                "path": "billing.domain.invoice",
+                "file_path": source_dir / "billing" / "domain" / "invoice.py",
+            },
+            {"path": "shared.hidden"},
+        ]
+    )
+    graph.nodes["billing"].content = ""
+    graph.nodes["billing.domain.order"].content = 'print("ü")'
+    for path in ("billing", "billing.domain.order", "billing.domain.invoice"):
+        graph.nodes[path].finalize()
+    return graph
+
+
+EXPECTED_TREE = {
+    "billing": {
+        "__init__.py": "",
+        "domain": {
+            "invoice": "class Invoice: ...",
+            "order": 'print("ü")',
+        },
+    }
+}
+
+
+# --- TESTS ---
+class TestJsonTree:
+    def test_matches_indented_json_dump(self, graph, tmp_path):
+        output = tmp_path / "tree.json"
+
+        export_scan(graph, output, mask_content=False)
+
+        text = output.read_text("utf-8")
+        assert text == json.dumps(EXPECTED_TREE, indent=2, ensure_ascii=False)
+
+    def test_masked_and_empty(self, graph, tmp_path):
+        output = tmp_path / "tree.json"
+
+        export_scan(graph, output, mask_content=True)
+        assert json.loads(output.read_text("utf-8"))["billing"]["domain"] == {
+            "invoice": MASKED_CONTENT,
+            "order": MASKED_CONTENT,
+        }
+
+        export_scan(CodeGraph(), output, mask_content=False)
+        assert output.read_text("utf-8") == "{}"
+
+    def test_gzip(self, graph, tmp_path):
+        output = tmp_path / "tree.json.gz"
+
+        export_scan(graph, output, mask_content=False)
+
+        with gzip.open(output, "rt", encoding="utf-8") as f:
+            assert json.load(f) == EXPECTED_TREE
+
+
+class TestNdjson:
+    @pytest.mark.parametrize("name", ["tree.ndjson", "tree.jsonl.gz"])
+    def test_one_record_per_line(self, graph, tmp_path, name):
+        output = tmp_path / name
+
+        export_scan(graph, output, mask_content=False)
+
+        opener = gzip.open if name.endswith(".gz") else open
+        with opener(output, "rt", encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+
+        nodes = {r["path"]: r for r in records if r["type"] == "node"}
+        edges = {(r["source"], r["target"]) for r in records if r["type"] == "edge"}
+        assert set(nodes) == {"billing", "billing.domain.order", "billing.domain.invoice"}
+        assert nodes["billing.domain.invoice"]["content"] == "class Invoice: ..."
+        assert nodes["billing.domain.order"]["context"] == "billing"
+        assert edges == {
+            ("billing.domain.order", "billing.domain.invoice"),
+            ("billing.domain.order", "external.lib"),
+        }
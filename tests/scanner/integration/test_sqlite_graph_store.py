@@ -0,0 +1,198 @@
+import sqlite3
+
+import pytest
+
+from dddguard.scanner.domain import ViolationRecordVo
+from dddguard.scanner.ports.driven.storage.binary_snapshot_store import BinarySnapshotStore
+from dddguard.scanner.ports.driven.storage.snapshot_store_router import SnapshotStoreRouter
+from dddguard.scanner.ports.driven.storage.sqlite_graph_store import (
+    SqliteCodeGraph,
+    SqliteGraphStore,
+)
+from dddguard.scanner.ports.errors import SnapshotError
+from dddguard.shared.domain import (
+    AdapterType,
+    CodeGraph,
+    DirectionEnum,
+    LayerEnum,
+    NodeStatus,
+    PortType,
+)
+from tests.scanner.conftest import make_classified_graph, make_passport
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def source_dir(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    return src
+
+
+@pytest.fixture
+def store() -> SqliteGraphStore:
+    return SqliteGraphStore()
+
+
+@pytest.fixture
+def graph(source_dir) -> CodeGraph:
+    graph = make_classified_graph(
+        [
+            {
+                "path": "billing.ports.repo",
+                "file_path": source_dir / "billing" / "ports" / "repo.py",
+                "imports": {"billing.domain.invoice", "external.lib"},
+                "passport": make_passport(
+                    layer=LayerEnum.PORTS,
+                    direction=DirectionEnum.DRIVEN,
+                    component_type=PortType.REPOSITORY,
+                ),
+            },
+            {
+                "path": "billing.adapters.repo",
+                "file_path": source_dir / "billing" / "adapters" / "repo.py",
+                "imports": {"billing.ports.repo"},
+                "passport": make_passport(
+                    layer=LayerEnum.ADAPTERS, component_type=AdapterType.REPOSITORY
+                ),
+            },
+            {
+                "path": "billing.domain.invoice",
+                "file_path": source_dir / "billing" / "domain" / "invoice.py",
+            },
+        ]
+    )
+    graph.add_node("loose", file_path=None, content="print(1)")
+    graph.nodes["billing.domain.invoice"].content = "class Invoice: ..."
+    return graph
+
+
+@pytest.fixture
+def db_path(store, graph, source_dir, tmp_path):
+    path = tmp_path / "graph.sqlite"
+    store.save(graph, path, source_dir, scan_all=False, include_content=True)
+    return path
+
+
+# --- TESTS ---
+class TestRoundTrip:
+    def test_load_restores_graph(self, store, graph, db_path):
+        info, loaded = store.load(db_path)
+
+        assert (info.node_count, info.edge_count) == (4, 3)
+        assert info.has_content and not info.scan_all
+        for path, node in graph.nodes.items():
+            restored = loaded.nodes[path]
+            assert restored.imports == node.imports
+            assert restored.passport_id == node.passport_id
+            assert restored.status == node.status
+            assert restored.file_path == node.file_path
+            assert restored.content == node.content
+        assert loaded.nodes["billing.adapters.repo"].passport.component_type is (
+            AdapterType.REPOSITORY
+        )
+
+    def test_tables_are_plain_sql(self, db_path):
+        with sqlite3.connect(db_path) as connection:
+            rows = connection.execute(
+                "SELECT n.path FROM edges e JOIN nodes n ON n.id = e.source_id "
+                "WHERE e.target_path = 'external.lib'"
+            ).fetchall()
+
+        assert rows == [("billing.ports.repo",)]
+
+
+class TestLazyView:
+    def test_iteration_streams_nodes_with_their_edges(self, store, graph, db_path):
+        with store.open_view(db_path) as view:
+            assert isinstance(view, SqliteCodeGraph)
+            streamed = {node.path: node.imports for node in view.nodes.values()}
+
+            assert streamed == {path: node.imports for path, node in graph.nodes.items()}
+            assert len(view.nodes) == 4
+            assert "loose" in view.nodes and "external.lib" not in view.nodes
+            assert view.get_node("external.lib") is None
+
+    def test_index_queries_run_in_sql(self, store, db_path, source_dir):
+        with store.open_view(db_path) as view:
+            assert view.nodes_in_layer(LayerEnum.PORTS) == {"billing.ports.repo"}
+            assert view.nodes_with_direction(DirectionEnum.DRIVEN) == {"billing.ports.repo"}
+            assert view.nodes_of_type(AdapterType.REPOSITORY) == {"billing.adapters.repo"}
+            assert view.nodes_in_context("billing") == {
+                "billing.ports.repo",
+                "billing.adapters.repo",
+                "billing.domain.invoice",
+            }
+            assert view.importers_of("billing.ports.repo") == {"billing.adapters.repo"}
+            assert view.nodes_under(source_dir / "billing" / "ports") == {"billing.ports.repo"}
+            assert view.count_by_status(NodeStatus.CLASSIFIED) == 3
+            assert view.classified_count == 3
+
+    def test_reachable_walks_both_directions(self, store, db_path):
+        with store.open_view(db_path) as view:
+            assert view.reachable({"billing.adapters.repo"}, 1) == {
+                "billing.adapters.repo",
+                "billing.ports.repo",
+            }
+            assert view.reachable({"billing.adapters.repo"}, 5) == {
+                "billing.adapters.repo",
+                "billing.ports.repo",
+                "billing.domain.invoice",
+                "external.lib",
+            }
+            assert view.reachable({"billing.domain.invoice"}, 5, upstream=True) == {
+                "billing.domain.invoice",
+                "billing.ports.repo",
+                "billing.adapters.repo",
+            }
+
+
+class TestViolations:
+    def test_each_run_replaces_previous_results(self, store, db_path):
+        record = ViolationRecordVo(
+            rule_name="Domain Purity",
+            severity="error",
+            source_path="billing.domain.invoice",
+            target_path="billing.ports.repo",
+            target_context="billing",
+            message="Domain cannot import Ports",
+        )
+
+        assert store.save_violations(db_path, [record, record]) is True
+        assert store.save_violations(db_path, [record]) is True
+
+        with sqlite3.connect(db_path) as connection:
+            rows = connection.execute("SELECT rule_name, source_path FROM violations").fetchall()
+        assert rows == [("Domain Purity", "billing.domain.invoice")]
+
+
+class TestRouter:
+    @pytest.fixture
+    def router(self, store) -> SnapshotStoreRouter:
+        return SnapshotStoreRouter(binary_store=BinarySnapshotStore(), sqlite_store=store)
+
+    def test_suffix_picks_format_and_header_picks_reader(self, router, graph, source_dir, tmp_path):
+        binary, database = tmp_path / "graph.snapshot", tmp_path / "graph.db"
+        router.save(graph, binary, source_dir, scan_all=False, include_content=False)
+        router.save(graph, database, source_dir, scan_all=False, include_content=False)
+
+        assert database.read_bytes().startswith(b"SQLite format 3")
+        assert not binary.read_bytes().startswith(b"SQLite format 3")
+        # A renamed database is still recognised by its header
+        renamed = database.rename(tmp_path / "graph.bin")
+        assert set(router.load(renamed)[1].nodes) == set(router.load(binary)[1].nodes)
+        assert router.save_violations(renamed, []) is True
+        assert router.save_violations(binary, []) is False
+
+
+class TestRejectsBadFiles:
+    def test_schema_version_mismatch(self, store, db_path):
+        with sqlite3.connect(db_path) as connection:
+            connection.execute("PRAGMA user_version = 99")
+
+        with pytest.raises(SnapshotError, match="Unsupported graph database schema 99"):
+            store.open_view(db_path)
+
+    def test_missing_file(self, store, tmp_path):
+        with pytest.raises(SnapshotError, match="not a file"):
+            store.open_view(tmp_path / "absent.sqlite")
@@ -0,0 +1,25 @@
+import pytest
+
+from dddguard.scanner.ports.driven.storage.graph_codec import (
+    component_type_from_key,
+    enum_from_key,
+    enum_key,
+)
+from dddguard.shared.domain import AdapterType, LayerEnum, PortType, ScopeEnum
+
+
+class TestEnumKeys:
+    def test_round_trip(self):
+        assert enum_from_key(enum_key(LayerEnum.DOMAIN), LayerEnum) is LayerEnum.DOMAIN
+        assert component_type_from_key(enum_key(PortType.REPOSITORY)) is PortType.REPOSITORY
+        assert component_type_from_key(enum_key(AdapterType.REPOSITORY)) is (AdapterType.REPOSITORY)
+
+    @pytest.mark.parametrize("key", [None, enum_key(LayerEnum.DOMAIN)])
+    def test_rejects_missing_or_foreign_values(self, key):
+        with pytest.raises(KeyError):
+            enum_from_key(key, ScopeEnum)
+
+    @pytest.mark.parametrize("key", [None, enum_key(LayerEnum.DOMAIN)])
+    def test_rejects_non_component_types(self, key):
+        with pytest.raises(KeyError):
+            component_type_from_key(key)
@@ -2,7 +2,9 @@ from dataclasses import dataclass, field
 
 import pytest
 
+from dddguard.scanner.domain import ExpansionDirection
 from dddguard.scanner.domain.graph_expansion_service import GraphExpansionService
+from dddguard.shared.domain import CodeGraph, CsrAdjacency
 
 # --- MOCKS ---
 
@@ -117,3 +119,62 @@ class TestGraphExpansionService:
         # A imports B. B not in visited. Add B to visible. Queue B.
         # Pop B. Lookup B -> None. Continue.
         assert "B" in result
+
+    def test_csr_matches_dict_walk_on_dangling_edges(self, service):
+        graph = MockGraph(nodes={"A": MockNode(imports={"B"})})
+
+        result = service.expand(CsrAdjacency.from_graph(graph), {"A"}, depth=1)
+
+        assert result == service.expand(graph, {"A"}, depth=1) == {"A", "B"}
+
+
+class TestExpansionDirections:
+    """
+    Chain: A -> B -> C -> D (A imports B, ...). Seed: C.
+    """
+
+    @pytest.fixture
+    def mock_graph(self) -> MockGraph:
+        return MockGraph(
+            nodes={
+                "A": MockNode(imports={"B"}),
+                "B": MockNode(imports={"C"}),
+                "C": MockNode(imports={"D"}),
+                "D": MockNode(imports=set()),
+            }
+        )
+
+    @pytest.fixture
+    def code_graph(self, mock_graph) -> CodeGraph:
+        graph = CodeGraph()
+        for path, node in mock_graph.nodes.items():
+            graph.add_node(path).link_imports(list(node.imports))
+        return graph
+
+    @pytest.mark.parametrize(
+        ("direction", "depth", "expected"),
+        [
+            (ExpansionDirection.DOWNSTREAM, 1, {"C", "D"}),
+            (ExpansionDirection.UPSTREAM, 1, {"B", "C"}),
+            (ExpansionDirection.UPSTREAM, 5, {"A", "B", "C"}),
+            (ExpansionDirection.BOTH, 1, {"B", "C", "D"}),
+        ],
+    )
+    def test_direction(self, mock_graph, code_graph, direction, depth, expected):
+        # Reverse index, one-off reverse map and CSR frontier expansion all agree
+        for graph in (code_graph, mock_graph, CsrAdjacency.from_graph(code_graph)):
+            result = GraphExpansionService.expand(graph, {"C"}, depth=depth, direction=direction)
+            assert result == expected
+
+    def test_both_does_not_mix_directions(self):
+        """Siblings sharing an import are not dependents or dependencies of each other."""
+        graph = CodeGraph()
+        graph.add_node("X").link_imports(["common"])
+        graph.add_node("Y").link_imports(["common"])
+        graph.add_node("common").link_imports([])
+
+        result = GraphExpansionService.expand(
+            graph, {"X"}, depth=3, direction=ExpansionDirection.BOTH
+        )
+
+        assert result == {"X", "common"}
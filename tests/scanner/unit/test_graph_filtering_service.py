@@ -6,10 +6,12 @@ import pytest
 from dddguard.scanner.domain.graph_filtering_service import GraphFilteringService
 from dddguard.shared.domain import (
     ArchetypeType,
+    CodeGraph,
     ComponentPassport,
     LayerEnum,
     ScopeEnum,
 )
+from tests.scanner.conftest import make_passport
 
 # --- MOCKS ---
 
@@ -180,3 +182,67 @@ class TestGraphFilteringService:
 
         # "assets.data" is hidden because its type is ASSET
         assert "assets.data" not in result
+
+
+class TestIndexedFocusMatchesScan:
+    """
+    A real CodeGraph is filtered through its secondary indexes; a plain
+    graph-like object falls back to the per-node scan. Both must agree.
+    """
+
+    @pytest.fixture
+    def graph(self, tmp_path) -> CodeGraph:
+        specs = [
+            ("billing.domain.model", "src/billing/domain/model.py", "billing", LayerEnum.DOMAIN),
+            ("billing.app.service", "src/billing/app/service.py", "billing", LayerEnum.APP),
+            ("ordering.domain.model", "src/ordering/domain/model.py", "ordering", LayerEnum.DOMAIN),
+            ("shared.kernel", "src/shared/kernel.py", "shared", LayerEnum.DOMAIN),
+            ("billing2.app.x", "src/billing2/app/x.py", "billing2", LayerEnum.APP),
+        ]
+        graph = CodeGraph()
+        for path, rel, ctx, layer in specs:
+            node = graph.add_node(path, file_path=tmp_path / rel)
+            node.link_imports([])
+            node.classify(make_passport(context_name=ctx, layer=layer))
+
+        asset = graph.add_node("assets.data", file_path=tmp_path / "src/assets/data.json")
+        asset.link_imports([])
+        asset.classify(
+            make_passport(
+                context_name="assets",
+                layer=LayerEnum.UNDEFINED,
+                component_type=ArchetypeType.ASSET,
+            )
+        )
+        # Unclassified nodes never survive
+        graph.add_node("billing.raw", file_path=tmp_path / "src/billing/raw.py")
+        return graph
+
+    @pytest.mark.parametrize(
+        ("focus", "layers", "contexts", "assets"),
+        [
+            ("src", None, None, True),
+            ("src", None, None, False),
+            ("src/billing", None, None, True),  # String prefix also matches src/billing2
+            ("src/billing/domain", None, None, True),
+            ("src/billing", ["APP"], None, True),
+            ("src/billing", None, ["shared"], True),
+            ("src", ["DOMAIN"], ["billing", "ordering"], True),
+            ("src/ordering", None, ["assets"], False),
+            ("elsewhere", None, None, True),
+        ],
+    )
+    def test_same_result_as_scan(self, graph, tmp_path, focus, layers, contexts, assets):
+        kwargs = dict(
+            focus_path=tmp_path / focus,
+            whitelist_layers=layers,
+            whitelist_contexts=contexts,
+            include_assets=assets,
+        )
+
+        indexed = GraphFilteringService.determine_initial_focus(graph=graph, **kwargs)
+        scanned = GraphFilteringService.determine_initial_focus(
+            graph=MockGraph(nodes=dict(graph.nodes)), **kwargs
+        )
+
+        assert indexed == scanned
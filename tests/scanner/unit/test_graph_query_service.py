@@ -0,0 +1,152 @@
+import pytest
+
+from dddguard.scanner.domain import GraphQueryService, QuerySyntaxError
+from dddguard.shared.domain import (
+    AdapterType,
+    AppType,
+    DirectionEnum,
+    DomainType,
+    LayerEnum,
+    PortType,
+)
+from tests.scanner.conftest import make_classified_graph, make_passport
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def graph():
+    """
+    billing.app.uc -> billing.domain.order, billing.adapters.repo
+    billing.adapters.repo -> billing.ports.repo
+    billing.ports.repo -> shipping.app.api -> shipping.domain.parcel
+    """
+
+    def spec(path, layer, component_type, imports=(), direction=DirectionEnum.NONE):
+        return {
+            "path": path,
+            "imports": set(imports),
+            "passport": make_passport(
+                context_name=path.split(".")[0],
+                layer=layer,
+                component_type=component_type,
+                direction=direction,
+            ),
+        }
+
+    return make_classified_graph(
+        [
+            spec(
+                "billing.app.uc",
+                LayerEnum.APP,
+                AppType.USE_CASE,
+                {"billing.domain.order", "billing.adapters.repo", "external.lib"},
+            ),
+            spec("billing.domain.order", LayerEnum.DOMAIN, DomainType.ENTITY),
+            spec(
+                "billing.adapters.repo",
+                LayerEnum.ADAPTERS,
+                AdapterType.REPOSITORY,
+                {"billing.ports.repo"},
+                direction=DirectionEnum.DRIVEN,
+            ),
+            spec(
+                "billing.ports.repo",
+                LayerEnum.PORTS,
+                PortType.REPOSITORY,
+                {"shipping.app.api"},
+                direction=DirectionEnum.DRIVEN,
+            ),
+            spec("shipping.app.api", LayerEnum.APP, AppType.USE_CASE, {"shipping.domain.parcel"}),
+            spec("shipping.domain.parcel", LayerEnum.DOMAIN, DomainType.ENTITY),
+        ]
+    )
+
+
+def paths_of(result) -> list[str]:
+    return [row[0] for row in result.rows]
+
+
+# --- TESTS ---
+class TestNodeQueries:
+    def test_attribute_and_edge_predicates(self, graph):
+        result = GraphQueryService.execute(
+            graph, "nodes where context = billing and layer = app and imports(layer = adapters)"
+        )
+
+        assert result.columns[0] == "path"
+        assert result.rows == (("billing.app.uc", "billing", "APP", "NONE", "USE_CASE"),)
+
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [
+            ("nodes where layer in (app, domain) and context != billing", ["shipping.app.api", "shipping.domain.parcel"]),
+            ("nodes where path = 'billing.*.repo'", ["billing.adapters.repo", "billing.ports.repo"]),
+            ("nodes where type = repository and direction = driven", ["billing.adapters.repo", "billing.ports.repo"]),
+            ("nodes where imported_by(context = billing) and not context = billing", ["shipping.app.api"]),
+            ("nodes where not (layer = domain or layer = app) and path = billing.*", ["billing.adapters.repo", "billing.ports.repo"]),
+            ("nodes where context = billing and reaches(layer = domain and context = shipping)", ["billing.adapters.repo", "billing.app.uc", "billing.ports.repo"]),
+            ("nodes where reached_by(path = billing.adapters.repo)", ["billing.ports.repo", "shipping.app.api", "shipping.domain.parcel"]),
+            ("nodes where layer = domain and reaches(layer = adapters)", []),
+        ],
+    )  # fmt: skip
+    def test_expressions(self, graph, query, expected):
+        assert paths_of(GraphQueryService.execute(graph, query)) == expected
+
+    def test_limit_keeps_total(self, graph):
+        result = GraphQueryService.execute(graph, "NODES LIMIT 2")
+
+        assert len(result.rows) == 2
+        assert result.total == 6
+
+
+class TestEdgeAndPathQueries:
+    def test_edges_between_layers(self, graph):
+        result = GraphQueryService.execute(graph, "edges from layer = app to layer = domain")
+
+        assert [(row[0], row[2]) for row in result.rows] == [
+            ("billing.app.uc", "billing.domain.order"),
+            ("shipping.app.api", "shipping.domain.parcel"),
+        ]
+
+    def test_paths_respect_length_bounds(self, graph):
+        result = GraphQueryService.execute(
+            graph, "paths from context = billing to context = shipping min 3"
+        )
+
+        assert [(row[0], row[1], row[2]) for row in result.rows] == [
+            ("billing.adapters.repo", "shipping.domain.parcel", "3"),
+            ("billing.app.uc", "shipping.app.api", "3"),
+            ("billing.app.uc", "shipping.domain.parcel", "4"),
+        ]
+        assert result.rows[2][3] == (
+            "billing.app.uc -> billing.adapters.repo -> billing.ports.repo"
+            " -> shipping.app.api -> shipping.domain.parcel"
+        )
+
+    def test_paths_are_found_from_either_side(self, graph):
+        # One target, many sources: searched backwards over the importers index
+        result = GraphQueryService.execute(
+            graph,
+            "paths from not path = shipping.domain.parcel to path = shipping.domain.parcel max 2",
+        )
+
+        assert [row[0] for row in result.rows] == ["billing.ports.repo", "shipping.app.api"]
+
+
+class TestQueryErrors:
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "",
+            "modules where layer = app",
+            "nodes where colour = red",
+            "nodes where layer = kitchen",
+            "nodes where layer = app and",
+            "paths from layer = app",
+            "paths from layer = app to layer = domain min 3 max 2",
+            "nodes limit many",
+        ],
+    )
+    def test_invalid_queries_raise(self, graph, query):
+        with pytest.raises(QuerySyntaxError):
+            GraphQueryService.execute(graph, query)
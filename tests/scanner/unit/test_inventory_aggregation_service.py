@@ -0,0 +1,45 @@
+from pathlib import Path
+
+from dddguard.scanner.domain import InventoryAggregationService
+from dddguard.shared.domain import LayerEnum, ScopeEnum
+from tests.scanner.conftest import make_classified_graph, make_passport
+
+
+class TestInventoryAggregationService:
+    def test_groups_by_context_with_layers_and_counts(self):
+        graph = make_classified_graph(
+            [
+                {"path": "billing.domain.a", "passport": make_passport(context_name="billing")},
+                {
+                    "path": "billing.app.b",
+                    "passport": make_passport(context_name="billing", layer=LayerEnum.APP),
+                },
+                {
+                    "path": "orders.domain.c",
+                    "passport": make_passport(context_name="orders", macro_zone="sales"),
+                },
+                {
+                    "path": "shared.x",
+                    "passport": make_passport(
+                        context_name="shared", scope=ScopeEnum.SHARED, layer=LayerEnum.GLOBAL
+                    ),
+                },
+                {"path": "unknown", "passport": make_passport(context_name=None)},
+            ]
+        )
+
+        inventory = InventoryAggregationService.build(
+            graph=graph, source_dir=Path("/src"), fingerprint="fp"
+        )
+
+        assert inventory.fingerprint == "fp"
+        assert inventory.context_names == ["shared", "billing", "orders"]
+
+        billing = inventory.contexts[1]
+        assert billing.layers == ("APP", "DOMAIN")
+        assert billing.node_count == 2
+
+        # GLOBAL/UNDEFINED are not selectable layers
+        assert inventory.contexts[0].layers == ()
+        assert inventory.macro_zones == ["sales"]
+        assert inventory.layers == ["APP", "DOMAIN"]
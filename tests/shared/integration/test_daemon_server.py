@@ -0,0 +1,152 @@
+import socket
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from dddguard.shared.adapters.driving.daemon import (
+    DaemonClient,
+    DaemonServer,
+    RemoteCallError,
+    RemoteFacade,
+    daemon_supported,
+    is_trusted_socket,
+)
+from dddguard.shared.helpers.generics import GenericAppError
+
+pytestmark = pytest.mark.skipif(not daemon_supported(), reason="needs AF_UNIX sockets")
+
+
+@dataclass(frozen=True, kw_only=True)
+class _Report:
+    target: Path
+    count: int
+
+
+class _FakeFacade:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.config = "local-config"
+
+    def lint_project(self, path: Path | None = None) -> _Report:
+        self.calls += 1
+        return _Report(target=path or Path("/default"), count=self.calls)
+
+    def explode(self) -> _Report:
+        raise GenericAppError(message="boom", context_name="Linter")
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def socket_path():
+    # AF_UNIX paths are limited to ~100 bytes: keep it short
+    with tempfile.TemporaryDirectory(prefix="dg") as directory:
+        yield Path(directory) / "d.sock"
+
+
+@pytest.fixture
+def served(socket_path):
+    built: list[_FakeFacade] = []
+    stamp = {"value": 1}
+
+    def build_services():
+        built.append(_FakeFacade())
+        return {"linter": built[-1]}
+
+    server = DaemonServer(
+        socket_path=socket_path,
+        build_services=build_services,
+        methods={"linter": frozenset({"lint_project", "explode"})},
+        reload_stamp=lambda: stamp["value"],
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    client = DaemonClient(socket_path)
+    for _ in range(200):
+        if client.ping() is not None:
+            break
+        threading.Event().wait(0.01)
+
+    yield client, built, stamp
+
+    client.close()
+    server.shutdown()
+    thread.join(timeout=5)
+
+
+# --- TESTS ---
+
+
+def test_calls_share_one_warm_facade(served):
+    client, built, _ = served
+    remote = RemoteFacade(_FakeFacade(), client, "linter", frozenset({"lint_project"}))
+
+    first = remote.lint_project(Path("src"))
+    second = remote.lint_project()
+
+    assert first == _Report(target=Path("src").absolute(), count=1)
+    assert second.count == 2
+    assert len(built) == 1
+    assert remote.config == "local-config"  # Not served: read from the local facade
+
+
+def test_stamp_change_rebuilds_services(served):
+    client, built, stamp = served
+
+    client.call("linter.lint_project")
+    stamp["value"] = 2
+    result = client.call("linter.lint_project")
+
+    assert len(built) == 2
+    assert result["count"] == 1
+
+
+def test_errors_keep_context_and_layer(served):
+    client, _, _ = served
+
+    with pytest.raises(RemoteCallError) as excinfo:
+        client.call("linter.explode")
+
+    assert excinfo.value.context_name == "Linter"
+    assert excinfo.value.layer_title == GenericAppError(message="", context_name="").layer_title
+    assert excinfo.value.message == "boom"
+
+
+def test_unknown_method_is_rejected(served):
+    client, _, _ = served
+
+    with pytest.raises(RemoteCallError, match="Unknown method"):
+        client.call("linter.config")
+
+
+def test_remote_facade_falls_back_when_daemon_is_gone(tmp_path):
+    local = _FakeFacade()
+    client = DaemonClient(tmp_path / "missing.sock")
+    remote = RemoteFacade(local, client, "linter", frozenset({"lint_project"}))
+
+    assert remote.lint_project().count == 1
+    assert local.calls == 1
+    assert client.ping() is None
+
+
+def test_socket_is_owner_only_and_trusted(served, socket_path):
+    assert socket_path.stat().st_mode & 0o777 == 0o600
+    assert is_trusted_socket(socket_path)
+
+
+def test_shared_directory_is_refused(socket_path):
+    directory = socket_path.parent
+    directory.chmod(0o777)  # e.g. pre-created by another user in the temp dir
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as impostor:
+        impostor.bind(str(socket_path))
+
+        assert not is_trusted_socket(socket_path)
+        server = DaemonServer(
+            socket_path=socket_path,
+            build_services=lambda: {"linter": _FakeFacade()},
+            methods={"linter": frozenset({"lint_project"})},
+        )
+        with pytest.raises(PermissionError):
+            server.serve_forever()
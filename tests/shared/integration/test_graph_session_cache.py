@@ -0,0 +1,105 @@
+import os
+
+import pytest
+
+from dddguard.shared.adapters.driven.graph_session_cache import GraphSessionCache
+from dddguard.shared.domain import CodeGraph, NodeStatus, ScannerConfig
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def source_dir(tmp_path):
+    src = tmp_path / "src"
+    (src / "billing").mkdir(parents=True)
+    (src / "billing" / "order.py").write_text("x = 1")
+    (src / "README.md").write_text("# docs")
+    return src
+
+
+@pytest.fixture
+def scanner_config() -> ScannerConfig:
+    return ScannerConfig()
+
+
+class _CountingBuilder:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self) -> CodeGraph:
+        self.calls += 1
+        graph = CodeGraph()
+        graph.add_node("billing.order").link_imports(["billing.other"])
+        return graph
+
+
+def _touch(path, content):
+    path.write_text(content)
+    future = path.stat().st_mtime + 10
+    os.utime(path, (future, future))
+
+
+# --- TESTS ---
+
+
+def test_hit_returns_independent_copies(source_dir, scanner_config):
+    cache = GraphSessionCache()
+    build = _CountingBuilder()
+
+    first = cache.get_or_build(source_dir, False, scanner_config, build)
+    first.nodes["billing.order"].imports |= {"mutated"}
+    second = cache.get_or_build(source_dir, False, scanner_config, build)
+
+    assert build.calls == 1
+    assert second is not first
+    assert second.nodes["billing.order"].imports == {"billing.other"}
+    assert second.nodes["billing.order"].status == NodeStatus.LINKED
+
+
+def test_source_change_invalidates(source_dir, scanner_config):
+    cache = GraphSessionCache()
+    build = _CountingBuilder()
+
+    cache.get_or_build(source_dir, False, scanner_config, build)
+    _touch(source_dir / "billing" / "order.py", "x = 22")
+    cache.get_or_build(source_dir, False, scanner_config, build)
+
+    assert build.calls == 2
+
+
+def test_non_python_change_only_matters_in_scan_all_mode(source_dir, scanner_config):
+    cache = GraphSessionCache()
+    strict, full = _CountingBuilder(), _CountingBuilder()
+
+    cache.get_or_build(source_dir, False, scanner_config, strict)
+    cache.get_or_build(source_dir, True, scanner_config, full)
+    _touch(source_dir / "README.md", "# changed docs")
+    cache.get_or_build(source_dir, False, scanner_config, strict)
+    cache.get_or_build(source_dir, True, scanner_config, full)
+
+    assert strict.calls == 1
+    assert full.calls == 2
+
+
+def test_lru_eviction(tmp_path, scanner_config):
+    cache = GraphSessionCache(max_entries=1)
+    build = _CountingBuilder()
+    a, b = tmp_path / "a", tmp_path / "b"
+    a.mkdir()
+    b.mkdir()
+
+    cache.get_or_build(a, False, scanner_config, build)
+    cache.get_or_build(b, False, scanner_config, build)
+    cache.get_or_build(a, False, scanner_config, build)
+
+    assert build.calls == 3
+
+
+def test_peek_never_builds(source_dir, scanner_config):
+    cache = GraphSessionCache()
+    assert cache.peek(source_dir, False, scanner_config) is None
+
+    cache.get_or_build(source_dir, False, scanner_config, _CountingBuilder())
+    assert "billing.order" in cache.peek(source_dir, False, scanner_config).nodes
+
+    _touch(source_dir / "billing" / "order.py", "x = 2")
+    assert cache.peek(source_dir, False, scanner_config) is None
@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from dddguard.scanner.domain import ExpansionDirection, GraphExpansionService
+from dddguard.shared.domain import CodeGraph, CsrAdjacency, csr_adjacency_vo
+
+
+def _graph(edges: dict[str, list[str]]) -> CodeGraph:
+    graph = CodeGraph()
+    for path, imports in edges.items():
+        graph.add_node(path).link_imports(imports)
+    return graph
+
+
+@pytest.fixture(params=["pure", "numpy"])
+def backend(request, monkeypatch):
+    if request.param == "pure":
+        monkeypatch.setattr(csr_adjacency_vo, "_numpy_available", lambda: False)
+    else:
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(csr_adjacency_vo, "_numpy_available", lambda: True)
+    return request.param
+
+
+class TestCsrLayout:
+    def test_ids_follow_sorted_paths_and_rows_hold_neighbours(self):
+        csr = CsrAdjacency.from_graph(_graph({"b": ["a", "c"], "a": [], "c": ["a"]}))
+
+        assert csr.paths == ("a", "b", "c")
+        assert (csr.node_count, csr.edge_count) == (3, 3)
+        assert list(csr.offsets) == [0, 0, 2, 3]
+        assert list(csr.imports_of(csr.ids["b"])) == [0, 2]
+        assert sorted(csr.path_of(i) for i in csr.importers_of(csr.ids["a"])) == ["b", "c"]
+
+    def test_dangling_targets_get_ids_without_edges(self):
+        csr = CsrAdjacency.from_graph(_graph({"a": ["ext"]}))
+
+        assert csr.id_of("ext") == 1
+        assert list(csr.imports_of(1)) == []
+        assert csr.id_of("missing") is None
+
+    def test_snapshot_is_read_only(self):
+        csr = CsrAdjacency.from_graph(_graph({"a": ["b"], "b": []}))
+
+        with pytest.raises(TypeError):
+            csr.targets[0] = 1
+
+
+class TestCsrReach:
+    def test_depth_limits_levels(self, backend):
+        csr = CsrAdjacency.from_graph(_graph({"a": ["b"], "b": ["c"], "c": ["d"], "d": []}))
+
+        assert csr.reach_paths({"a"}, 2) == {"a", "b", "c"}
+        assert csr.reach_paths({"d"}, 2, upstream=True) == {"b", "c", "d"}
+        assert csr.reach_paths({"a"}, 0) == {"a"}
+
+    def test_cycles_and_unknown_seeds(self, backend):
+        csr = CsrAdjacency.from_graph(_graph({"a": ["b"], "b": ["a"]}))
+
+        assert csr.reach_paths({"a", "ghost"}, 10) == {"a", "b", "ghost"}
+        assert csr.reach([], 3) == []
+
+    def test_matches_budgeted_bfs_on_random_graphs(self, backend):
+        rng = random.Random(7)
+        paths = [f"m{i}" for i in range(60)]
+        graph = _graph({p: rng.sample(paths, rng.randint(0, 4)) for p in paths})
+        csr = CsrAdjacency.from_graph(graph)
+
+        for _ in range(20):
+            seeds = set(rng.sample(paths, 3))
+            depth = rng.randint(1, 4)
+            for direction in ExpansionDirection:
+                assert GraphExpansionService.expand(
+                    csr, seeds, depth, direction
+                ) == GraphExpansionService.expand(graph, seeds, depth, direction)
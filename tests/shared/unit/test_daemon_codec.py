@@ -0,0 +1,121 @@
+import io
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from dddguard.shared.adapters.driving.daemon.protocol import (
+    decode,
+    encode,
+    ensure_private_dir,
+    is_trusted_socket,
+    read_message,
+    socket_path_for,
+)
+from dddguard.shared.domain import (
+    AdapterType,
+    CodeGraph,
+    ComponentPassport,
+    ComponentType,
+    LayerEnum,
+    NodeStatus,
+    PortType,
+)
+from tests.scanner.conftest import make_classified_graph, make_passport
+
+
+@dataclass(frozen=True, kw_only=True)
+class _Row:
+    name: str
+    kind: ComponentType
+    tags: tuple[str, ...] = ()
+    where: Path | None = None
+
+
+def _round_trip(value, hint):
+    return decode(hint, json.loads(json.dumps(encode(value, hint))))
+
+
+# --- TESTS ---
+
+
+@pytest.mark.parametrize("kind", [PortType.REPOSITORY, AdapterType.REPOSITORY])
+def test_union_enum_keeps_its_member(kind):
+    # Both members are "repository": only the tag tells them apart
+    row = _Row(name="repo", kind=kind, tags=("a", "b"), where=Path("src/repo.py"))
+
+    restored = _round_trip(row, _Row)
+
+    assert restored.kind is kind
+    assert restored.tags == ("a", "b")
+    assert restored.where == Path("src/repo.py").absolute()
+
+
+def test_graph_round_trip_keeps_nodes_and_passports():
+    graph = make_classified_graph(
+        [
+            {
+                "path": "billing.ports.repo",
+                "imports": {"billing.domain.order"},
+                "passport": make_passport(
+                    layer=LayerEnum.PORTS, component_type=PortType.REPOSITORY
+                ),
+            },
+            {"path": "billing.domain.order"},
+        ]
+    )
+
+    restored = _round_trip(graph, CodeGraph)
+
+    node = restored.nodes["billing.ports.repo"]
+    assert node.status is NodeStatus.CLASSIFIED
+    assert node.imports == {"billing.domain.order"}
+    assert node.passport == graph.nodes["billing.ports.repo"].passport
+    assert restored.nodes_in_layer(LayerEnum.PORTS) == {"billing.ports.repo"}
+
+
+def test_optional_and_collections():
+    hint = dict[str, list[ComponentPassport]] | None
+
+    assert _round_trip(None, hint) is None
+    assert _round_trip({"x": [make_passport()]}, hint) == {"x": [make_passport()]}
+
+
+def test_socket_path_is_stable_per_project(tmp_path):
+    first = socket_path_for(tmp_path)
+
+    assert first == socket_path_for(tmp_path)
+    assert first != socket_path_for(tmp_path / "other")
+    assert first.suffix == ".sock"
+    assert first.parent.name.startswith("dddguard-")
+
+
+def test_private_dir_is_created_owner_only(tmp_path):
+    directory = tmp_path / "sockets"
+    ensure_private_dir(directory)
+
+    assert directory.stat().st_mode & 0o777 == 0o700
+    ensure_private_dir(directory)  # Reusing our own directory is fine
+
+    directory.chmod(0o755)
+    with pytest.raises(PermissionError):
+        ensure_private_dir(directory)
+
+
+def test_only_sockets_in_private_dirs_are_trusted(tmp_path):
+    directory = tmp_path / "sockets"
+    ensure_private_dir(directory)
+    (directory / "plain.sock").write_text("")
+
+    assert not is_trusted_socket(directory / "plain.sock")  # Not a socket
+    assert not is_trusted_socket(directory / "missing.sock")
+
+
+def test_read_message_framing():
+    stream = io.BytesIO(b'{"id": 1}\n[1, 2]\n')
+
+    assert read_message(stream) == {"id": 1}
+    with pytest.raises(ValueError, match="not a JSON object"):
+        read_message(stream)
+    assert read_message(stream) is None
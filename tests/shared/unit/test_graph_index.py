@@ -0,0 +1,197 @@
+import pickle
+from pathlib import Path
+
+from dddguard.shared.domain import (
+    ArchetypeType,
+    CodeGraph,
+    CodeNode,
+    ComponentPassport,
+    DirectionEnum,
+    LayerEnum,
+    MatchMethod,
+    NodeStatus,
+    ScopeEnum,
+)
+
+
+def _passport(context: str | None = "billing", **overrides) -> ComponentPassport:
+    fields = dict(
+        scope=ScopeEnum.CONTEXT,
+        context_name=context,
+        macro_zone=None,
+        layer=LayerEnum.DOMAIN,
+        direction=DirectionEnum.NONE,
+        component_type=ArchetypeType.UNKNOWN,
+        match_method=MatchMethod.STRUCTURAL,
+    )
+    fields.update(overrides)
+    return ComponentPassport(**fields)
+
+
+def _classified(graph: CodeGraph, path: str, passport: ComponentPassport, file_path=None):
+    node = graph.add_node(path, file_path=file_path)
+    node.link_imports([])
+    node.classify(passport)
+    return node
+
+
+class TestGraphIndexMaintenance:
+    def test_classify_populates_attribute_indexes(self):
+        graph = CodeGraph()
+        _classified(graph, "billing.app.x", _passport(layer=LayerEnum.APP))
+        _classified(
+            graph,
+            "shared.y",
+            _passport("shared", scope=ScopeEnum.SHARED, direction=DirectionEnum.DRIVEN),
+        )
+
+        assert graph.nodes_in_context("billing") == {"billing.app.x"}
+        assert graph.nodes_in_layer(LayerEnum.APP) == {"billing.app.x"}
+        assert graph.nodes_in_scope(ScopeEnum.SHARED) == {"shared.y"}
+        assert graph.nodes_with_direction(DirectionEnum.DRIVEN) == {"shared.y"}
+        assert graph.nodes_in_context("nope") == set()
+
+    def test_reclassification_moves_node_between_groups(self):
+        graph = CodeGraph()
+        node = _classified(graph, "a", _passport("billing"))
+
+        node.passport = _passport("ordering")
+
+        assert graph.nodes_in_context("billing") == set()
+        assert graph.nodes_in_context("ordering") == {"a"}
+
+    def test_status_counters_follow_transitions(self):
+        graph = CodeGraph()
+        graph.add_node("raw")
+        node = _classified(graph, "a", _passport())
+
+        assert graph.count_by_status(NodeStatus.DETECTED) == 1
+        assert graph.classified_count == 1
+
+        node.finalize()
+
+        assert graph.count_by_status(NodeStatus.FINALIZED) == 1
+        assert graph.classified_count == 1
+        assert graph.coverage_percent == 50.0
+
+    def test_direct_insertion_and_removal_are_indexed(self):
+        graph = CodeGraph()
+        node = CodeNode(path="a")
+        node.passport = _passport("billing")
+
+        graph.nodes["a"] = node
+        assert graph.nodes_in_context("billing") == {"a"}
+
+        del graph.nodes["a"]
+        assert graph.nodes_in_context("billing") == set()
+
+        # Detached nodes no longer report to the old index
+        node.passport = _passport("ordering")
+        assert graph.nodes_in_context("ordering") == set()
+
+    def test_constructor_and_fork_build_indexes(self):
+        node = CodeNode(path="a")
+        node.passport = _passport("billing")
+        graph = CodeGraph(nodes={"a": node})
+
+        copy = graph.fork()
+        copy.nodes["a"].passport = _passport("ordering")
+
+        assert graph.nodes_in_context("billing") == {"a"}
+        assert copy.nodes_in_context("ordering") == {"a"}
+
+    def test_constructor_accepts_imports_and_passport(self):
+        node = CodeNode(path="a", imports={"b"}, passport=_passport("billing"))
+        graph = CodeGraph(nodes={"a": node, "b": CodeNode(path="b")})
+
+        assert node.passport == _passport("billing")
+        assert graph.nodes_in_context("billing") == {"a"}
+        assert graph.importers_of("b") == {"a"}
+
+    def test_graph_survives_pickling(self):
+        graph = CodeGraph()
+        _classified(graph, "a", _passport("billing")).imports = {"b"}
+        graph.add_node("b")
+
+        copy = pickle.loads(pickle.dumps(graph))
+        copy.nodes["a"].passport = _passport("ordering")
+
+        assert copy.nodes_in_context("ordering") == {"a"}
+        assert copy.importers_of("b") == {"a"}
+        # The original keeps its own index
+        assert graph.nodes_in_context("billing") == {"a"}
+
+    def test_nodes_of_type(self):
+        graph = CodeGraph()
+        _classified(graph, "asset", _passport(component_type=ArchetypeType.ASSET))
+        _classified(graph, "code", _passport())
+
+        assert graph.nodes_of_type(ArchetypeType.ASSET) == {"asset"}
+
+
+class TestDirectoryIndex:
+    def test_nodes_under_uses_string_prefix_semantics(self, tmp_path: Path):
+        graph = CodeGraph()
+        for path, rel in [
+            ("billing.a", "src/billing/a.py"),
+            ("billing.sub.b", "src/billing/sub/b.py"),
+            ("billing2.c", "src/billing2/c.py"),
+            ("other.d", "src/other/d.py"),
+        ]:
+            graph.add_node(path, file_path=tmp_path / rel)
+        graph.add_node("virtual")  # No file path
+
+        assert graph.nodes_under(tmp_path / "src" / "billing") == {
+            "billing.a",
+            "billing.sub.b",
+            "billing2.c",
+        }
+        assert graph.nodes_under(tmp_path / "src" / "billing" / "a") == {"billing.a"}
+
+    def test_directory_index_is_maintained_after_first_query(self, tmp_path: Path):
+        graph = CodeGraph()
+        graph.add_node("a", file_path=tmp_path / "src" / "a.py")
+        assert graph.nodes_under(tmp_path / "src") == {"a"}
+
+        graph.add_node("b", file_path=tmp_path / "src" / "b.py")
+        del graph.nodes["a"]
+
+        assert graph.nodes_under(tmp_path / "src") == {"b"}
+
+
+class TestImportersIndex:
+    def test_link_imports_maintains_reverse_edges(self):
+        graph = CodeGraph()
+        graph.add_node("a").link_imports(["b", "c"])
+        graph.add_node("d").link_imports(["b"])
+
+        assert graph.importers_of("b") == {"a", "d"}
+        assert graph.importers_of("c") == {"a"}
+
+        # Relinking replaces the old edges
+        graph.nodes["a"].link_imports(["c"])
+        assert graph.importers_of("b") == {"d"}
+
+    def test_assignment_and_removal_update_reverse_edges(self):
+        graph = CodeGraph()
+        node = CodeNode(path="a")
+        node.imports = {"b"}
+        graph.nodes["a"] = node
+
+        assert graph.importers_of("b") == {"a"}
+
+        node.imports = {"c"}
+        assert graph.importers_of("b") == set()
+        assert graph.importers_of("c") == {"a"}
+
+        del graph.nodes["a"]
+        assert graph.importers_of("c") == set()
+
+    def test_imports_cannot_be_mutated_in_place(self):
+        graph = CodeGraph()
+        node = graph.add_node("a")
+        node.link_imports(["b"])
+
+        assert isinstance(node.imports, frozenset)
+        node.imports |= {"c"}
+        assert graph.importers_of("c") == {"a"}
@@ -0,0 +1,98 @@
+import random
+
+from dddguard.shared.domain import CodeGraph, CsrAdjacency, ImportCycleReportVo
+from tests.scanner.conftest import make_passport
+
+
+def _graph(edges: dict[str, list[str]], contexts: bool = False) -> CodeGraph:
+    graph = CodeGraph()
+    for path, imports in edges.items():
+        node = graph.add_node(path)
+        node.link_imports(imports)
+        if contexts:
+            node.passport = make_passport(context_name=path.split(".")[0])
+    return graph
+
+
+def _reference_components(edges: dict[str, list[str]]) -> set[frozenset[str]]:
+    """Mutual reachability by brute force."""
+    nodes = set(edges) | {t for targets in edges.values() for t in targets}
+    reach = {}
+    for start in nodes:
+        seen, stack = {start}, [start]
+        while stack:
+            for target in edges.get(stack.pop(), ()):
+                if target not in seen:
+                    seen.add(target)
+                    stack.append(target)
+        reach[start] = seen
+    return {frozenset(n for n in nodes if n in reach[s] and s in reach[n]) for s in nodes}
+
+
+class TestStronglyConnectedComponents:
+    def test_matches_brute_force_on_random_graphs(self):
+        rng = random.Random(7)
+        for _ in range(50):
+            names = [f"m{i}" for i in range(rng.randint(1, 12))]
+            edges = {n: rng.sample(names, rng.randint(0, min(3, len(names)))) for n in names}
+            csr = CsrAdjacency.from_adjacency(edges)
+
+            found = {
+                frozenset(csr.path_of(i) for i in component)
+                for component in csr.strongly_connected_components()
+            }
+
+            assert found == _reference_components(edges)
+
+    def test_components_come_in_reverse_topological_order(self):
+        csr = CsrAdjacency.from_adjacency({"a": ["b"], "b": ["c"], "c": ["b"]})
+
+        order = [sorted(csr.path_of(i) for i in c) for c in csr.strongly_connected_components()]
+
+        assert order == [["b", "c"], ["a"]]
+
+    def test_deep_chain_does_not_recurse(self):
+        size = 50_000
+        edges = {f"m{i:05}": [f"m{(i + 1) % size:05}"] for i in range(size)}
+
+        components = CsrAdjacency.from_adjacency(edges).strongly_connected_components()
+
+        assert [len(c) for c in components] == [size]
+
+
+class TestImportCycleReport:
+    def test_module_cycles_with_shortest_chain(self):
+        graph = _graph({"a": ["b"], "b": ["c", "a"], "c": ["a"], "d": ["d", "a"]})
+
+        report = ImportCycleReportVo.from_graph(graph)
+
+        assert [c.members for c in report.module_cycles] == [("a", "b", "c")]
+        assert report.module_cycles[0].cycle == ("a", "b", "a")
+        # Self-imports are not dependency cycles
+        assert report.context_cycles == ()
+
+    def test_context_cycles_keep_witness_imports(self):
+        graph = _graph(
+            {
+                "billing.app.uc": ["shipping.ports.api"],
+                "shipping.ports.api": ["shipping.app.uc"],
+                "shipping.app.uc": ["billing.domain.order"],
+                "billing.domain.order": [],
+            },
+            contexts=True,
+        )
+
+        report = ImportCycleReportVo.from_graph(graph)
+
+        assert report.module_cycles == ()
+        (cycle,) = report.context_cycles
+        assert cycle.cycle == ("billing", "shipping", "billing")
+        assert cycle.witnesses == (
+            ("billing.app.uc", "shipping.ports.api"),
+            ("shipping.app.uc", "billing.domain.order"),
+        )
+
+    def test_acyclic_graph(self):
+        report = ImportCycleReportVo.from_graph(_graph({"a": ["b"], "b": []}))
+
+        assert not report.has_cycles
@@ -0,0 +1,141 @@
+"""
+Unit tests for PassportTable (ComponentPassport interning).
+"""
+
+import pytest
+
+from dddguard.shared.domain import (
+    PASSPORT_TABLE,
+    AdapterType,
+    ArchetypeType,
+    CodeNode,
+    ComponentPassport,
+    DirectionEnum,
+    DomainType,
+    LayerEnum,
+    MatchMethod,
+    PassportTable,
+    PortType,
+    ScopeEnum,
+)
+from dddguard.shared.helpers.generics import GenericDomainError
+
+
+def _passport(**overrides) -> ComponentPassport:
+    fields = dict(
+        scope=ScopeEnum.CONTEXT,
+        context_name="billing",
+        macro_zone=None,
+        layer=LayerEnum.DOMAIN,
+        direction=DirectionEnum.NONE,
+        component_type=DomainType.ENTITY,
+        match_method=MatchMethod.STRUCTURAL,
+    )
+    fields.update(overrides)
+    return ComponentPassport(**fields)
+
+
+@pytest.fixture
+def table() -> PassportTable:
+    return PassportTable()
+
+
+class TestInterning:
+    def test_equal_passports_share_one_id(self, table):
+        first = table.intern(_passport())
+        second = table.intern(_passport())
+
+        assert first == second
+        assert len(table) == 1
+
+    def test_distinct_passports_get_dense_ids(self, table):
+        ids = [
+            table.intern(_passport()),
+            table.intern(_passport(context_name="ordering")),
+            table.intern(_passport(macro_zone="sales")),
+        ]
+
+        assert ids == [0, 1, 2]
+
+    def test_get_returns_first_interned_instance(self, table):
+        original = _passport()
+        table.intern(original)
+
+        assert table.get(table.intern(_passport())) is original
+
+    def test_canonical_reuses_existing_instance(self, table):
+        original = _passport()
+        table.intern(original)
+
+        fields = dict(
+            scope=ScopeEnum.CONTEXT,
+            context_name="billing",
+            macro_zone=None,
+            layer=LayerEnum.DOMAIN,
+            direction=DirectionEnum.NONE,
+            component_type=DomainType.ENTITY,
+            match_method=MatchMethod.STRUCTURAL,
+        )
+        assert table.canonical(**fields) is original
+        assert len(table) == 1
+
+    def test_component_types_with_shared_values_stay_distinct(self, table):
+        """PortType.REPOSITORY and AdapterType.REPOSITORY compare equal as strings."""
+        port = _passport(component_type=PortType.REPOSITORY)
+        adapter = _passport(component_type=AdapterType.REPOSITORY)
+
+        assert table.encode(port) != table.encode(adapter)
+
+
+class TestEncoding:
+    def test_decode_round_trips(self, table):
+        original = _passport(
+            scope=ScopeEnum.SHARED,
+            macro_zone="sales/core",
+            layer=LayerEnum.ADAPTERS,
+            direction=DirectionEnum.DRIVEN,
+            component_type=AdapterType.GATEWAY,
+            match_method=MatchMethod.NAME,
+        )
+
+        assert table.decode(table.encode(original)) == original
+
+    def test_plain_string_values_are_accepted(self, table):
+        assert table.encode(_passport(component_type="ENTITY")) == table.encode(_passport())
+
+    def test_plain_string_component_type_is_stored_as_enum(self, table):
+        """The first passport seen becomes canonical: it must not leak a plain string."""
+        passport_id = table.intern(_passport(component_type="ENTITY"))
+
+        assert table.get(passport_id).component_type is DomainType.ENTITY
+        assert table.intern(_passport()) == passport_id
+
+    def test_unknown_enum_value_raises(self, table):
+        with pytest.raises(GenericDomainError):
+            table.encode(_passport(direction="SIDEWAYS"))
+
+
+class TestNodeReference:
+    def test_classify_stores_passport_id(self):
+        node = CodeNode(path="billing.domain.order")
+        node.classify(_passport(component_type=ArchetypeType.HELPER))
+
+        assert node.passport_id is not None
+        assert node.passport is PASSPORT_TABLE.get(node.passport_id)
+
+    def test_equal_passports_resolve_to_same_instance(self):
+        a = CodeNode(path="a")
+        b = CodeNode(path="b")
+        a.classify(_passport(context_name="interning"))
+        b.classify(_passport(context_name="interning"))
+
+        assert a.passport_id == b.passport_id
+        assert a.passport is b.passport
+
+    def test_assigning_none_clears_reference(self):
+        node = CodeNode(path="a")
+        node.passport = _passport()
+        node.passport = None
+
+        assert node.passport_id is None
+        assert node.passport is None
@@ -0,0 +1,57 @@
+import random
+
+from dddguard.shared.domain import CsrAdjacency, ReachabilityIndex
+
+
+def _closure(edges: dict[str, list[str]], start: str) -> set[str]:
+    seen: set[str] = set()
+    stack = list(edges.get(start, ()))
+    while stack:
+        node = stack.pop()
+        if node not in seen:
+            seen.add(node)
+            stack.extend(edges.get(node, ()))
+    return seen
+
+
+class TestReachabilityIndex:
+    def test_matches_traversal_on_random_graphs(self):
+        rng = random.Random(11)
+        for _ in range(50):
+            names = [f"m{i}" for i in range(rng.randint(1, 12))]
+            edges = {n: rng.sample(names, rng.randint(0, min(3, len(names)))) for n in names}
+            index = ReachabilityIndex(CsrAdjacency.from_adjacency(edges))
+
+            for source in names:
+                expected = _closure(edges, source)
+                assert index.descendants([source]) == expected
+                assert index.ancestors([source]) == {
+                    n for n in names if source in _closure(edges, n)
+                }
+                assert [index.reaches(source, t) for t in names] == [t in expected for t in names]
+
+    def test_nodes_reach_themselves_only_through_cycles(self):
+        index = ReachabilityIndex(
+            CsrAdjacency.from_adjacency({"a": ["b"], "b": ["a", "c"], "c": [], "d": ["d"]})
+        )
+
+        assert index.reaches("a", "a")
+        assert index.reaches("d", "d")
+        assert not index.reaches("c", "c")
+        assert not index.reaches("c", "a")
+        assert index.component_count == 3
+        assert index.ancestors(["c"]) == {"a", "b"}
+        assert not index.reaches("a", "unknown")
+
+    def test_index_is_cached_by_graph_content(self):
+        edges = {"x.a": ["x.b"], "x.b": []}
+
+        first = ReachabilityIndex.for_graph(CsrAdjacency.from_adjacency(edges))
+        again = ReachabilityIndex.for_graph(CsrAdjacency.from_adjacency(dict(edges)))
+        changed = ReachabilityIndex.for_graph(
+            CsrAdjacency.from_adjacency({**edges, "x.b": ["x.a"]})
+        )
+
+        assert again is first
+        assert changed is not first
+        assert changed.reaches("x.b", "x.b")